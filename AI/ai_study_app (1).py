@@ -1,43 +1,17 @@
 import streamlit as st
-import pandas as pd
 from enum import Enum
 
+import content_store
+import instrumentation
+import search
+import theme
+from tables import content_table
+
 # Set page config
 st.set_page_config(page_title="AI Planning & Learning Study Guide", layout="wide")
 
 # Custom CSS for better styling
-st.markdown("""
-<style>
-    .concept-box {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 20px;
-        border-radius: 10px;
-        color: white;
-        margin: 10px 0;
-    }
-    .example-box {
-        background: #e8f4f8;
-        padding: 15px;
-        border-left: 5px solid #0288d1;
-        border-radius: 5px;
-        margin: 10px 0;
-    }
-    .definition-box {
-        background: #fff3e0;
-        padding: 15px;
-        border-left: 5px solid #f57c00;
-        border-radius: 5px;
-        margin: 10px 0;
-    }
-    .warning-box {
-        background: #ffebee;
-        padding: 15px;
-        border-left: 5px solid #c62828;
-        border-radius: 5px;
-        margin: 10px 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+theme.inject_css("planning")
 
 # Title
 st.title("🤖 AI Planning & Learning - Complete Study Guide")
@@ -45,6 +19,7 @@ st.markdown("---")
 
 # Sidebar Navigation
 st.sidebar.title("📚 Navigation")
+search.sidebar("planning")
 chapters = [
     "Home",
     "1. Planning Fundamentals",
@@ -58,10 +33,18 @@ chapters = [
     "9. Learning Concepts"
 ]
 
-selected_chapter = st.sidebar.radio("Choose a topic:", chapters)
+selected_chapter = st.sidebar.radio("Choose a topic:", chapters,
+                                    key=search.nav_key("planning"))
+
+instrumentation.begin("planning", selected_chapter)
+
+# Static pages compiled into the content pack are replayed from it; the
+# branches below are the source they were extracted from.
+if content_store.serve("planning", selected_chapter):
+    pass
 
 # ==================== HOME PAGE ====================
-if selected_chapter == "Home":
+elif selected_chapter == "Home":
     st.markdown("""
     # 📖 Welcome to AI Planning & Learning Study Guide
     
@@ -132,7 +115,7 @@ elif selected_chapter == "1. Planning Fundamentals":
         ]
     }
     
-    df = pd.DataFrame(properties)
+    df = content_table(properties)
     st.dataframe(df, use_container_width=True)
     
     st.subheader("📝 Real-World Example: Umbrella Problem")
@@ -1082,7 +1065,9 @@ elif selected_chapter == "9. Learning Concepts":
         "Deductive": ["Top-down", "General theory", "Apply rules", "Few (1-5)", "Certain", "Known domains"]
     }
     
-    st.dataframe(pd.DataFrame(comparison_data), use_container_width=True)
+    st.dataframe(content_table(comparison_data), use_container_width=True)
+
+instrumentation.end()
 
 # Footer
 st.divider()
@@ -0,0 +1,195 @@
+# Compiled content pack for the study guides.
+#
+# tools/build_content.py extracts every static page of the three guides into
+# structured JSON sources (content/src/) and compiles them into a single
+# binary pack (content/content.pack). Each worker process memory-maps the
+# pack, so all workers share one copy through the OS page cache, and a render
+# reads and decodes only the requested page's bytes before replaying its
+# blocks with the thin loop in render_blocks().
+#
+# The Python guides stay the editable source. The pack records a hash of each
+# guide's source files; if they changed since the build, that guide is served
+# from Python again until the pack is rebuilt. Pages with widgets (the quiz,
+# calculators, ...) are never served from the pack.
+#
+# STUDY_APP_CONTENT_PACK=<path> picks another pack; STUDY_APP_CONTENT_PACK=off
+# disables the pack entirely.
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+
+import streamlit as st
+
+from tables import content_table
+
+AI_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PACK = os.path.join(AI_DIR, "content", "content.pack")
+
+MAGIC = b"STCP"
+VERSION = 1
+HEADER = struct.Struct("<4sIQ")  # magic, version, index length
+
+# Modules the guides' pages render with (tables, styling, the engines)
+SHARED_SOURCES = ["tables.py", "theme.py", "reasoning"]
+
+# Files each guide's pages are rendered from
+GUIDE_SOURCES = {
+    "uncertainty": ["ai_study_app.py", "uncertainty_topics"] + SHARED_SOURCES,
+    "planning": ["ai_study_app (1).py"] + SHARED_SOURCES,
+    "unit5": ["unit5.py", "unit5_quiz.py"] + SHARED_SOURCES,
+}
+
+WIDGET_BLOCKS = ("form", "radio", "button", "progress", "input")
+
+ENABLED = os.environ.get("STUDY_APP_CONTENT_PACK", "") != "off"
+
+_pack = None
+_pack_loaded = False
+_pack_lock = threading.Lock()
+
+
+def source_hash(guide):
+    digest = hashlib.blake2b(digest_size=16)
+    for name in GUIDE_SOURCES[guide]:
+        path = os.path.join(AI_DIR, name)
+        if os.path.isdir(path):
+            files = sorted(os.path.join(path, f) for f in os.listdir(path) if f.endswith(".py"))
+        else:
+            files = [path]
+        for file in files:
+            digest.update(os.path.relpath(file, AI_DIR).encode("utf-8"))
+            with open(file, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _child_blocks(block):
+    if block["type"] == "columns":
+        return [child for column in block["columns"] for child in column]
+    if block["type"] == "tabs":
+        return [child for tab in block["tabs"] for child in tab["children"]]
+    return block.get("children", [])
+
+
+def has_widgets(blocks):
+    return any(block["type"] in WIDGET_BLOCKS or has_widgets(_child_blocks(block))
+               for block in blocks)
+
+
+def write_pack(path, pages, guide_hashes):
+    # pages: iterable of (guide, page, blocks)
+    blobs, entries, offset = [], {}, 0
+    for guide, page, blocks in pages:
+        blob = json.dumps(blocks, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        entries.setdefault(guide, {})[page] = [offset, len(blob), has_widgets(blocks)]
+        blobs.append(blob)
+        offset += len(blob)
+    index = json.dumps({"guides": guide_hashes, "pages": entries},
+                       ensure_ascii=False).encode("utf-8")
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index)))
+        f.write(index)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, path)
+
+
+class ContentPack:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_len = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} content pack")
+        index = json.loads(self._map[HEADER.size:HEADER.size + index_len])
+        self._data_start = HEADER.size + index_len
+        self.pages = index["pages"]
+        # Guides whose sources changed since the build are not served
+        self.fresh = {guide for guide, digest in index["guides"].items()
+                      if digest == source_hash(guide)}
+
+    def blocks(self, guide, page):
+        entry = self.pages.get(guide, {}).get(page)
+        if entry is None:
+            return None
+        offset, length, _ = entry
+        start = self._data_start + offset
+        return json.loads(self._map[start:start + length])
+
+    def can_serve(self, guide, page):
+        entry = self.pages.get(guide, {}).get(page)
+        return guide in self.fresh and entry is not None and not entry[2]
+
+
+def get_pack():
+    global _pack, _pack_loaded
+    if not _pack_loaded:
+        with _pack_lock:
+            if not _pack_loaded:
+                path = os.environ.get("STUDY_APP_CONTENT_PACK") or DEFAULT_PACK
+                _pack = ContentPack(path) if ENABLED and os.path.exists(path) else None
+                _pack_loaded = True
+    return _pack
+
+
+def serve(guide, page):
+    # Renders the page from the pack; False means the caller renders it
+    if not ENABLED:
+        return False
+    pack = get_pack()
+    if pack is None or not pack.can_serve(guide, page):
+        return False
+    render_blocks(pack.blocks(guide, page))
+    return True
+
+
+def _table(block):
+    data = {column: [row[i] for row in block["rows"]]
+            for i, column in enumerate(block["columns"])}
+    return content_table(data)
+
+
+def render_blocks(blocks):
+    for block in blocks:
+        kind = block["type"]
+        if kind == "heading":
+            (st.title, st.header, st.subheader)[block["level"] - 1](block["text"])
+        elif kind == "markdown":
+            st.markdown(block["text"], unsafe_allow_html=block["html"])
+        elif kind == "caption":
+            st.caption(block["text"])
+        elif kind == "divider":
+            st.divider()
+        elif kind == "latex":
+            st.latex(block["text"])
+        elif kind == "alert":
+            getattr(st, block["kind"])(block["text"], icon=block.get("icon") or None)
+        elif kind == "code":
+            st.code(block["text"], language=block["language"] or None)
+        elif kind == "table":
+            if block["interactive"]:
+                st.dataframe(_table(block), use_container_width=True)
+            else:
+                st.table(_table(block))
+        elif kind == "metric":
+            st.metric(block["label"], block["value"], help=block["help"] or None)
+        elif kind == "columns":
+            weights = block.get("weights") or [1] * len(block["columns"])
+            for column, children in zip(st.columns(weights), block["columns"]):
+                with column:
+                    render_blocks(children)
+        elif kind == "tabs":
+            for tab, spec in zip(st.tabs([t["label"] for t in block["tabs"]]), block["tabs"]):
+                with tab:
+                    render_blocks(spec["children"])
+        elif kind == "expander":
+            with st.expander(block["label"], expanded=block.get("expanded", False)):
+                render_blocks(block["children"])
+        elif kind == "group":
+            with st.container():
+                render_blocks(block["children"])
@@ -0,0 +1,207 @@
+# Opt-in per-render instrumentation for the study guides.
+#
+# Enable with STUDY_APP_METRICS=1 (in-process snapshot only) or
+# STUDY_APP_METRICS_FILE=/path/metrics.prom (also rewrites a Prometheus text
+# file after every render). When neither is set, measure()/begin()/end() are
+# no-ops and streamlit is left untouched.
+#
+# Guides call begin() before their page and end() after it, or wrap the page
+# in measure(). A render that raises or is stopped by a rerun never reaches
+# end(); the next begin() on that thread drops it unrecorded.
+#
+# For every (guide, page) it records wall time, st.markdown/st.latex/
+# st.table/st.dataframe calls, bytes of HTML passed with unsafe_allow_html,
+# pandas objects created and content tables built.
+
+import contextlib
+import functools
+import os
+import sys
+import threading
+import time
+
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+
+import tables
+
+METRICS_FILE = os.environ.get("STUDY_APP_METRICS_FILE")
+ENABLED = bool(os.environ.get("STUDY_APP_METRICS") or METRICS_FILE)
+
+COUNTED_CALLS = ("markdown", "latex", "table", "dataframe")
+PANDAS_TYPES = ("DataFrame", "Series")
+
+_local = threading.local()
+_lock = threading.Lock()
+_stats = {}
+_patched_streamlit = False
+_patched_pandas = False
+
+
+class _Recorder:
+    def __init__(self, guide, page):
+        self.guide = guide
+        self.page = page
+        self.calls = dict.fromkeys(COUNTED_CALLS, 0)
+        self.html_bytes = 0
+        self.pandas_objects = 0
+        self.tables_before = tables.build_count
+        self.start = time.perf_counter()
+
+
+def _counting(name, func, body_index):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        recorder = getattr(_local, "recorder", None)
+        if recorder is not None:
+            recorder.calls[name] += 1
+            if name == "markdown" and kwargs.get("unsafe_allow_html"):
+                body = kwargs.get("body", args[body_index] if len(args) > body_index else "")
+                recorder.html_bytes += len(str(body).encode("utf-8"))
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def _patch_streamlit():
+    # st.markdown etc. are methods bound to the main container at import, so
+    # both the module attributes and the DeltaGenerator methods (sidebar,
+    # columns, tabs, ...) are wrapped.
+    global _patched_streamlit
+    with _lock:
+        if _patched_streamlit:
+            return
+        for name in COUNTED_CALLS:
+            setattr(DeltaGenerator, name, _counting(name, getattr(DeltaGenerator, name), 1))
+            setattr(st, name, _counting(name, getattr(st, name), 0))
+        _patched_streamlit = True
+
+
+def _patch_pandas():
+    # pandas is imported lazily by the guides, so hook it once it shows up
+    global _patched_pandas
+    pd = sys.modules.get("pandas")
+    if pd is None or _patched_pandas:
+        return
+    with _lock:
+        if _patched_pandas:
+            return
+        for type_name in PANDAS_TYPES:
+            cls = getattr(pd, type_name)
+            cls.__init__ = _counting_init(cls.__init__)
+        _patched_pandas = True
+
+
+def _counting_init(init):
+    @functools.wraps(init)
+    def wrapper(self, *args, **kwargs):
+        recorder = getattr(_local, "recorder", None)
+        if recorder is not None:
+            recorder.pandas_objects += 1
+        init(self, *args, **kwargs)
+    return wrapper
+
+
+def begin(guide, page):
+    # Replaces any recorder an unfinished render left open
+    if not ENABLED:
+        return
+    _patch_streamlit()
+    _patch_pandas()
+    _local.recorder = _Recorder(guide, page)
+
+
+def end():
+    recorder = getattr(_local, "recorder", None)
+    if recorder is None:
+        return
+    _local.recorder = None
+    elapsed = time.perf_counter() - recorder.start
+    _patch_pandas()
+
+    with _lock:
+        stats = _stats.setdefault((recorder.guide, recorder.page), {
+            "renders": 0,
+            "seconds_total": 0.0,
+            "seconds_last": 0.0,
+            "seconds_max": 0.0,
+            "calls": dict.fromkeys(COUNTED_CALLS, 0),
+            "html_bytes": 0,
+            "pandas_objects": 0,
+            "tables_built": 0,
+        })
+        stats["renders"] += 1
+        stats["seconds_total"] += elapsed
+        stats["seconds_last"] = elapsed
+        stats["seconds_max"] = max(stats["seconds_max"], elapsed)
+        for name, count in recorder.calls.items():
+            stats["calls"][name] += count
+        stats["html_bytes"] += recorder.html_bytes
+        stats["pandas_objects"] += recorder.pandas_objects
+        stats["tables_built"] += tables.build_count - recorder.tables_before
+
+    if METRICS_FILE:
+        write_prometheus(METRICS_FILE)
+
+
+@contextlib.contextmanager
+def measure(guide, page):
+    begin(guide, page)
+    try:
+        yield
+    finally:
+        end()
+
+
+def snapshot():
+    # Copy of the metrics so far: {(guide, page): stats}
+    with _lock:
+        return {key: dict(stats, calls=dict(stats["calls"])) for key, stats in _stats.items()}
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text():
+    metrics = [
+        ("study_page_renders_total", "counter", "Number of page renders",
+         lambda s: [({}, s["renders"])]),
+        ("study_page_render_seconds_total", "counter", "Wall time spent rendering the page",
+         lambda s: [({}, s["seconds_total"])]),
+        ("study_page_render_seconds_last", "gauge", "Wall time of the latest render",
+         lambda s: [({}, s["seconds_last"])]),
+        ("study_page_render_seconds_max", "gauge", "Slowest render seen",
+         lambda s: [({}, s["seconds_max"])]),
+        ("study_page_st_calls_total", "counter", "streamlit calls made while rendering",
+         lambda s: [({"call": name}, count) for name, count in s["calls"].items()]),
+        ("study_page_html_bytes_total", "counter", "Bytes of raw HTML sent via st.markdown",
+         lambda s: [({}, s["html_bytes"])]),
+        ("study_page_pandas_objects_total", "counter", "pandas DataFrame/Series objects created",
+         lambda s: [({}, s["pandas_objects"])]),
+        ("study_page_tables_built_total", "counter", "Content tables built (cache misses)",
+         lambda s: [({}, s["tables_built"])]),
+    ]
+    current = snapshot()
+    lines = []
+    for name, kind, help_text, samples in metrics:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for (guide, page), stats in sorted(current.items()):
+            for extra, value in samples(stats):
+                labels = {"guide": guide, "page": page, **extra}
+                rendered = ",".join(f'{k}="{_label(v)}"' for k, v in labels.items())
+                lines.append(f"{name}{{{rendered}}} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path):
+    # Written to a temp file and renamed so scrapers never see a partial file
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(prometheus_text())
+    os.replace(tmp, path)
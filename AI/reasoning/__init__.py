@@ -0,0 +1,2 @@
+# Inference engines behind the interactive topic pages (numpy only).
+# Topic modules import the submodules they need directly.
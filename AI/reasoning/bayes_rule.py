@@ -0,0 +1,81 @@
+# Bayes' rule over whole arrays of inputs.
+#
+# For a hypothesis H and evidence E:
+#
+#   P(H | E) = P(E | H) P(H) / (P(E | H) P(H) + P(E | not H) (1 - P(H)))
+#
+# with P(H) the prior (base rate), P(E | H) the likelihood (sensitivity) and
+# P(E | not H) the false-positive rate. posterior() broadcasts its inputs like
+# any NumPy expression; posterior_grid() crosses three 1-d arrays into a
+# (priors, likelihoods, false positives) grid in one pass, so sweeping a
+# million base rates costs a few array operations.
+
+from fractions import Fraction
+
+import numpy as np
+
+# Bounds on what one call may allocate: values in one range, cells in a grid
+MAX_VALUES = 1_000_000
+MAX_CELLS = 10_000_000
+
+
+def posterior(prior, likelihood, false_positive):
+    # P(H | E); nan where the evidence is impossible (both terms zero)
+    prior = np.asarray(prior, dtype=float)
+    hit = np.asarray(likelihood, dtype=float) * prior
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return hit / (hit + np.asarray(false_positive, dtype=float) * (1 - prior))
+
+
+def posterior_grid(priors, likelihoods, false_positives):
+    # Every combination: array of shape (priors, likelihoods, false positives)
+    priors, likelihoods, false_positives = (np.asarray(a, dtype=float).ravel()
+                                            for a in (priors, likelihoods, false_positives))
+    cells = priors.size * likelihoods.size * false_positives.size
+    if cells > MAX_CELLS:
+        raise ValueError(f"{cells:,} combinations is too many; the limit is {MAX_CELLS:,}")
+    return posterior(priors[:, None, None], likelihoods[None, :, None], false_positives[None, None, :])
+
+
+def base_rate_sweep(likelihoods, false_positives, points, low=1e-6, high=1.0):
+    # Posteriors for `points` base rates spaced evenly on a log scale
+    priors = np.geomspace(low, high, points)
+    return priors, posterior_grid(priors, likelihoods, false_positives)
+
+
+def crossing(priors, posteriors, level=0.5):
+    # Smallest prior whose posterior reaches `level`, per curve (axis 0 is
+    # the prior); nan where no prior in the sweep gets there
+    reached = posteriors >= level
+    first = reached.argmax(axis=0)
+    return np.where(reached.any(axis=0), np.asarray(priors)[first], np.nan)
+
+
+def parse_values(text):
+    # "0.8", "1/30000, 0.5" or a range "start:stop:count" (add " log" for
+    # log spacing) -> 1-d array of probabilities
+    text = text.strip()
+    if ":" in text:
+        spec, _, scale = text.partition(" ")
+        parts = spec.split(":")
+        if len(parts) != 3:
+            raise ValueError(f"a range is start:stop:count, got {spec!r}")
+        start, stop = float(Fraction(parts[0])), float(Fraction(parts[1]))
+        count = int(parts[2])
+        if not 1 <= count <= MAX_VALUES:
+            raise ValueError(f"a range takes 1 to {MAX_VALUES:,} values, got {count:,}")
+        if scale.strip() == "log":
+            values = np.geomspace(start, stop, count)
+        elif not scale.strip():
+            values = np.linspace(start, stop, count)
+        else:
+            raise ValueError(f"unknown spacing {scale.strip()!r}; use 'log' or nothing")
+    else:
+        values = np.array([float(Fraction(part.strip())) for part in text.split(",") if part.strip()])
+    if values.size > MAX_VALUES:
+        raise ValueError(f"at most {MAX_VALUES:,} values, got {values.size:,}")
+    if values.size == 0:
+        raise ValueError("no values given")
+    if ((values < 0) | (values > 1)).any():
+        raise ValueError("probabilities must lie between 0 and 1")
+    return values
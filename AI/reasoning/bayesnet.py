@@ -0,0 +1,163 @@
+# Discrete Bayesian networks: named variables with named states, a parent
+# list per variable and a CPT model (reasoning.cpt) per variable. Exact
+# inference reads the CPTs as dense Factors over (parents..., variable),
+# expanded from the models on first use; samplers use the models directly.
+
+import numpy as np
+
+from reasoning.cpt import CPT, NoisyOR, TabularCPT
+from reasoning.factor import Factor
+
+
+def _model(name, cpt, parent_cards, check=True):
+    # A CPT model, or an array of shape (parent cards..., states) as a table
+    model = cpt if isinstance(cpt, CPT) else TabularCPT(cpt)
+    if check:
+        model.check(name, parent_cards)
+    return model
+
+
+class BayesianNetwork:
+    def __init__(self):
+        self.states = {}  # variable -> tuple of state names
+        self.parents = {}  # variable -> tuple of parents
+        self.models = {}  # variable -> CPT model
+        self._factors = {}  # variable -> its model expanded to a Factor
+        # Bumped on every change so engines can drop cached results
+        self.version = 0
+
+    def __repr__(self):
+        return f"BayesianNetwork({len(self.states)} variables)"
+
+    @property
+    def cpts(self):
+        # variable -> Factor over parents + (variable,)
+        for name, model in self.models.items():
+            if name not in self._factors:
+                parents = self.parents[name]
+                table = model.table([self.card(p) for p in parents])
+                self._factors[name] = Factor(parents + (name,), table)
+        return self._factors
+
+    @property
+    def nodes(self):
+        # Insertion order, which is topological (parents are added first)
+        return list(self.states)
+
+    def add_node(self, name, states, parents=(), cpt=None, check=True):
+        # cpt: a CPT model, or an array of shape (parent cards...,
+        # len(states)) whose rows are distributions over `states`; uniform
+        # when omitted. check=False skips validating the CPT's numbers, for
+        # tables already checked in bulk (reasoning.network_files)
+        if name in self.states:
+            raise ValueError(f"{name!r} is already in the network")
+        for parent in parents:
+            if parent not in self.states:
+                raise KeyError(f"parent {parent!r} of {name!r} must be added first")
+        states = tuple(states)
+        parent_cards = [len(self.states[p]) for p in parents]
+        if cpt is None:
+            cpt = np.full(parent_cards + [len(states)], 1 / len(states))
+        model = _model(name, cpt, parent_cards, check)
+        if model.card != len(states):
+            raise ValueError(f"CPT of {name!r} covers {model.card} states, not {len(states)}")
+        self.models[name] = model
+        self.states[name] = states
+        self.parents[name] = tuple(parents)
+        self.version += 1
+
+    def set_cpt(self, name, cpt):
+        model = _model(name, cpt, [self.card(p) for p in self.parents[name]])
+        if model.card != self.card(name):
+            raise ValueError(f"CPT of {name!r} covers {model.card} states, not {self.card(name)}")
+        self.models[name] = model
+        self._factors.pop(name, None)
+        self.version += 1
+
+    def children(self, name):
+        return [child for child, parents in self.parents.items() if name in parents]
+
+    def card(self, name):
+        return len(self.states[name])
+
+    def state_index(self, name, state):
+        try:
+            return self.states[name].index(state)
+        except ValueError:
+            raise KeyError(f"{name!r} has no state {state!r}; "
+                           f"choose from {self.states[name]}") from None
+
+    def evidence_indices(self, evidence):
+        # {variable: state name} -> {variable: state index}
+        return {name: self.state_index(name, state) for name, state in (evidence or {}).items()}
+
+    def factors(self):
+        return [self.cpts[name] for name in self.states]
+
+
+def alarm_network(alarm="table"):
+    # The burglary-alarm example of the Bayesian Networks page. The calling
+    # probabilities for a silent alarm are not on the page; these are the
+    # usual textbook-sized false-alarm rates. alarm="noisy-or" swaps the
+    # alarm table for a noisy-OR fitted to its single-cause rows.
+    tf = ("True", "False")
+    net = BayesianNetwork()
+    net.add_node("Burglary", tf, cpt=[0.002, 0.998])
+    net.add_node("Earthquake", tf, cpt=[0.001, 0.999])
+    if alarm == "noisy-or":
+        # P(silent | cause alone) = (1 - leak) * (1 - cause probability)
+        leak = 0.001
+        cpt = NoisyOR([1 - 0.05 / (1 - leak), 1 - 0.69 / (1 - leak)], leak=leak)
+    else:
+        cpt = [
+            [[0.94, 0.06], [0.95, 0.05]],
+            [[0.31, 0.69], [0.001, 0.999]],
+        ]
+    net.add_node("Alarm", tf, parents=("Burglary", "Earthquake"), cpt=cpt)
+    net.add_node("DavidCalls", tf, parents=("Alarm",), cpt=[[0.91, 0.09], [0.05, 0.95]])
+    net.add_node("SophiaCalls", tf, parents=("Alarm",), cpt=[[0.75, 0.25], [0.02, 0.98]])
+    return net
+
+
+def random_network(n_nodes, max_parents=3, states=2, seed=None):
+    # Random DAG over X0..X{n-1} with up to `max_parents` parents among
+    # earlier nodes and Dirichlet(1) CPT rows; `states` is a state count or
+    # a (low, high) range to draw it from. For benchmarks and scale tests.
+    rng = np.random.default_rng(seed)
+    net = BayesianNetwork()
+    for i in range(n_nodes):
+        k = int(rng.integers(0, min(i, max_parents) + 1))
+        parents = [f"X{p}" for p in sorted(rng.choice(i, size=k, replace=False))] if k else []
+        card = states if isinstance(states, int) else int(rng.integers(states[0], states[1] + 1))
+        shape = tuple(net.card(p) for p in parents)
+        net.add_node(f"X{i}", [f"s{j}" for j in range(card)], parents,
+                     rng.dirichlet(np.ones(card), size=shape))
+    return net
+
+
+def meningitis_network():
+    # The meningitis example of the Bayes' Theorem page: P(M) = 1/30,000,
+    # P(stiff neck | M) = 0.8, and P(stiff neck | no M) chosen so that
+    # P(stiff neck) = 0.02
+    prior = 1 / 30000
+    healthy = (0.02 - 0.8 * prior) / (1 - prior)
+    net = BayesianNetwork()
+    net.add_node("Meningitis", ("True", "False"), cpt=[prior, 1 - prior])
+    net.add_node("StiffNeck", ("True", "False"), parents=("Meningitis",),
+                 cpt=[[0.8, 0.2], [healthy, 1 - healthy]])
+    return net
+
+
+def car_network():
+    # The car of the LTMS page's diagnosis example, with failure rates: the
+    # car starts (barring a 1% hiccup) only if battery, fuel and engine are
+    # all fine; the lights show whether the battery works
+    net = BayesianNetwork()
+    net.add_node("Battery", ("Working", "Dead"), cpt=[0.9, 0.1])
+    net.add_node("Fuel", ("Has fuel", "Empty"), cpt=[0.95, 0.05])
+    net.add_node("Engine", ("Working", "Broken"), cpt=[0.98, 0.02])
+    starts = [[[[0.99, 0.01] if (b, f, e) == (0, 0, 0) else [0.0, 1.0] for e in range(2)]
+               for f in range(2)] for b in range(2)]
+    net.add_node("CarStarts", ("Yes", "No"), parents=("Battery", "Fuel", "Engine"), cpt=starts)
+    net.add_node("Lights", ("On", "Off"), parents=("Battery",), cpt=[[0.95, 0.05], [0.01, 0.99]])
+    return net
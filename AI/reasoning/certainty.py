@@ -0,0 +1,450 @@
+# MYCIN-style certainty factors: rules, their combination and a
+# forward-chaining engine.
+#
+#   IF has-spots(X) AND has-fever(X) THEN has-measles(X) CF=0.5
+#
+# Premises combine facts with AND, OR and parentheses: CF(A AND B) is the
+# smaller CF, CF(A OR B) the larger. A rule fires when its premise's CF is
+# above the threshold (0.2 in MYCIN) and then contributes premise CF x rule
+# CF to its conclusion (sequential combination). Everything said about one
+# fact - its evidence and its rules' contributions - is combined in
+# parallel: positive amounts into a measure of belief MB = 1 - prod(1 - x),
+# negative ones into a measure of disbelief MD likewise, and
+#
+#   CF = (MB - MD) / (1 - min(MB, MD))
+#
+# EMYCIN's rule, which is MB - MD when either is zero and, unlike combining
+# CFs pairwise, does not depend on the order the rules fire in.
+#
+# Rules are indexed by the facts in their premises. Changing a fact marks
+# only the rules that read it; their conclusions are recomputed in order of
+# depth in the rule graph (evidence first), so every rule is evaluated at
+# most once per change, after all of its premises have settled, and only
+# conclusions whose CF moved pass the change on. run() recomputes everything
+# from the evidence alone, for comparison.
+#
+# Each fact keeps its MB and MD as running products - a sum of log(1 - x)
+# plus a count of certain (x = 1) amounts - so a changed contribution is
+# taken out and the new one put in without revisiting the fact's other
+# rules. Each fact also keeps its provenance: the evidence it rests on, as a
+# bitset (one bit per evidence fact) through the rules that fired for it.
+# Retracting evidence is one more change to propagate; the provenance says
+# which conclusions it supported and explains every CF.
+
+import heapq
+import math
+import re
+
+import numpy as np
+
+THRESHOLD = 0.2
+
+_RULE = re.compile(r"^\s*IF\s+(.+?)\s+THEN\s+(\S+)\s+(?:CF\s*=?\s*)?(-?\d*\.?\d+)\s*$", re.I)
+_TOKEN = re.compile(r"\s*(\(|\)|[^\s()]+(?:\([^()]*\))?)")
+
+
+def combine(x, y):
+    # Parallel combination of two CFs for the same fact (EMYCIN)
+    if x >= 0 and y >= 0:
+        return x + y * (1 - x)
+    if x <= 0 and y <= 0:
+        return x + y * (1 + x)
+    return (x + y) / (1 - min(abs(x), abs(y)))
+
+
+def certainty(mb, md):
+    # CF from the measures of belief and disbelief; 0 when both are certain
+    if mb == 1 and md == 1:
+        return 0.0
+    return (mb - md) / (1 - min(mb, md))
+
+
+def _parse_premise(text):
+    # "a AND (b OR c)" -> ("and", ["a", ("or", ["b", "c"])]); AND binds
+    # tighter than OR
+    tokens = _TOKEN.findall(text)
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else None
+
+    def take():
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def either():
+        terms = [both()]
+        while peek() is not None and peek().upper() == "OR":
+            take()
+            terms.append(both())
+        return terms[0] if len(terms) == 1 else ("or", terms)
+
+    def both():
+        terms = [single()]
+        while peek() is not None and peek().upper() == "AND":
+            take()
+            terms.append(single())
+        return terms[0] if len(terms) == 1 else ("and", terms)
+
+    def single():
+        token = peek()
+        if token is None or token == ")" or token.upper() in ("AND", "OR"):
+            raise ValueError(f"expected a fact in {text!r}")
+        take()
+        if token != "(":
+            return token
+        inner = either()
+        if peek() != ")":
+            raise ValueError(f"missing ')' in {text!r}")
+        take()
+        return inner
+
+    premise = either()
+    if peek() is not None:
+        raise ValueError(f"unexpected {peek()!r} in {text!r}")
+    return premise
+
+
+def _facts(premise):
+    if isinstance(premise, str):
+        return {premise}
+    return set().union(*(_facts(term) for term in premise[1]))
+
+
+def _premise_text(premise, nested=False):
+    if isinstance(premise, str):
+        return premise
+    text = f" {premise[0].upper()} ".join(_premise_text(term, True) for term in premise[1])
+    return f"({text})" if nested else text
+
+
+class Rule:
+    __slots__ = ("premise", "conclusion", "cf", "facts")
+
+    def __init__(self, premise, conclusion, cf):
+        # premise: a fact name or a nested ("and"|"or", [terms]) tuple
+        if not -1 <= cf <= 1:
+            raise ValueError(f"a rule's CF must lie between -1 and 1, got {cf}")
+        self.premise = premise
+        self.conclusion = conclusion
+        self.cf = float(cf)
+        self.facts = frozenset(_facts(premise))
+        if conclusion in self.facts:
+            raise ValueError(f"{conclusion!r} cannot conclude itself")
+
+    def __repr__(self):
+        return f"IF {_premise_text(self.premise)} THEN {self.conclusion} CF={self.cf:g}"
+
+    def strength(self, cf):
+        # CF of the premise given fact -> CF (missing facts are unknown: 0)
+        return _strength(self.premise, cf)
+
+
+def _strength(premise, cf):
+    if isinstance(premise, str):
+        return cf.get(premise, 0.0)
+    values = [_strength(term, cf) for term in premise[1]]
+    return min(values) if premise[0] == "and" else max(values)
+
+
+def parse_rule(text):
+    # "IF a AND b THEN c CF=0.5" (the "CF=" is optional)
+    match = _RULE.match(text)
+    if not match:
+        raise ValueError(f"write rules as 'IF premise THEN conclusion CF=0.5', got {text.strip()!r}")
+    premise, conclusion, cf = match.groups()
+    return Rule(_parse_premise(premise), conclusion, float(cf))
+
+
+def parse_rules(text):
+    # One rule per line; blank lines and lines starting with # are skipped
+    rules = []
+    for number, line in enumerate(text.splitlines(), 1):
+        if line.strip() and not line.lstrip().startswith("#"):
+            try:
+                rules.append(parse_rule(line))
+            except ValueError as error:
+                raise ValueError(f"line {number}: {error}") from None
+    return rules
+
+
+class _Measure:
+    # MB (or MD) of one fact: 1 - prod(1 - x) over the amounts x it holds
+    __slots__ = ("count", "certain", "log_rest")
+
+    def __init__(self):
+        self.count = self.certain = 0
+        self.log_rest = 0.0
+
+    def add(self, x):
+        self.count += 1
+        if x >= 1:
+            self.certain += 1
+        else:
+            self.log_rest += math.log1p(-x)
+
+    def remove(self, x):
+        self.count -= 1
+        if x >= 1:
+            self.certain -= 1
+        elif self.count:
+            self.log_rest -= math.log1p(-x)
+        if not self.count:
+            self.log_rest = 0.0  # drops accumulated rounding
+
+    @property
+    def value(self):
+        return 1.0 if self.certain else -math.expm1(self.log_rest)
+
+
+class CertaintyEngine:
+    def __init__(self, rules=(), threshold=THRESHOLD):
+        self.threshold = threshold
+        self.rules = []
+        self.evidence = {}  # fact -> CF given by the user
+        self.cf = {}  # fact -> current CF (nonzero ones only)
+        self.support = {}  # fact -> bitset of the evidence it rests on
+        self._bit = {}  # evidence fact -> its bit in the support bitsets
+        self._belief = {}  # fact -> _Measure of its positive amounts (MB)
+        self._disbelief = {}  # fact -> _Measure of its negative amounts (MD)
+        self._contribution = []  # per rule: premise CF x rule CF, or 0
+        self._rule_support = []  # per rule: support of its premise when fired
+        self._firing = {}  # fact -> indices of its rules that fired
+        self._by_premise = {}  # fact -> indices of the rules that read it
+        self._by_conclusion = {}  # fact -> indices of the rules concluding it
+        self._depth = None  # fact -> depth in the rule graph, built lazily
+        self.evaluated = 0  # rule evaluations, for measuring
+        for rule in rules:
+            self._append(parse_rule(rule) if isinstance(rule, str) else rule)
+        self._depths()  # raises ValueError for circular rules
+
+    def __repr__(self):
+        return f"CertaintyEngine({len(self.rules)} rules, {len(self.evidence)} facts given)"
+
+    def add_rule(self, rule):
+        if isinstance(rule, str):
+            rule = parse_rule(rule)
+        # Checked before anything changes, so a refused rule leaves no trace
+        if self._reaches(rule.conclusion, rule.facts):
+            raise ValueError(f"the rules would be circular through {rule.conclusion}")
+        index = self._append(rule)
+        # Nothing to propagate unless the new rule fires already
+        if rule.strength(self.cf) > self.threshold:
+            self._update({rule.conclusion: {index}})
+        return rule
+
+    def _append(self, rule):
+        index = len(self.rules)
+        self.rules.append(rule)
+        self._contribution.append(0.0)
+        self._rule_support.append(0)
+        for fact in rule.facts:
+            self._by_premise.setdefault(fact, []).append(index)
+        self._by_conclusion.setdefault(rule.conclusion, []).append(index)
+        self._depth = None
+        return index
+
+    def _reaches(self, start, targets):
+        # Whether some fact in targets is start or follows from it by rules
+        targets = set(targets)
+        seen, stack = {start}, [start]
+        while stack:
+            fact = stack.pop()
+            if fact in targets:
+                return True
+            for i in self._by_premise.get(fact, ()):
+                conclusion = self.rules[i].conclusion
+                if conclusion not in seen:
+                    seen.add(conclusion)
+                    stack.append(conclusion)
+        return False
+
+    @property
+    def facts(self):
+        return set(self._by_premise) | set(self._by_conclusion) | set(self.evidence)
+
+    def observable(self):
+        # Facts that only evidence can set: read by rules, concluded by none
+        return [fact for fact in self._by_premise if fact not in self._by_conclusion]
+
+    def _depths(self):
+        # 0 for facts no rule concludes, else 1 + the deepest premise fact
+        # (Kahn's algorithm over premise -> conclusion edges)
+        if self._depth is not None:
+            return self._depth
+        waiting = {fact: 0 for fact in self._by_conclusion}
+        for rule in self.rules:
+            waiting[rule.conclusion] += len(rule.facts)
+        depth = dict.fromkeys(self.facts, 0)
+        ready = [fact for fact in depth if not waiting.get(fact)]
+        settled = 0
+        while ready:
+            fact = ready.pop()
+            settled += 1
+            for i in self._by_premise.get(fact, ()):
+                conclusion = self.rules[i].conclusion
+                depth[conclusion] = max(depth[conclusion], depth[fact] + 1)
+                waiting[conclusion] -= 1
+                if not waiting[conclusion]:
+                    ready.append(conclusion)
+        if settled < len(depth):
+            circular = sorted(fact for fact, count in waiting.items() if count)
+            raise ValueError(f"the rules are circular through {', '.join(circular[:5])}")
+        self._depth = depth
+        return depth
+
+    def _account(self, fact, old, new):
+        # Swaps one amount said about `fact` (0: nothing) in its MB/MD
+        if old > 0:
+            self._belief[fact].remove(old)
+        elif old < 0:
+            self._disbelief[fact].remove(-old)
+        if new > 0:
+            self._belief.setdefault(fact, _Measure()).add(new)
+        elif new < 0:
+            self._disbelief.setdefault(fact, _Measure()).add(-new)
+
+    def measures(self, fact):
+        # (MB, MD) of `fact`
+        belief, disbelief = self._belief.get(fact), self._disbelief.get(fact)
+        return (belief.value if belief else 0.0), (disbelief.value if disbelief else 0.0)
+
+    def _evaluate(self, i):
+        rule = self.rules[i]
+        strength = rule.strength(self.cf)
+        amount = rule.cf * strength if strength > self.threshold else 0.0
+        self.evaluated += 1
+        old = self._contribution[i]
+        if amount != old:
+            self._account(rule.conclusion, old, amount)
+            self._contribution[i] = amount
+            firing = self._firing.setdefault(rule.conclusion, set())
+            if amount:
+                firing.add(i)
+            else:
+                firing.discard(i)
+        # Premises may rest on other evidence even when the amount is the same
+        support = 0
+        if amount:
+            for fact in rule.facts:
+                support |= self.support.get(fact, 0)
+        self._rule_support[i] = support
+
+    def _update(self, dirty):
+        # dirty: fact -> indices of its rules to re-evaluate (or an empty set
+        # when only its evidence changed); returns the facts whose CF changed
+        depth = self._depths()
+        heap = [(depth.get(fact, 0), fact) for fact in dirty]
+        heapq.heapify(heap)
+        changed = []
+        while heap:
+            _, fact = heapq.heappop(heap)
+            for i in dirty.pop(fact):
+                self._evaluate(i)
+            support = 1 << self._bit[fact] if fact in self.evidence else 0
+            for i in self._firing.get(fact, ()):
+                support |= self._rule_support[i]
+            # Rounded, so the order amounts were accumulated in cannot tip a
+            # premise across the threshold
+            cf = round(certainty(*self.measures(fact)), 12)
+            moved = abs(cf - self.cf.get(fact, 0.0)) > 1e-12
+            if not moved and support == self.support.get(fact, 0):
+                continue
+            if moved:
+                changed.append(fact)
+            for value, store in ((cf, self.cf), (support, self.support)):
+                if value:
+                    store[fact] = value
+                else:
+                    store.pop(fact, None)
+            for i in self._by_premise.get(fact, ()):
+                conclusion = self.rules[i].conclusion
+                if conclusion not in dirty:
+                    dirty[conclusion] = set()
+                    heapq.heappush(heap, (depth.get(conclusion, 0), conclusion))
+                dirty[conclusion].add(i)
+        return changed
+
+    def tell(self, fact, cf):
+        # Sets the evidence for `fact` (CF between -1 and 1; 0 retracts it);
+        # returns the facts whose CF changed
+        if not -1 <= cf <= 1:
+            raise ValueError(f"a CF must lie between -1 and 1, got {cf}")
+        self._account(fact, self.evidence.get(fact, 0.0), float(cf))
+        if cf:
+            self.evidence[fact] = float(cf)
+            self._bit.setdefault(fact, len(self._bit))
+        else:
+            self.evidence.pop(fact, None)
+        return self._update({fact: set()})
+
+    def retract(self, fact):
+        # Withdraws the evidence for `fact`: returns (the conclusions that
+        # rested on it, the facts whose CF changed)
+        if fact not in self.evidence:
+            raise KeyError(f"{fact!r} has no evidence to retract")
+        dependents = self.dependents(fact)
+        return dependents, self.tell(fact, 0.0)
+
+    def dependents(self, fact):
+        # Concluded facts whose support includes the evidence for `fact`
+        bit = self._bit.get(fact)
+        if bit is None or fact not in self.evidence:
+            return []
+        return sorted(f for f, support in self.support.items() if support >> bit & 1 and f != fact)
+
+    def explain(self, fact):
+        # The evidence facts `fact` currently rests on
+        support = self.support.get(fact, 0)
+        return sorted(f for f, bit in self._bit.items() if support >> bit & 1)
+
+    def set_threshold(self, threshold):
+        self.threshold = threshold
+        self.run()
+
+    def run(self):
+        # Recomputes every CF from the evidence alone
+        self.cf, self.support = {}, {}
+        self._belief, self._disbelief, self._firing = {}, {}, {}
+        self._contribution = [0.0] * len(self.rules)
+        self._rule_support = [0] * len(self.rules)
+        for fact, cf in self.evidence.items():
+            self._bit.setdefault(fact, len(self._bit))
+            self._account(fact, 0.0, cf)
+        dirty = {fact: set() for fact in self.evidence}
+        for i, rule in enumerate(self.rules):
+            dirty.setdefault(rule.conclusion, set()).add(i)
+        self._update(dirty)
+
+    def conclusions(self, minimum=THRESHOLD):
+        # (fact, CF) for concluded facts with |CF| >= minimum, strongest first
+        found = [(fact, cf) for fact, cf in self.cf.items()
+                 if fact in self._by_conclusion and abs(cf) >= minimum]
+        return sorted(found, key=lambda item: (-abs(item[1]), item[0]))
+
+    def fired(self, fact):
+        # (rule, contribution) for the rules that fired for `fact`
+        return [(self.rules[i], self._contribution[i]) for i in sorted(self._firing.get(fact, ()))]
+
+
+def random_rules(n_rules, n_facts=None, n_evidence=None, max_premises=3, seed=None):
+    # Random acyclic rule base over facts F0..F{n-1}: the first n_evidence
+    # are only ever given, and every rule reads facts numbered below its
+    # conclusion. For benchmarks and scale tests.
+    rng = np.random.default_rng(seed)
+    n_facts = n_facts or max(4, n_rules // 5)
+    n_evidence = n_evidence or max(2, n_facts // 4)
+    conclusions = rng.integers(n_evidence, n_facts, n_rules)
+    counts = rng.integers(1, max_premises + 1, n_rules)
+    # Premise facts drawn below the conclusion; repeats are dropped
+    drawn = (rng.random((n_rules, max_premises)) * conclusions[:, None]).astype(int)
+    operators = rng.choice(["and", "or"], n_rules)
+    cfs = np.round(rng.uniform(-1, 1, n_rules), 2)
+    rules = []
+    for conclusion, k, row, operator, cf in zip(conclusions.tolist(), counts.tolist(), drawn.tolist(),
+                                                operators.tolist(), cfs.tolist()):
+        facts = [f"F{i}" for i in dict.fromkeys(row[:k])]
+        premise = facts[0] if len(facts) == 1 else (operator, facts)
+        rules.append(Rule(premise, f"F{conclusion}", cf or 0.5))
+    return rules
@@ -0,0 +1,201 @@
+# Conditional probability tables: P(variable | parents) in three forms that a
+# BayesianNetwork accepts interchangeably.
+#
+#   TabularCPT  the dense table, one row per parent configuration (the form
+#               of the alarm table on the Bayesian Networks page)
+#   NoisyMax    one small table per parent, so its size grows linearly with
+#               the number of parents instead of exponentially
+#   NoisyOR     the two-state special case of NoisyMax
+#
+# Every model answers log_probabilities() for arrays of parent state indices
+# of any broadcastable shape - that is how the samplers draw whole batches
+# without expanding anything - and table() gives the dense array that exact
+# inference multiplies. The noisy models work on log cumulative parameters,
+# so long products of small probabilities stay representable.
+#
+# The noisy models read states in the pages' ("True", "False") order: the
+# last state of every variable means "absent", earlier states are more
+# severe.
+
+from functools import cached_property
+
+import numpy as np
+
+
+def _log(values):
+    with np.errstate(divide="ignore"):
+        return np.log(values)
+
+
+class CPT:
+    card = 0
+
+    @property
+    def parameters(self):
+        # Free parameters (every distribution loses one to normalization)
+        raise NotImplementedError
+
+    def check(self, name, parent_cards):
+        # Raises ValueError unless the model fits `parent_cards` parents
+        raise NotImplementedError
+
+    def log_probabilities(self, parent_states):
+        # log P(variable=s | parents) for every state s: parent_states holds
+        # one int array per parent; the result has their broadcast shape
+        # plus a last axis of length card
+        raise NotImplementedError
+
+    def probabilities(self, parent_states):
+        return np.exp(self.log_probabilities(parent_states))
+
+    def sample(self, parent_states, u):
+        # Inverse CDF: the state whose cumulative range holds the uniform
+        # draws `u`, counted as the number of thresholds below them
+        cumulative = np.cumsum(self.probabilities(parent_states), axis=-1)
+        draw = np.zeros(np.shape(u), dtype=np.intp)
+        for k in range(self.card - 1):
+            draw += u >= cumulative[..., k]
+        return draw
+
+    def log_probability(self, parent_states, states):
+        # log P(variable=states | parents), all arrays broadcast together
+        log_p = self.log_probabilities(parent_states)
+        states = np.asarray(states)
+        shape = np.broadcast_shapes(log_p.shape[:-1], states.shape)
+        log_p = np.broadcast_to(log_p, shape + (self.card,))
+        return np.take_along_axis(log_p, np.broadcast_to(states, shape)[..., None], axis=-1)[..., 0]
+
+    def table(self, parent_cards):
+        # The dense array of shape (parent cards..., card)
+        grids = [np.arange(m).reshape([-1 if a == i else 1 for a in range(len(parent_cards))])
+                 for i, m in enumerate(parent_cards)]
+        values = self.probabilities(grids)
+        return np.broadcast_to(values, tuple(parent_cards) + (self.card,)).copy()
+
+
+class TabularCPT(CPT):
+    def __init__(self, values):
+        self.values = np.asarray(values, dtype=float)
+        self.card = self.values.shape[-1]
+        # Rows of the flattened table are addressed by mixed-radix parent codes
+        self._flat = self.values.reshape(-1, self.card)
+        self._strides = []
+        step = 1
+        for m in reversed(self.values.shape[:-1]):
+            self._strides.insert(0, step)
+            step *= m
+
+    def __repr__(self):
+        return f"TabularCPT(shape={self.values.shape})"
+
+    # Derived tables are built on first use: exact inference only reads
+    # `values`, and networks loaded from files create thousands of CPTs
+
+    @cached_property
+    def _log_flat(self):
+        return _log(self._flat)
+
+    @cached_property
+    def _cumulative(self):
+        return np.cumsum(self._flat, axis=1)
+
+    @property
+    def parameters(self):
+        return self._flat.shape[0] * (self.card - 1)
+
+    def check(self, name, parent_cards):
+        if self.values.shape[:-1] != tuple(parent_cards):
+            raise ValueError(f"CPT of {name!r} must have shape {tuple(parent_cards)} + (states,), "
+                             f"got {self.values.shape}")
+        if not np.allclose(self.values.sum(axis=-1), 1.0):
+            raise ValueError(f"CPT rows of {name!r} must sum to 1")
+
+    def _rows(self, parent_states):
+        row = 0
+        for states, stride in zip(parent_states, self._strides):
+            row = row + np.asarray(states) * stride
+        return row
+
+    def probabilities(self, parent_states):
+        return self._flat[self._rows(parent_states)]
+
+    def log_probabilities(self, parent_states):
+        return self._log_flat[self._rows(parent_states)]
+
+    def sample(self, parent_states, u):
+        # Gathers one threshold column at a time instead of whole rows
+        rows = self._rows(parent_states)
+        draw = np.zeros(np.shape(u), dtype=np.intp)
+        for k in range(self.card - 1):
+            draw += u >= self._cumulative[rows, k]
+        return draw
+
+    def log_probability(self, parent_states, states):
+        return self._log_flat[self._rows(parent_states), states]
+
+    def table(self, parent_cards):
+        return self.values
+
+
+class NoisyMax(CPT):
+    # links[i] has one row per non-absent state of parent i: the variable's
+    # distribution when that parent alone is active in that state. leak is
+    # its distribution when every parent is absent (by default: absent).
+    # Each active parent independently pushes the variable up to some level;
+    # the variable takes the most severe level any of them reaches.
+
+    def __init__(self, links, leak=None):
+        self.links = [np.atleast_2d(np.asarray(link, dtype=float)) for link in links]
+        if leak is None:
+            card = self.links[0].shape[1] if self.links else 2
+            leak = np.eye(card)[-1]
+        self.leak = np.asarray(leak, dtype=float)
+        self.card = len(self.leak)
+        # log P(level <= y) with levels counted from "absent" upwards; an
+        # absent parent never raises the level, so its row is log 1 = 0
+        self._log_cdf = [
+            np.vstack([_log(np.cumsum(link[:, ::-1], axis=1)), np.zeros(self.card)])
+            for link in self.links
+        ]
+        self._leak_log_cdf = _log(np.cumsum(self.leak[::-1]))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({len(self.links)} parents, {self.parameters} parameters)"
+
+    @property
+    def parameters(self):
+        return sum(link.shape[0] for link in self.links + [self.leak[None]]) * (self.card - 1)
+
+    def check(self, name, parent_cards):
+        if len(self.links) != len(parent_cards):
+            raise ValueError(f"{name!r} has {len(parent_cards)} parents but {len(self.links)} links")
+        for i, (link, m) in enumerate(zip(self.links, parent_cards)):
+            if link.shape != (m - 1, self.card):
+                raise ValueError(f"link {i} of {name!r} must have shape {(m - 1, self.card)}, "
+                                 f"got {link.shape}")
+        for rows in self.links + [self.leak[None]]:
+            if not np.allclose(rows.sum(axis=-1), 1.0) or (rows < 0).any():
+                raise ValueError(f"noisy-MAX distributions of {name!r} must be non-negative and sum to 1")
+
+    def log_probabilities(self, parent_states):
+        # The cumulative distribution of the level is the product of the
+        # parents' (a sum in log space); differences of it give the levels
+        log_cdf = self._leak_log_cdf
+        for states, table in zip(parent_states, self._log_cdf):
+            log_cdf = log_cdf + table[np.asarray(states)]
+        below = np.concatenate([np.full(log_cdf.shape[:-1] + (1,), -np.inf), log_cdf[..., :-1]], axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # log(e^a - e^b) = a + log(1 - e^(b - a))
+            log_p = log_cdf + np.log1p(-np.exp(np.minimum(below - log_cdf, 0.0)))
+        log_p = np.where(np.isneginf(log_cdf), -np.inf, log_p)
+        return log_p[..., ::-1]
+
+
+class NoisyOR(NoisyMax):
+    # Two states ("True", "False"): each parent in its first state causes the
+    # variable with its own probability; leak is the chance it happens with
+    # no cause at all
+
+    def __init__(self, causes, leak=0.0):
+        self.causes = [float(p) for p in causes]
+        super().__init__([[[p, 1 - p]] for p in self.causes], [leak, 1 - leak])
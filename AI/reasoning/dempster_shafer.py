@@ -0,0 +1,468 @@
+# Dempster-Shafer evidence over a frame of discernment, as bitmasks.
+#
+# A frame of n hypotheses has 2^n subsets; subset A is the integer whose bit
+# i is set when hypothesis i is in A, so a mass function is an array of 2^n
+# masses indexed by subset. All the set functions come from two transforms,
+# each n vectorized passes over the array (O(n 2^n) in all, rather than
+# O(4^n) for a loop over subsets and their subsets):
+#
+#   zeta over subsets     b(A) = sum of m(B) for B ⊆ A     (Bel, plus m(∅))
+#   zeta over supersets   Q(A) = sum of m(B) for B ⊇ A     (commonality)
+#
+# with the Möbius transforms as their inverses. Pl(A) = 1 - b(not A), and the
+# complement of subset A is subset 2^n - 1 - A: the array reversed.
+#
+# Dempster's rule is a product in commonality space: the unnormalized
+# combination of independent sources has Q = Q1 x Q2 x ... pointwise, so any
+# number of sources costs one transform each and one inverse. The mass the
+# product leaves on the empty set is the conflict K; the rest is divided by
+# 1 - K.
+#
+# SparseMassFunction keeps only the focal elements, as {bitmask: mass}, for
+# evidence with a few focal elements over frames too large to tabulate.
+# combine_sparse() combines many sources as a balanced tree of pairwise
+# combinations; each pair intersects every focal element of one with every
+# focal element of the other in NumPy blocks. workers > 1 splits the sources
+# into contiguous runs, reduces each run in a spawn-based process pool and
+# combines the runs' results in the parent. max_focal and min_mass
+# summarize each intermediate result: its lightest focal elements are merged
+# into one, their union - less specific but never wrong - and the mass moved
+# is turned into a bound on how far any Bel or Pl can be from the exact
+# answer. Merging only moves mass to supersets, and intersecting with another
+# source keeps it that way, so the tree tracks the total mass moved relative
+# to each node's unnormalized mass: a combination keeping 1 - K of it
+# stretches what was moved below by 1 / (1 - K). A summary made early in a
+# one-at-a-time fold passes through every later combination; in the tree it
+# passes through log2(sources) of them.
+
+import concurrent.futures
+import math
+import multiprocessing
+import re
+
+import numpy as np
+
+# Frames above this many hypotheses would need tables of more than 2^16
+# masses (512 KB each, and every transform copies one); larger frames go to
+# SparseMassFunction
+MAX_FRAME = 16
+# Masses this small after a Möbius transform are rounding noise
+EPS = 1e-12
+# Sparse combination intersects at most this many pairs of focal elements
+# at once
+PAIR_BLOCK = 1 << 20
+
+
+def zeta(values, supersets=False):
+    # Sums over subsets (or supersets) of every subset, for all at once
+    values = np.array(values, dtype=float)
+    for i in range(values.size.bit_length() - 1):
+        pairs = values.reshape(-1, 2, 1 << i)
+        if supersets:
+            pairs[:, 0] += pairs[:, 1]
+        else:
+            pairs[:, 1] += pairs[:, 0]
+    return values
+
+
+def mobius(values, supersets=False):
+    # The inverse of zeta()
+    values = np.array(values, dtype=float)
+    for i in range(values.size.bit_length() - 1):
+        pairs = values.reshape(-1, 2, 1 << i)
+        if supersets:
+            pairs[:, 0] -= pairs[:, 1]
+        else:
+            pairs[:, 1] -= pairs[:, 0]
+    return values
+
+
+class MassFunction:
+    def __init__(self, frame, values):
+        # frame: hypothesis names; values: the mass of every subset, indexed
+        # by bitmask, summing to 1 with none on the empty set
+        self.frame = _frame(frame)
+        values = np.asarray(values, dtype=float)
+        if values.shape != (1 << len(self.frame),):
+            raise ValueError(f"a frame of {len(self.frame)} needs {1 << len(self.frame)} masses, got {values.shape}")
+        if (values < -EPS).any():
+            raise ValueError("masses cannot be negative")
+        if abs(values[0]) > EPS:
+            raise ValueError("the empty set cannot have mass")
+        if abs(values.sum() - 1) > 1e-9:
+            raise ValueError(f"masses must sum to 1, got {values.sum():.6g}")
+        self.values = values
+        self._index = {name: i for i, name in enumerate(self.frame)}
+
+    @classmethod
+    def from_focal(cls, frame, focal):
+        # focal: {subset: mass}, a subset given as a bitmask or as names;
+        # mass left over goes to the whole frame (ignorance)
+        frame = _frame(frame)
+        values = np.zeros(1 << len(frame))
+        for mask, mass in _masses(frame, focal).items():
+            values[mask] = mass
+        return cls(frame, values)
+
+    @classmethod
+    def vacuous(cls, frame):
+        # Total ignorance: all mass on the frame
+        return cls.from_focal(frame, {})
+
+    def __repr__(self):
+        return f"MassFunction({len(self.frame)} hypotheses, {len(self.focal())} focal elements)"
+
+    def mask(self, names):
+        return _mask(names, self._index)
+
+    def names(self, mask):
+        return tuple(name for i, name in enumerate(self.frame) if mask >> i & 1)
+
+    def focal(self):
+        # (names, mass) of the subsets with mass, heaviest first
+        masks = np.flatnonzero(self.values > EPS)
+        order = np.argsort(-self.values[masks], kind="stable")
+        return [(self.names(int(m)), float(self.values[m])) for m in masks[order]]
+
+    def belief(self):
+        # Bel of every subset: the mass of its nonempty subsets
+        return zeta(self.values)
+
+    def plausibility(self):
+        # Pl of every subset: 1 - Bel of its complement
+        return 1 - self.belief()[::-1]
+
+    def commonality(self):
+        # Q of every subset: the mass of its supersets
+        return zeta(self.values, supersets=True)
+
+    def bel(self, names):
+        mask = self.mask(names)
+        return float(self.values[_submasks(mask)].sum())
+
+    def pl(self, names):
+        mask = self.mask(names)
+        return 1 - float(self.values[_submasks(~mask & (len(self.values) - 1))].sum())
+
+    def intervals(self):
+        # {hypothesis: (Bel, Pl)} for each hypothesis on its own: Bel is its
+        # singleton's mass, Pl its commonality
+        singletons = 1 << np.arange(len(self.frame))
+        pl = self.commonality()[singletons]
+        return {name: (float(self.values[s]), float(p)) for name, s, p in zip(self.frame, singletons, pl)}
+
+    def combine(self, *others):
+        # Dempster's rule with other sources: (combined, conflict K)
+        return combine([self, *others])
+
+
+def combine(sources):
+    # Combines independent mass functions over the same frame by Dempster's
+    # rule: returns (combined, conflict K)
+    sources = list(sources)
+    if not sources:
+        raise ValueError("nothing to combine")
+    frame = sources[0].frame
+    for source in sources[1:]:
+        if source.frame != frame:
+            raise ValueError("every source must use the same frame, in the same order")
+    product = sources[0].commonality()
+    for source in sources[1:]:
+        product *= source.commonality()
+    values = mobius(product, supersets=True)
+    values[np.abs(values) < EPS] = 0.0
+    conflict = min(max(float(values[0]), 0.0), 1.0)
+    if conflict > 1 - EPS:
+        raise ZeroDivisionError("the sources contradict each other completely (K = 1)")
+    values[0] = 0.0
+    values = np.clip(values, 0.0, None)
+    return MassFunction(frame, values / values.sum()), conflict
+
+
+class SparseMassFunction:
+    def __init__(self, frame, focal):
+        # frame: hypothesis names, any number; focal: {bitmask: mass} of the
+        # focal elements, summing to 1
+        self.frame = _frame(frame, limit=None)
+        whole = (1 << len(self.frame)) - 1
+        self.focal_masses = {}
+        for mask, mass in focal.items():
+            mask = int(mask)
+            if not 0 < mask <= whole:
+                raise ValueError(f"subset {mask:#x} is empty or outside the frame")
+            if mass < -EPS:
+                raise ValueError("masses cannot be negative")
+            if mass > EPS:
+                self.focal_masses[mask] = self.focal_masses.get(mask, 0.0) + float(mass)
+        total = sum(self.focal_masses.values())
+        if abs(total - 1) > 1e-9:
+            raise ValueError(f"masses must sum to 1, got {total:.6g}")
+        self._index = {name: i for i, name in enumerate(self.frame)}
+
+    @classmethod
+    def from_focal(cls, frame, focal):
+        # As MassFunction.from_focal(): subsets as bitmasks or names, the mass
+        # left over on the whole frame
+        frame = _frame(frame, limit=None)
+        return cls(frame, _masses(frame, focal))
+
+    @classmethod
+    def from_dense(cls, mass_function):
+        masks = np.flatnonzero(mass_function.values > EPS)
+        return cls(mass_function.frame, dict(zip(masks.tolist(), mass_function.values[masks].tolist())))
+
+    def __repr__(self):
+        return f"SparseMassFunction({len(self.frame)} hypotheses, {len(self)} focal elements)"
+
+    def __len__(self):
+        return len(self.focal_masses)
+
+    def dense(self):
+        values = np.zeros(1 << len(_frame(self.frame)))
+        values[list(self.focal_masses)] = list(self.focal_masses.values())
+        return MassFunction(self.frame, values)
+
+    def mask(self, names):
+        return _mask(names, self._index)
+
+    def names(self, mask):
+        return tuple(name for i, name in enumerate(self.frame) if mask >> i & 1)
+
+    def focal(self):
+        # (names, mass) of the focal elements, heaviest first
+        ranked = sorted(self.focal_masses.items(), key=lambda item: (-item[1], item[0]))
+        return [(self.names(mask), mass) for mask, mass in ranked]
+
+    def bel(self, names):
+        mask = self.mask(names)
+        return sum(mass for b, mass in self.focal_masses.items() if not b & ~mask)
+
+    def pl(self, names):
+        mask = self.mask(names)
+        return sum(mass for b, mass in self.focal_masses.items() if b & mask)
+
+    def intervals(self):
+        # {hypothesis: (Bel, Pl)} for each hypothesis on its own
+        bel, pl = [0.0] * len(self.frame), [0.0] * len(self.frame)
+        for mask, mass in self.focal_masses.items():
+            if not mask & (mask - 1):
+                bel[mask.bit_length() - 1] += mass
+            while mask:
+                low = mask & -mask
+                pl[low.bit_length() - 1] += mass
+                mask ^= low
+        return {name: (bel[i], pl[i]) for i, name in enumerate(self.frame)}
+
+    def summarize(self, max_focal=None, min_mass=0.0):
+        # Merges the lightest focal elements into their union: returns (the
+        # summary, the mass moved). No Bel or Pl changes by more than that.
+        masks, masses = _arrays(self)
+        masks, masses, moved = _summarize(masks, masses, max_focal, min_mass)
+        return SparseMassFunction(self.frame, dict(zip(masks.tolist(), masses.tolist()))), moved
+
+
+def combine_sparse(sources, max_focal=None, min_mass=0.0, workers=1):
+    # Dempster's rule over sparse sources, as a balanced reduction tree.
+    # Returns (combined, conflict K, error): with summarizing, every Bel and
+    # Pl of the result is within `error` of the exact combination's.
+    sources = list(sources)
+    if not sources:
+        raise ValueError("nothing to combine")
+    frame = sources[0].frame
+    for source in sources[1:]:
+        if source.frame != frame:
+            raise ValueError("every source must use the same frame, in the same order")
+    workers = max(1, min(workers, len(sources) // 2))
+    leaves = []
+    for source in sources:
+        masks, masses, moved = _summarize(*_arrays(source), max_focal, min_mass)
+        leaves.append((masks, masses, 0.0, moved))
+    if workers > 1:
+        runs = [(leaves[start:start + size], max_focal, min_mass)
+                for start, size in zip(np.cumsum([0] + _split(len(leaves), workers)), _split(len(leaves), workers))]
+        context = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(workers, mp_context=context) as pool:
+            leaves = list(pool.map(_reduce, *zip(*runs)))
+    masks, masses, log_kept, moved = _reduce(leaves, max_focal, min_mass)
+    combined = SparseMassFunction(frame, dict(zip(masks.tolist(), masses.tolist())))
+    # The exact 1 - K is at least the summary's less the mass moved, and no
+    # Bel or Pl moves by more than the moved mass over the exact 1 - K
+    error = min(moved / (1 - moved), 1.0) if moved < 1 else 1.0
+    return combined, max(0.0, -math.expm1(log_kept)), error
+
+
+def _arrays(mass_function):
+    # Focal masks and masses as arrays: uint64 masks up to 64 hypotheses,
+    # Python ints (object) above that
+    dtype = np.uint64 if len(mass_function.frame) <= 64 else object
+    masks = np.array(list(mass_function.focal_masses), dtype=dtype)
+    return masks, np.array(list(mass_function.focal_masses.values()))
+
+
+def _pair(a, b, max_focal, min_mass):
+    # Combines two tree nodes (masks, masses, log(1 - K), mass moved by
+    # summaries, as a fraction of the node's mass)
+    a_masks, a_masses, a_kept, a_moved = a
+    b_masks, b_masses, b_kept, b_moved = b
+    # Intersections are taken a block of rows at a time, so memory stays
+    # bounded by the number of distinct results rather than the product
+    rows = max(1, PAIR_BLOCK // len(b_masks))
+    blocks = []
+    for start in range(0, len(a_masks), rows):
+        masks, inverse = np.unique(np.bitwise_and.outer(a_masks[start:start + rows], b_masks).ravel(),
+                                   return_inverse=True)
+        blocks.append((masks, np.bincount(inverse.ravel(),
+                                          np.multiply.outer(a_masses[start:start + rows], b_masses).ravel())))
+    masks, masses = blocks[0]
+    if len(blocks) > 1:
+        masks, inverse = np.unique(np.concatenate([m for m, _ in blocks]), return_inverse=True)
+        masses = np.bincount(inverse.ravel(), np.concatenate([w for _, w in blocks]))
+    if masks[0] == 0:
+        masks, masses = masks[1:], masses[1:]
+    kept = masses.sum()
+    if kept <= EPS:
+        raise ZeroDivisionError("the sources contradict each other completely (K = 1)")
+    # Mass moved in either input moves at most that much of the product (what
+    # meets the other's empty set is empty either way); as a fraction of the
+    # kept mass it is stretched by 1 / (1 - K)
+    masks, masses, moved = _summarize(masks, masses / kept, max_focal, min_mass)
+    return masks, masses, a_kept + b_kept + math.log(kept), (a_moved + b_moved) / kept + moved
+
+
+def _summarize(masks, masses, max_focal, min_mass):
+    drop = masses < min_mass
+    if max_focal and np.count_nonzero(~drop) > max_focal:
+        order = np.argsort(-masses, kind="stable")
+        drop[order[max_focal - 1:]] = True
+    if not drop.any():
+        return masks, masses, 0.0
+    union = np.bitwise_or.reduce(masks[drop])
+    moved = float(masses[drop & (masks != union)].sum())
+    masks, masses = masks[~drop], masses[~drop]
+    same = np.flatnonzero(masks == union)
+    if same.size:
+        masses = masses.copy()
+        masses[same[0]] += 1 - masses.sum()
+    else:
+        masks = np.append(masks, np.array([union], dtype=masks.dtype))
+        masses = np.append(masses, 1 - masses.sum())
+    return masks, masses, moved
+
+
+def _reduce(nodes, max_focal, min_mass):
+    # Pairs neighbours level by level until one node is left
+    while len(nodes) > 1:
+        paired = [_pair(nodes[i], nodes[i + 1], max_focal, min_mass) for i in range(0, len(nodes) - 1, 2)]
+        nodes = paired + nodes[len(paired) * 2:]
+    return nodes[0]
+
+
+def _split(total, parts):
+    return [total // parts + (i < total % parts) for i in range(parts)]
+
+
+def _masses(frame, focal):
+    # {bitmask: mass} from subsets given as bitmasks or names, with what is
+    # left over on the whole frame
+    whole = (1 << len(frame)) - 1
+    index = {name: i for i, name in enumerate(frame)}
+    masses = {}
+    for subset, mass in focal.items():
+        mask = int(subset) if isinstance(subset, (int, np.integer)) else _mask(subset, index)
+        if not 0 < mask <= whole:
+            raise ValueError(f"subset {subset!r} is empty or outside the frame")
+        masses[mask] = masses.get(mask, 0.0) + mass
+    total = sum(masses.values())
+    if total > 1 + 1e-9:
+        raise ValueError(f"masses add up to {total:.6g}, more than 1")
+    if total < 1:
+        masses[whole] = masses.get(whole, 0.0) + 1 - total
+    return masses
+
+
+def _frame(frame, limit=MAX_FRAME):
+    frame = tuple(frame)
+    if not frame:
+        raise ValueError("the frame needs at least one hypothesis")
+    if len(set(frame)) != len(frame):
+        raise ValueError("the frame lists a hypothesis twice")
+    if limit and len(frame) > limit:
+        raise ValueError(f"frames are limited to {limit} hypotheses, got {len(frame)}; "
+                         "use SparseMassFunction for larger ones")
+    return frame
+
+
+def _mask(names, index):
+    if isinstance(names, str):
+        names = [names]
+    mask = 0
+    for name in names:
+        try:
+            mask |= 1 << index[name]
+        except KeyError:
+            raise KeyError(f"{name!r} is not in the frame; choose from {list(index)}") from None
+    return mask
+
+
+def _submasks(mask):
+    # Every nonempty subset of `mask`, as bitmasks
+    bits = [1 << i for i in range(mask.bit_length()) if mask >> i & 1]
+    subsets = np.zeros(1, dtype=np.int64)
+    for bit in bits:
+        subsets = np.concatenate([subsets, subsets | bit])
+    return subsets[1:]
+
+
+def parse_frame(text):
+    # Any number of hypotheses: parse_masses() goes sparse above MAX_FRAME
+    frame = [name.strip() for name in text.split(",") if name.strip()]
+    _frame(frame, limit=None)
+    return frame
+
+
+def parse_masses(text, frame):
+    # One focal element per line, "Flu, Cold: 0.6"; "Θ" or "*" is the whole
+    # frame. Whatever mass is left goes to the whole frame. A MassFunction,
+    # or a SparseMassFunction for frames above MAX_FRAME.
+    focal = {}
+    index = {name: i for i, name in enumerate(frame)}
+    for n, line in enumerate(text.splitlines(), 1):
+        line = line.split("#")[0].strip()
+        if not line:
+            continue
+        match = re.match(r"^\{?([^:=}]*)\}?\s*[:=]\s*(\d*\.?\d+)$", line)
+        if not match:
+            raise ValueError(f"line {n}: write 'Hypothesis, Hypothesis: mass', got {line!r}")
+        names = [name.strip() for name in match.group(1).split(",") if name.strip()]
+        try:
+            mask = (1 << len(frame)) - 1 if names in (["Θ"], ["*"]) else _mask(names, index)
+        except KeyError as error:
+            raise ValueError(f"line {n}: {error.args[0]}") from None
+        if not mask:
+            raise ValueError(f"line {n}: no hypotheses given")
+        focal[mask] = focal.get(mask, 0.0) + float(match.group(2))
+    if len(frame) > MAX_FRAME:
+        return SparseMassFunction.from_focal(frame, focal)
+    return MassFunction.from_focal(frame, focal)
+
+
+def random_sources(n_sources, n_hypotheses, focal=3, reliability=0.9, seed=None):
+    # Sensors watching one true hypothesis (H0): each puts random mass on
+    # `focal` random subsets of about a quarter of the frame that hold H0
+    # with probability `reliability`, and the rest on the whole frame. For
+    # benchmarks and scale tests.
+    rng = np.random.default_rng(seed)
+    frame = [f"H{i}" for i in range(n_hypotheses)]
+    members = rng.random((n_sources, focal, n_hypotheses)) < 0.25
+    members[:, :, 0] = rng.random((n_sources, focal)) < reliability
+    members[~members.any(axis=2), 0] = True
+    weights = rng.dirichlet(np.ones(focal + 1), n_sources)
+    bits = [1 << i for i in range(n_hypotheses)]
+    sources = []
+    for rows, row_weights in zip(members.tolist(), weights.tolist()):
+        focal_masses = {}
+        for row, weight in zip(rows, row_weights):
+            mask = sum(bit for bit, member in zip(bits, row) if member)
+            focal_masses[mask] = focal_masses.get(mask, 0.0) + weight
+        sources.append(SparseMassFunction.from_focal(frame, focal_masses))
+    return sources
@@ -0,0 +1,156 @@
+# d-separation and relevance for Bayesian networks.
+#
+# independence_index() precomputes, once per network version, every
+# variable's ancestors and descendants as bitsets (Python ints, one bit per
+# variable in topological order), so ancestral sets of any group of
+# variables are a few ORs.
+#
+# Independence queries use Shachter's Bayes-ball: a ball starts at the query
+# variables and bounces through the DAG - passing through unobserved chains
+# and forks, bouncing back up from observed colliders - marking each node it
+# reaches from a parent ("bottom") or from a child ("top"). Every node and
+# edge is handled at most twice, so one run is linear in the network size.
+# Unobserved nodes left without a bottom mark are d-separated from the query
+# given the evidence; nodes marked on top are the only ones whose CPTs
+# P(query | evidence) needs, so inference drops the rest (barren nodes and
+# irrelevant ones) before eliminating anything.
+#
+# A batch of queries with the same sources and evidence shares one run, and
+# runs are kept in an LRU cache, so large batches reduce to bit tests.
+
+import threading
+import weakref
+from collections import OrderedDict
+
+_indexes = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def independence_index(network):
+    # IndependenceIndex of `network`, built once per network version
+    with _indexes_lock:
+        index = _indexes.get(network)
+        if index is None or index.version != network.version:
+            index = IndependenceIndex(network)
+            _indexes[network] = index
+        return index
+
+
+class IndependenceIndex:
+    def __init__(self, network, cache_size=4096):
+        self.version = network.version
+        self.nodes = network.nodes  # topological: parents come first
+        self.position = {name: i for i, name in enumerate(self.nodes)}
+        self.parents = [[self.position[p] for p in network.parents[name]] for name in self.nodes]
+        self.children = [[] for _ in self.nodes]
+        for i, parents in enumerate(self.parents):
+            for p in parents:
+                self.children[p].append(i)
+
+        # Ancestor bitsets in topological order, descendants in reverse
+        self._ancestors = [0] * len(self.nodes)
+        for i, parents in enumerate(self.parents):
+            for p in parents:
+                self._ancestors[i] |= self._ancestors[p] | (1 << p)
+        self._descendants = [0] * len(self.nodes)
+        for i in reversed(range(len(self.nodes))):
+            for c in self.children[i]:
+                self._descendants[i] |= self._descendants[c] | (1 << c)
+
+        self.cache_size = cache_size
+        self._runs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"IndependenceIndex({len(self.nodes)} variables)"
+
+    def bits(self, names):
+        result = 0
+        for name in names:
+            try:
+                result |= 1 << self.position[name]
+            except KeyError:
+                raise KeyError(f"{name!r} is not in the network") from None
+        return result
+
+    def names(self, bits):
+        return [name for i, name in enumerate(self.nodes) if bits >> i & 1]
+
+    def ancestors(self, names):
+        # Strict ancestors of any of `names`
+        result = 0
+        for name in names:
+            result |= self._ancestors[self.position[name]]
+        return set(self.names(result))
+
+    def descendants(self, names):
+        result = 0
+        for name in names:
+            result |= self._descendants[self.position[name]]
+        return set(self.names(result))
+
+    def _ball(self, sources, observed):
+        # Bayes-ball from `sources` given `observed` (bitsets): returns the
+        # (top, bottom) mark bitsets
+        key = (sources, observed)
+        with self._lock:
+            marks = self._runs.get(key)
+            if marks is not None:
+                self._runs.move_to_end(key)
+                return marks
+
+        top = bottom = 0
+        # (node, came from a child?); sources start as if from a child
+        schedule = [(i, True) for i in range(len(self.nodes)) if sources >> i & 1]
+        while schedule:
+            j, from_child = schedule.pop()
+            bit = 1 << j
+            if not observed & bit and from_child:
+                # Unobserved, entered from below: passes up and down
+                if not top & bit:
+                    top |= bit
+                    schedule.extend((p, True) for p in self.parents[j])
+                if not bottom & bit:
+                    bottom |= bit
+                    schedule.extend((c, False) for c in self.children[j])
+            elif not from_child:
+                if observed & bit:
+                    # Observed collider: bounces back up to the parents
+                    if not top & bit:
+                        top |= bit
+                        schedule.extend((p, True) for p in self.parents[j])
+                elif not bottom & bit:
+                    # Unobserved, entered from above: passes on down
+                    bottom |= bit
+                    schedule.extend((c, False) for c in self.children[j])
+        marks = (top, bottom)
+        with self._lock:
+            self._runs[key] = marks
+            if len(self._runs) > self.cache_size:
+                self._runs.popitem(last=False)
+        return marks
+
+    def d_separated(self, xs, ys, given=()):
+        # True when every path between xs and ys is blocked by `given`
+        observed = self.bits(given)
+        targets = self.bits(ys) & ~observed
+        _, bottom = self._ball(self.bits(xs) & ~observed, observed)
+        return not bottom & targets
+
+    def independent(self, queries):
+        # Batch of (xs, ys, given) triples -> list of booleans; queries with
+        # the same xs and given share one Bayes-ball run
+        return [self.d_separated(xs, ys, given) for xs, ys, given in queries]
+
+    def requisite(self, query, evidence=()):
+        # Variables whose CPTs P(query | evidence) depends on
+        observed = self.bits(evidence)
+        top, _ = self._ball(self.bits(query) & ~observed, observed)
+        return set(self.names(top))
+
+    def ancestral(self, names):
+        # `names` with all their ancestors: the CPTs P(names) depends on
+        result = self.bits(names)
+        for name in names:
+            result |= self._ancestors[self.position[name]]
+        return set(self.names(result))
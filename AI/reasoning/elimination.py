@@ -0,0 +1,275 @@
+# Exact inference by variable elimination.
+#
+# The CPTs are reduced by the evidence, then every variable that is neither
+# queried nor observed is summed out in a greedy min-fill order: each step
+# multiplies the factors that mention the variable and sums it out in one
+# einsum call (reasoning.factor.sum_product).
+#
+# Before eliminating, the CPTs a query does not need are dropped: Bayes-ball
+# (reasoning.dseparation) keeps only the requisite ones, which leaves out
+# barren variables (unobserved, with no observed descendants) and those
+# d-separated from the query by the evidence.
+#
+# The min-fill order is computed once per set of observed variables over all
+# unobserved ones; a query eliminates in that order, skipping its own
+# variables and any that pruning removed. Queries under the same evidence
+# thus run the same early steps. On networks of more than FULL_ORDER_NODES
+# variables (loaded files, benchmarks) a whole-network order is too slow to
+# find, so each query orders just the CPTs it needs.
+#
+# Every factor carries a key describing how it was built: a reduced CPT is
+# (variable, evidence on its scope) and an intermediate factor is (eliminated
+# variable, keys of its inputs). Equal keys mean equal factors, so results
+# are kept in an LRU cache and reused by later queries that share evidence
+# and elimination steps - e.g. asking for each variable's posterior in turn
+# under the same evidence recomputes only what differs.
+#
+# MPE and partial-MAP queries run the same elimination with max in place of
+# sum for the variables being explained (max-product), after every other
+# variable has been summed out, keeping an argmax table per maximized
+# variable; a traceback in reverse order reads the best assignment off them.
+
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from reasoning.dseparation import independence_index
+from reasoning.factor import Factor, sum_product
+
+FULL_ORDER_NODES = 200
+
+
+def min_fill_order(scopes, eliminate, cards=None, then=()):
+    # Greedy elimination order over the interaction graph of `scopes`: each
+    # step picks the variable whose elimination adds the fewest new edges
+    # (ties: smallest resulting factor, then name, so orders are stable).
+    # Variables in `then` come after all of `eliminate` (MAP: sum first,
+    # then maximize).
+    graph = {}
+    for scope in scopes:
+        for v in scope:
+            graph.setdefault(v, set()).update(u for u in scope if u != v)
+    for v in list(eliminate) + list(then):
+        graph.setdefault(v, set())
+
+    def cost(v):
+        ns = list(graph[v])
+        fill = sum(1 for i, a in enumerate(ns) for b in ns[i + 1:] if b not in graph[a])
+        size = 1
+        if cards:
+            for u in ns:
+                size *= cards[u]
+        return fill, size, v
+
+    order = []
+    for stage in (eliminate, then):
+        costs = {v: cost(v) for v in stage}
+        while costs:
+            v = min(costs, key=costs.get)
+            del costs[v]
+            order.append(v)
+            ns = graph.pop(v)
+            for a in ns:
+                graph[a].discard(v)
+                graph[a].update(ns - {a})
+            # Only variables next to the new clique can change their cost
+            stale = set(ns)
+            for a in ns:
+                stale |= graph[a]
+            for u in stale:
+                if u in costs:
+                    costs[u] = cost(u)
+    return order
+
+
+class VariableElimination:
+    def __init__(self, network, cache_size=4096, prune=True):
+        self.network = network
+        self.cache_size = cache_size
+        self.prune = prune
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._orders = {}  # (observed, maximized, needed or None) -> min-fill order
+        self._version = network.version
+        self._lock = threading.Lock()
+
+    def _cached(self, key, build):
+        with self._lock:
+            if self._version != self.network.version:
+                self._cache.clear()
+                self._orders.clear()
+                self._version = self.network.version
+            factor = self._cache.get(key)
+            if factor is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return factor
+            self.misses += 1
+        factor = build()
+        with self._lock:
+            self._cache[key] = factor
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return factor
+
+    def _needed(self, variables, evidence):
+        # CPTs needed for P(variables | evidence), or for P(evidence)
+        if not self.prune:
+            return None
+        index = independence_index(self.network)
+        if variables:
+            return index.requisite(variables, evidence)
+        return index.ancestral(evidence)
+
+    def _reduced(self, evidence, needed=None):
+        # (key, CPT reduced by the evidence) for every needed variable
+        factors = []
+        for name, cpt in self.network.cpts.items():
+            if needed is not None and name not in needed:
+                continue
+            observed = tuple(sorted((v, evidence[v]) for v in cpt.variables if v in evidence))
+            key = (name, observed)
+            factors.append((key, self._cached(key, lambda cpt=cpt: cpt.reduce(evidence))))
+        return factors
+
+    def _sum_out(self, factors, variable):
+        touching = [(k, f) for k, f in factors if variable in f.variables]
+        if not touching:
+            return factors  # pruned away
+        factors = [(k, f) for k, f in factors if variable not in f.variables]
+        key = (variable, frozenset(k for k, _ in touching))
+        factors.append((key, self._cached(key, lambda: sum_product([f for _, f in touching], (variable,)))))
+        return factors
+
+    def _eliminate(self, variables, evidence, needed=None):
+        # Sums out every variable outside `variables` and the evidence;
+        # returns the remaining (unnormalized) factor over `variables`.
+        # Unless given, the needed CPTs are those of P(variables | evidence).
+        if needed is None:
+            needed = self._needed(variables, evidence)
+        factors = self._reduced(evidence, needed)
+        keep = set(variables)
+        for variable in self._order(evidence, needed=needed):
+            if variable not in keep:
+                factors = self._sum_out(factors, variable)
+        result = sum_product([f for _, f in factors], ())
+        return result.transpose(variables)
+
+    def _order(self, evidence, maximize=frozenset(), needed=None):
+        # Over the whole network, so every pruned subset can share it - or,
+        # on large networks, over the `needed` CPTs only
+        net = self.network
+        if needed is None or len(net.states) <= FULL_ORDER_NODES:
+            needed = None
+        key = (frozenset(evidence), maximize, None if needed is None else frozenset(needed))
+        order = self._orders.get(key)
+        if order is None:
+            names = net.states if needed is None else [v for v in net.states if v in needed]
+            scopes = [[v for v in net.cpts[name].variables if v not in evidence] for name in names]
+            variables = {v for scope in scopes for v in scope} | set(maximize)
+            summed = [v for v in net.states if v in variables and v not in maximize]
+            maximized = [v for v in net.states if v in maximize]
+            cards = {v: net.card(v) for v in variables}
+            order = min_fill_order(scopes, summed, cards, then=maximized)
+            self._orders[key] = order
+            if len(self._orders) > self.cache_size:
+                del self._orders[next(iter(self._orders))]
+        return order
+
+    def query(self, variables, evidence=None):
+        # Posterior P(variables | evidence) as a normalized Factor whose
+        # axes follow `variables`; evidence maps variables to state names
+        variables = tuple(variables)
+        evidence = self.network.evidence_indices(evidence)
+        overlap = [v for v in variables if v in evidence]
+        if overlap:
+            raise ValueError(f"{overlap} are both queried and observed")
+        return self._eliminate(variables, evidence).normalize()
+
+    def probability(self, evidence):
+        # P(evidence): the joint probability of the observed states
+        return math.exp(self.log_probability(evidence))
+
+    def log_probability(self, evidence):
+        # log P(evidence), which stays finite where P(evidence) underflows
+        return self._eliminate((), self.network.evidence_indices(evidence)).log_total()
+
+    def map(self, variables, evidence=None):
+        # Partial MAP: the most probable joint states of `variables` given
+        # the evidence, with every other variable summed out. Returns
+        # ({variable: state name}, P(those states | evidence)).
+        variables = tuple(variables)
+        net = self.network
+        evidence = net.evidence_indices(evidence)
+        overlap = [v for v in variables if v in evidence]
+        if overlap:
+            raise ValueError(f"{overlap} are both queried and observed")
+        maximize = frozenset(variables)
+
+        # Dropped CPTs are constant in the explained variables; P(evidence)
+        # is computed over the same CPTs, so the constants cancel below
+        needed = self._needed(variables, evidence)
+        factors = self._reduced(evidence, needed)
+        steps = []  # (variable, scope of its argmax table, argmax table)
+        for variable in self._order(evidence, maximize, needed):
+            if variable not in maximize:
+                factors = self._sum_out(factors, variable)
+                continue
+            touching = [(k, f) for k, f in factors if variable in f.variables]
+            factors = [(k, f) for k, f in factors if variable not in f.variables]
+            key = ("max", variable, frozenset(k for k, _ in touching))
+            factor, argmax = self._cached(key, lambda: _max_out([f for _, f in touching], variable))
+            factors.append((key, factor))
+            steps.append((variable, factor.variables, argmax))
+
+        # Everything is eliminated: what is left are scalars
+        log_joint = sum(f.log_total() for _, f in factors)
+        log_evidence = self._eliminate((), evidence, needed).log_total()
+        if not np.isfinite(log_evidence):
+            raise ZeroDivisionError("the evidence is impossible in this network")
+        assignment = {}
+        for variable, scope, argmax in reversed(steps):
+            assignment[variable] = int(argmax[tuple(assignment[v] for v in scope)])
+        states = {v: net.states[v][assignment[v]] for v in variables}
+        return states, math.exp(log_joint - log_evidence)
+
+    def mpe(self, evidence=None):
+        # Most probable explanation: MAP over every unobserved variable
+        unobserved = [v for v in self.network.states if not evidence or v not in evidence]
+        return self.map(unobserved, evidence)
+
+    def posteriors(self, evidence=None):
+        # {variable: {state: probability}} for every unobserved variable
+        net = self.network
+        result = {}
+        for name in net.states:
+            if evidence and name in evidence:
+                continue
+            marginal = self.query([name], evidence)
+            result[name] = dict(zip(net.states[name], marginal.values.tolist()))
+        return result
+
+
+def _max_out(factors, variable):
+    # Multiplies the factors and maximizes `variable` out; also returns the
+    # argmax table over the remaining variables
+    product = sum_product(factors, ())
+    axis = product.variables.index(variable)
+    kept = product.variables[:axis] + product.variables[axis + 1:]
+    return (Factor(kept, product.values.max(axis=axis), product.log_scale),
+            product.values.argmax(axis=axis))
+
+
+def brute_force_map(network, variables, evidence=None):
+    # Partial MAP by enumerating the full joint table: exponential in the
+    # number of variables, for checking and timing on small networks only
+    evidence = network.evidence_indices(evidence)
+    joint = sum_product([cpt.reduce(evidence) for cpt in network.cpts.values()], ())
+    others = [v for v in joint.variables if v not in variables]
+    table = joint.marginalize(others).transpose(variables)
+    best = np.unravel_index(int(table.values.argmax()), table.values.shape)
+    states = {v: network.states[v][i] for v, i in zip(variables, best)}
+    return states, float(table.values[best] / table.values.sum())
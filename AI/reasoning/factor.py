@@ -0,0 +1,118 @@
+# Array-backed factors: a tuple of variable names and a numpy array with one
+# axis per variable (axis length = number of states). Products and sums are
+# done with np.einsum, so combining factors never builds Python-level loops
+# over table rows.
+#
+# A factor's table is `values * exp(log_scale)`: every product or reduction
+# is rescaled so its largest entry is 1 and the scale moves to log_scale.
+# Long products of small probabilities (a chain of many observations)
+# therefore never underflow, and P(evidence) stays available as a log
+# probability.
+
+import numpy as np
+
+# np.einsum's sublist format accepts at most 52 distinct axes per call
+MAX_EINSUM_AXES = 52
+# ... and at most 63 operands
+MAX_EINSUM_OPERANDS = 63
+
+
+class Factor:
+    __slots__ = ("variables", "values", "log_scale")
+
+    def __init__(self, variables, values, log_scale=0.0):
+        self.variables = tuple(variables)
+        self.values = np.asarray(values, dtype=float)
+        self.log_scale = log_scale
+        if self.values.ndim != len(self.variables):
+            raise ValueError(f"factor over {self.variables} needs a {len(self.variables)}-d "
+                             f"array, got shape {self.values.shape}")
+
+    def __repr__(self):
+        return f"Factor({self.variables}, shape={self.values.shape})"
+
+    @property
+    def cards(self):
+        return self.values.shape
+
+    def reduce(self, evidence):
+        # Fixes the variables in `evidence` ({variable: state index}) and
+        # drops their axes
+        if not any(v in evidence for v in self.variables):
+            return self
+        index = tuple(evidence.get(v, slice(None)) for v in self.variables)
+        return _rescaled([v for v in self.variables if v not in evidence], self.values[index], self.log_scale)
+
+    def marginalize(self, variables):
+        # Sums the given variables out
+        axes = tuple(i for i, v in enumerate(self.variables) if v in variables)
+        kept = [v for v in self.variables if v not in variables]
+        return Factor(kept, self.values.sum(axis=axes), self.log_scale)
+
+    def normalize(self):
+        total = self.values.sum()
+        if total <= 0:
+            raise ZeroDivisionError(f"factor over {self.variables} sums to {total}")
+        return Factor(self.variables, self.values / total)
+
+    def log_total(self):
+        # log of the sum of the (scaled) table
+        with np.errstate(divide="ignore"):
+            return float(np.log(self.values.sum())) + self.log_scale
+
+    def transpose(self, variables):
+        variables = tuple(variables)
+        if variables == self.variables:
+            return self
+        order = [self.variables.index(v) for v in variables]
+        return Factor(variables, np.transpose(self.values, order), self.log_scale)
+
+    def __mul__(self, other):
+        return sum_product([self, other], ())
+
+
+def _einsum_args(factors, keep):
+    # Maps each variable to a small integer axis label for np.einsum
+    labels = {}
+    for factor in factors:
+        for variable in factor.variables:
+            labels.setdefault(variable, len(labels))
+    if len(labels) > MAX_EINSUM_AXES:
+        raise ValueError(f"{len(labels)} variables in one product; einsum supports "
+                         f"{MAX_EINSUM_AXES} (the elimination order is too wide)")
+    operands = []
+    for factor in factors:
+        operands.append(factor.values)
+        operands.append([labels[v] for v in factor.variables])
+    operands.append([labels[v] for v in keep])
+    return operands
+
+
+def sum_product(factors, eliminate):
+    # Multiplies the factors and sums the `eliminate` variables out, in one
+    # einsum call, then rescales the result to a peak of 1
+    keep = []
+    for factor in factors:
+        for variable in factor.variables:
+            if variable not in eliminate and variable not in keep:
+                keep.append(variable)
+    if not factors:
+        return Factor((), 1.0)
+    if len(factors) > MAX_EINSUM_OPERANDS:
+        # Multiply in groups first, smallest factors together (a long chain
+        # of observations leaves many scalars)
+        factors = sorted(factors, key=lambda f: f.values.size)
+        factors = [sum_product(factors[i:i + MAX_EINSUM_OPERANDS], ())
+                   for i in range(0, len(factors), MAX_EINSUM_OPERANDS)]
+        return sum_product(factors, eliminate)
+    values = np.einsum(*_einsum_args(factors, keep), optimize=len(factors) > 2)
+    return _rescaled(keep, values, sum(factor.log_scale for factor in factors))
+
+
+def _rescaled(variables, values, log_scale):
+    # Moves the peak of `values` into log_scale
+    peak = values.max() if np.size(values) else 0.0
+    if peak > 0 and peak != 1.0:
+        values = values / peak
+        log_scale += float(np.log(peak))
+    return Factor(variables, values, log_scale)
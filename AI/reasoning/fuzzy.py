@@ -0,0 +1,467 @@
+# Fuzzy inference, Mamdani and Sugeno, over whole batches of inputs.
+#
+# A FuzzyVariable has a range, discretized into a universe of evenly spaced
+# points, and named terms, each a membership function (Triangle, Trapezoid,
+# Gaussian) that maps any array of values to degrees in [0, 1]. Rules read
+#
+#   IF service IS poor OR food IS NOT delicious THEN tip IS cheap
+#   IF service IS good THEN tip = 5 + 1.5 * service          (Sugeno only)
+#
+# with the operators of the fuzzy logic page: AND is the minimum, OR the
+# maximum and NOT 1 - mu. AND binds tighter than OR; parentheses group.
+#
+# FuzzySystem.infer() takes arrays of crisp inputs (any shape, broadcast
+# together) and answers for all of them at once: every term's membership is
+# computed once per batch, every rule's firing strength is one array over the
+# batch, and the Python-level loops are over rules and output terms, never
+# inputs.
+#
+#   Mamdani  each output term is clipped at the strongest firing of its rules
+#            and the clipped sets are joined by max into one fuzzy set per
+#            input, a (batch, universe) array; defuzzify by its centroid (the
+#            centre of area) or its bisector (the point that splits the area
+#            in half, from a cumulative sum)
+#   Sugeno   each rule gives a crisp value - an output term's centroid, or a
+#            linear function of the inputs - and the answer is their average
+#            weighted by firing strength
+#
+# Inputs that no rule fires for have no answer (NaN).
+
+import re
+
+import numpy as np
+
+# Points in a variable's universe unless it says otherwise
+POINTS = 501
+# Mamdani batches are aggregated in blocks of at most this many cells
+# (inputs x universe points)
+BLOCK_CELLS = 1 << 22
+
+_NUMBER = r"-?\d*\.?\d+(?:[eE][-+]?\d+)?"
+_RULE = re.compile(r"^\s*IF\s+(.+?)\s+THEN\s+([A-Za-z_][\w-]*)\s*(?:IS\s+(\S+)|=\s*(.+?))\s*$", re.I)
+_TOKEN = re.compile(r"\s*(\(|\)|[^\s()]+)")
+_VARIABLE = re.compile(rf"^\s*([A-Za-z_][\w-]*)\s*\[\s*({_NUMBER})\s*,\s*({_NUMBER})\s*\]\s*(?::\s*(.*))?$")
+_TERM = re.compile(r"^\s*([A-Za-z_][\w-]*)\s*=\s*(triangle|trapezoid|gaussian)\s*\(([^()]*)\)\s*$", re.I)
+_LINEAR = re.compile(rf"\s*([-+]?)\s*({_NUMBER})?\s*\*?\s*([A-Za-z_][\w-]*)?\s*")
+
+
+class Trapezoid:
+    __slots__ = ("a", "b", "c", "d")
+
+    def __init__(self, a, b, c, d):
+        # Rises from a to b, is 1 from b to c and falls to d; a == b (or
+        # c == d) makes a shoulder
+        if not a <= b <= c <= d:
+            raise ValueError(f"trapezoid corners must be in order, got {a}, {b}, {c}, {d}")
+        self.a, self.b, self.c, self.d = float(a), float(b), float(c), float(d)
+
+    def __repr__(self):
+        return f"trapezoid({self.a:g}, {self.b:g}, {self.c:g}, {self.d:g})"
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        rise = np.clip((x - self.a) / (self.b - self.a), 0, 1) if self.b > self.a else (x >= self.a) * 1.0
+        fall = np.clip((self.d - x) / (self.d - self.c), 0, 1) if self.d > self.c else (x <= self.d) * 1.0
+        return np.minimum(rise, fall)
+
+
+class Triangle(Trapezoid):
+    __slots__ = ()
+
+    def __init__(self, a, b, c):
+        if not a <= b <= c:
+            raise ValueError(f"triangle corners must be in order, got {a}, {b}, {c}")
+        super().__init__(a, b, b, c)
+
+    def __repr__(self):
+        return f"triangle({self.a:g}, {self.b:g}, {self.d:g})"
+
+
+class Gaussian:
+    __slots__ = ("mean", "sigma")
+
+    def __init__(self, mean, sigma):
+        if sigma <= 0:
+            raise ValueError(f"a Gaussian's sigma must be positive, got {sigma}")
+        self.mean, self.sigma = float(mean), float(sigma)
+
+    def __repr__(self):
+        return f"gaussian({self.mean:g}, {self.sigma:g})"
+
+    def __call__(self, x):
+        return np.exp(-0.5 * ((np.asarray(x, dtype=float) - self.mean) / self.sigma) ** 2)
+
+
+SHAPES = {"triangle": Triangle, "trapezoid": Trapezoid, "gaussian": Gaussian}
+
+
+class FuzzyVariable:
+    def __init__(self, name, low, high, terms=None, points=POINTS):
+        # terms: {name: membership function}
+        if not low < high:
+            raise ValueError(f"{name!r} needs a range with low < high, got [{low}, {high}]")
+        self.name = name
+        self.low, self.high = float(low), float(high)
+        self.terms = dict(terms or {})
+        self.universe = np.linspace(self.low, self.high, points)
+
+    def __repr__(self):
+        terms = "; ".join(f"{term} = {shape!r}" for term, shape in self.terms.items())
+        return f"{self.name} [{self.low:g}, {self.high:g}]" + (f": {terms}" if terms else "")
+
+    def membership(self, term, x):
+        try:
+            shape = self.terms[term]
+        except KeyError:
+            raise KeyError(f"{self.name!r} has no term {term!r}; choose from {list(self.terms)}") from None
+        return shape(x)
+
+    def memberships(self, x):
+        # {term: degree of membership of x (an array of any shape)}
+        return {term: shape(x) for term, shape in self.terms.items()}
+
+    def centroid(self, term):
+        mu = self.membership(term, self.universe)
+        if not mu.sum():
+            raise ValueError(f"{self.name} IS {term} is empty over [{self.low:g}, {self.high:g}]")
+        return float(mu @ self.universe / mu.sum())
+
+
+def _parse_premise(text):
+    # "a IS x AND (b IS NOT y OR c IS z)" -> ("and", [("is", "a", "x"),
+    # ("or", [("not", ("is", "b", "y")), ("is", "c", "z")])])
+    tokens = _TOKEN.findall(text)
+    position = 0
+
+    def peek():
+        return tokens[position].upper() if position < len(tokens) else None
+
+    def take():
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def either():
+        terms = [both()]
+        while peek() == "OR":
+            take()
+            terms.append(both())
+        return terms[0] if len(terms) == 1 else ("or", terms)
+
+    def both():
+        terms = [single()]
+        while peek() == "AND":
+            take()
+            terms.append(single())
+        return terms[0] if len(terms) == 1 else ("and", terms)
+
+    def single():
+        token = peek()
+        if token == "NOT":
+            take()
+            return ("not", single())
+        if token == "(":
+            take()
+            inner = either()
+            if peek() != ")":
+                raise ValueError(f"missing ')' in {text!r}")
+            take()
+            return inner
+        if token is None or token in (")", "AND", "OR", "IS"):
+            raise ValueError(f"expected 'variable IS term' in {text!r}")
+        variable = take()
+        if peek() != "IS":
+            raise ValueError(f"expected IS after {variable!r} in {text!r}")
+        take()
+        negated = peek() == "NOT"
+        if negated:
+            take()
+        if peek() is None or peek() in ("(", ")", "AND", "OR", "IS", "NOT"):
+            raise ValueError(f"expected a term after '{variable} IS' in {text!r}")
+        atom = ("is", variable, take())
+        return ("not", atom) if negated else atom
+
+    premise = either()
+    if peek() is not None:
+        raise ValueError(f"unexpected {tokens[position]!r} in {text!r}")
+    return premise
+
+
+def _parse_linear(text):
+    # "5 + 1.5 * service - food" -> (5.0, {"service": 1.5, "food": -1.0})
+    constant, coefficients, position = 0.0, {}, 0
+    text = text.strip()
+    while position < len(text):
+        match = _LINEAR.match(text, position)
+        sign, number, variable = match.groups()
+        if match.end() == position or not (number or variable) or (position and not sign):
+            raise ValueError(f"write Sugeno outputs as 'c + a * x + ...', got {text!r}")
+        value = float(number or 1) * (-1 if sign == "-" else 1)
+        if variable:
+            coefficients[variable] = coefficients.get(variable, 0.0) + value
+        else:
+            constant += value
+        position = match.end()
+    if not position:
+        raise ValueError("the Sugeno output is empty")
+    return constant, coefficients
+
+
+def _premise_text(premise, nested=False):
+    if premise[0] == "is":
+        return f"{premise[1]} IS {premise[2]}"
+    if premise[0] == "not":
+        inner = premise[1]
+        if inner[0] == "is":
+            return f"{inner[1]} IS NOT {inner[2]}"
+        return f"NOT ({_premise_text(inner)})"
+    text = f" {premise[0].upper()} ".join(_premise_text(term, True) for term in premise[1])
+    return f"({text})" if nested else text
+
+
+def _atoms(premise):
+    if premise[0] == "is":
+        return {premise[1:]}
+    if premise[0] == "not":
+        return _atoms(premise[1])
+    return set().union(*(_atoms(term) for term in premise[1]))
+
+
+class FuzzyRule:
+    __slots__ = ("premise", "output", "term", "linear")
+
+    def __init__(self, premise, output, term=None, linear=None):
+        # premise: nested ("is", variable, term) / ("not", p) / ("and"|"or",
+        # [terms]) tuples; the consequent is an output term, or for Sugeno a
+        # (constant, {input: coefficient}) linear function
+        if (term is None) == (linear is None):
+            raise ValueError("a rule concludes either 'output IS term' or 'output = c + a * x'")
+        self.premise = premise
+        self.output = output
+        self.term = term
+        self.linear = linear
+
+    def __repr__(self):
+        if self.term is not None:
+            then = f"{self.output} IS {self.term}"
+        else:
+            constant, coefficients = self.linear
+            then = f"{self.output} = {constant:g}" + "".join(f" {'-' if c < 0 else '+'} {abs(c):g} * {v}"
+                                                             for v, c in coefficients.items())
+        return f"IF {_premise_text(self.premise)} THEN {then}"
+
+
+def _strength(premise, mu):
+    if premise[0] == "is":
+        return mu[premise[1:]]
+    if premise[0] == "not":
+        return 1 - _strength(premise[1], mu)
+    values = [_strength(term, mu) for term in premise[1]]
+    reduce = np.minimum if premise[0] == "and" else np.maximum
+    result = values[0]
+    for value in values[1:]:
+        result = reduce(result, value)
+    return result
+
+
+class FuzzySystem:
+    def __init__(self, inputs, output, rules):
+        self.inputs = {variable.name: variable for variable in inputs}
+        self.output = output
+        self.rules = list(rules)
+        if not self.rules:
+            raise ValueError("the rule base is empty")
+        for rule in self.rules:
+            if rule.output != output.name:
+                raise ValueError(f"rule '{rule}' concludes {rule.output!r}, but the output is {output.name!r}")
+            if rule.term is not None:
+                output.membership(rule.term, output.low)
+            for variable, term in _atoms(rule.premise):
+                if variable not in self.inputs:
+                    raise KeyError(f"rule '{rule}' reads {variable!r}, which is not an input")
+                self.inputs[variable].membership(term, 0.0)
+            for variable in (rule.linear or (0, {}))[1]:
+                if variable not in self.inputs:
+                    raise KeyError(f"rule '{rule}' reads {variable!r}, which is not an input")
+        self.sugeno_only = any(rule.term is None for rule in self.rules)
+
+    def __repr__(self):
+        return f"FuzzySystem({list(self.inputs)} -> {self.output.name}, {len(self.rules)} rules)"
+
+    def _batch(self, values):
+        # Broadcasts the inputs together and flattens them: ({name: 1-d
+        # array}, batch shape)
+        missing = set(self.inputs) - set(values)
+        if missing:
+            raise KeyError(f"no value given for {sorted(missing)}")
+        arrays = np.broadcast_arrays(*(np.asarray(values[name], dtype=float) for name in self.inputs))
+        shape = arrays[0].shape
+        return {name: array.ravel() for name, array in zip(self.inputs, arrays)}, shape
+
+    def strengths(self, values):
+        # Firing strength of every rule for every input: (rules, batch)
+        flat, shape = self._batch(values)
+        return self._strengths(flat).reshape((len(self.rules),) + shape)
+
+    def _strengths(self, flat):
+        atoms = set().union(*(_atoms(rule.premise) for rule in self.rules))
+        mu = {(variable, term): self.inputs[variable].membership(term, flat[variable]) for variable, term in atoms}
+        size = len(next(iter(flat.values())))
+        return np.array([np.broadcast_to(_strength(rule.premise, mu), (size,)) for rule in self.rules])
+
+    def _clips(self, strengths):
+        # {output term: the strongest firing of its rules}
+        clips = {}
+        for rule, strength in zip(self.rules, strengths):
+            clips[rule.term] = np.maximum(clips[rule.term], strength) if rule.term in clips else strength
+        return clips
+
+    def aggregate(self, values):
+        # Mamdani: the output fuzzy set for every input, (batch, universe)
+        flat, shape = self._batch(values)
+        return self._aggregate(self._strengths(flat)).reshape(shape + self.output.universe.shape)
+
+    def _aggregate(self, strengths):
+        if self.sugeno_only:
+            raise ValueError("rules with 'output = ...' conclusions need Sugeno inference")
+        universe = self.output.universe
+        result = np.zeros((strengths.shape[1], universe.size))
+        for term, clip in self._clips(strengths).items():
+            # Only the columns where the term has any membership
+            mu = self.output.membership(term, universe)
+            support = np.flatnonzero(mu)
+            if not support.size:
+                continue
+            columns = slice(support[0], support[-1] + 1)
+            np.maximum(result[:, columns], np.minimum(clip[:, None], mu[None, columns]), out=result[:, columns])
+        return result
+
+    def infer(self, values, method="mamdani", defuzzify="centroid"):
+        # Crisp outputs for a batch of crisp inputs ({input: array}), shaped
+        # like the broadcast inputs (a float for scalars)
+        flat, shape = self._batch(values)
+        size = len(next(iter(flat.values())))
+        if method == "sugeno":
+            result = self._sugeno(flat, self._strengths(flat))
+        elif method == "mamdani":
+            if defuzzify not in DEFUZZIFIERS:
+                raise ValueError(f"unknown defuzzification {defuzzify!r}; choose from {list(DEFUZZIFIERS)}")
+            rows = max(1, BLOCK_CELLS // self.output.universe.size)
+            result = np.empty(size)
+            for start in range(0, size, rows):
+                block = {name: array[start:start + rows] for name, array in flat.items()}
+                result[start:start + rows] = DEFUZZIFIERS[defuzzify](self._aggregate(self._strengths(block)),
+                                                                     self.output.universe)
+        else:
+            raise ValueError(f"unknown inference method {method!r}; choose 'mamdani' or 'sugeno'")
+        result = result.reshape(shape)
+        return float(result) if not shape else result
+
+    def _sugeno(self, flat, strengths):
+        outputs = np.empty_like(strengths)
+        centroids = {}
+        for i, rule in enumerate(self.rules):
+            if rule.term is not None:
+                if rule.term not in centroids:
+                    centroids[rule.term] = self.output.centroid(rule.term)
+                outputs[i] = centroids[rule.term]
+            else:
+                constant, coefficients = rule.linear
+                outputs[i] = constant
+                for variable, coefficient in coefficients.items():
+                    outputs[i] += coefficient * flat[variable]
+        total = strengths.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(total > 0, (strengths * outputs).sum(axis=0) / total, np.nan)
+
+
+def centroid(mu, universe):
+    # Centre of area of each row of mu over an evenly spaced universe
+    area = mu.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(area > 0, mu @ universe / area, np.nan)
+
+
+def bisector(mu, universe):
+    # The point splitting each row's area in half: where the running area
+    # first reaches half, interpolated within that step
+    cumulative = np.cumsum(mu, axis=1)
+    half = cumulative[:, -1] / 2
+    index = np.argmax(cumulative >= half[:, None], axis=1)
+    rows = np.arange(len(mu))
+    step = universe[1] - universe[0] if universe.size > 1 else 0.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        over = (cumulative[rows, index] - half) / mu[rows, index]
+        point = universe[index] + step * (0.5 - over)
+    return np.where(half > 0, np.clip(point, universe[0], universe[-1]), np.nan)
+
+
+DEFUZZIFIERS = {"centroid": centroid, "bisector": bisector}
+
+
+def parse_variable(text):
+    # "service [0, 10]: poor = gaussian(0, 1.5); good = triangle(2, 5, 8)"
+    match = _VARIABLE.match(text)
+    if not match:
+        raise ValueError(f"write variables as 'name [low, high]: term = triangle(a, b, c); ...', got {text.strip()!r}")
+    name, low, high, terms_text = match.groups()
+    terms = {}
+    for part in (terms_text or "").split(";"):
+        if not part.strip():
+            continue
+        term = _TERM.match(part)
+        if not term:
+            raise ValueError(f"write terms as 'name = triangle(a, b, c)', trapezoid(a, b, c, d) or "
+                             f"gaussian(mean, sigma), got {part.strip()!r}")
+        term_name, shape, arguments = term.groups()
+        if term_name in terms:
+            raise ValueError(f"{name} has two terms called {term_name!r}")
+        try:
+            numbers = [float(x) for x in arguments.split(",")]
+            terms[term_name] = SHAPES[shape.lower()](*numbers)
+        except TypeError:
+            raise ValueError(f"wrong number of corners in {part.strip()!r}") from None
+        except ValueError as error:
+            raise ValueError(f"{part.strip()!r}: {error}") from None
+    return FuzzyVariable(name, float(low), float(high), terms)
+
+
+def parse_rule(text):
+    # "IF a IS x AND b IS NOT y THEN out IS z", or "THEN out = 2 + 0.5 * a"
+    match = _RULE.match(text)
+    if not match:
+        raise ValueError(f"write rules as 'IF input IS term THEN output IS term', got {text.strip()!r}")
+    premise, output, term, linear = match.groups()
+    return FuzzyRule(_parse_premise(premise), output, term=term, linear=_parse_linear(linear) if linear else None)
+
+
+def parse_system(variables_text, rules_text):
+    # One variable per line and one rule per line (# starts a comment); the
+    # variable the rules conclude is the output, the others are inputs
+    variables = {}
+    for number, line in enumerate(variables_text.splitlines(), 1):
+        if line.strip() and not line.lstrip().startswith("#"):
+            try:
+                variable = parse_variable(line)
+            except ValueError as error:
+                raise ValueError(f"variables, line {number}: {error}") from None
+            if variable.name in variables:
+                raise ValueError(f"variables, line {number}: {variable.name!r} is defined twice")
+            variables[variable.name] = variable
+    rules = []
+    for number, line in enumerate(rules_text.splitlines(), 1):
+        if line.strip() and not line.lstrip().startswith("#"):
+            try:
+                rules.append(parse_rule(line))
+            except ValueError as error:
+                raise ValueError(f"rules, line {number}: {error}") from None
+    outputs = {rule.output for rule in rules}
+    if len(outputs) != 1:
+        raise ValueError(f"the rules must all conclude the same variable, got {sorted(outputs) or 'none'}")
+    output = outputs.pop()
+    if output not in variables:
+        raise ValueError(f"the output {output!r} is not defined")
+    try:
+        return FuzzySystem([v for name, v in variables.items() if name != output], variables[output], rules)
+    except KeyError as error:
+        raise ValueError(error.args[0]) from None
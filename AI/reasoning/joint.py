@@ -0,0 +1,284 @@
+# Joint distributions over a few discrete variables, stored whole.
+#
+# JointDistribution holds P(v1, ..., vn) as a dense N-d array with one axis
+# per variable or - when most cells are zero - sparsely, as the flat indices
+# of the nonzero cells (sorted) and their probabilities. Marginals are sums
+# over axes (dense) or bincounts of re-encoded cell indices (sparse);
+# conditioning takes a slice (dense) or masks the matching cells (sparse) and
+# renormalizes. No query loops over cells in Python, so tables with millions
+# of cells answer in milliseconds.
+#
+# ask() answers text queries: P(A=a, B=b | C=c) is a number, P(A | B, C) a
+# conditional table (a Factor over B, C, A), and A _|_ B | C an independence
+# test.
+
+import re
+
+import numpy as np
+
+from reasoning.factor import Factor
+
+# Tables with fewer nonzero cells than this are stored sparsely
+SPARSE_DENSITY = 0.1
+# Sparse marginals up to this many cells are built densely (one bincount)
+DENSE_CELLS = 1 << 22
+
+
+class JointDistribution:
+    def __init__(self, variables, values, sparse=None):
+        # variables: {name: states}; values: array shaped like the states,
+        # normalized here (counts are fine). sparse=None picks the storage
+        # by the share of nonzero cells
+        values = np.asarray(values, dtype=float)
+        self._setup(variables)
+        if values.shape != self.shape:
+            raise ValueError(f"joint table must have shape {self.shape}, got {values.shape}")
+        flat = values.ravel()
+        if sparse is None:
+            sparse = np.count_nonzero(flat) < SPARSE_DENSITY * flat.size
+        if sparse:
+            codes = np.flatnonzero(flat)
+            self._store(None, codes, flat[codes])
+        else:
+            self._store(values, None, None)
+
+    @classmethod
+    def from_cells(cls, variables, cells):
+        # cells: {(state of each variable, ...): weight}; the table is never
+        # allocated densely unless it is dense enough
+        joint = cls.__new__(cls)
+        joint._setup(variables)
+        index = [np.array([joint._index(v, cell[i]) for cell in cells], dtype=np.int64)
+                 for i, v in enumerate(joint.variables)]
+        codes = np.ravel_multi_index(index, joint.shape)
+        joint._from_codes(codes, np.fromiter(cells.values(), dtype=float, count=len(cells)))
+        return joint
+
+    @classmethod
+    def from_codes(cls, variables, codes, weights):
+        # Flat cell indices (C order) and their weights; repeats add up
+        joint = cls.__new__(cls)
+        joint._setup(variables)
+        joint._from_codes(np.asarray(codes, dtype=np.int64), np.asarray(weights, dtype=float))
+        return joint
+
+    def _setup(self, variables):
+        self.states = {name: tuple(states) for name, states in variables.items()}
+        self.variables = tuple(self.states)
+        self.shape = tuple(len(states) for states in self.states.values())
+        self.size = int(np.prod(self.shape, dtype=np.int64))
+        self._strides = [int(np.prod(self.shape[a + 1:], dtype=np.int64)) for a in range(len(self.shape))]
+
+    def _from_codes(self, codes, weights):
+        if len(codes) and (codes.min() < 0 or codes.max() >= self.size):
+            raise ValueError("cell index out of range")
+        if len(codes) >= SPARSE_DENSITY * self.size and self.size <= DENSE_CELLS:
+            self._store(np.bincount(codes, weights, minlength=self.size).reshape(self.shape), None, None)
+            return
+        codes, inverse = np.unique(codes, return_inverse=True)
+        weights = np.bincount(inverse, weights, minlength=len(codes))
+        keep = weights != 0
+        self._store(None, codes[keep], weights[keep])
+
+    def _store(self, dense, codes, weights):
+        total = dense.sum() if dense is not None else weights.sum()
+        if (dense < 0).any() if dense is not None else (weights < 0).any():
+            raise ValueError("probabilities cannot be negative")
+        if total <= 0:
+            raise ZeroDivisionError("the joint table sums to zero")
+        self._dense = None if dense is None else dense / total
+        self._codes = codes
+        self._weights = None if weights is None else weights / total
+
+    def __repr__(self):
+        kind = f"sparse, {self.nonzero:,} nonzero" if self.sparse else "dense"
+        return f"JointDistribution({', '.join(self.variables)}; {self.size:,} cells, {kind})"
+
+    @property
+    def sparse(self):
+        return self._dense is None
+
+    @property
+    def nonzero(self):
+        return len(self._codes) if self.sparse else int(np.count_nonzero(self._dense))
+
+    def dense(self):
+        if not self.sparse:
+            return self._dense
+        values = np.zeros(self.size)
+        values[self._codes] = self._weights
+        return values.reshape(self.shape)
+
+    def _axis(self, name):
+        try:
+            return self.variables.index(name)
+        except ValueError:
+            raise KeyError(f"{name!r} is not a variable; choose from {self.variables}") from None
+
+    def _index(self, name, state):
+        try:
+            return self.states[name].index(state)
+        except ValueError:
+            raise KeyError(f"{name!r} has no state {state!r}; choose from {self.states[name]}") from None
+
+    def _coordinates(self, axes):
+        # State indices of the nonzero cells along `axes` (sparse only)
+        return [self._codes // self._strides[a] % self.shape[a] for a in axes]
+
+    def marginal(self, names):
+        # P(names), with axes in the order given
+        names = tuple(names)
+        axes = [self._axis(n) for n in names]
+        variables = {n: self.states[n] for n in names}
+        if not self.sparse:
+            others = tuple(a for a in range(len(self.variables)) if a not in axes)
+            summed = self._dense.sum(axis=others)
+            kept = sorted(axes)
+            return JointDistribution(variables, np.transpose(summed, [kept.index(a) for a in axes]))
+        shape = tuple(self.shape[a] for a in axes)
+        codes = np.ravel_multi_index(self._coordinates(axes), shape) if axes else np.zeros_like(self._codes)
+        return JointDistribution.from_codes(variables, codes, self._weights)
+
+    def _matching(self, evidence):
+        # Dense: the sliced table; sparse: mask of the matching cells
+        if not self.sparse:
+            index = [slice(None)] * len(self.variables)
+            for name, state in evidence.items():
+                index[self._axis(name)] = self._index(name, state)
+            return self._dense[tuple(index)]
+        mask = np.ones(len(self._codes), dtype=bool)
+        axes = [self._axis(name) for name in evidence]
+        for coordinate, (name, state) in zip(self._coordinates(axes), evidence.items()):
+            mask &= coordinate == self._index(name, state)
+        return mask
+
+    def mass(self, evidence):
+        # P(evidence) for {name: state}
+        matching = self._matching(evidence)
+        return float(matching.sum() if not self.sparse else self._weights[matching].sum())
+
+    def condition(self, evidence):
+        # P(other variables | evidence), as a joint over the other variables
+        rest = [n for n in self.variables if n not in evidence]
+        variables = {n: self.states[n] for n in rest}
+        if self.mass(evidence) == 0:
+            raise ZeroDivisionError(f"P({_event(evidence)}) is zero")
+        matching = self._matching(evidence)
+        if not self.sparse:
+            return JointDistribution(variables, matching)
+        axes = [self._axis(n) for n in rest]
+        shape = tuple(self.shape[a] for a in axes)
+        coordinates = [c[matching] for c in self._coordinates(axes)]
+        codes = np.ravel_multi_index(coordinates, shape) if axes else np.zeros(int(matching.sum()), np.int64)
+        return JointDistribution.from_codes(variables, codes, self._weights[matching])
+
+    def probability(self, event, given=None):
+        # P(event | given) for {name: state} dicts
+        given = given or {}
+        for name, state in event.items():
+            if name in given and given[name] != state:
+                return 0.0
+        evidence = self.mass(given)
+        if evidence == 0:
+            raise ZeroDivisionError(f"P({_event(given)}) is zero")
+        return self.mass({**given, **event}) / evidence
+
+    def conditional(self, names, given=()):
+        # P(names | given) as a Factor over given + names whose entries sum
+        # to 1 for every configuration of `given` (nan where it is impossible)
+        names, given = tuple(names), tuple(given)
+        _distinct(names, given)
+        table = self.marginal(given + names).dense()
+        totals = table.sum(axis=tuple(range(len(given), len(given) + len(names))), keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return Factor(given + names, table / totals)
+
+    def independent(self, xs, ys, given=(), tol=1e-9):
+        # X _|_ Y | Z: P(x, y, z) P(z) = P(x, z) P(y, z) for every cell
+        xs, ys, given = tuple(xs), tuple(ys), tuple(given)
+        _distinct(xs, ys, given)
+        table = self.marginal(given + xs + ys).dense()
+        z_axes = tuple(range(len(given)))
+        x_axes = tuple(range(len(given), len(given) + len(xs)))
+        y_axes = tuple(range(len(given) + len(xs), table.ndim))
+        p_z = table.sum(axis=x_axes + y_axes, keepdims=True)
+        p_xz = table.sum(axis=y_axes, keepdims=True)
+        p_yz = table.sum(axis=x_axes, keepdims=True)
+        return bool(np.allclose(table * p_z, p_xz * p_yz, atol=tol, rtol=0))
+
+    def ask(self, text):
+        # "P(A=a | B=b)" -> float, "P(A | B)" -> Factor, "A _|_ B | C" -> bool
+        text = text.strip()
+        match = re.fullmatch(r"(.+?)\s*(?:_\|_|⫫)\s*(.+?)(?:\s*\|\s*(.+))?", text)
+        if match:
+            xs, ys, given = (_names(part) for part in match.groups(""))
+            return self.independent(xs, ys, given)
+        match = re.fullmatch(r"P\s*\(\s*(.+?)\s*(?:\|\s*(.*?)\s*)?\)", text)
+        if not match:
+            raise ValueError(f"cannot read {text!r}: ask P(A=a | B=b), P(A | B) or A _|_ B | C")
+        target, given = (_terms(part or "") for part in match.groups())
+        if not target:
+            raise ValueError("nothing to find the probability of")
+        for name, _ in target + given:
+            self._axis(name)
+        _distinct([n for n, _ in target], [n for n, _ in given])
+        if all(state is not None for _, state in target + given):
+            return self.probability(dict(target), dict(given))
+        if any(state is not None for _, state in target):
+            raise ValueError("give every variable before | a state, or none of them")
+        # Observed states are sliced out of the table over every given
+        # variable, so the rest stays conditioned on them
+        fixed = {n: s for n, s in given if s is not None}
+        if fixed and self.mass(fixed) == 0:
+            raise ZeroDivisionError(f"P({_event(fixed)}) is zero")
+        table = self.conditional([n for n, _ in target], [n for n, _ in given])
+        if fixed:
+            index = [self._index(v, fixed[v]) if v in fixed else slice(None) for v in table.variables]
+            table = Factor([v for v in table.variables if v not in fixed], table.values[tuple(index)])
+        return table
+
+
+def _distinct(*groups):
+    # A variable may appear once across a query
+    seen = set()
+    for name in (name for group in groups for name in group):
+        if name in seen:
+            raise ValueError(f"{name!r} appears more than once in the question")
+        seen.add(name)
+
+
+def _names(text):
+    return [part.strip() for part in text.split(",") if part.strip()]
+
+
+def _terms(text):
+    # "A=a, B" -> [("A", "a"), ("B", None)]
+    terms = []
+    for part in _names(text):
+        name, _, state = part.partition("=")
+        terms.append((name.strip(), state.strip() or None))
+    return terms
+
+
+def _event(evidence):
+    return ", ".join(f"{name}={state}" for name, state in evidence.items())
+
+
+def parse_variables(text):
+    # "Math: likes, dislikes; English: likes, dislikes" -> {name: states}
+    variables = {}
+    for part in text.split(";"):
+        if not part.strip():
+            continue
+        name, colon, states = part.partition(":")
+        name, states = name.strip(), _names(states)
+        if not colon or not name:
+            raise ValueError(f"write each variable as 'Name: state, state', got {part.strip()!r}")
+        if name in variables:
+            raise ValueError(f"{name!r} is defined twice")
+        if len(states) < 2 or len(set(states)) != len(states):
+            raise ValueError(f"{name!r} needs at least two different states")
+        variables[name] = states
+    if not variables:
+        raise ValueError("no variables given")
+    return variables
@@ -0,0 +1,262 @@
+# Compiled junction trees for repeated Bayesian network queries.
+#
+# compile_network() turns a network into a junction tree once: the moral
+# graph is triangulated with the min-fill order, its maximal cliques are
+# joined into a maximum-weight spanning tree over separator sizes, and every
+# CPT is multiplied into one clique's potential. Compiled trees are cached
+# per network (until the network changes), so every session shares them.
+#
+# Queries use Shafer-Shenoy message passing. Evidence multiplies an indicator
+# into the potential of each observed variable's home clique. The message
+# from clique i to j depends only on the evidence whose home clique lies on
+# i's side of the edge, so messages are cached under that part of the
+# evidence: a first query runs the usual two passes (collect to the root,
+# distribute back), and changing one observation afterwards only recomputes
+# the messages leaving that variable's side of the tree.
+
+import math
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+from reasoning.elimination import min_fill_order
+from reasoning.factor import Factor, sum_product
+
+_compiled = weakref.WeakKeyDictionary()
+_compiled_lock = threading.Lock()
+
+
+def compile_network(network):
+    # Junction tree of `network`, compiled once per network version
+    with _compiled_lock:
+        tree = _compiled.get(network)
+        if tree is None or tree.version != network.version:
+            tree = JunctionTree(network)
+            _compiled[network] = tree
+        return tree
+
+
+def _triangulate(network):
+    # Maximal cliques of the moral graph triangulated in min-fill order
+    scopes = [cpt.variables for cpt in network.cpts.values()]
+    cards = {v: network.card(v) for v in network.states}
+    graph = {v: set() for v in network.states}
+    for scope in scopes:
+        for v in scope:
+            graph[v].update(u for u in scope if u != v)
+
+    cliques = []
+    for v in min_fill_order(scopes, list(network.states), cards):
+        clique = frozenset(graph[v] | {v})
+        for a in graph[v]:
+            graph[a].discard(v)
+            graph[a].update(graph[v] - {a})
+        del graph[v]
+        if not any(clique <= other for other in cliques):
+            cliques.append(clique)
+    return cliques
+
+
+def _spanning_tree(cliques):
+    # Maximum-weight spanning tree (Kruskal) with separator sizes as weights;
+    # empty separators join disconnected parts of the network
+    parent = list(range(len(cliques)))
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    candidates = sorted(
+        ((len(cliques[i] & cliques[j]), i, j)
+         for i in range(len(cliques)) for j in range(i + 1, len(cliques))),
+        key=lambda edge: (-edge[0], edge[1], edge[2]),
+    )
+    edges = []
+    for _, i, j in candidates:
+        ri, rj = root(i), root(j)
+        if ri != rj:
+            parent[ri] = rj
+            edges.append((i, j))
+    return edges
+
+
+class JunctionTree:
+    def __init__(self, network, cache_size=8192):
+        self.network = network
+        self.version = network.version
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+        order = {v: i for i, v in enumerate(network.states)}
+        self.cliques = [tuple(sorted(c, key=order.get)) for c in _triangulate(network)]
+        self.neighbours = {i: [] for i in range(len(self.cliques))}
+        for i, j in _spanning_tree([frozenset(c) for c in self.cliques]):
+            self.neighbours[i].append(j)
+            self.neighbours[j].append(i)
+
+        # Each CPT goes to the smallest clique holding its scope; each
+        # variable's evidence goes to its home clique
+        factors = {i: [] for i in range(len(self.cliques))}
+        for cpt in network.cpts.values():
+            i = min((i for i, c in enumerate(self.cliques) if set(cpt.variables) <= set(c)),
+                    key=lambda i: len(self.cliques[i]))
+            factors[i].append(cpt)
+        self.home = {}
+        for v in network.states:
+            self.home[v] = min((i for i, c in enumerate(self.cliques) if v in c),
+                               key=lambda i: len(self.cliques[i]))
+        self.potentials = []
+        for i, clique in enumerate(self.cliques):
+            ones = Factor(clique, np.ones([network.card(v) for v in clique]))
+            self.potentials.append(sum_product([ones] + factors[i], ()).transpose(clique))
+
+        # Variables whose home clique is on i's side of the edge i -> j
+        homes = {}
+        for v, i in self.home.items():
+            homes.setdefault(i, []).append(v)
+        self._side = {(i, j): self._side_variables(i, j, homes)
+                      for i in self.neighbours for j in self.neighbours[i]}
+
+        # Collect order: (clique, its parent) edges, leaves first
+        self.root = max(range(len(self.cliques)), key=lambda i: len(self.neighbours[i]))
+        visit, seen, stack = [], {self.root}, [(self.root, None)]
+        while stack:
+            i, up = stack.pop()
+            visit.append((i, up))
+            for k in self.neighbours[i]:
+                if k not in seen:
+                    seen.add(k)
+                    stack.append((k, i))
+        self._collect = [(i, up) for i, up in reversed(visit) if up is not None]
+
+    def __repr__(self):
+        width = max(len(c) for c in self.cliques) - 1
+        return f"JunctionTree({len(self.cliques)} cliques, width {width})"
+
+    def _side_variables(self, i, j, homes):
+        side, stack, seen = set(), [i], {i, j}
+        while stack:
+            k = stack.pop()
+            side.update(homes.get(k, ()))
+            for n in self.neighbours[k]:
+                if n not in seen:
+                    seen.add(n)
+                    stack.append(n)
+        return frozenset(side)
+
+    def _cached(self, key, build):
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        value = build()
+        with self._lock:
+            self._cache[key] = value
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return value
+
+    def _potential(self, i, evidence):
+        observed = tuple(sorted((v, s) for v, s in evidence.items() if self.home[v] == i))
+        if not observed:
+            return self.potentials[i]
+
+        def build():
+            potential = self.potentials[i]
+            values = potential.values.copy()
+            for v, state in observed:
+                axis = potential.variables.index(v)
+                mask = np.zeros(values.shape[axis])
+                mask[state] = 1.0
+                shape = [1] * values.ndim
+                shape[axis] = -1
+                values *= mask.reshape(shape)
+            return Factor(potential.variables, values, potential.log_scale)
+
+        return self._cached(("potential", i, observed), build)
+
+    def _message(self, i, j, evidence):
+        side = self._side[i, j]
+        key = ("message", i, j, tuple(sorted((v, s) for v, s in evidence.items() if v in side)))
+
+        def build():
+            separator = tuple(v for v in self.cliques[i] if v in self.cliques[j])
+            factors = [self._potential(i, evidence)]
+            factors += [self._message(k, i, evidence) for k in self.neighbours[i] if k != j]
+            eliminate = tuple(v for v in self.cliques[i] if v not in separator)
+            return sum_product(factors, eliminate).transpose(separator)
+
+        return self._cached(key, build)
+
+    def propagate(self, evidence=None):
+        # The two passes: collect towards the root, then distribute back.
+        # Cached messages whose side of the tree saw no evidence change are
+        # reused as they are.
+        evidence = self._collect_pass(evidence)
+        for i, up in reversed(self._collect):
+            self._message(up, i, evidence)
+        return evidence
+
+    def _collect_pass(self, evidence):
+        # Messages towards the root, leaves first, so building one never
+        # recurses deeper than one clique (long chains would overflow the
+        # stack otherwise)
+        evidence = self.network.evidence_indices(evidence)
+        for i, up in self._collect:
+            self._message(i, up, evidence)
+        return evidence
+
+    def _belief(self, i, evidence):
+        factors = [self._potential(i, evidence)]
+        factors += [self._message(k, i, evidence) for k in self.neighbours[i]]
+        return sum_product(factors, ()).transpose(self.cliques[i])
+
+    def marginals(self, evidence=None):
+        # {variable: {state: probability}} for every unobserved variable
+        evidence = self.propagate(evidence)
+        beliefs = {}
+        result = {}
+        for v in self.network.states:
+            if v in evidence:
+                continue
+            i = self.home[v]
+            if i not in beliefs:
+                beliefs[i] = self._belief(i, evidence)
+            marginal = beliefs[i].marginalize([u for u in self.cliques[i] if u != v]).normalize()
+            result[v] = dict(zip(self.network.states[v], marginal.values.tolist()))
+        return result
+
+    def query(self, variables, evidence=None):
+        # Joint posterior of variables that share a clique, as a Factor
+        # (use VariableElimination for arbitrary sets)
+        variables = tuple(variables)
+        evidence = self.propagate(evidence)
+        overlap = [v for v in variables if v in evidence]
+        if overlap:
+            raise ValueError(f"{overlap} are both queried and observed")
+        holders = [i for i, c in enumerate(self.cliques) if set(variables) <= set(c)]
+        if not holders:
+            raise ValueError(f"{variables} are not in one clique; use VariableElimination")
+        i = min(holders, key=lambda i: len(self.cliques[i]))
+        belief = self._belief(i, evidence)
+        rest = [v for v in self.cliques[i] if v not in variables]
+        return belief.marginalize(rest).transpose(variables).normalize()
+
+    def probability(self, evidence):
+        # P(evidence)
+        return math.exp(self.log_probability(evidence))
+
+    def log_probability(self, evidence):
+        # log P(evidence), which stays finite where P(evidence) underflows
+        evidence = self._collect_pass(evidence)
+        return self._belief(self.root, evidence).log_total()
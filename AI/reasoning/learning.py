@@ -0,0 +1,99 @@
+# Learning a network's CPTs from observations by counting.
+#
+# CPTLearner keeps one integer count array per variable, over (parent
+# states..., state), for a fixed DAG. update() adds a chunk of rows: every
+# variable's family is encoded as one mixed-radix integer per row and counted
+# with np.bincount - a vectorized group-by. read_csv() streams a file through
+# pandas.read_csv in chunks parsed straight into categorical codes, so memory
+# is bounded by the chunk size however large the file is. Counts only ever
+# add up, so more rows (another chunk, another file) update the CPTs
+# incrementally.
+#
+# Laplace smoothing is applied when the CPTs are read, so it can be changed
+# without counting again. Rows with a missing or unknown value in a family
+# are skipped for that family only.
+
+import numpy as np
+import pandas as pd
+
+from reasoning.bayesnet import BayesianNetwork
+from reasoning.sampling import forward_samples
+
+CHUNK_ROWS = 100_000
+
+
+def _strides(shape):
+    strides, step = [], 1
+    for m in reversed(shape):
+        strides.insert(0, step)
+        step *= m
+    return strides
+
+
+def _codes(column, states):
+    # State indices of a column of state names; -1 for missing or unknown
+    if isinstance(column.dtype, pd.CategoricalDtype) and list(column.cat.categories) == list(states):
+        return column.cat.codes.to_numpy()
+    values = column.astype(str)
+    return pd.Categorical(values.where(values.isin(states)), categories=states).codes
+
+
+class CPTLearner:
+    def __init__(self, network):
+        # Only the network's variables, states and parents are used
+        self.states = dict(network.states)
+        self.parents = dict(network.parents)
+        self.counts = {
+            name: np.zeros([len(self.states[p]) for p in self.parents[name]] + [len(states)], dtype=np.int64)
+            for name, states in self.states.items()
+        }
+        self.skipped = dict.fromkeys(self.states, 0)
+        self.rows = 0
+
+    def __repr__(self):
+        return f"CPTLearner({len(self.states)} variables, {self.rows:,} rows)"
+
+    def update(self, frame):
+        # Adds a DataFrame with one column of state names per variable
+        codes = {name: _codes(frame[name], states) for name, states in self.states.items()}
+        for name, counts in self.counts.items():
+            family = self.parents[name] + (name,)
+            code = np.zeros(len(frame), dtype=np.int64)
+            valid = np.ones(len(frame), dtype=bool)
+            for variable, stride in zip(family, _strides(counts.shape)):
+                valid &= codes[variable] >= 0
+                code += codes[variable].astype(np.int64) * stride
+            counts += np.bincount(code[valid], minlength=counts.size).reshape(counts.shape)
+            self.skipped[name] += int(len(frame) - valid.sum())
+        self.rows += len(frame)
+        return self
+
+    def read_csv(self, source, chunk_rows=CHUNK_ROWS):
+        # Streams a CSV (path or file object) with a header naming the
+        # variables; other columns are ignored
+        dtype = {name: pd.CategoricalDtype(states) for name, states in self.states.items()}
+        for chunk in pd.read_csv(source, usecols=list(self.states), dtype=dtype, chunksize=chunk_rows):
+            self.update(chunk)
+        return self
+
+    def cpt(self, name, smoothing=1.0):
+        # (counts + smoothing) normalized per parent configuration; rows with
+        # neither data nor smoothing stay uniform
+        counts = self.counts[name] + smoothing
+        totals = counts.sum(axis=-1, keepdims=True)
+        uniform = np.full(counts.shape, 1 / counts.shape[-1])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(totals > 0, counts / totals, uniform)
+
+    def network(self, smoothing=1.0):
+        # A new network with the same DAG and the learned CPTs
+        net = BayesianNetwork()
+        for name, states in self.states.items():
+            net.add_node(name, states, self.parents[name], self.cpt(name, smoothing))
+        return net
+
+
+def sample_frame(network, n, seed=None):
+    # n rows of state names drawn from `network`: data to learn from
+    values, _ = forward_samples(network, n, np.random.default_rng(seed))
+    return pd.DataFrame({name: np.asarray(states)[values[name]] for name, states in network.states.items()})
@@ -0,0 +1,415 @@
+# Reading and writing Bayesian networks in the usual interchange formats.
+#
+#   .bif          the Bayesian Interchange Format (bnlearn's repository)
+#   .xml, .xmlbif XMLBIF 0.3 (Weka, JavaBayes, pgmpy)
+#   .json         {"nodes": [{"name", "states", "parents", "cpt"}, ...]}
+#   .jsonl        one such node object per line
+#
+# Every reader streams: BIF is read one block at a time, XMLBIF with
+# iterparse (elements are dropped once read), JSON one node object at a time
+# with raw_decode - so only the parsed numbers of a file are ever held, not
+# its text. CPT numbers are in C order over (parents..., variable), as in
+# all three formats (the variable's states change fastest, then the last
+# parent's).
+#
+# A parsed network is compiled to a handful of flat arrays (names, state
+# names, parent indices, every CPT's numbers back to back). load_network()
+# keeps that form in an .npz file named after the SHA-256 of the source, so
+# loading the same file again skips parsing; CPTs are views into the flat
+# array. Only files on disk are cached: bytes (an upload) are parsed every
+# time, so visitors cannot fill the cache directory.
+
+import hashlib
+import heapq
+import io
+import json
+import math
+import os
+import re
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+from reasoning.bayesnet import BayesianNetwork
+
+FORMATS = {".bif": "bif", ".xml": "xmlbif", ".xmlbif": "xmlbif", ".json": "json", ".jsonl": "jsonl"}
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ai-study-guide", "networks")
+# Part of every cache key: bump when the compiled layout changes
+COMPILED_VERSION = b"1"
+READ_BYTES = 1 << 20
+
+
+def file_format(name):
+    # "bif", "xmlbif", "json" or "jsonl", from a file name's extension
+    ext = os.path.splitext(name)[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"unknown network file type {ext!r}; use one of {', '.join(FORMATS)}")
+    return FORMATS[ext]
+
+
+# Each reader yields ("variable", name, states) and ("cpt", name, parents,
+# values, rows) items: values is a flat array in C order, or None when the
+# CPT is given as rows - a list of (parent states, values) - instead.
+
+
+def _numbers(text):
+    return np.array(text.replace(",", " ").split(), dtype=float)
+
+
+def _bif_blocks(text_file):
+    # Top-level `keyword ... { ... }` blocks, one at a time, comments removed
+    block, depth = [], 0
+    in_comment = False
+    for line in text_file:
+        if in_comment or "/*" in line:
+            line, in_comment = _strip_block_comment(line, in_comment)
+        line = line.split("//", 1)[0]
+        start = 0
+        for brace in _BRACES.finditer(line):
+            depth += 1 if brace.group() == "{" else -1
+            if depth == 0:
+                block.append(line[start:brace.end()])
+                yield " ".join(block)
+                block, start = [], brace.end()
+            elif depth < 0:
+                raise ValueError("unbalanced '}'")
+        if line[start:].strip():
+            block.append(line[start:])
+    if "".join(block).strip():
+        raise ValueError("the file ends inside a block")
+
+
+def _strip_block_comment(line, in_comment):
+    kept = []
+    while line:
+        if in_comment:
+            end = line.find("*/")
+            if end < 0:
+                return "".join(kept), True
+            line, in_comment = line[end + 2:], False
+        else:
+            start = line.find("/*")
+            if start < 0:
+                kept.append(line)
+                break
+            kept.append(line[:start])
+            line, in_comment = line[start + 2:], True
+    return "".join(kept), in_comment
+
+
+_BRACES = re.compile(r"[{}]")
+_BIF_VARIABLE = re.compile(r"variable\s+(\S+?)\s*\{.*?type\s+discrete\s*\[\s*\d+\s*\]\s*\{(.*?)\}", re.S)
+_BIF_PROBABILITY = re.compile(r"probability\s*\(\s*([^|)]+?)\s*(?:\|\s*([^)]*?))?\s*\)\s*\{(.*)\}", re.S)
+
+
+def _read_bif(text_file):
+    for block in _bif_blocks(text_file):
+        keyword = block.split(None, 1)[0]
+        if keyword == "variable":
+            match = _BIF_VARIABLE.match(block.strip())
+            if not match:
+                raise ValueError(f"cannot read the variable block {block.strip()[:60]!r}")
+            yield "variable", match.group(1), [s.strip() for s in match.group(2).split(",") if s.strip()]
+        elif keyword == "probability":
+            match = _BIF_PROBABILITY.match(block.strip())
+            if not match:
+                raise ValueError(f"cannot read the probability block {block.strip()[:60]!r}")
+            name, given, body = match.groups()
+            parents = [p.strip() for p in (given or "").split(",") if p.strip()]
+            values, rows = None, []
+            for entry in body.split(";"):
+                entry = entry.strip()
+                if entry.startswith("table"):
+                    values = _numbers(entry[len("table"):])
+                elif entry.startswith("("):
+                    states, _, numbers = entry[1:].partition(")")
+                    rows.append(([s.strip() for s in states.split(",")], _numbers(numbers)))
+                elif entry.startswith("default"):
+                    raise ValueError(f"CPT of {name!r}: 'default' entries are not supported")
+            yield "cpt", name, parents, values, rows
+        elif keyword != "network":
+            raise ValueError(f"unknown BIF block {keyword!r}")
+
+
+def _read_xmlbif(binary_file):
+    for _, element in ET.iterparse(binary_file, events=("end",)):
+        if element.tag == "VARIABLE":
+            yield "variable", element.findtext("NAME").strip(), [o.text.strip() for o in element.iter("OUTCOME")]
+            element.clear()
+        elif element.tag in ("DEFINITION", "PROBABILITY"):
+            yield ("cpt", element.findtext("FOR").strip(), [g.text.strip() for g in element.iter("GIVEN")],
+                   _numbers(element.findtext("TABLE")), [])
+            element.clear()
+
+
+def _node_items(node):
+    yield "variable", node["name"], node["states"]
+    yield "cpt", node["name"], node.get("parents", []), np.asarray(node["cpt"], dtype=float).ravel(), []
+
+
+def _read_jsonl(text_file):
+    for line in text_file:
+        if line.strip():
+            yield from _node_items(json.loads(line))
+
+
+def _read_json(text_file):
+    # The objects of the "nodes" array (or of a top-level array), decoded one
+    # at a time from a rolling buffer
+    decoder = json.JSONDecoder()
+    buffer, position = "", None
+    while position is None:
+        chunk = text_file.read(READ_BYTES)
+        buffer += chunk
+        stripped = buffer.lstrip()
+        if stripped.startswith("["):
+            position = len(buffer) - len(stripped) + 1
+        else:
+            match = re.search(r'"nodes"\s*:\s*\[', buffer)
+            if match:
+                position = match.end()
+            elif not chunk:
+                raise ValueError('expected a list of nodes or an object with a "nodes" list')
+    while True:
+        while True:
+            # Skip separators; stop at the end of the array
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position < len(buffer):
+                break
+            buffer, position = text_file.read(READ_BYTES), 0
+            if not buffer:
+                raise ValueError("the file ends inside the nodes list")
+        if buffer[position] == "]":
+            return
+        try:
+            node, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            chunk = text_file.read(READ_BYTES)
+            if not chunk:
+                raise
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+        yield from _node_items(node)
+        position = end
+
+
+def _items(source, fmt):
+    # source: a binary file object
+    if fmt == "xmlbif":
+        return _read_xmlbif(source)
+    text_file = io.TextIOWrapper(source, encoding="utf-8")
+    return {"bif": _read_bif, "json": _read_json, "jsonl": _read_jsonl}[fmt](text_file)
+
+
+def _compile(items):
+    # Reader items -> the compiled arrays, variables in topological order
+    states, cpts = {}, {}
+    for item in items:
+        if item[0] == "variable":
+            if item[1] in states:
+                raise ValueError(f"{item[1]!r} is defined twice")
+            states[item[1]] = list(item[2])
+        else:
+            cpts[item[1]] = item[2:]
+    for name in cpts:
+        if name not in states:
+            raise ValueError(f"CPT for the undefined variable {name!r}")
+    missing = [name for name in states if name not in cpts]
+    if missing:
+        raise ValueError(f"no CPT for {', '.join(missing[:5])}")
+
+    parents = {name: cpts[name][0] for name in states}
+    for name, ps in parents.items():
+        for p in ps:
+            if p not in states:
+                raise ValueError(f"unknown parent {p!r} of {name!r}")
+    order = _topological(parents)
+    if len(order) != len(states):
+        raise ValueError("the network has a cycle")
+
+    index = {name: i for i, name in enumerate(order)}
+    tables = []
+    for name in order:
+        given, values, rows = cpts[name]
+        shape = [len(states[p]) for p in given] + [len(states[name])]
+        if values is None:
+            table = np.full(shape, np.nan)
+            for parent_states, row in rows:
+                try:
+                    at = tuple(states[p].index(s) for p, s in zip(given, parent_states))
+                except ValueError:
+                    raise ValueError(f"CPT of {name!r}: unknown parent states {parent_states}") from None
+                table[at] = row
+            if np.isnan(table).any():
+                raise ValueError(f"CPT of {name!r} is missing rows")
+            values = table.ravel()
+        if values.size != math.prod(shape):
+            raise ValueError(f"CPT of {name!r} has {values.size} numbers, expected {math.prod(shape)}")
+        tables.append(values)
+    compiled = {
+        "names": np.array(order),
+        "cards": np.array([len(states[n]) for n in order], dtype=np.int32),
+        "states": np.array([s for n in order for s in states[n]]),
+        "parent_counts": np.array([len(cpts[n][0]) for n in order], dtype=np.int32),
+        "parents": np.array([index[p] for n in order for p in cpts[n][0]], dtype=np.int32),
+        "values": np.concatenate(tables) if tables else np.empty(0),
+    }
+    _check_rows(compiled, [t.size for t in tables])
+    return compiled
+
+
+def _check_rows(compiled, sizes):
+    # Every CPT row of every variable sums to 1, checked in one pass
+    cards = compiled["cards"]
+    values = compiled["values"]
+    rows = np.asarray(sizes, dtype=np.int64) // cards
+    row_of_value = np.repeat(np.arange(rows.sum()), np.repeat(cards, rows))
+    sums = np.bincount(row_of_value, values, minlength=int(rows.sum()))
+    bad = (np.abs(sums - 1) > 1e-6) | (np.bincount(row_of_value, values < 0, minlength=len(sums)) > 0)
+    if bad.any():
+        variable = np.searchsorted(np.cumsum(rows), np.flatnonzero(bad)[0], side="right")
+        raise ValueError(f"CPT rows of {str(compiled['names'][variable])!r} must be distributions (sum to 1)")
+
+
+def _topological(parents):
+    # Parents before children, otherwise in the file's order; shorter than
+    # `parents` when there is a cycle
+    names = list(parents)
+    position = {name: i for i, name in enumerate(names)}
+    remaining = {name: len(ps) for name, ps in parents.items()}
+    children = {name: [] for name in names}
+    for name, ps in parents.items():
+        for p in ps:
+            children[p].append(name)
+    heap = [position[name] for name, count in remaining.items() if not count]
+    heapq.heapify(heap)
+    order = []
+    while heap:
+        name = names[heapq.heappop(heap)]
+        order.append(name)
+        for child in children[name]:
+            remaining[child] -= 1
+            if not remaining[child]:
+                heapq.heappush(heap, position[child])
+    return order
+
+
+def _network(compiled):
+    # The compiled arrays -> a BayesianNetwork whose CPTs view `values`;
+    # the rows were checked when they were compiled
+    names = compiled["names"].tolist()
+    cards = compiled["cards"].tolist()
+    state_names = compiled["states"].tolist()
+    parent_index = compiled["parents"].tolist()
+    values = compiled["values"]
+    net = BayesianNetwork()
+    state_at = value_at = parent_at = 0
+    for name, card, count in zip(names, cards, compiled["parent_counts"].tolist()):
+        parents = [names[i] for i in parent_index[parent_at:parent_at + count]]
+        shape = [cards[i] for i in parent_index[parent_at:parent_at + count]] + [card]
+        size = math.prod(shape)
+        net.add_node(name, state_names[state_at:state_at + card], parents,
+                     values[value_at:value_at + size].reshape(shape), check=False)
+        state_at, value_at, parent_at = state_at + card, value_at + size, parent_at + count
+    return net
+
+
+def file_digest(source):
+    # SHA-256 of a path's or a bytes object's contents
+    digest = hashlib.sha256(COMPILED_VERSION)
+    if isinstance(source, (bytes, bytearray)):
+        digest.update(source)
+    else:
+        with open(source, "rb") as f:
+            for block in iter(lambda: f.read(READ_BYTES), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def read_network(source, fmt=None):
+    # Parses a path, or bytes with `fmt` given, into a BayesianNetwork
+    return _network(_parse(source, fmt))
+
+
+def _parse(source, fmt):
+    if isinstance(source, (bytes, bytearray)):
+        if fmt is None:
+            raise ValueError("give the format of a network passed as bytes")
+        return _compile(_items(io.BytesIO(source), fmt))
+    with open(source, "rb") as f:
+        return _compile(_items(f, fmt or file_format(source)))
+
+
+def load_network(source, fmt=None, cache_dir=CACHE_DIR):
+    # read_network() through the compiled cache: returns (network, whether
+    # it came from the cache). Bytes, or cache_dir=None, parse every time.
+    if cache_dir is None or isinstance(source, (bytes, bytearray)):
+        return read_network(source, fmt), False
+    path = os.path.join(cache_dir, file_digest(source) + ".npz")
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            compiled = {key: data[key] for key in data.files}
+        return _network(compiled), True
+    except (OSError, ValueError, KeyError):
+        pass
+    compiled = _parse(source, fmt)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Written under a temporary name first, so readers never see half a file
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as f:
+        np.savez(f, **compiled)
+    os.replace(temporary, path)
+    return _network(compiled), False
+
+
+def _write_bif(network, f):
+    f.write("network unknown {\n}\n")
+    for name, states in network.states.items():
+        f.write(f"variable {name} {{\n  type discrete [ {len(states)} ] {{ {', '.join(states)} }};\n}}\n")
+    for name, parents in network.parents.items():
+        table = network.cpts[name].values
+        if not parents:
+            f.write(f"probability ( {name} ) {{\n  table {', '.join(map(repr, table.tolist()))};\n}}\n")
+            continue
+        f.write(f"probability ( {name} | {', '.join(parents)} ) {{\n")
+        for configuration in np.ndindex(table.shape[:-1]):
+            states = ", ".join(network.states[p][s] for p, s in zip(parents, configuration))
+            f.write(f"  ({states}) {', '.join(map(repr, table[configuration].tolist()))};\n")
+        f.write("}\n")
+
+
+def _write_xmlbif(network, f):
+    f.write('<?xml version="1.0"?>\n<BIF VERSION="0.3">\n<NETWORK>\n<NAME>unknown</NAME>\n')
+    for name, states in network.states.items():
+        outcomes = "".join(f"<OUTCOME>{escape(s)}</OUTCOME>" for s in states)
+        f.write(f'<VARIABLE TYPE="nature"><NAME>{escape(name)}</NAME>{outcomes}</VARIABLE>\n')
+    for name, parents in network.parents.items():
+        given = "".join(f"<GIVEN>{escape(p)}</GIVEN>" for p in parents)
+        table = " ".join(map(repr, network.cpts[name].values.ravel().tolist()))
+        f.write(f"<DEFINITION><FOR>{escape(name)}</FOR>{given}<TABLE>{table}</TABLE></DEFINITION>\n")
+    f.write("</NETWORK>\n</BIF>\n")
+
+
+def _node(network, name):
+    return {"name": name, "states": list(network.states[name]), "parents": list(network.parents[name]),
+            "cpt": network.cpts[name].values.tolist()}
+
+
+def _write_json(network, f):
+    f.write('{"nodes": [\n')
+    f.write(",\n".join(json.dumps(_node(network, name)) for name in network.nodes))
+    f.write("\n]}\n")
+
+
+def _write_jsonl(network, f):
+    for name in network.nodes:
+        f.write(json.dumps(_node(network, name)) + "\n")
+
+
+def save_network(network, path, fmt=None):
+    # Writes every CPT expanded to its table, in the format of `path`
+    writer = {"bif": _write_bif, "xmlbif": _write_xmlbif, "json": _write_json, "jsonl": _write_jsonl}
+    with open(path, "w", encoding="utf-8") as f:
+        writer[fmt or file_format(path)](network, f)
@@ -0,0 +1,261 @@
+# Approximate inference by sampling, for networks too large for exact
+# elimination.
+#
+# Every sampler works on whole NumPy batches: a variable is drawn for all
+# samples (or all Gibbs chains) at once by asking its CPT model
+# (reasoning.cpt) for the distributions under the parents' sample arrays, so
+# the Python-level loop is over variables, never samples. Noisy-OR/MAX
+# models are evaluated from their parameters and never expanded to tables;
+# weights and Gibbs conditionals are kept in log space.
+#
+#   rejection_sampling()    forward (ancestral) samples, keeping those that
+#                           agree with the evidence
+#   likelihood_weighting()  evidence clamped, samples weighted by its
+#                           likelihood
+#   gibbs_sampling()        many parallel chains resampling each unobserved
+#                           variable from its Markov blanket
+#
+# Each returns an Estimate with the posterior of one query variable, its
+# effective sample size and a convergence trace. workers > 1 shards the
+# batches (or chains) over a spawn-based process pool; shards get
+# independent random streams from one SeedSequence, so results depend only
+# on the seed and the number of workers.
+
+import concurrent.futures
+import multiprocessing
+
+import numpy as np
+
+TRACE_POINTS = 100
+# Batches of forward samples tried for Gibbs starting states
+START_ATTEMPTS = 100
+
+
+class Estimate:
+    def __init__(self, method, variable, states, distribution, ess, samples, trace):
+        self.method = method
+        self.variable = variable
+        self.states = states
+        self.distribution = distribution  # {state: probability}
+        self.ess = ess  # effective sample size
+        self.samples = samples  # samples drawn (accepted or not)
+        self.trace = trace  # [(samples so far, [probability per state])]
+
+    def __repr__(self):
+        shown = ", ".join(f"{s}={p:.4f}" for s, p in self.distribution.items())
+        return (f"Estimate({self.method}: P({self.variable}) ~ {shown}; "
+                f"ess {self.ess:.0f} of {self.samples})")
+
+
+def _categorical(rng, probs):
+    # One draw per row of `probs` (rows need not be normalized)
+    cumulative = np.cumsum(probs, axis=-1)
+    u = rng.random(probs.shape[:-1]) * cumulative[..., -1]
+    return np.minimum((cumulative < u[..., None]).sum(axis=-1), probs.shape[-1] - 1)
+
+
+def forward_samples(network, n, rng, evidence=None):
+    # Ancestral samples {variable: int array (n,)} with the evidence
+    # variables clamped, plus each sample's log-likelihood of the evidence
+    evidence = evidence or {}
+    values, log_weight = {}, np.zeros(n)
+    for name, model in network.models.items():
+        parent_states = [values[parent] for parent in network.parents[name]]
+        if name in evidence:
+            values[name] = np.full(n, evidence[name])
+            log_weight += model.log_probability(parent_states, evidence[name])
+        else:
+            values[name] = model.sample(parent_states, rng.random(n))
+    return values, log_weight
+
+
+def _weighted_batches(network, variable, evidence, n, batch, seed, clamp):
+    # Per-batch weighted state counts for rejection sampling (clamp=False,
+    # weights 0/1) and likelihood weighting (clamp=True). Each batch's
+    # weights are divided by its largest one, whose log is returned as the
+    # batch's shift, so tiny likelihoods do not underflow to zero.
+    rng = np.random.default_rng(seed)
+    card = network.card(variable)
+    sums, weights, squares, shifts = [], [], [], []
+    for start in range(0, n, batch):
+        size = min(batch, n - start)
+        if clamp:
+            values, log_weight = forward_samples(network, size, rng, evidence)
+            shift = log_weight.max()
+            if np.isneginf(shift):
+                shift = 0.0
+            weight = np.exp(log_weight - shift)
+        else:
+            values, _ = forward_samples(network, size, rng)
+            weight, shift = np.ones(size), 0.0
+            for name, state in evidence.items():
+                weight *= values[name] == state
+        sums.append(np.bincount(values[variable], weights=weight, minlength=card))
+        weights.append(weight.sum())
+        squares.append((weight ** 2).sum())
+        shifts.append(shift)
+    return np.array(sums), np.array(weights), np.array(squares), np.array(shifts)
+
+
+def _gibbs_start(network, evidence, chains, rng):
+    # Starting states the evidence is possible in: forward samples with the
+    # evidence clamped, chains whose sample rules it out copying one that
+    # does not. A chain started from an impossible state would stay in it.
+    for _ in range(START_ATTEMPTS):
+        values, log_weight = forward_samples(network, chains, rng, evidence)
+        bad = np.isneginf(log_weight)
+        if not bad.all():
+            good = np.flatnonzero(~bad)
+            source = np.arange(chains)
+            source[bad] = good[rng.integers(good.size, size=bad.sum())]
+            return {name: states[source] for name, states in values.items()}
+    raise ZeroDivisionError("no chain could start from a state the evidence is possible in; "
+                            "the evidence is impossible or too rare to sample")
+
+
+def _gibbs_chains(network, variable, evidence, sweeps, chains, burn_in, seed):
+    # States of `variable` after each sweep: int array (sweeps, chains)
+    rng = np.random.default_rng(seed)
+    models, parents = network.models, network.parents
+    values = _gibbs_start(network, evidence, chains, rng)
+    free = [name for name in network.states if name not in evidence]
+    children = {name: network.children(name) for name in free}
+    history = np.empty((sweeps, chains), dtype=np.int64)
+
+    for sweep in range(burn_in + sweeps):
+        for name in free:
+            # log P(name=s | parents) + sum over children of log P(child | its
+            # parents), for every state s (axis 1) of every chain (axis 0)
+            logp = models[name].log_probabilities([values[p] for p in parents[name]])
+            logp = np.broadcast_to(logp, (chains, logp.shape[-1]))
+            states = np.arange(logp.shape[1])[None, :]
+            for child in children[name]:
+                parent_states = [states if p == name else values[p][:, None] for p in parents[child]]
+                logp = logp + models[child].log_probability(parent_states, values[child][:, None])
+            top = logp.max(axis=1, keepdims=True)
+            # Cannot happen from a possible state; never draw from nan rows
+            if np.isneginf(top).any():
+                raise ZeroDivisionError(f"every state of {name!r} is impossible given the evidence")
+            values[name] = _categorical(rng, np.exp(logp - top))
+        if sweep >= burn_in:
+            history[sweep - burn_in] = values[variable]
+    return history
+
+
+def _autocorrelation_ess(series):
+    # ESS of a (steps, chains) series: chains * steps / (1 + 2 * sum of the
+    # autocorrelations), summed over pairs of lags while the pair is positive
+    steps, chains = series.shape
+    if steps < 4:
+        return float(steps * chains)
+    centered = series - series.mean(axis=0)
+    variance = (centered ** 2).mean()
+    if variance == 0:
+        return float(steps * chains)
+    size = 1 << (2 * steps - 1).bit_length()
+    spectrum = np.fft.rfft(centered, n=size, axis=0)
+    acov = np.fft.irfft(spectrum * np.conj(spectrum), n=size, axis=0)[:steps].mean(axis=1) / steps
+    rho = acov / variance
+    total = 0.0
+    for lag in range(1, steps - 1, 2):
+        pair = rho[lag] + rho[lag + 1]
+        if pair < 0:
+            break
+        total += pair
+    return float(steps * chains / (1 + 2 * total))
+
+
+def _trace(counts, sizes):
+    # Running estimate after each block of samples, at most TRACE_POINTS
+    cumulative = np.cumsum(counts, axis=0)
+    totals = cumulative.sum(axis=1)
+    seen = np.cumsum(sizes)
+    pick = np.unique(np.linspace(0, len(seen) - 1, min(TRACE_POINTS, len(seen))).astype(int))
+    trace = []
+    for i in pick:
+        if totals[i] > 0:
+            trace.append((int(seen[i]), (cumulative[i] / totals[i]).tolist()))
+    return trace
+
+
+def _run(func, shard_args, workers):
+    if workers <= 1:
+        return [func(*args) for args in shard_args]
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(workers, mp_context=context) as pool:
+        return list(pool.map(func, *zip(*shard_args)))
+
+
+def _seeds(seed, shards):
+    return np.random.SeedSequence(seed).spawn(shards)
+
+
+def _split(total, parts):
+    return [total // parts + (i < total % parts) for i in range(parts)]
+
+
+def _weighted_estimate(method, network, variable, evidence, n, batch, seed, workers, clamp):
+    evidence = network.evidence_indices(evidence)
+    if variable in evidence:
+        raise ValueError(f"{variable!r} is both queried and observed")
+    workers = max(1, workers)
+    shards = [(network, variable, evidence, size, batch, shard_seed, clamp)
+              for size, shard_seed in zip(_split(n, workers), _seeds(seed, workers)) if size]
+    results = _run(_weighted_batches, shards, workers)
+    # Put every batch on the scale of the largest shift, then interleave the
+    # shards' batches as if they had run side by side
+    top = max(shifts.max() for *_, shifts in results)
+    scaled = []
+    for sums, weights, squares, shifts in results:
+        factor = np.exp(shifts - top)
+        scaled.append((sums * factor[:, None], weights * factor, squares * factor ** 2))
+    rounds = max(len(sums) for sums, _, _ in scaled)
+    counts, sizes = [], []
+    for r in range(rounds):
+        for (sums, _, _), shard in zip(scaled, shards):
+            if r < len(sums):
+                counts.append(sums[r])
+                sizes.append(min(batch, shard[3] - r * batch))
+    counts = np.array(counts)
+    weight = sum(w.sum() for _, w, _ in scaled)
+    square = sum(s.sum() for _, _, s in scaled)
+    if weight == 0:
+        raise ZeroDivisionError("no sample was consistent with the evidence; draw more samples")
+    states = network.states[variable]
+    distribution = dict(zip(states, (counts.sum(axis=0) / weight).tolist()))
+    return Estimate(method, variable, states, distribution, float(weight ** 2 / square), n,
+                    _trace(counts, sizes))
+
+
+def rejection_sampling(network, variable, evidence=None, n=10000, batch=10000, seed=None, workers=1):
+    # Forward sampling; samples that contradict the evidence are dropped
+    return _weighted_estimate("rejection sampling", network, variable, evidence,
+                              n, batch, seed, workers, clamp=False)
+
+
+def likelihood_weighting(network, variable, evidence=None, n=10000, batch=10000, seed=None, workers=1):
+    # Evidence is clamped and each sample weighted by P(evidence | sample)
+    return _weighted_estimate("likelihood weighting", network, variable, evidence,
+                              n, batch, seed, workers, clamp=True)
+
+
+def gibbs_sampling(network, variable, evidence=None, n=10000, chains=100, burn_in=50,
+                   seed=None, workers=1):
+    # n samples from `chains` parallel chains (n // chains sweeps each)
+    evidence = network.evidence_indices(evidence)
+    if variable in evidence:
+        raise ValueError(f"{variable!r} is both queried and observed")
+    sweeps = max(1, n // chains)
+    workers = max(1, min(workers, chains))
+    shards = [(network, variable, evidence, sweeps, size, burn_in, shard_seed)
+              for size, shard_seed in zip(_split(chains, workers), _seeds(seed, workers))]
+    history = np.concatenate(_run(_gibbs_chains, shards, workers), axis=1)
+
+    card = network.card(variable)
+    counts = np.stack([(history == s).sum(axis=1) for s in range(card)], axis=1)
+    states = network.states[variable]
+    distribution = dict(zip(states, (counts.sum(axis=0) / counts.sum()).tolist()))
+    # The worst-mixing state indicator decides the effective sample size
+    ess = min(_autocorrelation_ess((history == s).astype(float)) for s in range(card))
+    return Estimate("Gibbs sampling", variable, states, distribution, ess,
+                    history.size, _trace(counts, np.full(sweeps, history.shape[1])))
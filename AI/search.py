@@ -0,0 +1,223 @@
+# Full-text search over every study guide.
+#
+# The index is built from the structured page sources in content/src/ (see
+# tools/build_content.py), so it covers every guide and unit that has been
+# extracted. Each page is split into sections - the page itself plus each tab
+# and expander - and every section is one document: HTML and markdown
+# markup is stripped, the text is tokenized into lowercase words and stored
+# in an inverted index (term -> [(doc, term frequency)]). Queries are ranked
+# with BM25 and only touch the postings of their own terms, so they stay in
+# the sub-millisecond range as content grows.
+#
+# sidebar() draws the search box as a fragment; the index is built once per
+# process with st.cache_resource and shared by every session.
+
+import html
+import json
+import math
+import os
+import re
+from collections import Counter
+
+import streamlit as st
+
+AI_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(AI_DIR, "content", "src")
+
+GUIDE_TITLES = {
+    "uncertainty": "Uncertainty & Reasoning",
+    "planning": "Planning & Learning",
+    "unit5": "Unit 5: Expert Systems",
+}
+
+# BM25 parameters (the usual defaults)
+K1 = 1.2
+B = 0.75
+
+MAX_RESULTS = 5
+SNIPPET_CHARS = 160
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+TAG_RE = re.compile(r"<[^>]+>")
+MARKUP_RE = re.compile(r"[*_`#>|~]+|-{3,}|\${1,2}")
+SPACE_RE = re.compile(r"\s+")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def plain_text(text):
+    # Rendered words only: no HTML tags, entities or markdown markup
+    text = html.unescape(TAG_RE.sub(" ", text))
+    return SPACE_RE.sub(" ", MARKUP_RE.sub(" ", text)).strip()
+
+
+def _block_text(block):
+    kind = block["type"]
+    if kind in ("heading", "markdown", "caption", "alert", "code", "latex"):
+        return [block["text"]]
+    if kind == "table":
+        return block["columns"] + [cell for row in block["rows"] for cell in row]
+    if kind == "metric":
+        return [block["label"], block["value"]]
+    if kind == "radio":
+        return [block["label"]] + block["options"]
+    if kind in ("button", "input"):
+        return [block["label"]]
+    return []
+
+
+def _sections(blocks, path, out):
+    # Appends (path, [text]) for the section at `path` and every tab and
+    # expander nested in it; text of plain containers stays with its section
+    texts = []
+    out.append((path, texts))
+
+    def walk(blocks):
+        for block in blocks:
+            kind = block["type"]
+            texts.extend(_block_text(block))
+            if kind == "columns":
+                for column in block["columns"]:
+                    walk(column)
+            elif kind == "tabs":
+                for tab in block["tabs"]:
+                    _sections(tab["children"], path + [tab["label"]], out)
+            elif kind == "expander":
+                _sections(block["children"], path + [block["label"]], out)
+            elif "children" in block:
+                walk(block["children"])
+
+    walk(blocks)
+    return out
+
+
+def load_sources(src_dir=SRC_DIR):
+    sources = []
+    if not os.path.isdir(src_dir):
+        return sources
+    for guide in sorted(os.listdir(src_dir)):
+        guide_dir = os.path.join(src_dir, guide)
+        for name in sorted(os.listdir(guide_dir)):
+            if name.endswith(".json"):
+                with open(os.path.join(guide_dir, name), encoding="utf-8") as f:
+                    sources.append(json.load(f))
+    return sources
+
+
+class SearchIndex:
+    def __init__(self, sources):
+        # docs[i] = (guide, page, section labels, plain text)
+        self.docs = []
+        self.postings = {}
+        lengths = []
+        for source in sources:
+            for path, texts in _sections(source["blocks"], [], []):
+                text = plain_text(" ".join(texts))
+                # Page and section titles are searchable too
+                tokens = tokenize(" ".join([source["page"]] + path + [text]))
+                if not tokens:
+                    continue
+                doc = len(self.docs)
+                self.docs.append((source["guide"], source["page"], path, text))
+                lengths.append(len(tokens))
+                for term, count in Counter(tokens).items():
+                    self.postings.setdefault(term, []).append((doc, count))
+
+        n_docs = len(self.docs)
+        average = sum(lengths) / n_docs if n_docs else 0
+        # Per-document length normalisation, precomputed once
+        self.norms = [K1 * (1 - B + B * length / average) for length in lengths]
+        self.idf = {term: math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+                    for term, docs in self.postings.items()}
+
+    def search(self, query, limit=MAX_RESULTS):
+        # [(score, doc id)] best first
+        scores = {}
+        for term in set(tokenize(query)):
+            idf = self.idf.get(term)
+            if idf is None:
+                continue
+            for doc, count in self.postings[term]:
+                scores[doc] = scores.get(doc, 0.0) + idf * count * (K1 + 1) / (count + self.norms[doc])
+        ranked = sorted(scores.items(), key=lambda item: -item[1])[:limit]
+        return [(score, doc) for doc, score in ranked]
+
+    def snippet(self, doc, query, width=SNIPPET_CHARS):
+        # Window of the section text around the first query hit, hits in bold
+        text = self.docs[doc][3]
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not terms:
+            return text[:width]
+        hit = re.compile(r"(?<![a-z0-9])(" + "|".join(map(re.escape, terms)) + r")(?![a-z0-9])",
+                         re.IGNORECASE)
+        match = hit.search(text)
+        start = max(0, match.start() - width // 3) if match else 0
+        if start:
+            # Cut at word boundaries
+            start = text.find(" ", start, match.start()) + 1 or start
+        end = start + width
+        if end < len(text):
+            end = max(text.rfind(" ", start, end), start + width // 2)
+        window = text[start:end].replace("[", "(").replace("]", ")")
+        window = hit.sub(lambda m: f"**{m.group(1)}**", window)
+        window = window.replace("$", "\\$").replace(" - ", " · ")
+        return ("…" if start else "") + window + ("…" if end < len(text) else "")
+
+
+@st.cache_resource(show_spinner=False)
+def get_index():
+    return SearchIndex(load_sources())
+
+
+def register_pages(pages):
+    # Called by the multipage launcher: {guide: st.Page}, so results from
+    # other guides can switch to them
+    st.session_state["search_guide_pages"] = pages
+
+
+def nav_key(guide):
+    # Session-state key of a guide's sidebar navigation radio
+    return f"nav_{guide}"
+
+
+def _open(guide, page):
+    # on_click callback: runs before the rerun, so the navigation radio can
+    # still be given its new value
+    st.session_state[nav_key(guide)] = page
+
+
+def sidebar(guide):
+    # Search box for the top of a guide's sidebar
+    with st.sidebar:
+        _search_box(guide)
+
+
+# A fragment: typing a query reruns only the search box and its results
+@st.fragment
+def _search_box(guide):
+    query = st.text_input("🔍 Search all guides", key="search_query",
+                          placeholder="e.g. Blocks World, Abbott")
+    if not query.strip():
+        return
+    index = get_index()
+    results = index.search(query)
+    if not results:
+        st.caption("No matches.")
+        return
+    guide_pages = st.session_state.get("search_guide_pages", {})
+    for rank, (_, doc) in enumerate(results):
+        result_guide, page, path, _ = index.docs[doc]
+        location = " › ".join([page] + path)
+        if result_guide != guide:
+            location = f"{GUIDE_TITLES.get(result_guide, result_guide)} › {location}"
+        st.markdown(f"**{location}**  \n{index.snippet(doc, query)}")
+        if result_guide == guide or result_guide in guide_pages:
+            if st.button("Open", key=f"search_open_{rank}", on_click=_open,
+                         args=(result_guide, page)):
+                # Opening a page reruns the whole app
+                if result_guide != guide:
+                    st.switch_page(guide_pages[result_guide])
+                st.rerun()
+    st.markdown("---")
@@ -0,0 +1,32 @@
+import streamlit as st
+
+import search
+
+# One server for all three study guides: each guide is mounted as a page of a
+# single multipage app, so the interpreter, streamlit, pandas and every
+# st.cache_* cache are loaded once and shared instead of once per guide.
+#
+#   streamlit run AI/study_guides.py
+
+st.set_page_config(
+    page_title="AI Study Guides",
+    page_icon="📚",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Guides keep their own set_page_config/CSS calls, so each still runs
+# standalone; when mounted here they just override the title per page.
+GUIDE_PAGES = [
+    st.Page("ai_study_app.py", title="Uncertainty & Reasoning", icon="🧠",
+            url_path="uncertainty", default=True),
+    st.Page("ai_study_app (1).py", title="Planning & Learning", icon="🤖",
+            url_path="planning"),
+    st.Page("unit5.py", title="Unit 5: Expert Systems", icon="💡",
+            url_path="unit5"),
+]
+
+# Lets sidebar search results open pages of the other guides
+search.register_pages({page.url_path: page for page in GUIDE_PAGES})
+
+st.navigation({"📚 Study Guides": GUIDE_PAGES}).run()
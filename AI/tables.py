@@ -0,0 +1,69 @@
+# Content tables for st.table / st.dataframe.
+#
+# The guides describe their tables as literal dicts. content_table() builds
+# each one into a DataFrame once per process, keyed by a hash of its content,
+# and hands the same frozen frame to every rerun and every session. pandas is
+# only imported the first time a table is actually built, so pages without
+# tables never pay for it.
+
+import hashlib
+import json
+
+_TABLES = {}
+_FROZEN_FRAME = None
+
+# Number of DataFrames built so far (read by the instrumentation layer)
+build_count = 0
+
+
+def _content_key(data):
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _refuse(*args, **kwargs):
+    raise TypeError("content tables are shared between sessions and read-only; "
+                    "call .copy() to get an editable DataFrame")
+
+
+class _ReadOnlyIndexer:
+    def __init__(self, indexer):
+        self._indexer = indexer
+
+    def __getitem__(self, key):
+        return self._indexer[key]
+
+    __setitem__ = _refuse
+
+
+def _frozen_frame_class():
+    global _FROZEN_FRAME
+    if _FROZEN_FRAME is None:
+        import pandas as pd
+
+        class FrozenFrame(pd.DataFrame):
+            # Derived frames (copy(), filtering, ...) are plain DataFrames
+            @property
+            def _constructor(self):
+                return pd.DataFrame
+
+            __setitem__ = __delitem__ = _refuse
+            insert = pop = update = _refuse
+
+            loc = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.loc.fget(self)))
+            iloc = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.iloc.fget(self)))
+            at = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.at.fget(self)))
+            iat = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.iat.fget(self)))
+
+        _FROZEN_FRAME = FrozenFrame
+    return _FROZEN_FRAME
+
+
+def content_table(data):
+    global build_count
+    key = _content_key(data)
+    table = _TABLES.get(key)
+    if table is None:
+        table = _TABLES[key] = _frozen_frame_class()(data)
+        build_count += 1
+    return table
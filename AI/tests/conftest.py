@@ -0,0 +1,40 @@
+import itertools
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# The engines import each other as reasoning.*, from the AI folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def joint_rows():
+    # Every row of a BayesianNetwork's full joint: [({variable: state}, p)],
+    # one product of CPT entries per row
+    def rows(network):
+        names = network.nodes
+        result = []
+        for row in itertools.product(*(range(network.card(n)) for n in names)):
+            states = dict(zip(names, row))
+            p = 1.0
+            for n in names:
+                p *= network.cpts[n].values[tuple(states[q] for q in network.parents[n]) + (states[n],)]
+            result.append(({n: network.states[n][i] for n, i in states.items()}, p))
+        return result
+    return rows
+
+
+@pytest.fixture
+def brute_force(joint_rows):
+    # P(variable | evidence) in a BayesianNetwork by summing the joint's rows
+    def posterior(network, variable, evidence=None):
+        evidence = evidence or {}
+        states = network.states[variable]
+        totals = np.zeros(len(states))
+        for row, p in joint_rows(network):
+            if all(row[n] == s for n, s in evidence.items()):
+                totals[states.index(row[variable])] += p
+        return totals / totals.sum()
+    return posterior
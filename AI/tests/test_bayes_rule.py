@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from reasoning.bayes_rule import MAX_CELLS, MAX_VALUES, parse_values, posterior, posterior_grid
+
+
+def test_grid_matches_one_at_a_time():
+    rng = np.random.default_rng(0)
+    priors, likelihoods, false_positives = rng.random(4), rng.random(3), rng.random(2)
+    grid = posterior_grid(priors, likelihoods, false_positives)
+    for i, p in enumerate(priors):
+        for j, l in enumerate(likelihoods):
+            for k, f in enumerate(false_positives):
+                assert grid[i, j, k] == pytest.approx(l * p / (l * p + f * (1 - p)))
+
+
+def test_meningitis():
+    assert posterior(1 / 30000, 0.8, 0.019974) == pytest.approx(0.8 / 30000 / 0.02, rel=1e-3)
+
+
+@pytest.mark.parametrize("text, size", [("0.8", 1), ("1/3, 0.5", 2), ("0.01:0.5:50", 50), ("1e-6:1:7 log", 7)])
+def test_parse_values(text, size):
+    assert parse_values(text).size == size
+
+
+@pytest.mark.parametrize("text", ["0:1:0", f"0:1:{MAX_VALUES + 1}", "0:1", "1.5", "0:1:5 cubic", ""])
+def test_parse_values_rejects(text):
+    with pytest.raises(ValueError):
+        parse_values(text)
+
+
+def test_grid_is_bounded():
+    with pytest.raises(ValueError):
+        posterior_grid(np.zeros(MAX_CELLS // 10 + 1), np.zeros(10), [0.1])
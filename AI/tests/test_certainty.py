@@ -0,0 +1,99 @@
+import math
+
+import numpy as np
+import pytest
+
+from reasoning.certainty import CertaintyEngine, Rule, combine, parse_rule, random_rules
+
+
+def brute_force(rules, evidence, n_facts, threshold=0.2):
+    # Facts in number order (random_rules only reads facts numbered below a
+    # conclusion), each from all its amounts at once
+    cf = {}
+    for i in range(n_facts):
+        fact = f"F{i}"
+        amounts = [evidence[fact]] if fact in evidence else []
+        for rule in rules:
+            if rule.conclusion == fact and rule.strength(cf) > threshold:
+                amounts.append(rule.cf * rule.strength(cf))
+        mb = 1 - math.prod(1 - x for x in amounts if x > 0)
+        md = 1 - math.prod(1 + x for x in amounts if x < 0)
+        value = 0.0 if mb == md == 1 else (mb - md) / (1 - min(mb, md))
+        if abs(value) > 1e-12:
+            cf[fact] = value
+    return cf
+
+
+def assert_same(engine, expected):
+    assert set(engine.cf) == set(expected)
+    for fact, value in expected.items():
+        assert engine.cf[fact] == pytest.approx(value, abs=1e-9)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    rules = random_rules(200, n_facts=40, n_evidence=10, seed=seed)
+    engine = CertaintyEngine(rules)
+    evidence = {}
+    for _ in range(30):
+        fact = f"F{rng.integers(10)}"
+        if fact in evidence and rng.random() < 0.3:
+            engine.retract(fact)
+            del evidence[fact]
+        else:
+            evidence[fact] = round(float(rng.uniform(-1, 1)), 2) or 0.5
+            engine.tell(fact, evidence[fact])
+        assert_same(engine, brute_force(rules, evidence, 40))
+    engine.run()
+    assert_same(engine, brute_force(rules, evidence, 40))
+
+
+def test_combination_is_order_free():
+    engine = CertaintyEngine(["IF a THEN c CF=0.6", "IF b THEN c CF=-0.4"])
+    engine.tell("a", 1.0)
+    engine.tell("b", 1.0)
+    assert engine.cf["c"] == pytest.approx(combine(0.6, -0.4))
+
+
+def test_retract_reports_dependents():
+    engine = CertaintyEngine(["IF a THEN b CF=0.8", "IF b THEN c CF=0.9", "IF d THEN e CF=0.9"])
+    engine.tell("a", 1.0)
+    engine.tell("d", 1.0)
+    dependents, changed = engine.retract("a")
+    assert dependents == ["b", "c"]
+    assert set(changed) == {"a", "b", "c"}
+    assert engine.cf == {"d": 1.0, "e": 0.9}
+
+
+@pytest.mark.parametrize("text, conclusion, cf", [
+    ("IF a THEN b CF=0.5", "b", 0.5),
+    ("IF a THEN b 0.5", "b", 0.5),
+    ("IF a THEN step1 CF=0.7", "step1", 0.7),
+    ("IF a AND b THEN has-x(Y) cf = -.3", "has-x(Y)", -0.3),
+])
+def test_parse_rule(text, conclusion, cf):
+    rule = parse_rule(text)
+    assert (rule.conclusion, rule.cf) == (conclusion, cf)
+
+
+@pytest.mark.parametrize("text", ["IF a THEN step1", "IF a THEN b", "a THEN b 0.5"])
+def test_parse_rule_rejects(text):
+    with pytest.raises(ValueError):
+        parse_rule(text)
+
+
+def test_circular_rule_is_refused_without_a_trace():
+    engine = CertaintyEngine(["IF a THEN b CF=0.8", "IF b THEN c CF=0.8"])
+    engine.tell("a", 1.0)
+    before = (list(engine.rules), engine.facts, dict(engine.cf))
+    with pytest.raises(ValueError):
+        engine.add_rule("IF c THEN a CF=0.5")
+    assert (list(engine.rules), engine.facts, dict(engine.cf)) == before
+    engine.add_rule("IF c THEN d CF=0.5")
+    assert engine.cf["d"] == pytest.approx(0.5 * 0.64)
+
+
+def test_circular_rules_are_refused():
+    with pytest.raises(ValueError):
+        CertaintyEngine([Rule("a", "b", 0.5), Rule("b", "a", 0.5)])
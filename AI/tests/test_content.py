@@ -0,0 +1,56 @@
+import ast
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools"))
+
+import build_content  # noqa: E402
+import content_store  # noqa: E402
+
+
+def test_sources_are_current():
+    # Every page renders to the committed content/src (search indexes it)
+    assert build_content.stale_sources() == []
+
+
+def test_timings_are_stripped():
+    blocks = [{"type": "caption", "text": "753 inputs inferred in one pass in 10.0 ms."},
+              {"type": "columns", "columns": [[{"type": "markdown", "text": "done in 1,204 ms; 3 left"}]]}]
+    assert build_content.strip_timings(blocks) == [
+        {"type": "caption", "text": "753 inputs inferred in one pass."},
+        {"type": "columns", "columns": [[{"type": "markdown", "text": "done; 3 left"}]]}]
+
+
+
+def local_imports(file):
+    # Top-level names of the modules `file` imports that live in the AI dir
+    with open(file, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and not node.level:
+            modules = [node.module]
+        else:
+            continue
+        for module in modules:
+            top = module.split(".")[0]
+            if (os.path.exists(os.path.join(content_store.AI_DIR, top + ".py"))
+                    or os.path.isdir(os.path.join(content_store.AI_DIR, top))):
+                yield top
+
+
+def test_guide_sources_cover_local_imports():
+    # A page is only served from the pack while its hash matches, so every
+    # local module a guide imports must be hashed; the app's own plumbing
+    # (the pack, metrics and search) does not change what a page shows
+    plumbing = {"content_store", "instrumentation", "search"}
+    for guide, sources in content_store.GUIDE_SOURCES.items():
+        covered = {os.path.splitext(name)[0] for name in sources}
+        for name in sources:
+            path = os.path.join(content_store.AI_DIR, name)
+            files = ([os.path.join(path, f) for f in os.listdir(path) if f.endswith(".py")]
+                     if os.path.isdir(path) else [path])
+            for file in files:
+                missing = set(local_imports(file)) - covered - plumbing
+                assert not missing, f"{guide}: {os.path.relpath(file, content_store.AI_DIR)} imports {missing}"
@@ -0,0 +1,103 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from reasoning.cpt import NoisyMax, NoisyOR, TabularCPT
+
+
+def random_rows(rng, rows, card):
+    return rng.dirichlet(np.ones(card), size=rows)
+
+
+def noisy_max_by_enumeration(links, leak, parent_states):
+    # Every active parent and the leak draw a state independently; the
+    # variable takes the most severe one (the smallest state index, since the
+    # last state means "absent")
+    card = len(leak)
+    sources = [leak] + [link[s] for link, s in zip(links, parent_states) if s < len(link)]
+    result = np.zeros(card)
+    for draws in itertools.product(range(card), repeat=len(sources)):
+        result[min(draws)] += np.prod([source[d] for source, d in zip(sources, draws)])
+    return result
+
+
+def noisy_max_by_cumulatives(links, leak, parent_states):
+    # P(Y <= y), counting levels up from "absent", is the product of each
+    # source's cumulative; state probabilities are differences of it
+    sources = [leak] + [link[s] for link, s in zip(links, parent_states) if s < len(link)]
+    cdf = np.prod([np.cumsum(source[::-1]) for source in sources], axis=0)
+    return np.diff(np.concatenate([[0.0], cdf]))[::-1]
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("card", [2, 3, 4])
+def test_noisy_max_matches_definition(seed, card):
+    rng = np.random.default_rng(seed)
+    parent_cards = list(rng.integers(2, 4, size=3))
+    links = [random_rows(rng, m - 1, card) for m in parent_cards]
+    leak = random_rows(rng, 1, card)[0]
+    model = NoisyMax(links, leak)
+    model.check("Y", parent_cards)
+    table = model.table(parent_cards)
+    for config in itertools.product(*map(range, parent_cards)):
+        expected = noisy_max_by_enumeration(links, leak, config)
+        assert table[config] == pytest.approx(expected, abs=1e-12)
+        assert table[config] == pytest.approx(noisy_max_by_cumulatives(links, leak, config), abs=1e-12)
+    assert np.allclose(table.sum(axis=-1), 1)
+
+
+def test_noisy_max_default_leak_is_absent():
+    links = [[[0.2, 0.3, 0.5]], [[0.1, 0.1, 0.8], [0.6, 0.3, 0.1]]]
+    table = NoisyMax(links).table([2, 3])
+    # every parent absent: the variable is absent
+    assert table[1, 2] == pytest.approx([0, 0, 1])
+    # one active parent alone gives its own row
+    assert table[0, 2] == pytest.approx(links[0][0])
+    assert table[1, 1] == pytest.approx(links[1][1])
+
+
+@pytest.mark.parametrize("leak", [0.0, 0.05])
+def test_noisy_or_is_one_minus_product(leak):
+    causes = [0.9, 0.6, 0.3]
+    table = NoisyOR(causes, leak).table([2, 2, 2])
+    for config in itertools.product(range(2), repeat=3):
+        # state 0 is "True": the parent is a present cause
+        survive = (1 - leak) * np.prod([1 - p for p, s in zip(causes, config) if s == 0])
+        assert table[config] == pytest.approx([1 - survive, survive], abs=1e-12)
+
+
+def test_noisy_or_keeps_tiny_probabilities():
+    # 500 strong causes: P(False) = 0.1 ** 500 underflows as a product but
+    # not as a sum of logs
+    model = NoisyOR([0.9] * 500)
+    log_p = model.log_probabilities([np.zeros(1, dtype=int)] * 500)[0]
+    assert log_p[1] == pytest.approx(500 * np.log(0.1))
+    assert log_p[0] == pytest.approx(0.0)
+
+
+def test_noisy_max_parameters_grow_linearly():
+    model = NoisyMax([random_rows(np.random.default_rng(0), 2, 3)] * 10)
+    assert model.parameters == (10 * 2 + 1) * 2
+    assert TabularCPT(model.table([3] * 10)).parameters == 3 ** 10 * 2
+
+
+def test_sample_and_log_probability_agree_with_table():
+    rng = np.random.default_rng(7)
+    links = [random_rows(rng, 2, 3), random_rows(rng, 1, 3)]
+    model = NoisyMax(links, random_rows(rng, 1, 3)[0])
+    table = model.table([3, 2])
+    parents = [np.full(100_000, 1), np.full(100_000, 0)]
+    draws = model.sample(parents, rng.random(100_000))
+    assert np.bincount(draws, minlength=3) / 100_000 == pytest.approx(table[1, 0], abs=0.01)
+    states = np.array([0, 1, 2])
+    assert np.exp(model.log_probability([1, 0], states)) == pytest.approx(table[1, 0])
+
+
+def test_check_rejects_bad_links():
+    with pytest.raises(ValueError, match="parents but"):
+        NoisyOR([0.5]).check("Y", [2, 2])
+    with pytest.raises(ValueError, match="must have shape"):
+        NoisyMax([[[0.5, 0.5]]]).check("Y", [3])
+    with pytest.raises(ValueError, match="sum to 1"):
+        NoisyMax([[[0.5, 0.6]]]).check("Y", [2])
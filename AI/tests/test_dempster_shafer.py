@@ -0,0 +1,121 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from reasoning.dempster_shafer import (MassFunction, SparseMassFunction, combine, combine_sparse, mobius,
+                                       parse_masses, random_sources, zeta)
+
+FRAME = ["a", "b", "c", "d", "e"]
+
+
+def random_focal(rng, n=4):
+    # {frozenset of names: mass}, with the rest on the whole frame
+    focal = {}
+    for weight in rng.dirichlet(np.ones(n + 1))[:n]:
+        subset = frozenset(name for name in FRAME if rng.random() < 0.5) or frozenset(FRAME[:1])
+        focal[subset] = focal.get(subset, 0.0) + weight
+    return focal
+
+
+def brute_force_combine(sources):
+    # Dempster's rule one pair of focal elements at a time
+    combined = {frozenset(FRAME): 1.0}
+    conflict_kept = 1.0
+    for focal in sources:
+        whole = dict(focal)
+        whole[frozenset(FRAME)] = whole.get(frozenset(FRAME), 0.0) + 1 - sum(focal.values())
+        result = {}
+        for (a, x), (b, y) in itertools.product(combined.items(), whole.items()):
+            result[a & b] = result.get(a & b, 0.0) + x * y
+        kept = 1 - result.pop(frozenset(), 0.0)
+        conflict_kept *= kept
+        combined = {subset: mass / kept for subset, mass in result.items()}
+    return combined, 1 - conflict_kept
+
+
+def brute_bel(masses, subset):
+    return sum(mass for b, mass in masses.items() if b <= subset)
+
+
+def brute_pl(masses, subset):
+    return sum(mass for b, mass in masses.items() if b & subset)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_combine_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    focal = [random_focal(rng) for _ in range(3)]
+    expected, conflict = brute_force_combine(focal)
+    combined, k = combine([MassFunction.from_focal(FRAME, f) for f in focal])
+    sparse, k_sparse, bound = combine_sparse([SparseMassFunction.from_focal(FRAME, f) for f in focal])
+    assert bound == 0
+    for m in (combined, sparse):
+        for size in range(1, len(FRAME) + 1):
+            for subset in itertools.combinations(FRAME, size):
+                assert m.bel(subset) == pytest.approx(brute_bel(expected, frozenset(subset)), abs=1e-9)
+                assert m.pl(subset) == pytest.approx(brute_pl(expected, frozenset(subset)), abs=1e-9)
+    assert k == pytest.approx(conflict) and k_sparse == pytest.approx(conflict)
+
+
+def test_zeta_and_mobius_invert():
+    values = np.random.default_rng(0).random(1 << 6)
+    for supersets in (False, True):
+        assert mobius(zeta(values, supersets), supersets) == pytest.approx(values)
+
+
+def test_intervals_bracket():
+    m = parse_masses("Flu, Cold: 0.6\nFlu: 0.2", ["Allergy", "Flu", "Cold"])
+    intervals = m.intervals()
+    assert intervals["Flu"] == pytest.approx((0.2, 1.0))
+    assert intervals["Cold"] == pytest.approx((0.0, 0.8))
+    assert intervals["Allergy"] == pytest.approx((0.0, 0.2))
+
+
+def test_total_conflict():
+    frame = ["x", "y"]
+    with pytest.raises(ZeroDivisionError):
+        combine([MassFunction.from_focal(frame, {"x": 1.0}), MassFunction.from_focal(frame, {"y": 1.0})])
+
+
+@pytest.mark.parametrize("max_focal", [8, 32])
+def test_summarized_error_is_within_bound(max_focal):
+    sources = random_sources(12, 10, seed=3)
+    exact, _, _ = combine_sparse(sources)
+    summary, _, bound = combine_sparse(sources, max_focal=max_focal)
+    assert len(summary) <= max_focal
+    exact_intervals, summary_intervals = exact.intervals(), summary.intervals()
+    for h in exact_intervals:
+        assert abs(exact_intervals[h][0] - summary_intervals[h][0]) <= bound + 1e-12
+        assert abs(exact_intervals[h][1] - summary_intervals[h][1]) <= bound + 1e-12
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("max_focal", [8, 12])
+def test_bound_holds_under_conflict(seed, max_focal):
+    # Unreliable sources on a small frame: conflict is high and summaries are
+    # stretched by every renormalization; the dense rule gives the exact answer
+    sources = random_sources(10, 8, reliability=0.7, seed=seed)
+    exact, _ = combine([source.dense() for source in sources])
+    summary, _, bound = combine_sparse(sources, max_focal=max_focal)
+    assert 0 < bound < 1
+    exact_intervals, summary_intervals = exact.intervals(), summary.intervals()
+    for h in exact_intervals:
+        assert abs(exact_intervals[h][0] - summary_intervals[h][0]) <= bound + 1e-9
+        assert abs(exact_intervals[h][1] - summary_intervals[h][1]) <= bound + 1e-9
+
+
+def test_bound_stays_informative_at_scale():
+    _, _, bound = combine_sparse(random_sources(1000, 64, seed=0), max_focal=256)
+    assert 0 < bound < 0.5
+
+
+def test_large_frames_go_sparse():
+    frame = [f"H{i}" for i in range(17)]
+    with pytest.raises(ValueError, match="SparseMassFunction"):
+        MassFunction.vacuous(frame)
+    assert isinstance(parse_masses("H0, H1: 0.5", frame[:16]), MassFunction)
+    sparse = parse_masses("H0, H1: 0.5\nH1: 0.25", frame)
+    assert isinstance(sparse, SparseMassFunction)
+    assert sparse.bel(["H0", "H1"]) == pytest.approx(0.75)
+    assert sparse.pl(["H16"]) == pytest.approx(0.25)
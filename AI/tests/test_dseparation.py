@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from reasoning.bayesnet import alarm_network, random_network
+from reasoning.dseparation import IndependenceIndex, independence_index
+from reasoning.elimination import VariableElimination
+
+
+def moral_separated(network, xs, ys, given):
+    # The moralized ancestral graph criterion: xs and ys are d-separated by
+    # `given` when removing `given` from the moral graph of the ancestral
+    # set of all three disconnects them
+    keep = set(xs) | set(ys) | set(given)
+    stack = list(keep)
+    while stack:
+        for parent in network.parents[stack.pop()]:
+            if parent not in keep:
+                keep.add(parent)
+                stack.append(parent)
+    edges = {name: set() for name in keep}
+    for child in keep:
+        parents = network.parents[child]
+        for p in parents:
+            edges[p].add(child)
+            edges[child].add(p)
+            for q in parents:
+                if q != p:
+                    edges[p].add(q)
+    seen = set(xs) - set(given)
+    stack = list(seen)
+    while stack:
+        for n in edges[stack.pop()]:
+            if n not in seen and n not in given:
+                seen.add(n)
+                stack.append(n)
+    return not seen & (set(ys) - set(given))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_d_separated_matches_moral_graph(seed):
+    rng = np.random.default_rng(seed)
+    network = random_network(9, max_parents=3, seed=seed)
+    index = IndependenceIndex(network)
+    for _ in range(30):
+        names = list(rng.permutation(network.nodes))
+        a, b, c = (int(k) for k in rng.integers(1, 3, 3))
+        xs, ys, given = names[:a], names[a:a + b], names[a + b:a + b + c - 1]
+        assert index.d_separated(xs, ys, given) == moral_separated(network, xs, ys, given), (xs, ys, given)
+
+
+def test_alarm_textbook_cases():
+    index = independence_index(alarm_network())
+    assert index.d_separated(["Burglary"], ["Earthquake"])
+    assert not index.d_separated(["Burglary"], ["Earthquake"], ["Alarm"])
+    assert not index.d_separated(["Burglary"], ["Earthquake"], ["DavidCalls"])
+    assert index.d_separated(["DavidCalls"], ["SophiaCalls"], ["Alarm"])
+    assert index.ancestral(["Alarm"]) == {"Alarm", "Burglary", "Earthquake"}
+    assert index.descendants(["Alarm"]) == {"DavidCalls", "SophiaCalls"}
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_requisite_pruning_keeps_posteriors(brute_force, seed):
+    # CPTs outside the requisite set can be anything without changing the
+    # posterior
+    rng = np.random.default_rng(seed)
+    network = random_network(8, max_parents=2, states=(2, 3), seed=seed)
+    query, *evidence_names = rng.permutation(network.nodes)[:3]
+    evidence = {name: network.states[name][0] for name in evidence_names}
+    requisite = independence_index(network).requisite([query], evidence)
+    before = brute_force(network, query, evidence)
+    for name in set(network.nodes) - requisite:
+        shape = [network.card(p) for p in network.parents[name]]
+        network.set_cpt(name, rng.dirichlet(np.ones(network.card(name)), size=shape))
+    assert brute_force(network, query, evidence) == pytest.approx(before)
+    assert VariableElimination(network).query([query], evidence).values == pytest.approx(before)
+
+
+def test_index_follows_network_version():
+    network = random_network(5, seed=0)
+    index = independence_index(network)
+    assert independence_index(network) is index
+    network.add_node("X5", ["s0", "s1"], ["X0"])
+    assert independence_index(network) is not index
@@ -0,0 +1,90 @@
+import math
+
+import numpy as np
+import pytest
+
+from reasoning.bayesnet import alarm_network, car_network, random_network
+from reasoning.elimination import VariableElimination
+
+
+def random_evidence(network, rng, count):
+    names = rng.choice(network.nodes, size=count, replace=False)
+    return {name: network.states[name][rng.integers(network.card(name))] for name in names}
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_posteriors_match_brute_force(brute_force, seed):
+    rng = np.random.default_rng(seed)
+    network = random_network(7, max_parents=3, states=(2, 3), seed=seed)
+    engine = VariableElimination(network)
+    evidence = random_evidence(network, rng, 2)
+    for name, posterior in engine.posteriors(evidence).items():
+        assert list(posterior.values()) == pytest.approx(brute_force(network, name, evidence))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_joint_query_and_evidence_probability(joint_rows, seed):
+    rng = np.random.default_rng(seed)
+    network = random_network(6, states=(2, 3), seed=seed)
+    engine = VariableElimination(network)
+    evidence = random_evidence(network, rng, 2)
+    rows = joint_rows(network)
+    assert engine.probability(evidence) == pytest.approx(
+        sum(p for row, p in rows if all(row[n] == s for n, s in evidence.items())))
+    free = [name for name in network.nodes if name not in evidence][:2]
+    table = engine.query(free, evidence)
+    assert table.variables == tuple(free)
+    for index in np.ndindex(table.values.shape):
+        states = {name: network.states[name][i] for name, i in zip(free, index)}
+        wanted = {**evidence, **states}
+        assert table.values[index] == pytest.approx(
+            sum(p for row, p in rows if all(row[n] == s for n, s in wanted.items())) / engine.probability(evidence))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_mpe_and_map_match_brute_force(joint_rows, seed):
+    network = random_network(6, states=2, seed=seed)
+    engine = VariableElimination(network)
+    evidence = {"X5": "s0"}
+    rows = [(row, p) for row, p in joint_rows(network) if row["X5"] == "s0"]
+    total = sum(p for _, p in rows)
+    best, p = engine.mpe(evidence)
+    top_row, top_p = max(rows, key=lambda item: item[1])
+    assert best == {n: s for n, s in top_row.items() if n != "X5"}
+    assert p == pytest.approx(top_p / total)
+    # Partial MAP sums the other variables out first
+    sums = {}
+    for row, q in rows:
+        key = (row["X0"], row["X1"])
+        sums[key] = sums.get(key, 0.0) + q
+    (x0, x1), q = max(sums.items(), key=lambda item: item[1])
+    assert engine.map(["X0", "X1"], evidence) == ({"X0": x0, "X1": x1}, pytest.approx(q / total))
+
+
+@pytest.mark.parametrize("alarm", ["table", "noisy-or"])
+def test_alarm(brute_force, alarm):
+    network = alarm_network(alarm)
+    evidence = {"DavidCalls": "True", "SophiaCalls": "True"}
+    posterior = VariableElimination(network).query(["Burglary"], evidence)
+    assert posterior.values == pytest.approx(brute_force(network, "Burglary", evidence))
+
+
+def test_impossible_evidence():
+    engine = VariableElimination(car_network())
+    assert engine.probability({"CarStarts": "Yes", "Battery": "Dead"}) == 0
+    assert math.isinf(engine.log_probability({"CarStarts": "Yes", "Battery": "Dead"}))
+    with pytest.raises(ZeroDivisionError):
+        engine.mpe({"CarStarts": "Yes", "Battery": "Dead"})
+
+
+def test_cache_follows_network_changes(brute_force):
+    network = random_network(5, seed=1)
+    engine = VariableElimination(network)
+    engine.query(["X0"], {"X4": "s1"})
+    network.set_cpt("X0", [0.9, 0.1])
+    assert engine.query(["X0"], {"X4": "s1"}).values == pytest.approx(brute_force(network, "X0", {"X4": "s1"}))
+
+
+def test_queried_and_observed():
+    with pytest.raises(ValueError):
+        VariableElimination(alarm_network()).query(["Alarm"], {"Alarm": "True"})
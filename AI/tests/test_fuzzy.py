@@ -0,0 +1,109 @@
+import math
+
+import numpy as np
+import pytest
+
+from reasoning.fuzzy import Trapezoid, Triangle, parse_rule, parse_system, parse_variable
+
+VARIABLES = """service [0, 10]: poor = gaussian(0, 1.5); good = gaussian(5, 1.5); excellent = gaussian(10, 1.5)
+food [0, 10]: rancid = trapezoid(0, 0, 1, 3); delicious = trapezoid(7, 9, 10, 10)
+tip [0, 30]: cheap = triangle(0, 5, 10); average = triangle(10, 15, 20); generous = triangle(20, 25, 30)"""
+RULES = """IF service IS poor OR food IS rancid THEN tip IS cheap
+IF service IS good THEN tip IS average
+IF service IS excellent OR food IS delicious THEN tip IS generous"""
+
+
+def gaussian(x, mean):
+    return math.exp(-0.5 * ((x - mean) / 1.5) ** 2)
+
+
+def ramp(x, a, b, c, d):
+    rise = 1.0 if a == b and x >= a else min(max((x - a) / (b - a), 0), 1) if b > a else 0.0
+    fall = 1.0 if c == d and x <= d else min(max((d - x) / (d - c), 0), 1) if d > c else 0.0
+    return min(rise, fall)
+
+
+def brute_force(service, food, method, points=501):
+    # The tipping controller one input and one universe point at a time
+    strengths = {
+        (0, 5, 10): max(gaussian(service, 0), ramp(food, 0, 0, 1, 3)),
+        (10, 15, 20): gaussian(service, 5),
+        (20, 25, 30): max(gaussian(service, 10), ramp(food, 7, 9, 10, 10)),
+    }
+    universe = [30 * i / (points - 1) for i in range(points)]
+    if method == "sugeno":
+        # Each output term stands for its centroid over the same universe
+        def centre(a, b, c):
+            mu = [ramp(y, a, b, b, c) for y in universe]
+            return sum(m * y for m, y in zip(mu, universe)) / sum(mu)
+        return sum(w * centre(*term) for term, w in strengths.items()) / sum(strengths.values())
+    mu = [max(min(w, ramp(y, a, b, b, c)) for (a, b, c), w in strengths.items()) for y in universe]
+    if method == "centroid":
+        return sum(m * y for m, y in zip(mu, universe)) / sum(mu)
+    half, running = sum(mu) / 2, 0.0
+    for m, y in zip(mu, universe):
+        running += m
+        if running >= half:
+            return y
+
+
+@pytest.fixture
+def system():
+    return parse_system(VARIABLES, RULES)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_batch_matches_brute_force(system, seed):
+    rng = np.random.default_rng(seed)
+    service, food = rng.uniform(0, 10, 20), rng.uniform(0, 10, 20)
+    centroids = system.infer({"service": service, "food": food})
+    bisectors = system.infer({"service": service, "food": food}, defuzzify="bisector")
+    sugeno = system.infer({"service": service, "food": food}, method="sugeno")
+    step = 30 / 500
+    for i, (s, f) in enumerate(zip(service, food)):
+        assert centroids[i] == pytest.approx(brute_force(s, f, "centroid"))
+        assert abs(bisectors[i] - brute_force(s, f, "bisector")) <= step
+        assert sugeno[i] == pytest.approx(brute_force(s, f, "sugeno"))
+
+
+def test_batch_matches_one_at_a_time(system):
+    service, food = np.meshgrid(np.linspace(0, 10, 7), np.linspace(0, 10, 5))
+    batch = system.infer({"service": service, "food": food})
+    assert batch.shape == service.shape
+    for index in np.ndindex(service.shape):
+        assert batch[index] == pytest.approx(system.infer({"service": service[index], "food": food[index]}))
+
+
+def test_linear_sugeno():
+    system = parse_system("x [0, 10]: low = trapezoid(0, 0, 2, 8); high = trapezoid(2, 8, 10, 10)\ny [0, 30]",
+                          "IF x IS low THEN y = 1\nIF x IS high THEN y = 2 + 2 * x")
+    x = np.array([0.0, 5.0, 10.0])
+    low, high = Trapezoid(0, 0, 2, 8)(x), Trapezoid(2, 8, 10, 10)(x)
+    expected = (low * 1 + high * (2 + 2 * x)) / (low + high)
+    assert system.infer({"x": x}, method="sugeno") == pytest.approx(expected)
+    with pytest.raises(ValueError):
+        system.infer({"x": x})
+
+
+def test_no_rule_fires():
+    system = parse_system("x [0, 10]: mid = triangle(4, 5, 6)\ny [0, 1]: on = triangle(0, 1, 1)",
+                          "IF x IS mid THEN y IS on")
+    assert np.isnan(system.infer({"x": 0.0}))
+
+
+def test_operators():
+    variable = parse_variable("x [0, 10]: a = triangle(0, 5, 10); b = trapezoid(0, 0, 2, 4)")
+    assert variable.membership("a", 2.5) == pytest.approx(0.5)
+    rule = parse_rule("IF x IS a AND x IS NOT b THEN y IS on")
+    assert repr(rule) == "IF x IS a AND x IS NOT b THEN y IS on"
+    assert Triangle(0, 5, 10)(np.array([0, 5, 7.5])) == pytest.approx([0, 1, 0.5])
+
+
+@pytest.mark.parametrize("variables, rules", [
+    ("x [0, 1]: a = triangle(1, 0, 2)\ny [0, 1]: b = triangle(0, 1, 1)", "IF x IS a THEN y IS b"),
+    ("x [0, 1]: a = triangle(0, 0, 1)\ny [0, 1]: b = triangle(0, 1, 1)", "IF z IS a THEN y IS b"),
+    ("x [0, 1]: a = triangle(0, 0, 1)\ny [0, 1]: b = triangle(0, 1, 1)", "IF x IS c THEN y IS b"),
+])
+def test_bad_systems(variables, rules):
+    with pytest.raises((ValueError, KeyError)):
+        parse_system(variables, rules)
@@ -0,0 +1,80 @@
+import json
+import os
+import subprocess
+import sys
+
+AI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Metrics are switched on by the environment at import, so each case renders a
+# small page in a fresh interpreter (streamlit in bare mode)
+RENDER = """
+import json
+import streamlit as st
+import instrumentation
+import pandas as pd
+
+from tables import content_table
+
+with instrumentation.measure("unit5", "Home"):
+    st.markdown("<b>hi</b>", unsafe_allow_html=True)
+    st.markdown("plain")
+    st.sidebar.markdown("side")
+    st.latex("x^2")
+    st.table(content_table({"a": [1, 2]}))
+    pd.Series([1, 2])
+instrumentation.begin("unit5", "Home")
+st.markdown("second render")
+instrumentation.end()
+# A render that raised before end(): dropped by the next begin()
+instrumentation.begin("unit5", "Broken")
+st.markdown("never finished")
+instrumentation.begin("planning", "Home")
+instrumentation.end()
+
+print(json.dumps({
+    "patched": instrumentation._patched_streamlit,
+    "enabled": instrumentation.ENABLED,
+    "stats": {"/".join(key): stats for key, stats in instrumentation.snapshot().items()},
+}))
+"""
+
+
+def render(**env):
+    environment = {k: v for k, v in os.environ.items() if not k.startswith("STUDY_APP_METRICS")}
+    environment.update(env)
+    result = subprocess.run([sys.executable, "-c", RENDER], cwd=AI_DIR, env=environment,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_disabled_is_a_no_op():
+    result = render()
+    assert result["enabled"] is False
+    assert result["patched"] is False
+    assert result["stats"] == {}
+
+
+def test_counts_per_page():
+    result = render(STUDY_APP_METRICS="1")
+    assert result["enabled"] is True
+    assert result["patched"] is True
+    assert set(result["stats"]) == {"unit5/Home", "planning/Home"}
+    home = result["stats"]["unit5/Home"]
+    assert home["renders"] == 2
+    assert home["calls"] == {"markdown": 4, "latex": 1, "table": 1, "dataframe": 0}
+    assert home["html_bytes"] == len("<b>hi</b>")
+    assert home["pandas_objects"] >= 1
+    assert home["seconds_total"] >= home["seconds_max"] >= home["seconds_last"] >= 0
+    assert result["stats"]["planning/Home"]["renders"] == 1
+
+
+def test_prometheus_file(tmp_path):
+    path = tmp_path / "metrics.prom"
+    render(STUDY_APP_METRICS_FILE=str(path))
+    text = path.read_text(encoding="utf-8")
+    assert "# TYPE study_page_renders_total counter" in text
+    assert 'study_page_renders_total{guide="unit5",page="Home"} 2' in text
+    assert 'study_page_st_calls_total{guide="unit5",page="Home",call="markdown"} 4' in text
+    assert 'study_page_html_bytes_total{guide="unit5",page="Home"} 9' in text
+    assert "Broken" not in text
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,73 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from reasoning.joint import JointDistribution
+
+VARIABLES = {"A": ["a0", "a1"], "B": ["b0", "b1", "b2"], "C": ["c0", "c1"]}
+
+
+def random_joint(seed, sparse=False):
+    table = np.random.default_rng(seed).random([len(s) for s in VARIABLES.values()])
+    return JointDistribution(VARIABLES, table, sparse=sparse), table / table.sum()
+
+
+def brute_force(table, event, given):
+    # Sums the matching cells one combination of states at a time
+    names = list(VARIABLES)
+    def mass(evidence):
+        return sum(table[index] for index in itertools.product(*(range(len(s)) for s in VARIABLES.values()))
+                   if all(VARIABLES[n][index[names.index(n)]] == s for n, s in evidence.items()))
+    return mass({**event, **given}) / mass(given)
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+@pytest.mark.parametrize("seed", range(3))
+def test_probability_matches_brute_force(seed, sparse):
+    joint, table = random_joint(seed, sparse)
+    for a, b in itertools.product(VARIABLES["A"], VARIABLES["B"]):
+        assert joint.ask(f"P(A={a} | B={b})") == pytest.approx(brute_force(table, {"A": a}, {"B": b}))
+        assert joint.ask(f"P(A={a}, B={b})") == pytest.approx(brute_force(table, {"A": a, "B": b}, {}))
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+@pytest.mark.parametrize("seed", range(3))
+def test_fixed_evidence_conditions_the_table(seed, sparse):
+    joint, table = random_joint(seed, sparse)
+    answer = joint.ask("P(A | B=b1)")
+    assert answer.variables == ("A",)
+    for i, a in enumerate(VARIABLES["A"]):
+        assert answer.values[i] == pytest.approx(brute_force(table, {"A": a}, {"B": "b1"}))
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_fixed_and_free_evidence(sparse):
+    joint, table = random_joint(7, sparse)
+    answer = joint.ask("P(A | B=b2, C)")
+    assert answer.variables == ("C", "A")
+    for (i, c), (j, a) in itertools.product(enumerate(VARIABLES["C"]), enumerate(VARIABLES["A"])):
+        assert answer.values[i, j] == pytest.approx(brute_force(table, {"A": a}, {"B": "b2", "C": c}))
+
+
+def test_impossible_fixed_evidence():
+    table = np.ones((2, 3, 2))
+    table[:, 0, :] = 0
+    with pytest.raises(ZeroDivisionError):
+        JointDistribution(VARIABLES, table).ask("P(A | B=b0, C)")
+
+
+@pytest.mark.parametrize("question", ["P(A | A)", "P(A, A)", "P(A | B=b0, A)", "A _|_ A", "A _|_ B | B"])
+def test_repeated_variables_are_rejected(question):
+    joint, _ = random_joint(0)
+    with pytest.raises(ValueError):
+        joint.ask(question)
+
+
+def test_independence():
+    a, b = np.array([0.3, 0.7]), np.array([0.2, 0.5, 0.3])
+    joint = JointDistribution(VARIABLES, np.einsum("i,j,k->ijk", a, b, [0.4, 0.6]))
+    assert joint.ask("A _|_ B")
+    assert joint.ask("A _|_ B | C")
+    dependent, _ = random_joint(1)
+    assert not dependent.ask("A _|_ B")
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from reasoning.bayesnet import alarm_network, random_network
+from reasoning.junction_tree import JunctionTree, compile_network
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_marginals_match_brute_force(brute_force, seed):
+    rng = np.random.default_rng(seed)
+    network = random_network(8, max_parents=3, states=(2, 3), seed=seed)
+    tree = JunctionTree(network)
+    names = rng.choice(network.nodes, size=2, replace=False)
+    evidence = {name: network.states[name][0] for name in names}
+    for name, marginal in tree.marginals(evidence).items():
+        assert list(marginal.values()) == pytest.approx(brute_force(network, name, evidence))
+
+
+def test_every_clique_is_consistent(joint_rows):
+    network = random_network(7, seed=2)
+    tree = JunctionTree(network)
+    evidence = {"X6": "s1"}
+    rows = [(row, p) for row, p in joint_rows(network) if row["X6"] == "s1"]
+    assert tree.probability(evidence) == pytest.approx(sum(p for _, p in rows))
+    for clique in tree.cliques:
+        free = [v for v in clique if v not in evidence][:2]
+        table = tree.query(free, evidence)
+        for index in np.ndindex(table.values.shape):
+            states = {v: network.states[v][i] for v, i in zip(free, index)}
+            expected = sum(p for row, p in rows if all(row[v] == s for v, s in states.items()))
+            assert table.values[index] == pytest.approx(expected / sum(p for _, p in rows))
+
+
+def test_changing_evidence_reuses_messages(brute_force):
+    network = alarm_network()
+    tree = JunctionTree(network)
+    tree.marginals({"DavidCalls": "True"})
+    misses = tree.misses
+    evidence = {"DavidCalls": "True", "SophiaCalls": "False"}
+    marginals = tree.marginals(evidence)
+    assert tree.misses - misses < 2 * len(tree.cliques)
+    for name, marginal in marginals.items():
+        assert list(marginal.values()) == pytest.approx(brute_force(network, name, evidence))
+
+
+def test_compiled_once_per_version():
+    network = random_network(5, seed=0)
+    tree = compile_network(network)
+    assert compile_network(network) is tree
+    network.set_cpt("X0", [0.5, 0.5])
+    assert compile_network(network) is not tree
+
+
+def test_query_outside_one_clique():
+    network = random_network(10, max_parents=1, seed=3)
+    tree = JunctionTree(network)
+    together = {frozenset(c) for c in tree.cliques}
+    pair = next((a, b) for a in network.nodes for b in network.nodes
+                if a != b and not any({a, b} <= c for c in together))
+    with pytest.raises(ValueError):
+        tree.query(list(pair))
@@ -0,0 +1,84 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from reasoning.bayesnet import alarm_network, random_network
+from reasoning.learning import CPTLearner, sample_frame
+
+
+def test_chunked_update_matches_one_shot():
+    network = random_network(6, max_parents=2, states=(2, 3), seed=2)
+    frame = sample_frame(network, 5000, seed=3)
+    whole = CPTLearner(network).update(frame)
+    chunked = CPTLearner(network)
+    for start in range(0, len(frame), 700):
+        chunked.update(frame.iloc[start:start + 700])
+    assert chunked.rows == whole.rows == len(frame)
+    for name in network.nodes:
+        assert np.array_equal(chunked.counts[name], whole.counts[name])
+
+
+def test_read_csv_matches_update():
+    network = alarm_network()
+    frame = sample_frame(network, 3000, seed=5)
+    streamed = CPTLearner(network).read_csv(io.StringIO(frame.to_csv(index=False)), chunk_rows=400)
+    direct = CPTLearner(network).update(frame)
+    for name in network.nodes:
+        assert np.array_equal(streamed.counts[name], direct.counts[name])
+
+
+def test_counts_are_family_frequencies():
+    network = alarm_network()
+    frame = sample_frame(network, 2000, seed=1)
+    learner = CPTLearner(network).update(frame)
+    parents = list(network.parents["Alarm"])
+    grouped = frame.groupby(parents + ["Alarm"]).size()
+    for key, count in grouped.items():
+        index = tuple(network.states[v].index(s) for v, s in zip(parents + ["Alarm"], key))
+        assert learner.counts["Alarm"][index] == count
+    assert learner.counts["Alarm"].sum() == len(frame)
+
+
+def test_laplace_smoothing():
+    network = alarm_network()
+    learner = CPTLearner(network)
+    assert np.allclose(learner.cpt("Burglary"), 0.5)
+    learner.update(pd.DataFrame({name: [network.states[name][0]] * 3 for name in network.nodes}))
+    # three rows of the first state: (3 + 1) / (3 + 2) with add-one smoothing
+    assert learner.cpt("Burglary", 1.0) == pytest.approx([4 / 5, 1 / 5])
+    assert learner.cpt("Burglary", 0.5) == pytest.approx([3.5 / 4, 0.5 / 4])
+    assert learner.cpt("Burglary", 0.0) == pytest.approx([1.0, 0.0])
+    # unseen parent configurations stay uniform without smoothing
+    table = learner.cpt("Alarm", 0.0)
+    assert np.allclose(table.sum(axis=-1), 1)
+    assert np.allclose(table[1, 1], 0.5)
+
+
+def test_unknown_values_are_skipped_per_family():
+    network = alarm_network()
+    frame = sample_frame(network, 100, seed=0)
+    frame.loc[:9, "Burglary"] = "Maybe"
+    frame.loc[10:14, "Earthquake"] = None
+    learner = CPTLearner(network).update(frame)
+    assert learner.skipped["Burglary"] == 10
+    assert learner.skipped["Earthquake"] == 5
+    assert learner.skipped["Alarm"] == 15
+    assert learner.skipped[network.nodes[-1]] == 0
+    assert learner.counts["Burglary"].sum() == 90
+    assert learner.rows == 100
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_recovers_known_cpts(seed):
+    network = random_network(5, max_parents=2, states=(2, 3), seed=seed)
+    learner = CPTLearner(network).update(sample_frame(network, 200_000, seed=seed))
+    learned = learner.network()
+    for name in network.nodes:
+        assert learned.parents[name] == network.parents[name]
+        # rows for parent configurations seen at least 2000 times are within
+        # about four standard errors
+        seen = learner.counts[name].sum(axis=-1) >= 2000
+        assert seen.any()
+        assert learned.cpts[name].values[seen] == pytest.approx(network.cpts[name].values[seen], abs=0.05)
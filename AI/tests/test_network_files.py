@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from reasoning import network_files
+from reasoning.bayesnet import alarm_network, random_network
+from reasoning.network_files import file_digest, load_network, read_network, save_network
+
+
+def assert_same_network(a, b):
+    assert a.nodes == b.nodes
+    for name in a.nodes:
+        assert a.states[name] == b.states[name]
+        assert a.parents[name] == b.parents[name]
+        assert a.cpts[name].values == pytest.approx(b.cpts[name].values)
+
+
+@pytest.mark.parametrize("ext", [".bif", ".xml", ".json", ".jsonl"])
+@pytest.mark.parametrize("make", [alarm_network, lambda: random_network(12, states=(2, 4), seed=5)])
+def test_round_trip(tmp_path, ext, make):
+    network = make()
+    path = str(tmp_path / f"net{ext}")
+    save_network(network, path)
+    assert_same_network(network, read_network(path))
+    with open(path, "rb") as f:
+        assert_same_network(network, read_network(f.read(), network_files.FORMATS[ext]))
+
+
+def test_cache_hit_and_miss(tmp_path):
+    path, cache = str(tmp_path / "alarm.bif"), str(tmp_path / "cache")
+    save_network(alarm_network(), path)
+    first, hit = load_network(path, cache_dir=cache)
+    assert not hit
+    again, hit = load_network(path, cache_dir=cache)
+    assert hit
+    assert_same_network(first, again)
+
+    # An edited file has a new hash, so it is parsed again
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text.replace("table 0.002, 0.998", "table 0.01, 0.99"))
+    edited, hit = load_network(path, cache_dir=cache)
+    assert not hit
+    assert edited.cpts["Burglary"].values == pytest.approx([0.01, 0.99])
+
+
+def test_uploaded_bytes_skip_the_disk_cache(tmp_path):
+    path, cache = str(tmp_path / "alarm.json"), tmp_path / "cache"
+    save_network(alarm_network(), path)
+    with open(path, "rb") as f:
+        source = f.read()
+    assert load_network(source, "json", cache_dir=str(cache))[1] is False
+    assert not cache.exists()
+    assert file_digest(source) == file_digest(path)
+
+
+def test_chunked_json(tmp_path, monkeypatch):
+    # Reads of a few bytes split names, numbers and separators across chunks
+    network = random_network(8, states=3, seed=2)
+    path = str(tmp_path / "net.json")
+    save_network(network, path)
+    monkeypatch.setattr(network_files, "READ_BYTES", 7)
+    assert_same_network(network, read_network(path))
+    # A top-level list of nodes works too
+    with open(path, encoding="utf-8") as f:
+        nodes = json.load(f)["nodes"]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(nodes, f)
+    assert_same_network(network, read_network(path))
+
+
+def node(name, states, parents, cpt):
+    return json.dumps({"name": name, "states": states, "parents": parents, "cpt": cpt})
+
+
+@pytest.mark.parametrize("lines, message", [
+    ([node("A", ["t", "f"], [], [0.5, 0.6])], "sum to 1"),
+    ([node("A", ["t", "f"], [], [1.5, -0.5])], "sum to 1"),
+    ([node("A", ["t", "f"], ["Z"], [[0.5, 0.5], [0.5, 0.5]])], "unknown parent"),
+    ([node("A", ["t", "f"], ["B"], [[0.5, 0.5], [0.5, 0.5]]),
+      node("B", ["t", "f"], ["A"], [[0.5, 0.5], [0.5, 0.5]])], "cycle"),
+    ([node("A", ["t", "f"], [], [0.5, 0.25, 0.25])], "numbers"),
+    ([node("A", ["t", "f"], [], [0.5, 0.5]), node("A", ["t", "f"], [], [0.5, 0.5])], "twice"),
+])
+def test_malformed_networks(tmp_path, lines, message):
+    path = tmp_path / "bad.jsonl"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=message):
+        read_network(str(path))
+
+
+def test_malformed_bif(tmp_path):
+    path = tmp_path / "bad.bif"
+    path.write_text("variable A {\n  type discrete [ 2 ] { t, f };\n}\n"
+                    "probability ( A | B ) {\n  (t) 0.5, 0.5;\n  (f) 0.5, 0.5;\n}\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="unknown parent"):
+        read_network(str(path))
+    path.write_text("variable A {\n  type discrete [ 2 ] { t, f };\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="ends inside"):
+        read_network(str(path))
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        network_files.file_format("net.csv")
+    assert read_network(b'{"nodes": []}', "json").nodes == []
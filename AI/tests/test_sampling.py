@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from reasoning.bayesnet import alarm_network, car_network, random_network
+from reasoning.sampling import gibbs_sampling, likelihood_weighting, rejection_sampling
+
+SAMPLERS = [rejection_sampling, likelihood_weighting, gibbs_sampling]
+
+
+@pytest.mark.parametrize("sampler", SAMPLERS)
+@pytest.mark.parametrize("seed", range(3))
+def test_random_network_matches_brute_force(brute_force, sampler, seed):
+    network = random_network(6, max_parents=2, states=(2, 3), seed=seed)
+    evidence = {"X5": "s0"}
+    estimate = sampler(network, "X1", evidence, n=20000, seed=seed)
+    assert list(estimate.distribution.values()) == pytest.approx(brute_force(network, "X1", evidence), abs=0.04)
+
+
+@pytest.mark.parametrize("sampler", SAMPLERS)
+def test_alarm(brute_force, sampler):
+    network = alarm_network()
+    evidence = {"DavidCalls": "True"}
+    estimate = sampler(network, "Alarm", evidence, n=50000, seed=1)
+    assert estimate.distribution["True"] == pytest.approx(brute_force(network, "Alarm", evidence)[0], abs=0.02)
+
+
+def test_seeded_runs_repeat():
+    network = random_network(8, seed=4)
+    first = gibbs_sampling(network, "X0", {"X7": "s1"}, n=2000, seed=9)
+    second = gibbs_sampling(network, "X0", {"X7": "s1"}, n=2000, seed=9)
+    assert first.distribution == second.distribution
+
+
+def test_gibbs_with_deterministic_cpts(brute_force):
+    # Most forward samples make CarStarts=Yes impossible; the chains must
+    # start from the ones that do not
+    network = car_network()
+    estimate = gibbs_sampling(network, "Battery", {"CarStarts": "Yes"}, n=5000, seed=0)
+    assert estimate.distribution["Working"] == 1.0
+    estimate = gibbs_sampling(network, "Lights", {"CarStarts": "Yes"}, n=20000, seed=0)
+    expected = brute_force(network, "Lights", {"CarStarts": "Yes"})
+    assert list(estimate.distribution.values()) == pytest.approx(expected, abs=0.02)
+
+
+@pytest.mark.parametrize("sampler", SAMPLERS)
+def test_impossible_evidence(sampler):
+    with pytest.raises(ZeroDivisionError):
+        sampler(car_network(), "Lights", {"CarStarts": "Yes", "Battery": "Dead"}, n=1000, seed=0)
+
+
+def test_queried_and_observed():
+    with pytest.raises(ValueError):
+        gibbs_sampling(alarm_network(), "Alarm", {"Alarm": "True"})
+    assert np.isfinite(likelihood_weighting(alarm_network(), "Alarm", n=100, seed=0).ess)
@@ -0,0 +1,117 @@
+import os
+import sys
+
+import pytest
+
+import search
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools"))
+
+import guide_pages  # noqa: E402
+
+
+def page(guide, name, *blocks):
+    return {"guide": guide, "page": name, "blocks": list(blocks)}
+
+
+def markdown(text):
+    return {"type": "markdown", "text": text}
+
+
+CORPUS = [
+    page("planning", "STRIPS",
+         markdown("<b>STRIPS</b> operators have preconditions, an add list and a delete list."),
+         {"type": "tabs", "tabs": [{"label": "Blocks World", "children": [
+             markdown("Stack block A on block B; a block can hold one block.")]}]}),
+    page("planning", "Search",
+         markdown("Forward search from the initial state; backward search regresses goals."),
+         {"type": "table", "columns": ["Search", "Direction"], "rows": [["Progression", "forward"]]}),
+    page("unit5", "Prolog",
+         markdown("Facts and rules: `parent(abbott, costello).` A **block** of clauses."),
+         {"type": "expander", "label": "Backtracking", "children": [markdown("Prolog retries the next clause.")]}),
+]
+
+
+@pytest.fixture
+def index():
+    return search.SearchIndex(CORPUS)
+
+
+def test_sections_are_documents(index):
+    # Each page, tab and expander is its own section
+    assert [(guide, name, path) for guide, name, path, _ in index.docs] == [
+        ("planning", "STRIPS", []), ("planning", "STRIPS", ["Blocks World"]),
+        ("planning", "Search", []), ("unit5", "Prolog", []), ("unit5", "Prolog", ["Backtracking"])]
+    # Markup is stripped from the indexed text
+    assert index.docs[0][3].startswith("STRIPS operators")
+    assert "**" not in index.docs[3][3] and "`" not in index.docs[3][3]
+
+
+def test_ranking(index):
+    # Four mentions in a short section beat one in a longer page
+    ranked = [index.docs[doc][:3] for _, doc in index.search("block")]
+    assert ranked == [("planning", "STRIPS", ["Blocks World"]), ("unit5", "Prolog", [])]
+    # The rarer term decides between sections that share a common one
+    first = index.search("search forward")[0][1]
+    assert index.docs[first][1] == "Search"
+    scores = [score for score, _ in index.search("prolog clause")]
+    assert scores == sorted(scores, reverse=True)
+    # Section titles and tables are searchable
+    assert index.docs[index.search("backtracking")[0][1]][2] == ["Backtracking"]
+    assert index.docs[index.search("progression")[0][1]][1] == "Search"
+
+
+def test_query_terms_are_case_and_punctuation_blind(index):
+    assert index.search("ABBOTT!") == index.search("abbott")
+    assert index.search("abbott abbott") == index.search("abbott")
+
+
+@pytest.mark.parametrize("query", ["", "   ", "?!", "zebra", "zebra unicorn"])
+def test_no_results(index, query):
+    assert index.search(query) == []
+
+
+def test_limit(index):
+    assert len(index.search("block search prolog strips", limit=2)) == 2
+    assert len(index.search("block search prolog strips")) == search.MAX_RESULTS
+
+
+def test_snippet_marks_hits(index):
+    doc = index.search("costello")[0][1]
+    assert "**costello**" in index.snippet(doc, "costello")
+    assert index.snippet(doc, "") == index.docs[doc][3][:search.SNIPPET_CHARS]
+
+
+def test_empty_corpus():
+    assert search.SearchIndex([]).search("anything") == []
+
+
+@pytest.fixture(scope="module")
+def guide_page_names():
+    return {guide["slug"]: guide_pages.page_names(guide) for guide in guide_pages.GUIDES}
+
+
+@pytest.mark.parametrize("query", ["Blocks World", "Abbott", "Bayes", "belief plausibility", "Prolog",
+                                   "fuzzy membership", "STRIPS", "certainty factor"])
+def test_hits_resolve_to_pages(guide_page_names, query):
+    # Every result opens an existing page of an existing guide
+    index = search.SearchIndex(search.load_sources())
+    results = index.search(query)
+    assert results
+    for _, doc in results:
+        guide, name, _, _ = index.docs[doc]
+        assert guide in search.GUIDE_TITLES
+        assert name in guide_page_names[guide]
+
+
+def test_open_switches_the_navigation():
+    guide = guide_pages.get_guide("planning")
+    at = guide_pages.new_app(guide).run()
+    assert guide_pages.nav_radio(at).key == search.nav_key("planning")
+    index = search.SearchIndex(search.load_sources())
+    result_guide, name, _, _ = index.docs[index.search("Blocks World")[0][1]]
+    assert result_guide == "planning"
+    at.text_input(key="search_query").set_value("Blocks World").run()
+    at.button(key="search_open_0").click().run()
+    assert not at.exception
+    assert guide_pages.nav_radio(at).value == name
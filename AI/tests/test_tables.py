@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import tables
+from tables import content_table
+
+AI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DATA = {
+    "System": ["MYCIN", "DENDRAL", "XCON"],
+    "Domain": ["Medicine", "Chemistry", "Configuration"],
+    "Year": [1976, 1965, 1980],
+    "CF": [0.6, None, 1.0],
+}
+
+# Each table twice, shared and eager, in the order the assertions read them
+PAGE = """
+import pandas as pd
+import streamlit as st
+
+from tables import content_table
+
+DATA = {data!r}
+st.table(content_table(DATA))
+st.table(pd.DataFrame(DATA))
+st.dataframe(content_table(DATA))
+st.dataframe(pd.DataFrame(DATA))
+"""
+
+
+def test_renders_like_an_eager_frame(tmp_path):
+    script = tmp_path / "page.py"
+    script.write_text(PAGE.format(data=DATA), encoding="utf-8")
+    at = AppTest.from_file(str(script)).run()
+    assert not at.exception
+    shared, eager = at.table
+    assert shared.proto == eager.proto
+    shared, eager = at.dataframe
+    assert shared.proto == eager.proto
+    pd.testing.assert_frame_equal(pd.DataFrame(content_table(DATA)), pd.DataFrame(DATA))
+
+
+def test_pandas_is_imported_on_first_table():
+    code = ("import sys, tables\n"
+            "print('pandas' in sys.modules)\n"
+            "tables.content_table({'a': [1]})\n"
+            "print('pandas' in sys.modules)\n")
+    result = subprocess.run([sys.executable, "-c", code], cwd=AI_DIR, capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["False", "True"]
+
+
+def test_built_once_per_content():
+    before = tables.build_count
+    first = content_table({"x": [1, 2], "y": ["a", "b"]})
+    assert content_table({"x": [1, 2], "y": ["a", "b"]}) is first
+    assert tables.build_count == before + 1
+    assert content_table({"x": [1, 2], "y": ["a", "c"]}) is not first
+    assert tables.build_count == before + 2
+
+
+def test_frozen():
+    table = content_table(DATA)
+    with pytest.raises(TypeError, match="read-only"):
+        table["New"] = 1
+    with pytest.raises(TypeError, match="read-only"):
+        del table["CF"]
+    with pytest.raises(TypeError, match="read-only"):
+        table.loc[0, "Year"] = 2000
+    with pytest.raises(TypeError, match="read-only"):
+        table.iat[0, 2] = 2000
+    with pytest.raises(TypeError, match="read-only"):
+        table.pop("CF")
+    assert table.loc[0, "System"] == "MYCIN"
+    assert table.iloc[1]["Year"] == 1965
+    # Derived frames are plain, editable DataFrames
+    editable = table.copy()
+    assert type(editable) is pd.DataFrame
+    editable["New"] = 1
+    assert type(table[table["Year"] > 1970]) is pd.DataFrame
+    assert "New" not in content_table(DATA)
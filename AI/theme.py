@@ -0,0 +1,84 @@
+# Shared look for the study guides. Each guide's stylesheet lives here once,
+# so the standalone apps and the multipage launcher inject the same CSS.
+
+import streamlit as st
+
+GUIDE_CSS = {
+    "uncertainty": """
+    .main-header {
+        font-size: 2.5rem;
+        font-weight: bold;
+        color: #1f77b4;
+        margin-bottom: 1rem;
+    }
+    .concept-box {
+        background-color: #E3F2FD;
+        padding: 20px;
+        border-left: 5px solid #2196F3;
+        border-radius: 10px;
+        margin: 15px 0;
+    }
+    .example-box {
+        background-color: #FFF3E0;
+        padding: 20px;
+        border-left: 5px solid #FF9800;
+        border-radius: 10px;
+        margin: 15px 0;
+    }
+    .warning-box {
+        background-color: #FFEBEE;
+        padding: 20px;
+        border-left: 5px solid #F44336;
+        border-radius: 10px;
+        margin: 15px 0;
+    }
+    .definition-box {
+        background-color: #F3E5F5;
+        padding: 20px;
+        border-left: 5px solid #9C27B0;
+        border-radius: 10px;
+        margin: 15px 0;
+    }
+    .formula-box {
+        background-color: #E8F5E9;
+        padding: 20px;
+        border-left: 5px solid #4CAF50;
+        border-radius: 10px;
+        margin: 15px 0;
+    }
+""",
+    "planning": """
+    .concept-box {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 20px;
+        border-radius: 10px;
+        color: white;
+        margin: 10px 0;
+    }
+    .example-box {
+        background: #e8f4f8;
+        padding: 15px;
+        border-left: 5px solid #0288d1;
+        border-radius: 5px;
+        margin: 10px 0;
+    }
+    .definition-box {
+        background: #fff3e0;
+        padding: 15px;
+        border-left: 5px solid #f57c00;
+        border-radius: 5px;
+        margin: 10px 0;
+    }
+    .warning-box {
+        background: #ffebee;
+        padding: 15px;
+        border-left: 5px solid #c62828;
+        border-radius: 5px;
+        margin: 10px 0;
+    }
+""",
+}
+
+
+def inject_css(guide):
+    st.markdown(f"<style>{GUIDE_CSS[guide]}</style>", unsafe_allow_html=True)
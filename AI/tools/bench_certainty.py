@@ -0,0 +1,121 @@
+# Certainty-factor consultations: incremental propagation versus full
+# recomputation.
+#
+# For random acyclic rule graphs of growing size, a consultation of --steps
+# changes is played: evidence is added on a random observable fact (or its
+# CF changed) or, with probability --retract, a piece of evidence already
+# given is withdrawn. The incremental engine propagates each change through
+# the premise index, updating the MB/MD accumulators and provenance of the
+# facts downstream only. The baseline recomputes every CF from the evidence
+# after a change, as a system without incremental propagation would; it is
+# timed on --full-runs evenly spaced steps, where both engines are also
+# compared fact by fact.
+#
+#   python AI/tools/bench_certainty.py
+#   python AI/tools/bench_certainty.py --sizes 1000 10000 100000 --steps 2000 --json cf.json
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+
+import guide_pages
+
+sys.path.insert(0, guide_pages.AI_DIR)
+
+from reasoning.certainty import CertaintyEngine, random_rules  # noqa: E402
+
+CFS = [1.0, 0.9, 0.7, 0.5, 0.3, -0.3, -0.6, -1.0]
+
+
+def consultation(engine, steps, retract, rng):
+    # (fact, CF) changes; CF 0 withdraws the fact's evidence
+    observable = engine.observable()
+    given, changes = {}, []
+    for _ in range(steps):
+        if given and rng.random() < retract:
+            fact = rng.choice(sorted(given))
+            del given[fact]
+            changes.append((fact, 0.0))
+        else:
+            fact, cf = rng.choice(observable), rng.choice(CFS)
+            given[fact] = cf
+            changes.append((fact, cf))
+    return changes
+
+
+def mismatches(a, b):
+    facts = set(a.cf) | set(b.cf)
+    wrong = sum(abs(a.cf.get(f, 0.0) - b.cf.get(f, 0.0)) > 1e-9 for f in facts)
+    return wrong + sum(a.explain(f) != b.explain(f) for f in facts)
+
+
+def bench(size, steps, retract, full_runs, seed):
+    rules = random_rules(size, seed=seed)
+    incremental = CertaintyEngine(rules)
+    full = CertaintyEngine(rules)
+    changes = consultation(incremental, steps, retract, random.Random(seed))
+    checked = set(range(steps - 1, -1, -max(1, steps // full_runs)))
+
+    times, evaluations, full_times, full_evaluations, wrong = [], [], [], [], 0
+    for step, (fact, cf) in enumerate(changes):
+        before = incremental.evaluated
+        start = time.perf_counter()
+        if cf:
+            incremental.tell(fact, cf)
+        else:
+            incremental.retract(fact)
+        times.append((time.perf_counter() - start) * 1000)
+        evaluations.append(incremental.evaluated - before)
+
+        if cf:
+            full.evidence[fact] = cf
+        else:
+            full.evidence.pop(fact, None)
+        if step in checked:
+            before = full.evaluated
+            start = time.perf_counter()
+            full.run()
+            full_times.append((time.perf_counter() - start) * 1000)
+            full_evaluations.append(full.evaluated - before)
+            wrong += mismatches(incremental, full)
+
+    return {
+        "rules": size, "facts": len(incremental.facts), "steps": steps,
+        "incremental_ms": statistics.mean(times), "incremental_p99_ms": sorted(times)[int(0.99 * (steps - 1))],
+        "incremental_evaluations": statistics.mean(evaluations),
+        "full_ms": statistics.mean(full_times), "full_evaluations": statistics.mean(full_evaluations),
+        "mismatches": wrong,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare incremental CF propagation with full recomputation.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--retract", type=float, default=0.35, help="share of changes that withdraw evidence")
+    parser.add_argument("--full-runs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results here")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'rules':>7} {'facts':>7} {'incr ms':>8} {'p99 ms':>8} {'evals':>8} "
+          f"{'full ms':>9} {'evals':>8} {'speed-up':>9}")
+    for size in args.sizes:
+        row = bench(size, args.steps, args.retract, args.full_runs, args.seed)
+        results.append(row)
+        note = f"  {row['mismatches']} MISMATCHES" if row["mismatches"] else ""
+        print(f"{size:>7,} {row['facts']:>7,} {row['incremental_ms']:>8.2f} {row['incremental_p99_ms']:>8.2f} "
+              f"{row['incremental_evaluations']:>8.0f} {row['full_ms']:>9.1f} {row['full_evaluations']:>8.0f} "
+              f"{row['full_ms'] / row['incremental_ms']:>8.0f}x{note}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
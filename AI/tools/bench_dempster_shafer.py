@@ -0,0 +1,93 @@
+# Combining many Dempster-Shafer sources: one after another versus a
+# balanced reduction tree, serially and across a process pool.
+#
+# Random sensors (a few focal elements each over a --hypotheses frame, too
+# large for the dense tables) all watch the same true hypothesis. For each
+# number of sources they are combined
+#   sequential  folding the sources in one at a time
+#   tree        combine_sparse(): a balanced tree of pairwise combinations
+#   pool        the same tree over --workers processes (spawn start-up
+#               included)
+# all summarizing to at most --max-focal focal elements. Both error bounds
+# on Bel and Pl are reported: a summarizing error made early in the fold is
+# stretched by every later renormalization, one in the tree by only log2 of
+# the number of sources. Up to --exact-limit sources the unsummarized
+# combination is timed too, with the error the tree actually made.
+#
+#   python AI/tools/bench_dempster_shafer.py
+#   python AI/tools/bench_dempster_shafer.py --sources 2 100 1000 --max-focal 1024 --workers 8 --json ds.json
+
+import argparse
+import json
+import sys
+import time
+
+import guide_pages
+
+sys.path.insert(0, guide_pages.AI_DIR)
+
+from reasoning.dempster_shafer import combine_sparse, random_sources  # noqa: E402
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def sequential(sources, max_focal):
+    # Folds the sources in one at a time, carrying the moved mass the way
+    # combine_sparse() does inside its tree: what was moved so far is
+    # stretched by each renormalization, 1 / (1 - K)
+    combined, moved = sources[0], 0.0
+    for source in sources[1:]:
+        combined, conflict, step = combine_sparse([combined, source], max_focal=max_focal)
+        moved = moved / (1 - conflict) + step / (1 + step)
+    return combined, min(moved / (1 - moved), 1.0) if moved < 1 else 1.0
+
+
+def largest_gap(a, b):
+    # Largest Bel or Pl difference over the single hypotheses
+    a, b = a.intervals(), b.intervals()
+    return max(max(abs(a[h][0] - b[h][0]), abs(a[h][1] - b[h][1])) for h in a)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sparse Dempster-Shafer combination of many sources.")
+    parser.add_argument("--sources", type=int, nargs="+", default=[2, 10, 100, 1000])
+    parser.add_argument("--hypotheses", type=int, default=40)
+    parser.add_argument("--focal", type=int, default=3, help="focal elements per source")
+    parser.add_argument("--max-focal", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--exact-limit", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results here")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'sources':>7} {'sequential':>11} {'bound':>8} {'tree':>9} {'bound':>8} {'pool':>9} {'focal':>6} "
+          f"{'K':>8} {'exact':>9} {'error':>8}")
+    for n in args.sources:
+        sources = random_sources(n, args.hypotheses, focal=args.focal, seed=args.seed)
+        (folded, sequential_bound), sequential_ms = timed(sequential, sources, args.max_focal)
+        (combined, conflict, bound), tree_ms = timed(combine_sparse, sources, max_focal=args.max_focal)
+        _, pool_ms = timed(combine_sparse, sources, max_focal=args.max_focal, workers=args.workers)
+        row = {"sources": n, "sequential_ms": sequential_ms, "sequential_bound": sequential_bound,
+               "tree_ms": tree_ms, "bound": bound, "pool_ms": pool_ms, "focal": len(combined),
+               "conflict": conflict, "sequential_gap": largest_gap(folded, combined)}
+        exact = ""
+        if n <= args.exact_limit:
+            (reference, _, _), row["exact_ms"] = timed(combine_sparse, sources)
+            row["error"] = largest_gap(combined, reference)
+            exact = f"{row['exact_ms']:>9.1f} {row['error']:>8.2g}"
+        results.append(row)
+        print(f"{n:>7,} {sequential_ms:>9.1f}ms {sequential_bound:>8.2g} {tree_ms:>7.1f}ms {bound:>8.2g} "
+              f"{pool_ms:>7.1f}ms {len(combined):>6} {conflict:>8.4f} {exact}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"hypotheses": args.hypotheses, "max_focal": args.max_focal, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# Independence queries and inference pruning on a large random network.
+#
+# 1. Builds the ancestor/descendant index of a --nodes network.
+# 2. Answers a batch of random d-separation queries with Bayes-ball. The
+#    queries come from a limited pool of (source, evidence) contexts, as from
+#    a UI or an analysis script, so most share a cached ball run. Every query
+#    is checked against the textbook test: separation in the moralized
+#    ancestral graph, which is run on the first --check queries for timing.
+# 3. Times the posterior of random variables under a few observations with
+#    variable elimination, with and without pruning the CPTs that Bayes-ball
+#    finds unneeded, on a second network of --infer-nodes (the whole large
+#    network is too wide to eliminate unpruned).
+#
+#   python AI/tools/bench_dsep.py
+#   python AI/tools/bench_dsep.py --nodes 2000 --queries 200000 --json dsep.json
+
+import argparse
+import json
+import random
+import sys
+import time
+
+import guide_pages
+
+sys.path.insert(0, guide_pages.AI_DIR)
+
+from reasoning.bayesnet import random_network  # noqa: E402
+from reasoning.dseparation import IndependenceIndex  # noqa: E402
+from reasoning.elimination import VariableElimination  # noqa: E402
+
+
+def moral_separated(net, xs, ys, given):
+    # Reference: xs and ys are d-separated by `given` iff `given` separates
+    # them in the moral graph of their ancestral set
+    keep, stack = set(xs) | set(ys) | set(given), list(xs) + list(ys) + list(given)
+    while stack:
+        for parent in net.parents[stack.pop()]:
+            if parent not in keep:
+                keep.add(parent)
+                stack.append(parent)
+    graph = {v: set() for v in keep}
+    for v in keep:
+        family = net.parents[v] + (v,)
+        for a in family:
+            graph[a].update(b for b in family if b != a)
+    seen = {x for x in xs if x not in given}
+    stack = list(seen)
+    while stack:
+        for u in graph[stack.pop()]:
+            if u not in given and u not in seen:
+                seen.add(u)
+                stack.append(u)
+    return not seen & (set(ys) - set(given))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark d-separation queries and inference pruning.")
+    parser.add_argument("--nodes", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=100000)
+    parser.add_argument("--contexts", type=int, default=1000, help="distinct (source, evidence) pairs")
+    parser.add_argument("--check", type=int, default=2000, help="queries also run by the reference test")
+    parser.add_argument("--infer-nodes", type=int, default=60)
+    parser.add_argument("--posteriors", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results here")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    net = random_network(args.nodes, seed=args.seed)
+    results = {"nodes": args.nodes}
+
+    start = time.perf_counter()
+    index = IndependenceIndex(net, cache_size=args.contexts)
+    results["index_ms"] = (time.perf_counter() - start) * 1000
+
+    contexts = [([rng.choice(net.nodes)], rng.sample(net.nodes, rng.randint(0, 5))) for _ in range(args.contexts)]
+    queries = []
+    for _ in range(args.queries):
+        xs, given = rng.choice(contexts)
+        queries.append((xs, [rng.choice(net.nodes)], given))
+
+    start = time.perf_counter()
+    answers = index.independent(queries)
+    results["batch_s"] = time.perf_counter() - start
+    results["queries_per_s"] = args.queries / results["batch_s"]
+    results["independent"] = sum(answers)
+
+    checked = queries[:args.check]
+    start = time.perf_counter()
+    expected = [moral_separated(net, *query) for query in checked]
+    results["reference_queries_per_s"] = len(checked) / (time.perf_counter() - start)
+    results["mismatches"] = sum(a != e for a, e in zip(answers, expected))
+
+    print(f"{args.nodes} nodes: index built in {results['index_ms']:.1f} ms")
+    print(f"{args.queries:,} queries over {args.contexts:,} contexts: {results['batch_s']:.2f} s, "
+          f"{results['queries_per_s']:,.0f}/s ({results['independent']:,} independent)")
+    print(f"moral-graph reference: {results['reference_queries_per_s']:,.0f}/s; "
+          f"{results['mismatches']} mismatches in {len(checked):,}")
+
+    net = random_network(args.infer_nodes, seed=args.seed)
+    evidence = {v: rng.choice(net.states[v]) for v in rng.sample(net.nodes, 5)}
+    targets = rng.sample([v for v in net.nodes if v not in evidence], args.posteriors)
+    for prune in (False, True):
+        engine = VariableElimination(net, prune=prune)
+        start = time.perf_counter()
+        for target in targets:
+            engine.query([target], evidence)
+        ms = (time.perf_counter() - start) * 1000 / len(targets)
+        results[f"posterior_ms_{'pruned' if prune else 'full'}"] = ms
+        print(f"{args.infer_nodes} nodes, posterior under 5 observations, "
+              f"{'pruned' if prune else 'full network'}: {ms:.1f} ms each")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
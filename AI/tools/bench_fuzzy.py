@@ -0,0 +1,68 @@
+# Fuzzy inference: one batched pass versus one input at a time.
+#
+# The tipping controller from the fuzzy logic page answers --sizes random
+# (service, food) inputs with Mamdani inference (centroid and bisector) and
+# with Sugeno inference, all in one call to FuzzySystem.infer(). The first
+# --loop inputs are also answered one call each, as a loop over inputs
+# would; both must agree.
+#
+#   python AI/tools/bench_fuzzy.py
+#   python AI/tools/bench_fuzzy.py --sizes 1000 1000000 --points 1001 --json fuzzy.json
+
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+import guide_pages
+
+sys.path.insert(0, guide_pages.AI_DIR)
+
+from reasoning.fuzzy import parse_system  # noqa: E402
+from uncertainty_topics.fuzzy_logic import EXAMPLE_RULES, EXAMPLE_VARIABLES  # noqa: E402
+
+METHODS = [("mamdani", "centroid"), ("mamdani", "bisector"), ("sugeno", "centroid")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched fuzzy inference against a loop over inputs.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--points", type=int, default=501, help="points in the output universe")
+    parser.add_argument("--loop", type=int, default=1000, help="inputs answered one at a time")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results here")
+    args = parser.parse_args()
+
+    system = parse_system(EXAMPLE_VARIABLES, EXAMPLE_RULES)
+    system.output.universe = np.linspace(system.output.low, system.output.high, args.points)
+    rng = np.random.default_rng(args.seed)
+
+    results = []
+    print(f"{'method':>18} {'inputs':>10} {'batch ms':>10} {'us/input':>9} {'loop us/input':>14} {'speed-up':>9}")
+    for method, defuzzify in METHODS:
+        label = method if method == "sugeno" else f"{method} {defuzzify}"
+        service, food = rng.uniform(0, 10, args.loop), rng.uniform(0, 10, args.loop)
+        start = time.perf_counter()
+        looped = np.array([system.infer({"service": s, "food": f}, method, defuzzify) for s, f in zip(service, food)])
+        loop_us = (time.perf_counter() - start) * 1e6 / args.loop
+        if not np.allclose(looped, system.infer({"service": service, "food": food}, method, defuzzify)):
+            raise SystemExit(f"{label}: the batch and the loop disagree")
+        for size in args.sizes:
+            service, food = rng.uniform(0, 10, size), rng.uniform(0, 10, size)
+            start = time.perf_counter()
+            system.infer({"service": service, "food": food}, method, defuzzify)
+            ms = (time.perf_counter() - start) * 1000
+            row = {"method": label, "inputs": size, "batch_ms": ms, "loop_us_per_input": loop_us}
+            results.append(row)
+            print(f"{label:>18} {size:>10,} {ms:>10.1f} {ms * 1000 / size:>9.2f} {loop_us:>14.1f} "
+                  f"{loop_us * size / ms / 1000:>8.0f}x")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"points": args.points, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
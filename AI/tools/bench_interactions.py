@@ -0,0 +1,153 @@
+# Server CPU per interaction: full-script rerun vs fragment rerun.
+#
+# The quiz, the progress tracker and the sidebar search are st.fragment
+# regions, so the browser asks the server to rerun only that region when one
+# of their widgets is used. For each interaction this replays it --repeat
+# times against a local `streamlit run` server twice: once as a full rerun
+# (what every interaction cost before the fragments) and once scoped to its
+# fragment, and reports the server's CPU time and the latency per interaction.
+# Every rerun also has a fixed cost in the server (session messages,
+# websocket I/O), so the same rerun of an empty script is measured as the
+# floor and the saving is reported on the cost above it.
+#
+#   python AI/tools/bench_interactions.py
+#   python AI/tools/bench_interactions.py --repeat 100 --json interactions.json
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+import guide_pages
+from load_sim import Server, Session
+
+# Heavy pages, so the cost of the rest of the script shows
+PROGRESS_PAGE = "9️⃣ Bayesian Networks"
+SEARCH_QUERIES = ["blocks world", "Abbott Babbitt Cabot", "dempster combination", "car cdr"]
+
+
+async def quiz(session, step):
+    # Submit the Unit 5 quiz
+    submit = session.buttons["Submit Quiz"]
+    return [submit], submit
+
+
+async def open_quiz(session):
+    await session.select("Quiz & Summary")
+    for widget_id, options in session.radios.values():
+        session.widget_values[widget_id] = WidgetState(id=widget_id, string_value=options[1])
+
+
+async def progress(session, step):
+    # Tick the current topic on and off in the progress tracker
+    checkbox = session.inputs["✅ Mark this topic complete"]
+    session.widget_values[checkbox] = WidgetState(id=checkbox, bool_value=step % 2 == 0)
+    return [], checkbox
+
+
+async def search(session, step):
+    # Type a new query into the sidebar search
+    box = session.inputs["🔍 Search all guides"]
+    query = SEARCH_QUERIES[step % len(SEARCH_QUERIES)]
+    session.widget_values[box] = WidgetState(id=box, string_value=query)
+    return [], box
+
+
+async def open_topic(session):
+    await session.select(PROGRESS_PAGE)
+
+
+async def no_setup(session):
+    pass
+
+
+async def rerun_only(session, step):
+    return [], None
+
+
+# name -> (guide, page setup, interaction)
+INTERACTIONS = {
+    "quiz submit": ("unit5", open_quiz, quiz),
+    "progress toggle": ("uncertainty", open_topic, progress),
+    "search query": ("uncertainty", open_topic, search),
+}
+
+
+async def measure(server, url, guide, setup, interaction, repeat, scoped):
+    async with Session(url, guide) as session:
+        await session.rerun()
+        await setup(session)
+        # Warm-up run, then time only the repeated interaction
+        triggers, widget_id = await interaction(session, 0)
+        await session.rerun(triggers)
+        session.latencies = []
+        cpu_before = server.cpu_seconds()
+        for step in range(1, repeat + 1):
+            triggers, widget_id = await interaction(session, step)
+            fragment_id = session.fragments.get(widget_id, "") if scoped else ""
+            await session.rerun(triggers, fragment_id)
+        cpu = server.cpu_seconds() - cpu_before
+    return {
+        "cpu_ms": round(cpu / repeat * 1000, 2),
+        "p50_ms": round(statistics.median(session.latencies) * 1000, 2),
+    }
+
+
+async def floor(args):
+    # Server cost of rerunning a one-line script
+    with tempfile.TemporaryDirectory() as tmp:
+        script = os.path.join(tmp, "empty.py")
+        with open(script, "w") as f:
+            f.write("import streamlit as st\nst.write('')\n")
+        with Server(script, args.port) as server:
+            url = f"ws://localhost:{args.port}/_stcore/stream"
+            return await measure(server, url, "empty", no_setup, rerun_only, args.repeat, False)
+
+
+async def bench(args):
+    results = {}
+    for guide in ("uncertainty", "unit5"):
+        names = [name for name, spec in INTERACTIONS.items() if spec[0] == guide]
+        with Server(guide_pages.get_guide(guide)["script"], args.port) as server:
+            url = f"ws://localhost:{args.port}/_stcore/stream"
+            for name in names:
+                _, setup, interaction = INTERACTIONS[name]
+                results[name] = {
+                    mode: await measure(server, url, guide, setup, interaction,
+                                        args.repeat, mode == "fragment")
+                    for mode in ("full", "fragment")
+                }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full and fragment reruns per interaction.")
+    parser.add_argument("--repeat", type=int, default=50, help="interactions per measurement")
+    parser.add_argument("--port", type=int, default=8598)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    base = asyncio.run(floor(args))
+    results = asyncio.run(bench(args))
+    print(f"rerun floor (empty script): {base['cpu_ms']} ms cpu, {base['p50_ms']} ms p50")
+    print(f"{'interaction':<18}{'full cpu ms':>12}{'frag cpu ms':>12}{'saved':>8}"
+          f"{'above floor':>13}{'full p50':>10}{'frag p50':>10}")
+    for name, row in results.items():
+        full, fragment = row["full"], row["fragment"]
+        saved = 1 - fragment["cpu_ms"] / full["cpu_ms"] if full["cpu_ms"] else 0
+        above = full["cpu_ms"] - base["cpu_ms"]
+        saved_above = (full["cpu_ms"] - fragment["cpu_ms"]) / above if above > 0 else 0
+        print(f"{name:<18}{full['cpu_ms']:>12}{fragment['cpu_ms']:>12}{saved:>8.0%}"
+              f"{saved_above:>13.0%}{full['p50_ms']:>10}{fragment['p50_ms']:>10}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"repeat": args.repeat, "floor": base, "interactions": results},
+                      f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
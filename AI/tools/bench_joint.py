@@ -0,0 +1,102 @@
+# Joint-table queries on large tables, dense and sparse.
+#
+# 1. A dense table of --dense-vars binary variables (2^n cells, all nonzero).
+# 2. A sparse table of --sparse-vars ternary variables with --nonzero random
+#    cells - billions of cells, only the nonzero ones stored.
+# Each answers a marginal, a conditional table, a probability under two
+# observations and an independence test; the sparse answers are checked
+# against the same table stored densely when it fits in --check-cells.
+#
+#   python AI/tools/bench_joint.py
+#   python AI/tools/bench_joint.py --dense-vars 24 --sparse-vars 24 --nonzero 5000000 --json joint.json
+
+import argparse
+import json
+import math
+import sys
+import time
+
+import numpy as np
+
+import guide_pages
+
+sys.path.insert(0, guide_pages.AI_DIR)
+
+from reasoning.joint import JointDistribution  # noqa: E402
+
+
+def questions(prefix):
+    return [f"P({prefix}3)", f"P({prefix}0 | {prefix}1)",
+            f"P({prefix}0={{s}} | {prefix}5={{t}}, {prefix}7={{s}})", f"{prefix}0 _|_ {prefix}1 | {prefix}2"]
+
+
+def bench(joint, asked, repeat):
+    times = {}
+    for question in asked:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            joint.ask(question)
+        times[question] = (time.perf_counter() - start) * 1000 / repeat
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark joint-table queries, dense and sparse.")
+    parser.add_argument("--dense-vars", type=int, default=22)
+    parser.add_argument("--sparse-vars", type=int, default=20)
+    parser.add_argument("--nonzero", type=int, default=1000000)
+    parser.add_argument("--check-cells", type=int, default=1 << 24)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results here")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    results = {}
+
+    variables = {f"D{i}": ("a", "b") for i in range(args.dense_vars)}
+    start = time.perf_counter()
+    dense = JointDistribution(variables, rng.random((2,) * args.dense_vars))
+    build = (time.perf_counter() - start) * 1000
+    asked = [q.format(s="a", t="b") for q in questions("D")]
+    results["dense"] = {"cells": dense.size, "build_ms": build, "query_ms": bench(dense, asked, args.repeat)}
+    print(f"{dense}: built in {build:.0f} ms")
+    for question, ms in results["dense"]["query_ms"].items():
+        print(f"  {question:<32} {ms:8.2f} ms")
+
+    variables = {f"S{i}": ("a", "b", "c") for i in range(args.sparse_vars)}
+    size = 3 ** args.sparse_vars
+    codes = rng.integers(0, size, args.nonzero)
+    weights = rng.random(args.nonzero)
+    start = time.perf_counter()
+    sparse = JointDistribution.from_codes(variables, codes, weights)
+    build = (time.perf_counter() - start) * 1000
+    asked = [q.format(s="a", t="b") for q in questions("S")]
+    results["sparse"] = {"cells": size, "nonzero": sparse.nonzero, "build_ms": build,
+                         "query_ms": bench(sparse, asked, args.repeat)}
+    print(f"{sparse}: built in {build:.0f} ms")
+    for question, ms in results["sparse"]["query_ms"].items():
+        print(f"  {question:<32} {ms:8.2f} ms")
+
+    if size <= args.check_cells:
+        table = np.zeros(size)
+        np.add.at(table, codes, weights)
+        reference = JointDistribution(variables, table.reshape(sparse.shape), sparse=False)
+        mismatches = 0
+        for question in asked:
+            a, b = sparse.ask(question), reference.ask(question)
+            same = a == b if isinstance(a, bool) else np.allclose(getattr(a, "values", a), getattr(b, "values", b),
+                                                                  equal_nan=True)
+            mismatches += not same
+        results["sparse"]["mismatches"] = mismatches
+        print(f"  checked against the dense table: {mismatches} mismatches")
+    else:
+        print(f"  (about 10^{math.log10(size):.1f} cells: too large to check densely)")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# Network file loading: parse times per format and reloads from the compiled
+# cache.
+#
+# A random --nodes network is written in every supported format, then each
+# file is loaded three ways: parsed from scratch, through the cache when it is
+# cold (parse, compile and write the .npz) and through it again when warm
+# (read the .npz). Every loaded network is compared with the original.
+#
+#   python AI/tools/bench_network_files.py
+#   python AI/tools/bench_network_files.py --nodes 5000 --states 2 4 --json files.json
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import guide_pages
+
+sys.path.insert(0, guide_pages.AI_DIR)
+
+from reasoning.bayesnet import random_network  # noqa: E402
+from reasoning.network_files import FORMATS, load_network, read_network, save_network  # noqa: E402
+
+
+def same_network(a, b):
+    return (a.nodes == b.nodes and a.parents == b.parents and a.states == b.states
+            and all(np.allclose(a.cpts[name].values, b.cpts[name].values) for name in a.nodes))
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark network file parsing and the compiled cache.")
+    parser.add_argument("--nodes", type=int, default=1000)
+    parser.add_argument("--states", type=int, nargs=2, default=[2, 2], metavar=("LOW", "HIGH"))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results here")
+    args = parser.parse_args()
+
+    net = random_network(args.nodes, states=tuple(args.states), seed=args.seed)
+    workdir = tempfile.mkdtemp()
+    results = []
+    try:
+        print(f"{'format':>7} {'size':>10} {'parse':>10} {'cold cache':>11} {'warm cache':>11}  (median ms)")
+        for ext in dict.fromkeys(FORMATS):
+            path = os.path.join(workdir, "network" + ext)
+            save_network(net, path)
+            parse, cold, warm = [], [], []
+            for _ in range(args.repeat):
+                loaded, ms = timed(read_network, path)
+                parse.append(ms)
+                cache = tempfile.mkdtemp(dir=workdir)
+                (loaded, hit), ms = timed(load_network, path, cache_dir=cache)
+                cold.append(ms)
+                (cached, hit), ms = timed(load_network, path, cache_dir=cache)
+                warm.append(ms)
+                if not hit or not same_network(net, loaded) or not same_network(net, cached):
+                    raise SystemExit(f"{ext}: the loaded network differs from the original")
+            row = {"format": ext, "bytes": os.path.getsize(path), "parse_ms": statistics.median(parse),
+                   "cold_ms": statistics.median(cold), "warm_ms": statistics.median(warm)}
+            results.append(row)
+            print(f"{ext:>7} {row['bytes']:>10,} {row['parse_ms']:>10.1f} {row['cold_ms']:>11.1f} "
+                  f"{row['warm_ms']:>11.1f}")
+    finally:
+        shutil.rmtree(workdir)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"nodes": args.nodes, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# Per-page render benchmarks for the study guides, driven headlessly by
+# streamlit's AppTest.
+#
+# For every entry of each guide's sidebar radio (`topics`, `chapters`,
+# `section`) a fresh interpreter records:
+#   cold_s    first render of the page in a new process (imports, caches);
+#             the page is chosen before the script first runs, so every
+#             page's cold render starts from the same point
+#   warm_s    median of --repeat reruns of the already-shown page
+#   peak_kb   peak Python allocation during one rerun (tracemalloc)
+#   elements  number of elements the page emits (main area + sidebar)
+#
+#   python AI/tools/bench_pages.py run --out bench.json
+#   python AI/tools/bench_pages.py compare baseline.json bench.json
+#
+# `compare` exits with status 1 when any page got slower or heavier than
+# the baseline by more than --threshold (and --min-delta-ms for timings).
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import guide_pages
+
+sys.path.insert(0, guide_pages.AI_DIR)
+
+from search import nav_key  # noqa: E402
+
+TIMED_METRICS = ("cold_s", "warm_s")
+
+
+def count_page_elements(at):
+    return guide_pages.count_elements(at.main) + guide_pages.count_elements(at.sidebar)
+
+
+def bench_page(slug, page, repeat):
+    # Executed inside a fresh interpreter so cold_s really is cold; the
+    # navigation is set up front, so the first run renders `page` itself
+    guide = guide_pages.get_guide(slug)
+    at = guide_pages.new_app(guide)
+    at.session_state[nav_key(slug)] = page
+    start = time.perf_counter()
+    at.run()
+    cold = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"{page!r} raised: {at.exception[0].message}")
+    if guide_pages.nav_radio(at).value != page:
+        raise RuntimeError(f"{page!r} is not a page of {slug}")
+
+    warm = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        at.run()
+        warm.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    at.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "guide": slug,
+        "page": page,
+        "cold_s": round(cold, 5),
+        "warm_s": round(statistics.median(warm), 5),
+        "peak_kb": round(peak / 1024, 1),
+        "elements": count_page_elements(at),
+    }
+
+
+def run_child(slug, page, repeat):
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "child", slug, page, "--repeat", str(repeat)],
+        capture_output=True, text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(f"{slug} page {page!r} failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run(args):
+    guides = [g for g in guide_pages.GUIDES if not args.guide or g["slug"] in args.guide]
+    pages = {}
+    for guide in guides:
+        for page in guide_pages.page_names(guide):
+            row = run_child(guide["slug"], page, args.repeat)
+            pages[f"{guide['slug']}/{page}"] = row
+            print(f"{guide['slug']:<12}{page[:38]:<40}cold {row['cold_s'] * 1000:8.1f} ms"
+                  f"  warm {row['warm_s'] * 1000:7.1f} ms  peak {row['peak_kb']:8.1f} KB"
+                  f"  {row['elements']:4d} el")
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "pages": pages,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\nWrote {len(pages)} pages to {args.out}")
+
+
+def find_regressions(baseline, current, threshold, min_delta_ms):
+    regressions = []
+    for key, row in current["pages"].items():
+        base = baseline["pages"].get(key)
+        if base is None:
+            continue
+        for metric in TIMED_METRICS + ("peak_kb",):
+            old, new = base[metric], row[metric]
+            if old <= 0 or new <= old * (1 + threshold):
+                continue
+            if metric in TIMED_METRICS and (new - old) * 1000 < min_delta_ms:
+                continue
+            regressions.append((key, metric, old, new))
+    return regressions
+
+
+def compare(args):
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+
+    for key in sorted(set(baseline["pages"]) ^ set(current["pages"])):
+        side = "baseline" if key in baseline["pages"] else "current"
+        print(f"only in {side}: {key}")
+    for key, row in current["pages"].items():
+        base = baseline["pages"].get(key)
+        if base and base["elements"] != row["elements"]:
+            print(f"elements changed: {key} {base['elements']} -> {row['elements']}")
+
+    regressions = find_regressions(baseline, current, args.threshold, args.min_delta_ms)
+    for key, metric, old, new in regressions:
+        print(f"REGRESSION {key}: {metric} {old} -> {new} ({(new / old - 1) * 100:+.0f}%)")
+    if regressions:
+        sys.exit(1)
+    print(f"No regressions over {args.threshold:.0%} across {len(current['pages'])} pages.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark study guide pages with AppTest.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="benchmark every page and write JSON")
+    run_parser.add_argument("--out", default="bench.json")
+    run_parser.add_argument("--repeat", type=int, default=5, help="warm reruns per page")
+    run_parser.add_argument("--guide", action="append",
+                            choices=[g["slug"] for g in guide_pages.GUIDES])
+
+    compare_parser = sub.add_parser("compare", help="flag regressions against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.2,
+                                help="relative slowdown that counts as a regression")
+    compare_parser.add_argument("--min-delta-ms", type=float, default=5.0,
+                                help="ignore timing changes smaller than this")
+
+    child_parser = sub.add_parser("child")
+    child_parser.add_argument("slug")
+    child_parser.add_argument("page")
+    child_parser.add_argument("--repeat", type=int, default=5)
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    elif args.command == "compare":
+        compare(args)
+    else:
+        print(json.dumps(bench_page(args.slug, args.page, args.repeat), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
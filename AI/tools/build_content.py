@@ -0,0 +1,151 @@
+# Build the content pack served by content_store.py.
+#
+#   python AI/tools/build_content.py            # extract + compile
+#   python AI/tools/build_content.py extract    # refresh content/src/*.json
+#   python AI/tools/build_content.py compile    # content/src -> content.pack
+#   python AI/tools/build_content.py check      # fail if content/src is stale
+#
+# extract renders every page of every guide from Python (pack disabled) with
+# AppTest and writes one JSON source file per page. Blocks shared by every
+# page of a guide (stylesheet, title, footer) are the guide's chrome and are
+# left out, so a source holds only what the page's own branch renders.
+# Timings measured while rendering ("in 12.3 ms") are cut out, so the same
+# pages always extract to the same sources.
+#
+# content/src is committed because search.py indexes it; check extracts
+# again in memory and lists every source that differs from it, so a page
+# changed without rebuilding fails instead of leaving search stale.
+
+import argparse
+import json
+import os
+import re
+import sys
+
+import guide_pages
+
+sys.path.insert(0, guide_pages.AI_DIR)
+
+import content_store  # noqa: E402
+
+SRC_DIR = os.path.join(guide_pages.AI_DIR, "content", "src")
+
+_TIMING = re.compile(r"\s+in [\d.,]+ ms\b")
+
+
+def _common_prefix(pages):
+    length = 0
+    for blocks in zip(*pages):
+        if any(block != blocks[0] for block in blocks):
+            break
+        length += 1
+    return length
+
+
+def strip_chrome(pages):
+    # pages: {page: blocks}; drops the leading/trailing blocks all pages share
+    block_lists = list(pages.values())
+    head = _common_prefix(block_lists)
+    tail = _common_prefix([blocks[::-1] for blocks in block_lists])
+    return {page: blocks[head:len(blocks) - tail] for page, blocks in pages.items()}
+
+
+def strip_timings(value):
+    # The blocks with every "in N ms" removed from their text
+    if isinstance(value, str):
+        return _TIMING.sub("", value)
+    if isinstance(value, list):
+        return [strip_timings(item) for item in value]
+    if isinstance(value, dict):
+        return {key: strip_timings(item) for key, item in value.items()}
+    return value
+
+
+def source_path(guide_slug, index, page):
+    from export_static import slugify
+    return os.path.join(SRC_DIR, guide_slug, f"{index:02d}-{slugify(page)}.json")
+
+
+def extracted(guide):
+    # {path: JSON text} of the guide's sources, rendered afresh
+    content_store.ENABLED = False
+    pages = {page: guide_pages.page_blocks(at) for page, at in guide_pages.iter_pages(guide)}
+    sources = {}
+    for index, (page, blocks) in enumerate(strip_chrome(pages).items()):
+        source = {"guide": guide["slug"], "page": page, "order": index,
+                  "blocks": strip_timings(blocks)}
+        sources[source_path(guide["slug"], index, page)] = json.dumps(source, ensure_ascii=False, indent=1) + "\n"
+    return sources
+
+
+def extract():
+    for guide in guide_pages.GUIDES:
+        sources = extracted(guide)
+        guide_dir = os.path.join(SRC_DIR, guide["slug"])
+        os.makedirs(guide_dir, exist_ok=True)
+        for old in os.listdir(guide_dir):
+            os.remove(os.path.join(guide_dir, old))
+        for path, text in sources.items():
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        print(f"extracted {len(sources)} pages of {guide['slug']}")
+
+
+def stale_sources():
+    # Paths under content/src that extract would add, change or remove
+    stale = []
+    for guide in guide_pages.GUIDES:
+        sources = extracted(guide)
+        guide_dir = os.path.join(SRC_DIR, guide["slug"])
+        present = {os.path.join(guide_dir, name) for name in os.listdir(guide_dir)} if os.path.isdir(guide_dir) else set()
+        for path in sorted(present | set(sources)):
+            if path not in sources or path not in present:
+                stale.append(path)
+                continue
+            with open(path, encoding="utf-8") as f:
+                if f.read() != sources[path]:
+                    stale.append(path)
+    return stale
+
+
+def load_sources():
+    sources = []
+    for guide in guide_pages.GUIDES:
+        guide_dir = os.path.join(SRC_DIR, guide["slug"])
+        for name in sorted(os.listdir(guide_dir)):
+            with open(os.path.join(guide_dir, name), encoding="utf-8") as f:
+                sources.append(json.load(f))
+    return sources
+
+
+def compile_pack(path):
+    sources = load_sources()
+    hashes = {guide["slug"]: content_store.source_hash(guide["slug"])
+              for guide in guide_pages.GUIDES}
+    content_store.write_pack(path, [(s["guide"], s["page"], s["blocks"]) for s in sources], hashes)
+    served = sum(not content_store.has_widgets(s["blocks"]) for s in sources)
+    print(f"compiled {len(sources)} pages ({served} static) into {path} "
+          f"({os.path.getsize(path) / 1024:.0f} KB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the study guides' content pack.")
+    parser.add_argument("step", nargs="?", default="all", choices=["all", "extract", "compile", "check"])
+    parser.add_argument("--pack", default=content_store.DEFAULT_PACK)
+    args = parser.parse_args()
+    if args.step == "check":
+        stale = stale_sources()
+        for path in stale:
+            print(f"stale: {os.path.relpath(path, guide_pages.AI_DIR)}")
+        if stale:
+            raise SystemExit("content/src is out of date: run tools/build_content.py")
+        print("content/src is up to date")
+        return
+    if args.step in ("all", "extract"):
+        extract()
+    if args.step in ("all", "compile"):
+        compile_pack(args.pack)
+
+
+if __name__ == "__main__":
+    main()
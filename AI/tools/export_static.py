@@ -0,0 +1,292 @@
+# Export the study guides as a self-contained static HTML site.
+#
+# Every page of every guide is rendered headlessly with AppTest, walked into
+# content blocks (tabs and expanders included) and written out as plain HTML,
+# so read-only traffic can be served from any file server. The only
+# interactive part, the Unit 5 quiz, ships as a small client-side island.
+#
+#   python AI/tools/export_static.py --out site
+#   python AI/tools/export_static.py --out site --guide unit5
+#
+# Needs markdown-it-py at export time (pip install markdown-it-py). LaTeX is
+# typeset in the browser by KaTeX; without it the TeX source is shown.
+
+import argparse
+import html
+import json
+import os
+import re
+import sys
+
+import guide_pages
+
+sys.path.insert(0, guide_pages.AI_DIR)
+
+try:
+    from markdown_it import MarkdownIt
+except ImportError:
+    sys.exit("export_static needs markdown-it-py: pip install markdown-it-py")
+
+from unit5_quiz import QUIZ_FEEDBACK, QUIZ_QUESTIONS
+
+KATEX = "https://cdn.jsdelivr.net/npm/katex@0.16.11/dist"
+MAX_TABS = 12
+
+MD = MarkdownIt("commonmark", {"html": True}).enable(["table", "strikethrough"])
+
+SITE_CSS = """
+body { margin: 0; font-family: "Source Sans Pro", -apple-system, "Segoe UI", sans-serif;
+       color: #31333F; line-height: 1.6; }
+.layout { display: flex; min-height: 100vh; }
+nav { width: 260px; flex-shrink: 0; background: #F0F2F6; padding: 24px 16px; }
+nav h1 { font-size: 1.2rem; }
+nav a { display: block; padding: 4px 8px; color: #31333F; text-decoration: none; border-radius: 6px; }
+nav a.current { background: #dfe3ea; font-weight: bold; }
+main { flex: 1; max-width: 1100px; padding: 32px 48px; }
+table { border-collapse: collapse; margin: 12px 0; }
+th, td { border: 1px solid #ddd; padding: 6px 10px; text-align: left; vertical-align: top; }
+pre { background: #F0F2F6; padding: 12px; border-radius: 6px; overflow-x: auto; }
+.columns { display: flex; gap: 16px; flex-wrap: wrap; }
+.columns > div { flex: 1; min-width: 200px; }
+.alert { padding: 12px 16px; border-radius: 8px; margin: 12px 0; }
+.alert-success { background: #dff0d8; } .alert-info { background: #dbeafe; }
+.alert-warning { background: #fff4d6; } .alert-error { background: #fde2e2; }
+.caption { color: #777; font-size: 0.9rem; }
+.metric .label { font-size: 0.9rem; } .metric .value { font-size: 2rem; }
+details { border: 1px solid #ddd; border-radius: 8px; padding: 8px 16px; margin: 12px 0; }
+summary { cursor: pointer; font-weight: bold; }
+.tabs { margin: 12px 0; }
+.tabs > input { display: none; }
+.tabs > label { display: inline-block; padding: 6px 14px; cursor: pointer; border-bottom: 2px solid transparent; }
+.tabs > .tab-panel { display: none; border-top: 1px solid #ddd; padding-top: 8px; }
+.form { border: 1px solid #ddd; border-radius: 8px; padding: 16px; margin: 12px 0; }
+.radio p { margin-bottom: 4px; } .radio label { display: block; }
+label.input { display: block; margin: 6px 0; }
+"""
+
+
+def tab_css():
+    rules = []
+    for i in range(1, MAX_TABS + 1):
+        rules.append(f".tabs > input:nth-of-type({i}):checked ~ label:nth-of-type({i}) "
+                     "{ border-bottom-color: #FF4B4B; color: #FF4B4B; }")
+        rules.append(f".tabs > input:nth-of-type({i}):checked ~ .tab-panel:nth-of-type({i}) "
+                     "{ display: block; }")
+    return "\n".join(rules)
+
+
+def slugify(text):
+    # Page numbers are dropped since the filename index already orders pages
+    slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    return re.sub(r"^[0-9-]+", "", slug) or "page"
+
+
+def page_filename(index, page):
+    return f"{index:02d}-{slugify(page)}.html"
+
+
+class PageWriter:
+    def __init__(self):
+        self.counter = 0
+
+    def next_id(self, prefix):
+        self.counter += 1
+        return f"{prefix}-{self.counter}"
+
+    def render(self, blocks):
+        return "\n".join(self.render_block(block) for block in blocks)
+
+    def render_block(self, block):
+        kind = block["type"]
+        if kind == "heading":
+            level = block["level"]
+            return f"<h{level}>{MD.renderInline(block['text'])}</h{level}>"
+        if kind == "markdown":
+            return MD.render(block["text"])
+        if kind == "caption":
+            return f'<div class="caption">{MD.render(block["text"])}</div>'
+        if kind == "divider":
+            return "<hr>"
+        if kind == "latex":
+            return f'<div class="latex">\\[{html.escape(block["text"])}\\]</div>'
+        if kind == "alert":
+            text = f'{block["icon"]} {block["text"]}' if block.get("icon") else block["text"]
+            return f'<div class="alert alert-{block["kind"]}">{MD.render(text)}</div>'
+        if kind == "code":
+            language = html.escape(block["language"])
+            return f'<pre><code class="language-{language}">{html.escape(block["text"])}</code></pre>'
+        if kind == "table":
+            return self.render_table(block)
+        if kind == "metric":
+            return (f'<div class="metric" title="{html.escape(block["help"])}">'
+                    f'<div class="label">{html.escape(block["label"])}</div>'
+                    f'<div class="value">{html.escape(block["value"])}</div></div>')
+        if kind == "columns":
+            cols = "".join(f"<div>{self.render(col)}</div>" for col in block["columns"])
+            return f'<div class="columns">{cols}</div>'
+        if kind == "tabs":
+            return self.render_tabs(block)
+        if kind == "expander":
+            opened = " open" if block.get("expanded") else ""
+            return (f"<details{opened}><summary>{MD.renderInline(block['label'])}</summary>"
+                    f"{self.render(block['children'])}</details>")
+        if kind == "form":
+            island = ISLANDS.get(block["key"])
+            if island:
+                return island(self, block)
+            return f'<div class="form"><fieldset disabled>{self.render(block["children"])}</fieldset></div>'
+        if kind == "radio":
+            return self.render_radio(block, self.next_id("radio"))
+        if kind == "button":
+            return f'<button disabled>{html.escape(block["label"])}</button>'
+        if kind == "input":
+            return f'<label class="input">{html.escape(block["label"])} <input disabled></label>'
+        if kind == "progress":
+            return f'<progress max="100" value="{block["value"]}"></progress>'
+        if kind == "group":
+            return f'<div>{self.render(block["children"])}</div>'
+        return ""
+
+    def render_table(self, block):
+        head = "".join(f"<th>{html.escape(c)}</th>" for c in [""] + block["columns"])
+        body = "".join(
+            "<tr>" + f"<th>{html.escape(idx)}</th>"
+            + "".join(f"<td>{html.escape(v)}</td>" for v in row) + "</tr>"
+            for idx, row in zip(block["index"], block["rows"])
+        )
+        return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+    def render_tabs(self, block):
+        name = self.next_id("tabs")
+        inputs, panels = [], []
+        for i, tab in enumerate(block["tabs"][:MAX_TABS]):
+            tab_id = f"{name}-{i}"
+            checked = " checked" if i == 0 else ""
+            inputs.append(f'<input type="radio" name="{name}" id="{tab_id}"{checked}>')
+            panels.append(f'<div class="tab-panel">{self.render(tab["children"])}</div>')
+        labels = [f'<label for="{name}-{i}">{html.escape(tab["label"])}</label>'
+                  for i, tab in enumerate(block["tabs"][:MAX_TABS])]
+        return f'<div class="tabs">{"".join(inputs)}{"".join(labels)}{"".join(panels)}</div>'
+
+    def render_radio(self, block, name, checked_first=True):
+        options = "".join(
+            f'<label><input type="radio" name="{name}" value="{html.escape(opt)}"'
+            f'{" checked" if checked_first and i == 0 else ""}> {html.escape(opt)}</label>'
+            for i, opt in enumerate(block["options"])
+        )
+        return f'<div class="radio"><p>{html.escape(block["label"])}</p>{options}</div>'
+
+
+def quiz_island(writer, block):
+    # Client-side replacement for unit5's quiz_form, scored with the same key
+    form_id = writer.next_id("quiz")
+    questions = "".join(
+        writer.render_radio({"label": q["question"], "options": q["options"]}, f"{form_id}-{q['key']}")
+        for q in QUIZ_QUESTIONS
+    )
+    key = json.dumps({f"{form_id}-{q['key']}": q["answer"] for q in QUIZ_QUESTIONS})
+    feedback = json.dumps(QUIZ_FEEDBACK, ensure_ascii=False)
+    return f"""<form class="form" id="{form_id}">{questions}
+<button type="submit">Submit Quiz</button><div class="result"></div></form>
+<script>
+(function () {{
+  var form = document.getElementById("{form_id}"), key = {key}, feedback = {feedback};
+  form.addEventListener("submit", function (event) {{
+    event.preventDefault();
+    var score = 0, total = 0;
+    for (var name in key) {{
+      total++;
+      var picked = form.querySelector('input[name="' + name + '"]:checked');
+      if (picked && picked.value.indexOf(key[name]) !== -1) score++;
+    }}
+    var html = '<div class="alert alert-success">Your Score: ' + score + '/' + total +
+               ' (' + Math.floor(score * 100 / total) + '%)</div>';
+    for (var i = 0; i < feedback.length; i++) {{
+      if (score >= feedback[i][0]) {{
+        html += '<div class="alert alert-' + feedback[i][1] + '">' + feedback[i][2] + '</div>';
+        break;
+      }}
+    }}
+    form.querySelector(".result").innerHTML = html;
+  }});
+}})();
+</script>"""
+
+
+ISLANDS = {"quiz_form": quiz_island}
+
+
+def page_html(guide, pages, current, body):
+    links = "".join(
+        f'<a href="{page_filename(i, page)}"{" class=current" if page == current else ""}>'
+        f"{html.escape(page)}</a>"
+        for i, page in enumerate(pages)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(current)} · {html.escape(guide["title"])}</title>
+<link rel="stylesheet" href="../site.css">
+<link rel="stylesheet" href="{KATEX}/katex.min.css">
+<script defer src="{KATEX}/katex.min.js"></script>
+<script defer src="{KATEX}/contrib/auto-render.min.js"
+        onload="renderMathInElement(document.body);"></script>
+</head><body><div class="layout">
+<nav><h1><a href="../index.html">📚 Guides</a></h1><h1>{html.escape(guide["title"])}</h1>{links}</nav>
+<main>{body}</main>
+</div></body></html>
+"""
+
+
+def index_html(guides):
+    items = "".join(
+        f'<li><a href="{g["slug"]}/{page_filename(0, pages[0])}">{html.escape(g["title"])}</a> '
+        f"({len(pages)} pages)</li>"
+        for g, pages in guides
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>AI Study Guides</title>
+<link rel="stylesheet" href="site.css"></head>
+<body><main><h1>📚 AI Study Guides</h1><ul>{items}</ul></main></body></html>
+"""
+
+
+def export_guide(guide, out_dir):
+    guide_dir = os.path.join(out_dir, guide["slug"])
+    os.makedirs(guide_dir, exist_ok=True)
+    bodies = {}
+    for page, at in guide_pages.iter_pages(guide):
+        bodies[page] = PageWriter().render(guide_pages.page_blocks(at))
+    # The nav lists every page, so pages are written once all are rendered
+    pages = list(bodies)
+    for i, page in enumerate(pages):
+        filename = page_filename(i, page)
+        with open(os.path.join(guide_dir, filename), "w", encoding="utf-8") as f:
+            f.write(page_html(guide, pages, page, bodies[page]))
+        print(f"  {guide['slug']}/{filename}")
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the study guides as a static HTML site.")
+    parser.add_argument("--out", default="site", help="output directory")
+    parser.add_argument("--guide", action="append", choices=[g["slug"] for g in guide_pages.GUIDES],
+                        help="only export this guide (repeatable)")
+    args = parser.parse_args()
+
+    guides = [g for g in guide_pages.GUIDES if not args.guide or g["slug"] in args.guide]
+    os.makedirs(args.out, exist_ok=True)
+    with open(os.path.join(args.out, "site.css"), "w", encoding="utf-8") as f:
+        f.write(SITE_CSS + tab_css())
+
+    exported = []
+    for guide in guides:
+        print(f"Exporting {guide['title']}...")
+        exported.append((guide, export_guide(guide, args.out)))
+    with open(os.path.join(args.out, "index.html"), "w", encoding="utf-8") as f:
+        f.write(index_html(exported))
+    print(f"Wrote {sum(len(p) for _, p in exported)} pages to {args.out}/")
+
+
+if __name__ == "__main__":
+    main()
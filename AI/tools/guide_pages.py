@@ -0,0 +1,161 @@
+# Headless access to the three study guides through streamlit's AppTest.
+# Shared by the export/benchmark tools: lists every page of every guide and
+# turns a rendered page into plain, JSON-friendly content blocks.
+
+import os
+
+from streamlit.testing.v1 import AppTest
+
+AI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GUIDES = [
+    {
+        "slug": "uncertainty",
+        "title": "AI Uncertainty & Reasoning Study Guide",
+        "script": os.path.join(AI_DIR, "ai_study_app.py"),
+    },
+    {
+        "slug": "planning",
+        "title": "AI Planning & Learning Study Guide",
+        "script": os.path.join(AI_DIR, "ai_study_app (1).py"),
+    },
+    {
+        "slug": "unit5",
+        "title": "Unit 5: Expert Systems & AI Programming",
+        "script": os.path.join(AI_DIR, "unit5.py"),
+    },
+]
+
+ALERT_TYPES = ("success", "info", "warning", "error")
+HEADING_LEVELS = {"title": 1, "header": 2, "subheader": 3}
+INPUT_WIDGETS = ("selectbox", "multiselect", "checkbox", "toggle", "slider", "select_slider",
+                 "number_input", "text_input", "text_area")
+
+
+def get_guide(slug):
+    for guide in GUIDES:
+        if guide["slug"] == slug:
+            return guide
+    raise KeyError(f"Unknown guide {slug!r}; choose from {[g['slug'] for g in GUIDES]}")
+
+
+def new_app(guide, timeout=60):
+    return AppTest.from_file(guide["script"], default_timeout=timeout)
+
+
+def nav_radio(at):
+    # Every guide navigates with the first radio in its sidebar
+    return at.sidebar.radio[0]
+
+
+def select_page(at, page):
+    nav_radio(at).set_value(page).run()
+    if at.exception:
+        raise RuntimeError(f"{page!r} raised: {at.exception[0].message}")
+    return at
+
+
+def page_names(guide):
+    at = new_app(guide).run()
+    return list(nav_radio(at).options)
+
+
+def iter_pages(guide):
+    # Yields (page, at) with `at` showing that page; one AppTest per guide
+    at = new_app(guide).run()
+    for page in nav_radio(at).options:
+        yield page, select_page(at, page)
+
+
+def _children(node):
+    children = getattr(node, "children", None) or {}
+    if isinstance(children, dict):
+        return [children[k] for k in sorted(children)]
+    return list(children)
+
+
+def _table_block(frame, interactive):
+    return {
+        "type": "table",
+        "interactive": interactive,
+        "columns": [str(c) for c in frame.columns],
+        "index": [str(i) for i in frame.index],
+        "rows": [[str(v) for v in row] for row in frame.itertuples(index=False)],
+    }
+
+
+def to_blocks(node):
+    blocks = []
+    for child in _children(node):
+        block = to_block(child)
+        if block is not None:
+            blocks.append(block)
+    return blocks
+
+
+def to_block(node):
+    kind = getattr(node, "type", None)
+    if kind in HEADING_LEVELS:
+        return {"type": "heading", "level": HEADING_LEVELS[kind], "text": node.value}
+    if kind == "markdown":
+        return {"type": "markdown", "text": node.value, "html": node.proto.allow_html}
+    if kind == "caption":
+        return {"type": "caption", "text": node.value}
+    if kind == "divider":
+        return {"type": "divider"}
+    if kind == "latex":
+        return {"type": "latex", "text": node.value.strip().strip("$").strip()}
+    if kind in ALERT_TYPES:
+        return {"type": "alert", "kind": kind, "text": node.value, "icon": node.icon}
+    if kind == "code":
+        return {"type": "code", "text": node.value, "language": node.language or ""}
+    if kind == "table":
+        return _table_block(node.value, interactive=False)
+    if kind == "dataframe":
+        return _table_block(node.value, interactive=True)
+    if kind == "metric":
+        return {"type": "metric", "label": node.label, "value": node.value,
+                "help": node.proto.help}
+    if kind == "flex_container":
+        columns = _children(node)
+        if not all(getattr(col, "type", None) == "column" for col in columns):
+            # A plain vertical block, e.g. around a fragment
+            return {"type": "group", "children": to_blocks(node)}
+        return {"type": "columns", "columns": [to_blocks(col) for col in columns],
+                "weights": [col.weight for col in columns]}
+    if kind == "tab_container":
+        return {"type": "tabs", "tabs": [{"label": tab.label, "children": to_blocks(tab)}
+                                         for tab in _children(node)]}
+    if kind == "expander":
+        return {"type": "expander", "label": node.label, "children": to_blocks(node),
+                "expanded": node.proto.expanded}
+    if kind == "form":
+        return {"type": "form", "key": node.proto.form.form_id, "children": to_blocks(node)}
+    if kind == "radio":
+        return {"type": "radio", "label": node.label, "options": list(node.options)}
+    if kind == "button":
+        return {"type": "button", "label": node.label}
+    if kind in INPUT_WIDGETS:
+        return {"type": "input", "kind": kind, "label": node.label}
+    if kind == "file_uploader":
+        # AppTest has no wrapper for it; the label is on the proto
+        return {"type": "input", "kind": kind, "label": node.proto.label}
+    if kind == "progress":
+        return {"type": "progress", "value": node.proto.progress.value}
+    if kind in ("column", "tab", "vertical"):
+        return {"type": "group", "children": to_blocks(node)}
+    # Widgets with no static meaning (balloons, events, ...) are left out
+    return None
+
+
+def count_elements(node):
+    # Leaf elements (text, tables, widgets, ...) below `node`
+    children = _children(node)
+    if not children:
+        return 0 if getattr(node, "type", None) in ("main", "sidebar", "event") else 1
+    return sum(count_elements(child) for child in children)
+
+
+def page_blocks(at):
+    # Main-area content of the page currently shown by `at`
+    return to_blocks(at.main)
@@ -0,0 +1,81 @@
+# Learn the CPTs of the Bayesian Networks page's alarm DAG from a CSV of
+# observations (one column per variable, state names as values).
+#
+# The file is streamed in chunks and counted with a vectorized group-by, so
+# memory stays bounded by --chunk-rows however large the file is. --simulate
+# first writes that many rows sampled from the page's network, to try it out
+# or to make a large test file; the learned CPTs are printed next to the ones
+# the rows came from, with the throughput and peak memory.
+#
+#   python AI/tools/learn_cpts.py alarm.csv --simulate 1000000
+#   python AI/tools/learn_cpts.py alarm.csv --smoothing 0 --json learned.json
+
+import argparse
+import json
+import os
+import resource
+import sys
+import time
+
+import guide_pages
+
+sys.path.insert(0, guide_pages.AI_DIR)
+
+from reasoning.bayesnet import alarm_network  # noqa: E402
+from reasoning.learning import CHUNK_ROWS, CPTLearner, sample_frame  # noqa: E402
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def simulate(path, rows, chunk_rows, seed):
+    net = alarm_network()
+    for i, start in enumerate(range(0, rows, chunk_rows)):
+        frame = sample_frame(net, min(chunk_rows, rows - start), seed=(seed, i))
+        frame.to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Learn the alarm network's CPTs from a CSV.")
+    parser.add_argument("csv")
+    parser.add_argument("--simulate", type=int, metavar="ROWS",
+                        help="first write this many rows sampled from the alarm network")
+    parser.add_argument("--smoothing", type=float, default=1.0, help="Laplace pseudo-count")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the learned CPTs here")
+    args = parser.parse_args()
+
+    if args.simulate:
+        start = time.perf_counter()
+        simulate(args.csv, args.simulate, args.chunk_rows, args.seed)
+        print(f"wrote {args.simulate:,} rows in {time.perf_counter() - start:.1f} s")
+
+    true = alarm_network()
+    learner = CPTLearner(true)
+    start = time.perf_counter()
+    learner.read_csv(args.csv, chunk_rows=args.chunk_rows)
+    seconds = time.perf_counter() - start
+    size_mb = os.path.getsize(args.csv) / 2 ** 20
+    print(f"learned from {learner.rows:,} rows ({size_mb:.0f} MB) in {seconds:.2f} s: "
+          f"{learner.rows / seconds:,.0f} rows/s, peak RSS {peak_rss_mb():.0f} MB")
+
+    learned = {}
+    for name in true.nodes:
+        table = learner.cpt(name, args.smoothing)
+        learned[name] = table.tolist()
+        skipped = f"  ({learner.skipped[name]:,} rows skipped)" if learner.skipped[name] else ""
+        print(f"\nP({name}={true.states[name][0]} | {', '.join(true.parents[name]) or '-'}){skipped}")
+        truth = true.cpts[name].values[..., 0].ravel()
+        for index, p in enumerate(table[..., 0].ravel()):
+            print(f"  row {index}: learned {p:.5f}  true {truth[index]:.5f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"rows": learner.rows, "smoothing": args.smoothing, "cpts": learned}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+# Concurrent-session load simulator for capacity planning.
+#
+# Starts a local `streamlit run` server and drives N headless sessions over
+# streamlit's websocket protocol (no browser), each following a navigation
+# script like a student would: sidebar radio changes, reading time between
+# clicks and, in Unit 5, quiz submissions. Tab switches (e.g. the LTMS steps)
+# happen in the browser without a server round-trip, so scripts model them
+# as extra reading time only. For every concurrency level it reports
+# throughput, latency percentiles and the server's CPU time and memory.
+#
+#   python AI/tools/load_sim.py --app unit5 --sessions 1,10,50
+#   python AI/tools/load_sim.py --app all --sessions 10,100 --steps 20 --think 0.5
+#
+# --app all serves the three guides through study_guides.py and spreads the
+# sessions over them.
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+import guide_pages
+
+LAUNCHER = os.path.join(guide_pages.AI_DIR, "study_guides.py")
+SIDEBAR = 1  # delta_path root of the sidebar container
+WIDGET_KINDS = ("radio", "button", "checkbox", "text_input")
+
+# url_path of each guide when mounted by the launcher
+LAUNCHER_PAGES = {"uncertainty": "uncertainty", "planning": "planning", "unit5": "unit5"}
+
+
+class Session:
+    def __init__(self, url, guide_slug, page_name=""):
+        self.url = url
+        self.guide = guide_slug
+        self.page_name = page_name
+        self.widget_values = {}
+        self.nav = None  # (widget id, options) of the sidebar radio
+        self.radios = {}  # main-area radios by label
+        self.buttons = {}
+        self.inputs = {}  # checkboxes and text inputs by label
+        self.fragments = {}  # widget id -> id of the fragment drawing it
+        self.latencies = []
+
+    async def __aenter__(self):
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.ws.close()
+
+    async def rerun(self, triggers=(), fragment_id=""):
+        # fragment_id reruns just that st.fragment, as the browser does for
+        # widgets drawn inside one
+        msg = BackMsg()
+        msg.rerun_script.page_name = self.page_name
+        msg.rerun_script.fragment_id = fragment_id
+        states = list(self.widget_values.values()) + [
+            WidgetState(id=widget_id, trigger_value=True) for widget_id in triggers
+        ]
+        msg.rerun_script.widget_states.widgets.extend(states)
+        self.radios, self.buttons = {}, {}
+
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.ws.recv())
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                self._track_widget(forward)
+            elif kind == "script_finished":
+                break
+        self.latencies.append(time.perf_counter() - start)
+
+    def _track_widget(self, forward):
+        element = forward.delta.new_element
+        kind = element.WhichOneof("type")
+        if kind not in WIDGET_KINDS:
+            return
+        widget = getattr(element, kind)
+        self.fragments[widget.id] = forward.delta.fragment_id
+        if kind == "radio":
+            if forward.metadata.delta_path[0] == SIDEBAR:
+                if self.nav is None:
+                    self.nav = (widget.id, list(widget.options))
+            else:
+                self.radios[widget.label] = (widget.id, list(widget.options))
+        elif kind == "button":
+            self.buttons[widget.label] = widget.id
+        else:
+            self.inputs[widget.label] = widget.id
+
+    async def select(self, page):
+        nav_id, _ = self.nav
+        self.widget_values[nav_id] = WidgetState(id=nav_id, string_value=page)
+        await self.rerun()
+
+    async def submit_quiz(self, rng):
+        for widget_id, options in self.radios.values():
+            self.widget_values[widget_id] = WidgetState(id=widget_id, string_value=rng.choice(options))
+        submit = self.buttons["Submit Quiz"]
+        await self.rerun(triggers=[submit], fragment_id=self.fragments[submit])
+
+
+async def read(rng, mean_think):
+    if mean_think:
+        await asyncio.sleep(rng.expovariate(1 / mean_think))
+
+
+async def student(url, guide_slug, page_name, steps, mean_think, seed):
+    # One student: open the app, then click through pages in a shuffled
+    # order, reading each one, and take the quiz when landing on it
+    rng = random.Random(seed)
+    async with Session(url, guide_slug, page_name) as session:
+        await session.rerun()
+        pages = session.nav[1]
+        for step in range(steps):
+            page = rng.choice(pages)
+            await session.select(page)
+            await read(rng, mean_think)
+            if "Submit Quiz" in session.buttons:
+                await session.submit_quiz(rng)
+                await read(rng, mean_think)
+            elif "LTMS" in page:
+                # Step 1..4 tabs are switched client-side: reading time only
+                await read(rng, mean_think * 3)
+    return session.latencies
+
+
+class Server:
+    def __init__(self, script, port):
+        self.script = script
+        self.port = port
+
+    def __enter__(self):
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "streamlit", "run", self.script,
+             "--server.headless", "true", "--server.port", str(self.port),
+             "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+            cwd=guide_pages.AI_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        health = f"http://localhost:{self.port}/_stcore/health"
+        for _ in range(100):
+            try:
+                urllib.request.urlopen(health, timeout=1)
+                return self
+            except OSError:
+                time.sleep(0.2)
+        self.proc.kill()
+        raise RuntimeError(f"streamlit server on port {self.port} did not start")
+
+    def __exit__(self, *exc):
+        self.proc.terminate()
+        self.proc.wait(timeout=10)
+
+    def rss_kb(self):
+        with open(f"/proc/{self.proc.pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+        return 0
+
+    def cpu_seconds(self):
+        with open(f"/proc/{self.proc.pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+async def sample_memory(server, peak, stop):
+    while not stop.is_set():
+        peak[0] = max(peak[0], server.rss_kb())
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=0.2)
+        except asyncio.TimeoutError:
+            pass
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run_level(server, url, guides, n_sessions, steps, mean_think, seed):
+    peak, stop = [server.rss_kb()], asyncio.Event()
+    sampler = asyncio.create_task(sample_memory(server, peak, stop))
+    cpu_before = server.cpu_seconds()
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        student(url, slug, page_name, steps, mean_think, seed + i)
+        for i, (slug, page_name) in enumerate(guides[i % len(guides)] for i in range(n_sessions))
+    ])
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await sampler
+
+    latencies = [lat for session in results for lat in session]
+    cpu = server.cpu_seconds() - cpu_before
+    return {
+        "sessions": n_sessions,
+        "requests": len(latencies),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+        "p90_ms": round(percentile(latencies, 0.90) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 1),
+        "server_cpu_ms_per_request": round(cpu / len(latencies) * 1000, 2),
+        "server_rss_mb": round(server.rss_kb() / 1024, 1),
+        "server_peak_rss_mb": round(peak[0] / 1024, 1),
+    }
+
+
+async def simulate(args):
+    if args.app == "all":
+        script = LAUNCHER
+        guides = [(slug, page) for slug, page in LAUNCHER_PAGES.items()]
+    else:
+        script = guide_pages.get_guide(args.app)["script"]
+        guides = [(args.app, "")]
+
+    levels = []
+    with Server(script, args.port) as server:
+        url = f"ws://localhost:{args.port}/_stcore/stream"
+        # Warm the server (imports, caches) before measuring
+        await student(url, guides[0][0], guides[0][1], 3, 0, args.seed)
+        print(f"{'sessions':>8}{'req':>7}{'req/s':>9}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}"
+              f"{'cpu ms/req':>12}{'rss MB':>9}{'peak MB':>9}")
+        for n_sessions in args.sessions:
+            row = await run_level(server, url, guides, n_sessions, args.steps, args.think, args.seed)
+            levels.append(row)
+            print(f"{row['sessions']:>8}{row['requests']:>7}{row['throughput_rps']:>9}"
+                  f"{row['p50_ms']:>9}{row['p90_ms']:>9}{row['p99_ms']:>9}"
+                  f"{row['server_cpu_ms_per_request']:>12}{row['server_rss_mb']:>9}"
+                  f"{row['server_peak_rss_mb']:>9}")
+    return levels
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent study-guide sessions.")
+    parser.add_argument("--app", default="all",
+                        choices=["all"] + [g["slug"] for g in guide_pages.GUIDES])
+    parser.add_argument("--sessions", default="1,10,25,50",
+                        type=lambda s: [int(n) for n in s.split(",")],
+                        help="comma-separated concurrency levels")
+    parser.add_argument("--steps", type=int, default=10, help="page visits per session")
+    parser.add_argument("--think", type=float, default=0.0,
+                        help="mean reading time between clicks in seconds (0 = flat out)")
+    parser.add_argument("--port", type=int, default=8599)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    levels = asyncio.run(simulate(args))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"app": args.app, "steps": args.steps, "think_s": args.think,
+                       "levels": levels}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# Resident memory of the study guides: three separate processes (one per
+# guide, as deployed before the launcher) versus a single process serving all
+# three through study_guides.py.
+#
+# Each measurement runs in a fresh interpreter that loads the app headlessly
+# with AppTest and visits every page, then reports its resident set size.
+#
+#   python AI/tools/measure_memory.py
+#   python AI/tools/measure_memory.py --json memory.json
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+
+import guide_pages
+
+LAUNCHER = os.path.join(guide_pages.AI_DIR, "study_guides.py")
+
+
+def current_rss_kb():
+    # Linux exposes the live RSS; elsewhere fall back to the peak
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return peak_rss_kb()
+
+
+def peak_rss_kb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def visit_guide(at, guide):
+    for page in guide_pages.nav_radio(at).options:
+        guide_pages.select_page(at, page)
+
+
+def run_child(target):
+    # Executed inside the measured interpreter
+    if target == "baseline":
+        import streamlit  # noqa: F401  (interpreter + streamlit import only)
+        from streamlit.testing.v1 import AppTest  # noqa: F401
+    elif target == "launcher":
+        from streamlit.testing.v1 import AppTest
+        at = AppTest.from_file(LAUNCHER, default_timeout=60).run()
+        for guide in guide_pages.GUIDES:
+            at.switch_page(os.path.basename(guide["script"])).run()
+            visit_guide(at, guide)
+    else:
+        guide = guide_pages.get_guide(target)
+        at = guide_pages.new_app(guide).run()
+        visit_guide(at, guide)
+    print(json.dumps({"rss_kb": current_rss_kb(), "peak_kb": peak_rss_kb()}))
+
+
+def measure(target):
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", target],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure resident memory per study guide.")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child)
+        return
+
+    results = {"baseline": measure("baseline")}
+    for guide in guide_pages.GUIDES:
+        results[guide["slug"]] = measure(guide["slug"])
+    results["launcher"] = measure("launcher")
+
+    separate = sum(results[g["slug"]]["rss_kb"] for g in guide_pages.GUIDES)
+    shared = results["launcher"]["rss_kb"]
+
+    print(f"{'process':<14}{'rss MB':>10}{'peak MB':>10}")
+    for name, row in results.items():
+        print(f"{name:<14}{row['rss_kb'] / 1024:>10.1f}{row['peak_kb'] / 1024:>10.1f}")
+    print(f"\nbefore: 3 processes = {separate / 1024:.1f} MB")
+    print(f"after:  launcher    = {shared / 1024:.1f} MB "
+          f"({(separate - shared) / 1024:.1f} MB saved)")
+
+    if args.json:
+        results["summary"] = {"separate_kb": separate, "launcher_kb": shared}
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
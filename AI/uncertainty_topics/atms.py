@@ -0,0 +1,83 @@
+import streamlit as st
+
+
+def render_atms():
+    st.markdown('<p class="main-header">6️⃣ ATMS - Assumption-Based TMS</p>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="concept-box"><h3>🎯 What is ATMS?</h3><p>ATMS explores <strong>all possible worlds simultaneously</strong>! Instead of picking one path and backtracking, it maintains <strong>multiple contexts</strong> in parallel.</p></div>', unsafe_allow_html=True)
+    
+    # Comparison
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown('<div class="example-box"><h4>JTMS & LTMS</h4><p><strong>Depth-First Approach</strong></p><ul><li>Follow one reasoning path</li><li>Backtrack when wrong</li><li>Serial exploration</li><li>Faster per path</li><li>May redo work</li></ul></div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown('<div class="definition-box"><h4>ATMS</h4><p><strong>Breadth-First Approach</strong></p><ul><li>Explore all paths at once</li><li>No backtracking needed</li><li>Parallel exploration</li><li>More memory usage</li><li>Never redo work</li></ul></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🕵️ ABC Murder - ATMS Style")
+    
+    st.markdown('<div class="example-box"><p><strong>Setup:</strong> Same murder case, but now we explore ALL possibilities at once!</p></div>', unsafe_allow_html=True)
+    
+    # Assumptions
+    st.markdown("### 📋 All Assumptions Defined")
+    
+    assumptions_col1, assumptions_col2 = st.columns(2)
+    
+    with assumptions_col1:
+        st.markdown("""
+        - **A1:** Hotel register forged
+        - **A2:** Hotel register NOT forged
+        - **A3:** Babbitt's B-I-L lied
+        - **A4:** Babbitt's B-I-L did NOT lie
+        """)
+    
+    with assumptions_col2:
+        st.markdown("""
+        - **A5:** Cabot lied
+        - **A6:** Cabot did NOT lie
+        - **A7:** Only A,B,C are suspects
+        - **A8:** NOT only A,B,C are suspects
+        """)
+    
+    # Contexts
+    st.markdown("### 🌍 Valid Contexts (Worlds)")
+    
+    st.markdown("""
+    **After ATMS prunes inconsistent contexts, we have:**
+    
+    1. **{A7, A1, A4, A6}** → Abbott is prime suspect (register was forged)
+    2. **{A7, A2, A3, A6}** → Babbitt is prime suspect (B-I-L lied)
+    3. **{A7, A2, A4, A5}** → Cabot is prime suspect (Cabot lied)
+    4. **{A8, A2, A4, A6}** → Look elsewhere (all three have alibis)
+    
+    **Each context represents a consistent possible world!**
+    """)
+    
+    st.markdown("### 🎯 How ATMS Labels Work")
+    
+    st.markdown('<div class="formula-box"><p><strong>Example Label: {A7, A2, A6}</strong></p><p>Meaning: "This belief is valid in any world where A7 AND A2 AND A6 are all true"</p><p>An assertion can have <strong>multiple labels</strong> representing different contexts!</p></div>', unsafe_allow_html=True)
+    
+    st.markdown("### ✅ Advantages vs ❌ Disadvantages")
+    
+    adv_col, dis_col = st.columns(2)
+    
+    with adv_col:
+        st.markdown("""
+        **Advantages:**
+        - ✅ No backtracking needed
+        - ✅ All scenarios explored
+        - ✅ Complete picture
+        - ✅ Good for complex problems
+        """)
+    
+    with dis_col:
+        st.markdown("""
+        **Disadvantages:**
+        - ❌ High memory usage
+        - ❌ Complex implementation
+        - ❌ Label management overhead
+        - ❌ Slower for simple problems
+        """)
+    
+    st.success("**ATMS = Parallel Universe Explorer!** 🌌")
@@ -0,0 +1,147 @@
+import itertools
+
+import numpy as np
+import streamlit as st
+
+from reasoning.bayes_rule import base_rate_sweep, crossing, parse_values, posterior_grid
+from reasoning.bayesnet import meningitis_network
+from reasoning.elimination import VariableElimination
+
+
+def render_bayes():
+    st.markdown('<p class="main-header">8️⃣ Bayes\' Theorem</p>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="concept-box"><h3>🎯 The Power of Bayes</h3><p>Bayes\' Theorem lets us <strong>update beliefs</strong> when we get new evidence. It\'s the foundation of modern AI!</p></div>', unsafe_allow_html=True)
+    
+    # Formula
+    st.markdown("### 📐 The Formula")
+    
+    st.latex(r"P(A|B) = \frac{P(B|A) \cdot P(A)}{P(B)}")
+    
+    st.markdown('<div class="definition-box"><p><strong>Terms:</strong></p><ul><li><strong>P(A|B)</strong> = Posterior (what we want)</li><li><strong>P(B|A)</strong> = Likelihood</li><li><strong>P(A)</strong> = Prior</li><li><strong>P(B)</strong> = Evidence</li></ul></div>', unsafe_allow_html=True)
+    
+    # Medical Example
+    st.markdown("### 🏥 Meningitis Example")
+    
+    st.markdown('<div class="example-box"><p><strong>Given:</strong></p><ul><li>P(Stiff Neck | Meningitis) = 0.8</li><li>P(Meningitis) = 1/30,000</li><li>P(Stiff Neck) = 0.02</li></ul><p><strong>Find:</strong> P(Meningitis | Stiff Neck) = ?</p></div>', unsafe_allow_html=True)
+    
+    st.latex(r"P(M|SN) = \frac{0.8 \times 0.0000333}{0.02} = 0.00133 = 0.13\%")
+    
+    st.success("**Result:** Only 0.13% chance! (1 in 750)")
+    st.info("Even though stiff neck is common with meningitis, the disease is so rare that most stiff necks are from other causes!")
+
+    st.markdown("#### 🩺 Most Probable Diagnosis")
+
+    meningitis_diagnosis()
+    
+    # Card Example
+    st.markdown("### 🃏 Playing Card Example")
+    
+    st.markdown('<div class="example-box"><p><strong>Problem:</strong> A card is a face card. What\'s the probability it\'s a King?</p></div>', unsafe_allow_html=True)
+    
+    st.latex(r"P(\text{King}|\text{Face}) = \frac{1 \times \frac{1}{13}}{\frac{3}{13}} = \frac{1}{3} = 33.3\%")
+    
+    st.success("**Makes sense:** 4 kings among 12 face cards = 4/12 = 1/3")
+
+    # Calculator
+    st.markdown("### 🧮 Bayes Calculator")
+
+    st.markdown("Enter one value, a list (`0.8, 0.9`) or a range (`0.01:0.5:50`, add ` log` for log spacing) for each input - every combination is computed at once. The chart shows how the answer depends on the **base rate**.")
+
+    bayes_calculator()
+
+
+@st.cache_resource(show_spinner=False)
+def meningitis_engine():
+    return VariableElimination(meningitis_network())
+
+
+# A fragment: answering reruns only the diagnosis
+@st.fragment
+def meningitis_diagnosis():
+    symptom = st.radio("Does the patient have a stiff neck?", ["Yes", "No"], horizontal=True,
+                       key="bayes_stiff_neck")
+    explanation, p = meningitis_engine().mpe({"StiffNeck": "True" if symptom == "Yes" else "False"})
+    diagnosis = "Meningitis" if explanation["Meningitis"] == "True" else "No meningitis"
+    st.metric("Most probable explanation", diagnosis, help="The diagnosis with the highest posterior probability")
+    st.caption(f"P({diagnosis.lower()} | stiff neck: {symptom.lower()}) = {p:.4%} - a stiff neck makes meningitis "
+               "40 times more likely, but never likely enough to be the best explanation.")
+
+
+# (prior, likelihood, false-positive rate) of the examples above; the
+# meningitis false-positive rate is the one that gives P(stiff neck) = 0.02
+BAYES_PRESETS = {
+    "Meningitis": ("1/30000", "0.8", "0.019974"),
+    "Face card → King": ("1/13", "1", "1/6"),
+}
+
+MAX_CURVES = 8
+
+
+def load_preset(values):
+    st.session_state.bayes_prior, st.session_state.bayes_likelihood, st.session_state.bayes_false_positive = values
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def base_rate_chart(likelihoods, false_positives, points):
+    # Cached by its inputs, so returning to a slider position is free
+    priors, grid = base_rate_sweep(likelihoods, false_positives, points)
+    curves = grid.reshape(points, -1)
+    halfway = crossing(priors, curves)
+    # The chart only needs a few hundred of the points
+    step = max(1, points // 400)
+    chart = {"log10 base rate": np.log10(priors[::step])}
+    for i, (l, f) in enumerate(itertools.product(likelihoods, false_positives)):
+        chart[f"P(E|H)={l:.4g}, P(E|¬H)={f:.4g}"] = curves[::step, i]
+    return chart, halfway
+
+
+# A fragment: editing the inputs reruns only the calculator
+@st.fragment
+def bayes_calculator():
+    for key, value in zip(["bayes_prior", "bayes_likelihood", "bayes_false_positive"], BAYES_PRESETS["Meningitis"]):
+        st.session_state.setdefault(key, value)
+    for col, (name, values) in zip(st.columns(len(BAYES_PRESETS)), BAYES_PRESETS.items()):
+        with col:
+            st.button(f"Load: {name}", on_click=load_preset, args=(values,), key=f"bayes_preset_{name}")
+
+    prior_col, likelihood_col, false_positive_col = st.columns(3)
+    with prior_col:
+        prior_text = st.text_input("Prior P(H):", key="bayes_prior")
+    with likelihood_col:
+        likelihood_text = st.text_input("Likelihood P(E|H):", key="bayes_likelihood")
+    with false_positive_col:
+        false_positive_text = st.text_input("False-positive rate P(E|¬H):", key="bayes_false_positive")
+    try:
+        priors = parse_values(prior_text)
+        likelihoods = parse_values(likelihood_text)
+        false_positives = parse_values(false_positive_text)
+        grid = posterior_grid(priors, likelihoods, false_positives)
+    except (ValueError, ZeroDivisionError) as error:
+        st.error(f"Could not read the inputs: {error}")
+        return
+
+    if grid.size == 1:
+        st.metric("P(H|E)", f"{grid.item():.4%}")
+    else:
+        rows = list(itertools.islice(itertools.product(priors, likelihoods, false_positives), 20))
+        st.table({
+            "P(H)": [f"{p:.4g}" for p, _, _ in rows],
+            "P(E|H)": [f"{l:.4g}" for _, l, _ in rows],
+            "P(E|¬H)": [f"{f:.4g}" for _, _, f in rows],
+            "P(H|E)": [f"{v:.4%}" for v in grid.ravel()[:len(rows)]],
+        })
+        st.caption(f"{grid.size:,} posteriors computed" + (" - the first 20 are shown" if grid.size > 20 else ""))
+
+    points = st.select_slider("Base rates in the sweep:", [1000, 10000, 100000, 1000000], value=100000,
+                              format_func=lambda n: f"{n:,}", key="bayes_points")
+    pairs = len(likelihoods) * len(false_positives)
+    if pairs > MAX_CURVES:
+        likelihoods = likelihoods[:MAX_CURVES]
+        false_positives = false_positives[:max(1, MAX_CURVES // len(likelihoods))]
+        st.warning(f"{pairs} likelihood/false-positive pairs - plotting "
+                   f"{len(likelihoods) * len(false_positives)} of them.")
+    chart, halfway = base_rate_chart(tuple(likelihoods.tolist()), tuple(false_positives.tolist()), points)
+    st.line_chart(chart, x="log10 base rate", y=[name for name in chart if name != "log10 base rate"])
+    reach = ", ".join("never" if np.isnan(p) else f"{p:.3g}" for p in halfway)
+    st.caption(f"{points * len(halfway):,} posteriors. Base rate where P(H|E) reaches 50%: {reach}")
@@ -0,0 +1,376 @@
+import time
+
+import numpy as np
+import streamlit as st
+
+from reasoning.bayesnet import alarm_network
+from reasoning.dseparation import independence_index
+from reasoning.elimination import VariableElimination
+from reasoning.junction_tree import compile_network
+from reasoning.learning import CPTLearner, sample_frame
+from reasoning.network_files import FORMATS, file_digest, file_format, read_network
+from reasoning.sampling import gibbs_sampling, likelihood_weighting, rejection_sampling
+from tables import content_table
+
+
+def render_bayesian_networks():
+    st.markdown('<p class="main-header">9️⃣ Bayesian Networks</p>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="definition-box"><h3>🎯 What is a Bayesian Network?</h3><p>A <strong>graphical model</strong> showing how variables depend on each other, with probability tables for each relationship.</p></div>', unsafe_allow_html=True)
+    
+    # Components
+    st.markdown("### 🧩 Two Main Components")
+    
+    comp1, comp2 = st.columns(2)
+    
+    with comp1:
+        st.markdown("""
+        **1. Directed Acyclic Graph (DAG)**
+        - Nodes = Variables
+        - Arrows = Dependencies
+        - No cycles allowed
+        """)
+    
+    with comp2:
+        st.markdown("""
+        **2. Conditional Probability Tables**
+        - Each node has a CPT
+        - Shows P(Node | Parents)
+        - Specifies relationships
+        """)
+    
+    # Burglary Example
+    st.markdown("### 🏠 Burglary Alarm Example")
+    
+    st.markdown("""
+    ```
+    Burglary    Earthquake
+        ↓           ↓
+        └→ Alarm ←┘
+             ↓
+        ┌────┴────┐
+        ↓         ↓
+    David      Sophia
+    Calls      Calls
+    ```
+    """)
+    
+    st.markdown('<div class="example-box"><p><strong>Story:</strong> Alarm can go off due to burglary OR earthquake. When it sounds, neighbors David and Sophia may call.</p></div>', unsafe_allow_html=True)
+    
+    # Probability Tables
+    st.markdown("### 📊 Probability Tables")
+    
+    # Prior probabilities
+    prior_col1, prior_col2 = st.columns(2)
+    
+    with prior_col1:
+        st.markdown("**Burglary:**")
+        st.write("- P(B=True) = 0.002")
+        st.write("- P(B=False) = 0.998")
+    
+    with prior_col2:
+        st.markdown("**Earthquake:**")
+        st.write("- P(E=True) = 0.001")
+        st.write("- P(E=False) = 0.999")
+    
+    # Alarm CPT
+    alarm_data = {
+        'Burglary': ['True', 'True', 'False', 'False'],
+        'Earthquake': ['True', 'False', 'True', 'False'],
+        'P(Alarm=T)': [0.94, 0.95, 0.31, 0.001]
+    }
+    df_alarm = content_table(alarm_data)
+    st.table(df_alarm)
+    
+    # Calculation Example
+    st.markdown("### 🧮 Example Calculation")
+    
+    st.markdown('<div class="formula-box"><p><strong>Find:</strong> P(Alarm=T, David=T, Sophia=T, ¬Burglary, ¬Earthquake)</p></div>', unsafe_allow_html=True)
+    
+    st.latex(r"= P(S|A) \times P(D|A) \times P(A|\neg B, \neg E) \times P(\neg B) \times P(\neg E)")
+    st.latex(r"= 0.75 \times 0.91 \times 0.001 \times 0.998 \times 0.999 = 0.00068")
+    
+    st.success("**Very low probability!** Makes sense - alarm rarely goes off without burglary or earthquake.")
+
+    # Interactive queries
+    st.markdown("### 🔍 Ask the Network")
+
+    st.markdown("Pick what you know and what you want to find out - the answer is computed exactly, by **variable elimination** or by message passing on a compiled **junction tree**.")
+
+    alarm_query()
+
+    # Independence
+    st.markdown("### 🔀 Who Depends on Whom?")
+
+    st.markdown("Two variables are **independent given** what you know when every path between them in the graph is blocked (*d-separation*): a chain or fork is blocked by observing its middle node, a collider (A → C ← B) is blocked *unless* C or something below it is observed. David and Sophia only depend on each other through Alarm - but Burglary and Earthquake become dependent once you hear a call.")
+
+    independence_query()
+
+    # Learning the tables
+    st.markdown("### 📈 Learn the Tables from Data")
+
+    st.markdown("In practice the CPT numbers come from data: each entry is a **count** - how often Alarm rang among the rows with the same Burglary and Earthquake values. Add rows from a CSV (a column per variable, values `True`/`False`) or simulate them, and watch the estimates approach the tables above.")
+
+    cpt_learning()
+
+    # Other networks
+    st.markdown("### 📂 Load Your Own Network")
+
+    st.markdown("The same questions work on any discrete network. Load one in a standard format - **BIF** (as in the bnlearn repository), **XMLBIF** or **JSON** - and ask for the posterior of any variable. A file is parsed once and kept in memory under its hash, so asking again is immediate.")
+
+    network_file_query()
+
+
+@st.cache_resource(show_spinner=False)
+def alarm_engine(model="table"):
+    # One engine per process and CPT model: its factor cache is shared by
+    # every session
+    return VariableElimination(alarm_network(model))
+
+
+ENGINES = ["Junction tree", "Variable elimination"]
+
+ALARM_MODELS = {"Full table": "table", "Noisy-OR": "noisy-or"}
+
+SAMPLERS = {
+    "Rejection sampling": rejection_sampling,
+    "Likelihood weighting": likelihood_weighting,
+    "Gibbs sampling": gibbs_sampling,
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def alarm_estimate(model, method, target, evidence_items, n):
+    # Fixed seed: the same question always shows the same run
+    return SAMPLERS[method](alarm_engine(model).network, target, dict(evidence_items), n=n, seed=0)
+
+
+# A fragment: changing the query reruns only this calculator
+@st.fragment
+def alarm_query():
+    model = ALARM_MODELS[st.radio("Alarm CPT:", list(ALARM_MODELS), horizontal=True, key="bn_model")]
+    net = alarm_engine(model).network
+    alarm = net.models["Alarm"]
+    if model == "noisy-or":
+        causes = ", ".join(f"{p:.3f}" for p in alarm.causes)
+        st.caption(f"Noisy-OR: each cause sets the alarm off on its own (probabilities {causes}, "
+                   f"leak {alarm.leak[0]}), so the CPT needs {alarm.parameters} numbers instead of one "
+                   f"row per combination of causes - it grows linearly with the number of parents.")
+    with st.expander("Alarm CPT in use"):
+        table = net.cpts["Alarm"].values
+        st.table({
+            "Burglary": ["True", "True", "False", "False"],
+            "Earthquake": ["True", "False", "True", "False"],
+            "P(Alarm=T)": [f"{p:.4f}" for p in table[..., 0].ravel()],
+        })
+
+    mode = st.radio("Inference:", ENGINES, horizontal=True, key="bn_engine")
+    # The compiled tree is cached per network, so sessions share it too
+    engine = compile_network(net) if mode == ENGINES[0] else alarm_engine(model)
+
+    target = st.selectbox("Find the probability of:", net.nodes, key="bn_target")
+
+    st.markdown("**Given that:**")
+    evidence = {}
+    others = [name for name in net.nodes if name != target]
+    for col, name in zip(st.columns(len(others)), others):
+        with col:
+            value = st.selectbox(name, ["Unknown", *net.states[name]], key=f"bn_evidence_{name}")
+            if value != "Unknown":
+                evidence[name] = value
+
+    given = ", ".join(f"{name}={value}" for name, value in evidence.items())
+    try:
+        posterior = engine.query([target], evidence)
+    except ZeroDivisionError:
+        st.error(f"The evidence {given} is impossible in this network.")
+        return
+
+    condition = f" | {given}" if given else ""
+    for col, state, p in zip(st.columns(len(posterior.values)), net.states[target], posterior.values):
+        with col:
+            st.metric(f"P({target}={state}{condition})", f"{p:.4f}")
+
+    if evidence:
+        st.caption(f"P({given}) = {engine.probability(evidence):.6f}")
+        # Max-product elimination: the single best explanation of everything
+        # unobserved, and the best explanation of the unobserved causes alone
+        explanation, p = alarm_engine(model).mpe(evidence)
+        shown = ", ".join(f"{name}={state}" for name, state in explanation.items())
+        lines = [f"**Most probable explanation:** {shown} (probability {p:.4f})"]
+        causes = [name for name in ("Burglary", "Earthquake") if name not in evidence]
+        if causes and len(causes) < len(explanation):
+            best, p = alarm_engine(model).map(causes, evidence)
+            shown = ", ".join(f"{name}={state}" for name, state in best.items())
+            lines.append(f"**Most probable causes alone:** {shown} (probability {p:.4f})")
+        st.info("  \n".join(lines))
+
+    if mode == ENGINES[0]:
+        # Two message passes give every marginal at once
+        marginals = engine.marginals(evidence)
+        with st.expander("All marginals under this evidence"):
+            st.table({
+                "Variable": list(marginals),
+                "P(True)": [f"{m['True']:.4f}" for m in marginals.values()],
+                "P(False)": [f"{m['False']:.4f}" for m in marginals.values()],
+            })
+
+    # The same question answered approximately
+    st.markdown("#### 🎲 Estimate it by sampling")
+    method = st.radio("Sampler:", list(SAMPLERS), horizontal=True, key="bn_sampler")
+    n = st.select_slider("Samples:", [1000, 5000, 20000, 100000], value=20000, key="bn_samples")
+    try:
+        estimate = alarm_estimate(model, method, target, tuple(sorted(evidence.items())), n)
+    except ZeroDivisionError:
+        st.warning("No sample agreed with the evidence - rare evidence needs more samples or likelihood weighting.")
+        return
+
+    state = net.states[target][0]
+    exact = float(posterior.values[0])
+    est_col, ess_col, n_col = st.columns(3)
+    with est_col:
+        st.metric(f"Estimate of P({target}={state}{condition})", f"{estimate.distribution[state]:.4f}",
+                  delta=f"{estimate.distribution[state] - exact:+.4f} vs exact", delta_color="off")
+    with ess_col:
+        st.metric("Effective sample size", f"{estimate.ess:,.0f}",
+                  help="How many independent samples the estimate is worth")
+    with n_col:
+        st.metric("Samples drawn", f"{estimate.samples:,}")
+    st.line_chart({
+        "samples": [seen for seen, _ in estimate.trace],
+        "estimate": [probs[0] for _, probs in estimate.trace],
+        "exact": [exact] * len(estimate.trace),
+    }, x="samples", y=["estimate", "exact"])
+
+
+# A fragment: changing the question reruns only this check
+@st.fragment
+def independence_query():
+    net = alarm_engine().network
+    # Ancestor index and Bayes-ball runs are cached per network
+    index = independence_index(net)
+    x_col, y_col, given_col = st.columns([1, 1, 2])
+    with x_col:
+        x = st.selectbox("Is", net.nodes, index=net.nodes.index("DavidCalls"), key="bn_dsep_x")
+    others = [name for name in net.nodes if name != x]
+    with y_col:
+        y = st.selectbox("independent of", others, index=others.index("SophiaCalls") if "SophiaCalls" in others else 0,
+                         key="bn_dsep_y")
+    with given_col:
+        given = st.multiselect("given that we know", [name for name in others if name != y],
+                               default=["Alarm"] if "Alarm" not in (x, y) else [], key="bn_dsep_given")
+
+    knowing = f" given {', '.join(given)}" if given else ""
+    if index.d_separated([x], [y], given):
+        st.success(f"**Yes** - every path between {x} and {y} is blocked{knowing}.")
+    else:
+        st.warning(f"**No** - some path between {x} and {y} is open{knowing}.")
+
+    # Every pair under the same knowledge, as one batch of queries
+    free = [name for name in net.nodes if name not in given]
+    pairs = [(a, b) for i, a in enumerate(free) for b in free[i + 1:]]
+    answers = index.independent([([a], [b], given) for a, b in pairs])
+    independent = [f"{a} ⫫ {b}" for (a, b), yes in zip(pairs, answers) if yes]
+    st.caption(f"All independent pairs{knowing}: " + (", ".join(independent) or "none"))
+
+
+SIMULATED_ROWS = 10000
+
+
+@st.fragment
+def cpt_learning():
+    # Counts live in the session, so every added file or batch updates them
+    if "bn_learner" not in st.session_state:
+        st.session_state.bn_learner = CPTLearner(alarm_network())
+    learner = st.session_state.bn_learner
+
+    upload = st.file_uploader("CSV of observations:", type="csv", key="bn_csv")
+    add_col, simulate_col, reset_col = st.columns(3)
+    with add_col:
+        add = st.button("📥 Add the CSV's rows", disabled=upload is None)
+    with simulate_col:
+        simulate = st.button(f"🎲 Add {SIMULATED_ROWS:,} simulated rows")
+    with reset_col:
+        reset = st.button("🗑️ Reset the counts")
+
+    if reset:
+        learner = st.session_state.bn_learner = CPTLearner(alarm_network())
+    if simulate:
+        learner.update(sample_frame(alarm_network(), SIMULATED_ROWS, seed=learner.rows))
+    if add:
+        try:
+            upload.seek(0)
+            learner.read_csv(upload)
+        except (OSError, ValueError) as error:
+            st.error(f"Could not read the CSV: {error}")
+
+    smoothing = st.slider("Laplace smoothing (pseudo-count added to every cell):", 0.0, 5.0, 1.0, 0.5,
+                          key="bn_smoothing")
+    st.caption(f"{learner.rows:,} rows counted")
+    if not learner.rows:
+        return
+
+    true = alarm_engine().network
+    rows = {"P(...)": [], "Learned": [], "In the network": [], "Rows": []}
+    for name in true.nodes:
+        learned = learner.cpt(name, smoothing)[..., 0].ravel()
+        actual = true.cpts[name].values[..., 0].ravel()
+        seen = learner.counts[name].sum(axis=-1).ravel()
+        parents = true.parents[name]
+        for index, configuration in enumerate(np.ndindex(learner.counts[name].shape[:-1])):
+            given = ", ".join(f"{p}={true.states[p][s]}" for p, s in zip(parents, configuration))
+            rows["P(...)"].append(f"{name}={true.states[name][0]}" + (f" | {given}" if given else ""))
+            rows["Learned"].append(f"{learned[index]:.4f}")
+            rows["In the network"].append(f"{actual[index]:.4f}")
+            rows["Rows"].append(f"{seen[index]:,}")
+    st.table(rows)
+    st.caption("Rare parent combinations (a burglary during an earthquake) get few rows, so their estimates stay near the smoothed guess of 0.5 the longest.")
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def network_file_engine(digest, fmt, _source):
+    # Keyed by the file's hash; the source itself is not hashed again
+    return VariableElimination(read_network(_source, fmt))
+
+
+@st.fragment
+def network_file_query():
+    upload = st.file_uploader("Network file:", type=[ext.lstrip(".") for ext in FORMATS], key="bn_network_file")
+    if upload is None:
+        return
+    try:
+        source = upload.getvalue()
+        fmt = file_format(upload.name)
+        digest = file_digest(source)
+        engine = network_file_engine(digest, fmt, source)
+    except (OSError, ValueError, KeyError) as error:
+        st.error(f"Could not load the network: {error}")
+        return
+
+    net = engine.network
+    edges = sum(len(parents) for parents in net.parents.values())
+    parameters = sum(model.parameters for model in net.models.values())
+    st.caption(f"{len(net.nodes):,} variables, {edges:,} arcs, {parameters:,} parameters.")
+
+    # Widget keys carry the file's hash, so a new file starts a new question
+    target_col, evidence_col = st.columns([1, 2])
+    with target_col:
+        target = st.selectbox("Probability of", net.nodes, key=f"bn_file_target_{digest[:12]}")
+    with evidence_col:
+        # (variable, state) pairs: names in a loaded file may contain "="
+        choices = [(name, state) for name in net.nodes if name != target for state in net.states[name]]
+        picked = st.multiselect("given", choices, format_func=lambda choice: f"{choice[0]}={choice[1]}",
+                                key=f"bn_file_evidence_{digest[:12]}")
+    evidence = dict(picked)
+    if len(evidence) < len(picked):
+        st.warning("Pick one state per variable.")
+        return
+    start = time.perf_counter()
+    try:
+        posterior = engine.query([target], evidence)
+    except ZeroDivisionError:
+        st.error("That evidence is impossible in this network.")
+        return
+    ms = (time.perf_counter() - start) * 1000
+    st.table({"State": list(net.states[target]), "P": [f"{p:.4f}" for p in posterior.values]})
+    st.caption(f"Variable elimination over the {len(net.nodes):,}-variable network: {ms:.1f} ms.")
@@ -0,0 +1,133 @@
+import streamlit as st
+
+from reasoning.certainty import THRESHOLD, CertaintyEngine, combine, parse_rules
+
+# The rule base the engine starts with: the measles rule and a few around it
+EXAMPLE_RULES = """IF has-spots(X) AND has-fever(X) THEN has-measles(X) CF=0.5
+IF had-measles-vaccine(X) THEN has-measles(X) CF=-0.7
+IF has-fever(X) AND (has-cough(X) OR sore-throat(X)) THEN has-flu(X) CF=0.6
+IF has-cough(X) AND runny-nose(X) THEN has-cold(X) CF=0.4
+IF has-measles(X) OR has-flu(X) THEN contagious(X) CF=0.9
+IF has-cold(X) THEN contagious(X) CF=0.3"""
+EXAMPLE_EVIDENCE = {"has-spots(X)": 1.0, "has-fever(X)": 0.8}
+
+
+def render_certainty_factors():
+    st.markdown('<p class="main-header">🔟 Certainty Factors</p>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="concept-box"><h3>🎯 What are Certainty Factors?</h3><p>A <strong>simpler alternative</strong> to full Bayesian probability. Uses a single number from -1 to +1 to express belief/disbelief.</p></div>', unsafe_allow_html=True)
+    
+    # Formula
+    st.markdown("### 📐 The Formula")
+    
+    st.latex(r"CF[h,e] = MB[h,e] - MD[h,e]")
+    
+    st.markdown("""
+    **Where:**
+    - **MB** = Measure of Belief (0 to 1)
+    - **MD** = Measure of Disbelief (0 to 1)
+    - **CF** = Certainty Factor (-1 to +1)
+    """)
+    
+    # Scale
+    st.markdown("### 📊 CF Scale")
+    
+    st.markdown("""
+    - **CF = +1** → Definitely true
+    - **CF = +0.7** → Strong evidence for
+    - **CF = 0** → No evidence either way
+    - **CF = -0.7** → Strong evidence against
+    - **CF = -1** → Definitely false
+    """)
+    
+    # Example Rule
+    st.markdown('<div class="example-box"><h4>🏥 Medical Rule Example</h4><p><strong>Rule:</strong></p><code>IF has-spots(X) AND has-fever(X)<br>THEN has-measles(X) CF = 0.5</code><p><strong>Meaning:</strong> Spots + fever gives moderate evidence (CF=0.5) for measles.</p></div>', unsafe_allow_html=True)
+    
+    # Combining Evidence
+    st.markdown("### 🔗 Combining Evidence")
+    
+    st.latex(r"MB_{\text{combined}} = MB_1 + MB_2 \times (1-MB_1)")
+    
+    st.markdown('<div class="example-box"><p><strong>Example:</strong></p><ul><li>Evidence 1: MB=0.3 → CF=0.3</li><li>Evidence 2: MB=0.2</li></ul></div>', unsafe_allow_html=True)
+    
+    combined = combine(0.3, 0.2)
+    st.latex(rf"MB_{{\text{{combined}}}} = 0.3 + 0.2 \times (1-0.3) = {combined:.2f}")
+    
+    st.success(f"**Combined CF = {combined:.2f}** (stronger than either alone!)")
+
+    # Rule engine
+    st.markdown("### 🧮 Run the Rules")
+
+    st.markdown("Write rules as `IF premise THEN conclusion CF=0.5` - premises use **AND** (the smaller CF counts), **OR** (the larger) and parentheses. A rule fires when its premise's CF is above the threshold and passes on *premise CF × rule CF*; everything said about one fact is combined as above (disbelief from negative rules combines the same way, then CF = (MB − MD) / (1 − min(MB, MD))). Conclusions feed later rules.")
+
+    rule_engine()
+
+
+def engine_for(rules_text, threshold):
+    # One engine per session, rebuilt when the rules change; evidence moves
+    # are passed on incrementally
+    state = st.session_state.get("cf_engine")
+    if state is None or state[0] != rules_text:
+        state = (rules_text, CertaintyEngine(parse_rules(rules_text), threshold))
+        st.session_state.cf_engine = state
+    engine = state[1]
+    if engine.threshold != threshold:
+        engine.set_threshold(threshold)
+    return engine
+
+
+# A fragment: moving a slider reruns only the engine
+@st.fragment
+def rule_engine():
+    rules_text = st.text_area("Rules (one per line):", EXAMPLE_RULES, height=160, key="cf_rules")
+    threshold = st.slider("Firing threshold:", 0.0, 0.5, THRESHOLD, 0.05, key="cf_threshold")
+    try:
+        engine = engine_for(rules_text, threshold)
+    except ValueError as error:
+        st.error(f"Could not read the rules: {error}")
+        return
+
+    st.markdown("**Evidence** (CF of each observed fact; 0 = unknown):")
+    observable = sorted(engine.observable())
+    before = engine.evaluated
+    withdrawn = []
+    for i, col in enumerate(st.columns(3)):
+        with col:
+            for fact in observable[i::3]:
+                cf = st.slider(fact, -1.0, 1.0, EXAMPLE_EVIDENCE.get(fact, 0.0), 0.1, key=f"cf_evidence_{fact}")
+                if cf != engine.evidence.get(fact, 0.0):
+                    try:
+                        if cf:
+                            engine.tell(fact, cf)
+                        else:
+                            withdrawn.append((fact, *engine.retract(fact)))
+                    except ValueError as error:
+                        st.error(str(error))
+                        return
+    for fact, dependents, changed in withdrawn:
+        revised = len([f for f in changed if f != fact])
+        if dependents:
+            st.info(f"Withdrew **{fact}**: {', '.join(dependents)} rested on it "
+                    f"({revised} CF{'' if revised == 1 else 's'} revised).")
+        else:
+            st.info(f"Withdrew **{fact}**: no conclusion rested on it.")
+
+    found = engine.conclusions(minimum=0.0)
+    if not found:
+        st.info("No rule fires with this evidence.")
+    else:
+        measures = [engine.measures(fact) for fact, _ in found]
+        st.table({
+            "Conclusion": [fact for fact, _ in found],
+            "CF": [f"{cf:+.3f}" for _, cf in found],
+            "MB": [f"{mb:.3f}" for mb, _ in measures],
+            "MD": [f"{md:.3f}" for _, md in measures],
+            "Rules that fired": ["; ".join(f"{rule} → {amount:+.2f}" for rule, amount in engine.fired(fact))
+                                 for fact, _ in found],
+            "Rests on": [", ".join(engine.explain(fact)) for fact, _ in found],
+        })
+    evaluated = engine.evaluated - before
+    st.caption(f"{evaluated} rule evaluation{'' if evaluated == 1 else 's'} for this change, of "
+               f"{len(engine.rules)} rule{'' if len(engine.rules) == 1 else 's'}: only the rules that read a "
+               "changed fact are looked at. Setting a fact back to 0 withdraws its evidence, and the "
+               "conclusions that rested on it are revised the same way.")
@@ -0,0 +1,155 @@
+import streamlit as st
+
+from reasoning.dempster_shafer import MAX_FRAME, combine, combine_sparse, parse_frame, parse_masses, random_sources
+
+# Three symptoms, each pointing at a set of diagnoses; the third clashes with
+# the first two
+EXAMPLE_FRAME = "Allergy, Flu, Cold, Pneumonia"
+EXAMPLE_SOURCES = [
+    "# Fever\nFlu, Cold, Pneumonia: 0.6",
+    "# Runny nose\nAllergy, Flu, Cold: 0.8",
+    "# Goes away with antihistamines\nAllergy: 0.9",
+]
+
+
+def render_dempster_shafer():
+    st.markdown('<p class="main-header">1️⃣1️⃣ Dempster-Shafer Theory</p>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="concept-box"><h3>🎯 What is Dempster-Shafer?</h3><p>An <strong>evidence theory</strong> that can represent <strong>ignorance</strong> explicitly and combine evidence from multiple sources.</p></div>', unsafe_allow_html=True)
+    
+    # Why DST
+    st.markdown("### 🤔 Why Was It Developed?")
+    
+    prob_col, dst_col = st.columns(2)
+    
+    with prob_col:
+        st.markdown('<div class="warning-box"><h4>Bayesian Problems</h4><ul><li>One evidence at a time</li><li>Can\'t represent "I don\'t know"</li><li>Probabilities must sum to 1</li></ul></div>', unsafe_allow_html=True)
+    
+    with dst_col:
+        st.markdown('<div class="definition-box"><h4>DST Solutions</h4><ul><li>Combines multiple evidence</li><li>Explicitly shows ignorance</li><li>Uses intervals [Bel, Pl]</li></ul></div>', unsafe_allow_html=True)
+    
+    # Core Concepts
+    st.markdown("### 📊 Core Concepts")
+    
+    st.markdown('<div class="formula-box"><p><strong>Belief (Bel):</strong> Minimum support (how sure we are)</p><p><strong>Plausibility (Pl):</strong> Maximum support (how possible)</p><p><strong>Ignorance = Pl - Bel</strong></p></div>', unsafe_allow_html=True)
+    
+    # Example
+    st.markdown('<div class="example-box"><h4>Example: Unknown Disease</h4><p><strong>Bayesian:</strong> Must assign P(Disease1)=0.5, P(Disease2)=0.5 even with no evidence!</p><p><strong>DST:</strong> Bel(Disease1)=0, Pl(Disease1)=1 → Shows we don\'t know!</p></div>', unsafe_allow_html=True)
+    
+    # Combination Rule
+    st.markdown("### 🔗 Dempster's Combination Rule")
+    
+    st.latex(r"(m_1 \oplus m_2)(C) = \frac{\sum_{A \cap B = C} m_1(A) \times m_2(B)}{1 - K}")
+    
+    st.markdown("**Combines evidence from independent sources!**")
+
+    st.markdown("The same rule is a product of **commonalities** - the mass of each subset's supersets - so any number of sources combine in one pass:")
+
+    st.latex(r"Q(A) = \sum_{B \supseteq A} m(B) \qquad Q_{1 \oplus 2}(A) \propto Q_1(A)\,Q_2(A)")
+
+    # Combination
+    st.markdown("### 🧮 Combine the Evidence")
+
+    st.markdown("List each source's focal elements as `Hypothesis, Hypothesis: mass`; mass a source leaves unassigned goes to the whole frame Θ (ignorance).")
+
+    evidence_combination()
+
+    # Many sources
+    st.markdown("### 📡 Many Sensors")
+
+    st.markdown("With dozens of hypotheses the full table of subsets no longer fits, but real evidence has only a few **focal elements**: keep just those. Many sources are combined pairwise as a balanced tree, and capping the focal elements kept at each step merges the lightest into their union - with a guaranteed bound on how far any Bel or Pl can move. Conflict stretches that bound at every step: keeping 256 focal elements holds it under 0.5 for every setting below, but with fewer kept and many sensors over a large frame it can reach 1, and the result is then an approximation with no guarantee.")
+
+    sensor_fusion()
+    
+    st.success("**DST is more flexible than Bayesian - can say 'I don't know'!**")
+
+
+# A fragment: editing the evidence reruns only the combination
+@st.fragment
+def evidence_combination():
+    frame_text = st.text_input("Frame of discernment (hypotheses, comma-separated):", EXAMPLE_FRAME, key="ds_frame")
+    try:
+        frame = parse_frame(frame_text)
+    except ValueError as error:
+        st.error(f"Could not read the frame: {error}")
+        return
+
+    sources = []
+    for i, col in enumerate(st.columns(len(EXAMPLE_SOURCES))):
+        with col:
+            text = st.text_area(f"Source {i + 1}:", EXAMPLE_SOURCES[i], height=110, key=f"ds_source_{i}")
+            try:
+                sources.append(parse_masses(text, frame))
+            except ValueError as error:
+                st.error(str(error))
+    if len(sources) < len(EXAMPLE_SOURCES):
+        return
+
+    try:
+        # Frames too large to tabulate are combined focal element by focal
+        # element, exactly (nothing is summarized)
+        if len(frame) > MAX_FRAME:
+            combined, conflict, _ = combine_sparse(sources)
+        else:
+            combined, conflict = combine(sources)
+    except ZeroDivisionError as error:
+        st.error(f"Cannot combine: {error}")
+        return
+
+    st.metric("Conflict K", f"{conflict:.3f}", help="Mass the sources put on incompatible subsets, removed by dividing by 1 - K")
+    belief_col, focal_col = st.columns(2)
+    with belief_col:
+        st.markdown("**Each hypothesis**")
+        intervals = combined.intervals()
+        st.table({
+            "Hypothesis": list(intervals),
+            "Bel": [f"{bel:.3f}" for bel, _ in intervals.values()],
+            "Pl": [f"{pl:.3f}" for _, pl in intervals.values()],
+            "Ignorance": [f"{pl - bel:.3f}" for bel, pl in intervals.values()],
+        })
+    with focal_col:
+        st.markdown("**Combined masses**")
+        focal = combined.focal()
+        whole = tuple(frame)
+        st.table({
+            "Focal element": ["Θ" if names == whole else "{" + ", ".join(names) + "}" for names, _ in focal],
+            "m": [f"{mass:.3f}" for _, mass in focal],
+        })
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def fused_sensors(n_sources, n_hypotheses, max_focal):
+    # Fixed seed: the same settings always show the same sensors
+    sources = random_sources(n_sources, n_hypotheses, seed=0)
+    combined, conflict, error = combine_sparse(sources, max_focal=max_focal)
+    intervals = sorted(combined.intervals().items(), key=lambda item: (-item[1][1], -item[1][0]))
+    return intervals[:5], len(combined), conflict, error
+
+
+# A fragment: moving a slider reruns only the fusion
+@st.fragment
+def sensor_fusion():
+    sources_col, frame_col, focal_col = st.columns(3)
+    with sources_col:
+        n_sources = st.select_slider("Sensors:", [2, 5, 10, 20, 50, 100, 200, 500, 1000], 10, key="ds_sensors")
+    with frame_col:
+        n_hypotheses = st.select_slider("Hypotheses:", [10, 20, 40, 64], 40, key="ds_hypotheses")
+    with focal_col:
+        max_focal = st.select_slider("Focal elements kept:", [64, 256], 64, key="ds_max_focal")
+
+    top, focal, conflict, error = fused_sensors(n_sources, n_hypotheses, max_focal)
+    conflict_col, error_col = st.columns(2)
+    conflict_col.metric("Conflict K", f"{conflict:.4f}")
+    error_col.metric("Bel/Pl error bound", "exact" if not error else f"±{error:.2g}" if error < 1 else "no guarantee",
+                     help="How far any Bel or Pl can be from combining without merging focal elements")
+    if error >= 1:
+        st.warning("Merging focal elements has moved too much mass for a bound: these intervals are an "
+                   "approximation with no guarantee. Keep 256 focal elements for a bounded result.")
+    st.table({
+        "Hypothesis": [h for h, _ in top],
+        "Bel": [f"{bel:.4f}" for _, (bel, _) in top],
+        "Pl": [f"{pl:.4f}" for _, (_, pl) in top],
+    })
+    st.caption(f"Each sensor puts mass on 3 random subsets that usually hold H0, the true hypothesis. "
+               f"{n_sources:,} sensors over {n_hypotheses} hypotheses combined; "
+               f"{focal} focal element{'' if focal == 1 else 's'} left.")
@@ -0,0 +1,180 @@
+import time
+
+import numpy as np
+import streamlit as st
+
+from reasoning.fuzzy import FuzzyVariable, Trapezoid, parse_system
+from tables import content_table
+
+# Age terms as trapezoids: the table on the page is read off these
+AGE = FuzzyVariable("age", 0, 100, {
+    "Infant": Trapezoid(0, 0, 2, 5),
+    "Child": Trapezoid(2, 6, 12, 16),
+    "Young": Trapezoid(8, 10, 22, 32),
+    "Adult": Trapezoid(18, 25.5, 40, 65),
+    "Old": Trapezoid(35, 68, 100, 100),
+})
+AGES = [2, 10, 21, 30, 45, 70]
+
+# The tipping problem: how good were the service and the food?
+EXAMPLE_VARIABLES = """service [0, 10]: poor = gaussian(0, 1.5); good = gaussian(5, 1.5); excellent = gaussian(10, 1.5)
+food [0, 10]: rancid = trapezoid(0, 0, 1, 3); delicious = trapezoid(7, 9, 10, 10)
+tip [0, 30]: cheap = triangle(0, 5, 10); average = triangle(10, 15, 20); generous = triangle(20, 25, 30)"""
+EXAMPLE_RULES = """IF service IS poor OR food IS rancid THEN tip IS cheap
+IF service IS good THEN tip IS average
+IF service IS excellent OR food IS delicious THEN tip IS generous"""
+# Points along the first input in the sweep below the controls
+SWEEP_POINTS = 201
+
+
+def render_fuzzy_logic():
+    st.markdown('<p class="main-header">1️⃣2️⃣ Fuzzy Logic</p>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="definition-box"><h3>🎯 What is Fuzzy Logic?</h3><p>Allows <strong>partial truth</strong> - values between 0 and 1. Not just TRUE or FALSE!</p></div>', unsafe_allow_html=True)
+    
+    # Comparison
+    st.markdown("### 🔄 Crisp vs Fuzzy")
+    
+    crisp_col, fuzzy_col = st.columns(2)
+    
+    with crisp_col:
+        st.markdown('<div class="warning-box"><h4>Crisp Logic</h4><ul><li>Only 0 or 1</li><li>True or False</li><li>Sharp boundaries</li><li>Age > 60 = Old</li></ul></div>', unsafe_allow_html=True)
+    
+    with fuzzy_col:
+        st.markdown('<div class="definition-box"><h4>Fuzzy Logic</h4><ul><li>0 to 1 (any value)</li><li>Partial truth</li><li>Smooth transitions</li><li>Age 55 = Old(0.6)</li></ul></div>', unsafe_allow_html=True)
+    
+    # Age Example
+    st.markdown("### 👴 Age Membership Example")
+    
+    age_data = {'Age': AGES}
+    for term, mu in AGE.memberships(np.array(AGES)).items():
+        age_data[term] = [round(float(x), 1) for x in mu]
+    df_age = content_table(age_data)
+    st.table(df_age)
+
+    st.caption("Read off trapezoids: " + ", ".join(f"{term} = {shape!r}" for term, shape in AGE.terms.items()))
+    
+    st.info("**Notice:** Age 45 is Adult(0.8) AND Old(0.3). These don't sum to 1!")
+    
+    # Operations
+    st.markdown("### 🔧 Fuzzy Operations")
+    
+    op1, op2, op3 = st.tabs(["Union", "Intersection", "Complement"])
+    
+    with op1:
+        st.markdown("### Union (OR)")
+        st.latex(r"\mu_{A \cup B}(x) = \max(\mu_A(x), \mu_B(x))")
+        st.success("**Take the MAXIMUM!**")
+    
+    with op2:
+        st.markdown("### Intersection (AND)")
+        st.latex(r"\mu_{A \cap B}(x) = \min(\mu_A(x), \mu_B(x))")
+        st.success("**Take the MINIMUM!**")
+    
+    with op3:
+        st.markdown("### Complement (NOT)")
+        st.latex(r"\mu_{A^c}(x) = 1 - \mu_A(x)")
+        st.success("**1 minus membership!**")
+    
+    # Inference
+    st.markdown("### 🎛️ Fuzzy Inference")
+
+    st.markdown("Rules connect fuzzy sets: `IF service IS poor OR food IS rancid THEN tip IS cheap`, with OR, AND and NOT as above. **Mamdani** inference clips each output set at how strongly its rules fire, joins the clipped sets by max and **defuzzifies** the result - its *centroid* (centre of area) or *bisector* (the point halving the area). **Sugeno** inference gives each rule a crisp output - a number, or `tip = 5 + 2 * service` - and averages them weighted by firing strength.")
+
+    fuzzy_controller()
+
+    # Applications
+    st.markdown("### 🚀 Applications")
+    
+    app_col1, app_col2, app_col3 = st.columns(3)
+    
+    with app_col1:
+        st.markdown("""
+        **Home:**
+        - 🌡️ AC control
+        - 🧺 Washing machines
+        - 📺 Cameras
+        """)
+    
+    with app_col2:
+        st.markdown("""
+        **Industry:**
+        - 🏭 Process control
+        - 🚂 Train speed
+        - ✈️ Aircraft systems
+        """)
+    
+    with app_col3:
+        st.markdown("""
+        **Other:**
+        - 🏥 Medical diagnosis
+        - 🎮 Game AI
+        - 🎯 Pattern recognition
+        """)
+    
+    st.success("**Fuzzy Logic = Human-like reasoning with partial truths!**")
+
+
+# A fragment: moving a slider reruns only the controller
+@st.fragment
+def fuzzy_controller():
+    variables_col, rules_col = st.columns(2)
+    with variables_col:
+        variables_text = st.text_area("Variables (`name [low, high]: term = shape(...); ...`):", EXAMPLE_VARIABLES,
+                                      height=130, key="fuzzy_variables")
+    with rules_col:
+        rules_text = st.text_area("Rules (one per line):", EXAMPLE_RULES, height=130, key="fuzzy_rules")
+    try:
+        system = parse_system(variables_text, rules_text)
+    except ValueError as error:
+        st.error(f"Could not read the controller: {error}")
+        return
+
+    method_col, defuzzify_col = st.columns(2)
+    with method_col:
+        method = st.radio("Inference:", ["Mamdani", "Sugeno"], horizontal=True, key="fuzzy_method").lower()
+    with defuzzify_col:
+        defuzzify = st.radio("Defuzzification:", ["Centroid", "Bisector"], horizontal=True, key="fuzzy_defuzzify",
+                             disabled=method == "sugeno").lower()
+    if method == "mamdani" and system.sugeno_only:
+        st.error("Rules with `output = ...` conclusions need Sugeno inference.")
+        return
+
+    values = {}
+    for col, variable in zip(st.columns(len(system.inputs)), system.inputs.values()):
+        with col:
+            values[variable.name] = st.slider(variable.name, variable.low, variable.high,
+                                              (variable.low + variable.high) / 2, key=f"fuzzy_input_{variable.name}")
+
+    output = system.output
+    crisp = system.infer(values, method, defuzzify)
+    strengths = system.strengths(values)
+    st.metric(output.name, "no rule fires" if np.isnan(crisp) else f"{crisp:.2f}")
+    st.table({
+        "Rule": [str(rule) for rule in system.rules],
+        "Fires": [f"{strength:.3f}" for strength in strengths],
+    })
+    if method == "mamdani":
+        chart = {output.name: output.universe, "output set": system.aggregate(values)}
+        for term in output.terms:
+            chart[term] = output.membership(term, output.universe)
+        st.line_chart(chart, x=output.name, y=["output set", *output.terms])
+
+    # The whole sweep is one batch: every combination of the first input's
+    # points and three settings of the others
+    names = list(system.inputs)
+    first = system.inputs[names[0]]
+    levels = np.linspace(0, 1, 3) if len(names) > 1 else np.zeros(1)
+    grid = {names[0]: first.universe[::max(1, first.universe.size // SWEEP_POINTS)][:, None]}
+    for name in names[1:]:
+        variable = system.inputs[name]
+        grid[name] = (variable.low + levels * (variable.high - variable.low))[None, :]
+    start = time.perf_counter()
+    sweep = system.infer(grid, method, defuzzify)
+    ms = (time.perf_counter() - start) * 1000
+    chart = {names[0]: grid[names[0]][:, 0]}
+    for j, level in enumerate(levels):
+        label = ", ".join(f"{name} = {grid[name][0, j]:g}" for name in names[1:]) or output.name
+        chart[label] = sweep[:, j]
+    st.line_chart(chart, x=names[0], y=[label for label in chart if label != names[0]])
+    st.caption(f"{sweep.size:,} inputs inferred in one pass in {ms:.1f} ms.")
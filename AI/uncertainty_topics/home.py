@@ -0,0 +1,70 @@
+import streamlit as st
+
+
+def render_home():
+    st.markdown('<p class="main-header">🧠 AI Uncertainty & Reasoning Study Guide</p>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    Welcome to your **complete study companion** for AI Uncertainty and Reasoning! 
+    This app explains every concept from your PPT in simple, easy-to-understand language.
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 📖 What You'll Learn")
+        st.markdown("""
+        **Part 1: Uncertainty & Non-Monotonic Reasoning**
+        - Understanding uncertainty in AI
+        - Non-monotonic reasoning approaches
+        - Default reasoning and minimalistic reasoning
+        
+        **Part 2: Truth Maintenance Systems**
+        - JTMS (Justification-Based)
+        - LTMS (Logic-Based)
+        - ATMS (Assumption-Based)
+        
+        **Part 3: Probabilistic Methods**
+        - Probability basics
+        - Bayes' Theorem and applications
+        - Bayesian Networks
+        - Certainty Factors
+        
+        **Part 4: Advanced Topics**
+        - Dempster-Shafer Theory
+        - Fuzzy Logic systems
+        """)
+    
+    with col2:
+        st.markdown("### 🎯 How to Use")
+        st.markdown("""
+        1. **Select a topic** from the sidebar
+        2. **Read carefully** - concepts build on each other
+        3. **Study examples** - they clarify theory
+        4. **Take your time** - understanding > speed
+        5. **Revisit topics** as needed for revision
+        
+        ### 💡 Study Tips
+        - Start with Chapter 1 and go sequentially
+        - Focus on understanding, not memorizing
+        - Pay attention to examples
+        - Color-coded boxes help you identify content types
+        - Use formulas as reference, not memorization
+        """)
+    
+    st.markdown("---")
+    
+    st.markdown("### 🚀 Quick Topic Overview")
+    
+    with st.expander("📋 Chapter-by-Chapter Guide"):
+        st.markdown("""
+        **Chapter 1-2:** Foundation - Why uncertainty matters, how beliefs change
+        
+        **Chapter 3-6:** Truth Maintenance - Systems that track and update beliefs automatically
+        
+        **Chapter 7-10:** Probability-Based - Mathematical approaches using probability theory
+        
+        **Chapter 11-12:** Alternative Approaches - Evidence theory and fuzzy reasoning
+        """)
+    
+    st.success("👈 **Ready to start? Choose your first topic from the sidebar!**")
@@ -0,0 +1,145 @@
+import streamlit as st
+
+
+def render_jtms():
+    st.markdown('<p class="main-header">4️⃣ JTMS - Justification-Based TMS</p>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="concept-box"><h3>🎯 What is JTMS?</h3><p>JTMS is the <strong>simplest and most popular</strong> Truth Maintenance System. It acts as a pure <strong>bookkeeper</strong> that:</p><ul><li>Doesn\'t understand the <strong>meaning</strong> of beliefs</li><li>Just tracks <strong>which beliefs support which</strong></li><li>Maintains <strong>consistent labels</strong> (IN or OUT)</li><li>Lets another system do the actual reasoning</li></ul></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🧩 Core Components")
+    
+    comp1, comp2, comp3 = st.columns(3)
+    
+    with comp1:
+        st.markdown("""
+        **Assertions**
+        
+        Propositions that can be believed
+        
+        Examples:
+        - "Abbott is a suspect"
+        - "It's raining"
+        - "Battery works"
+        """)
+    
+    with comp2:
+        st.markdown("""
+        **Justifications**
+        
+        Reasons WHY we believe something
+        
+        Has two parts:
+        - IN-list (must be true)
+        - OUT-list (must be false)
+        """)
+    
+    with comp3:
+        st.markdown("""
+        **Labels**
+        
+        Current belief status
+        
+        Values:
+        - IN (believed)
+        - OUT (not believed)
+        - UNKNOWN
+        """)
+    
+    st.markdown("### 📋 Understanding Justifications")
+    
+    st.markdown('<div class="definition-box"><h3>The Justification Rule</h3><p>An assertion is <strong>valid (IN)</strong> if and only if:</p><ol><li><strong>ALL</strong> beliefs in the IN-list are IN ✅</li><li><strong>NONE</strong> of the beliefs in the OUT-list are IN ❌</li></ol></div>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="example-box"><h4>Simple Example: Suspect Abbott</h4><p><strong>Assertion:</strong> "Abbott is a suspect"</p><p><strong>Justification:</strong></p><ul><li><strong>IN-list:</strong> [Beneficiary(Abbott)] - must be true</li><li><strong>OUT-list:</strong> [Alibi(Abbott)] - must be false</li></ul><hr><p><strong>Scenario 1:</strong></p><ul><li>Beneficiary(Abbott) = IN ✅</li><li>Alibi(Abbott) = OUT ❌</li><li><strong>Result:</strong> Suspect(Abbott) = IN ✅</li></ul><p><strong>Scenario 2:</strong></p><ul><li>Beneficiary(Abbott) = IN ✅</li><li>Alibi(Abbott) = IN ✅ (found evidence!)</li><li><strong>Result:</strong> Suspect(Abbott) = OUT ❌ (no longer suspect!)</li></ul></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🕵️ The ABC Murder Mystery")
+    
+    st.markdown('<div class="warning-box"><h4>📖 The Story</h4><p>Someone has been murdered. There are three suspects:</p><ul><li><strong>Abbott</strong></li><li><strong>Babbitt</strong></li><li><strong>Cabot</strong></li></ul><p>All three are <strong>beneficiaries</strong> of the deceased (they inherit money). We need to find the primary suspect by checking their alibis.</p></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🔍 Abbott's Investigation")
+    
+    abbott_col1, abbott_col2 = st.columns(2)
+    
+    with abbott_col1:
+        st.markdown('<div class="example-box"><h4>Initial Situation</h4><p><strong>Facts we have:</strong></p><ul><li>✅ Abbott is a beneficiary</li><li>❌ Abbott has NO alibi (so far)</li></ul><hr><p><strong>Justification for "Suspect(Abbott)":</strong></p><ul><li><strong>IN-list:</strong> Beneficiary(Abbott)</li><li><strong>OUT-list:</strong> Alibi(Abbott)</li></ul><hr><p><strong>Check:</strong></p><ul><li>Beneficiary(Abbott) = IN ✅</li><li>Alibi(Abbott) = OUT ❌</li></ul><p><strong>Conclusion:</strong> Suspect(Abbott) = <span style="color:red">IN ✅</span></p><p><strong>Abbott is our suspect!</strong></p></div>', unsafe_allow_html=True)
+    
+    with abbott_col2:
+        st.markdown('<div class="definition-box"><h4>New Evidence Arrives!</h4><p><strong>Discovery:</strong> Abbott was registered at an Albany hotel at the time of murder!</p><hr><p><strong>Updated facts:</strong></p><ul><li>✅ Abbott is a beneficiary (still true)</li><li>✅ Abbott HAS an alibi (new!)</li></ul><hr><p><strong>Justification check:</strong></p><ul><li>IN-list: Beneficiary(Abbott) = IN ✅</li><li>OUT-list: Alibi(Abbott) = IN ✅ <strong>← PROBLEM!</strong></li></ul><hr><p><strong>New Conclusion:</strong> Suspect(Abbott) = <span style="color:green">OUT ❌</span></p><p><strong>Abbott is NO longer a suspect!</strong></p></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 📊 Visual Representation")
+    
+    st.markdown("""
+    ```
+    Network Diagram for Abbott:
+    
+    [Beneficiary(Abbott)] ──(+)──┐
+                                  │
+                                  ├──> [Suspect(Abbott)]
+                                  │
+    [Alibi(Abbott)] ──────(-)────┘
+    
+    Legend:
+    (+) = IN-list connection (must be believed)
+    (-) = OUT-list connection (must NOT be believed)
+    ──> = Supports this conclusion
+    
+    When Alibi changes from OUT to IN:
+    → Suspect automatically changes from IN to OUT!
+    ```
+    """)
+    
+    st.markdown("### 🔄 What JTMS Does Automatically")
+    
+    what_does = st.columns(2)
+    
+    with what_does[0]:
+        st.markdown('<div class="concept-box"><h3>✅ JTMS Performs:</h3><ol><li><strong>Consistent Labeling</strong><br>Keeps all labels (IN/OUT) consistent with justifications</li><li><strong>Contradiction Resolution</strong><br>Handles conflicting beliefs</li><li><strong>Automatic Propagation</strong><br>When one belief changes, updates all dependent beliefs</li></ol></div>', unsafe_allow_html=True)
+    
+    with what_does[1]:
+        st.markdown('<div class="warning-box"><h3>❌ JTMS Does NOT:</h3><ol><li><strong>Apply reasoning rules</strong><br>You must tell it what rules to use</li><li><strong>Create justifications</strong><br>You must provide them</li><li><strong>Choose between alternatives</strong><br>You must decide</li><li><strong>Detect contradictions on its own</strong><br>You must flag them</li></ol></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🎯 Complete Example: All Three Suspects")
+    
+    st.markdown("""
+    **Let's track all three suspects:**
+    
+    | Suspect | Beneficiary? | Alibi? | Suspect Status |
+    |---------|-------------|--------|----------------|
+    | Abbott  | ✅ IN | ✅ IN (hotel) | ❌ OUT (has alibi) |
+    | Babbitt | ✅ IN | ✅ IN (brother-in-law) | ❌ OUT (has alibi) |
+    | Cabot   | ✅ IN | ✅ IN (ski show) | ❌ OUT (has alibi) |
+    
+    **Result:** All three have alibis, so none are suspects!
+    
+    **But wait...** What if one of these alibis is fake? That's where we might need 
+    to create a contradiction and let JTMS help us explore alternatives!
+    """)
+    
+    st.markdown("### 💡 Key Insight About JTMS")
+    
+    st.info("""
+    **JTMS is like a smart assistant:**
+    
+    - **You provide:** The justifications and rules
+    - **JTMS handles:** Keeping everything consistent automatically
+    
+    When evidence changes, JTMS instantly updates all affected beliefs 
+    by following the justification network!
+    """)
+    
+    st.markdown("### 🎓 Summary")
+    
+    st.success("""
+    **JTMS Key Points:**
+    
+    ✅ Simple bookkeeping system for beliefs
+    
+    ✅ Uses IN-lists and OUT-lists for justifications
+    
+    ✅ Automatically maintains consistency
+    
+    ✅ Perfect for non-monotonic reasoning
+    
+    ✅ Most widely used TMS in practice
+    """)
+    
+    st.info("👉 **Next:** Learn about LTMS, which adds logical intelligence!")
@@ -0,0 +1,267 @@
+import streamlit as st
+
+from reasoning.bayesnet import car_network
+from reasoning.elimination import VariableElimination
+from tables import content_table
+
+
+def render_ltms():
+    st.markdown('<p class="main-header">5️⃣ LTMS - Logic-Based TMS</p>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="concept-box"><h3>🎯 What is LTMS?</h3><p>LTMS is like JTMS, but <strong>smarter</strong>! It understands <strong>logical relationships</strong> and can <strong>automatically detect contradictions</strong>.</p></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🔄 The Key Difference")
+    
+    diff_col1, diff_col2 = st.columns(2)
+    
+    with diff_col1:
+        st.markdown('<div class="warning-box"><h3>JTMS</h3><p><strong>Treats beliefs as atoms</strong></p><ul><li>No automatic contradiction detection</li><li>Can label both P and ¬P as IN at the same time</li><li>You must explicitly create contradiction nodes</li><li>Doesn\'t understand logical relationships</li></ul><p><strong>Example:</strong></p><p>Can believe both:</p><ul><li>"Lights are ON" = IN</li><li>"Lights are OFF" = IN</li></ul><p>JTMS won\'t complain!</p></div>', unsafe_allow_html=True)
+    
+    with diff_col2:
+        st.markdown('<div class="definition-box"><h3>LTMS</h3><p><strong>Treats beliefs as logical propositions</strong></p><ul><li><strong>Automatically</strong> detects contradictions</li><li>CANNOT label both P and ¬P as IN</li><li>Understands P and ¬P are opposites</li><li>Uses logical relationships</li></ul><p><strong>Example:</strong></p><p>If you try to believe:</p><ul><li>"Lights are ON" = IN</li><li>"Lights are OFF" = IN</li></ul><p>LTMS <strong>automatically detects</strong> the contradiction!</p></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🚗 Car Diagnosis Example")
+    
+    st.markdown('<div class="example-box"><h4>🎯 The Scenario</h4><p>An expert system is trying to diagnose why a car won\'t start. The mechanic provides observations, and the system maintains beliefs about the car.</p></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 📊 Step-by-Step Process")
+    
+    step1, step2, step3, step4 = st.tabs(["Step 1: Initial", "Step 2: Contradiction", "Step 3: Backtracking", "Step 4: Resolution"])
+    
+    with step1:
+        st.markdown("### Step 1: Initial Assumptions")
+        st.markdown('<div class="concept-box"><p><strong>System starts with these assumptions:</strong></p></div>', unsafe_allow_html=True)
+        st.markdown("""
+        **Node A:** `engine_is_running_properly` = IN ✅
+        - *Justification:* Initial assumption (empty IN-list)
+        
+        **Node B:** `has_fuel` = IN ✅
+        - *Justification:* Initial assumption
+        
+        **Node C:** `battery_is_working` = IN ✅
+        - *Justification:* Initial assumption
+        
+        **Node D:** `car_starts` = IN ✅
+        - *Justification:* IN(A, B, C) - needs all three
+        - *Reasoning:* If engine works AND has fuel AND battery works → car starts
+        
+        **Initial Conclusion:** Car should start! 🚗✅
+        """)
+    
+    with step2:
+        st.markdown("### Step 2: Contradiction Arises")
+        st.markdown('<div class="warning-box"><p><strong>New Evidence from Mechanic:</strong></p></div>', unsafe_allow_html=True)
+        st.markdown("""
+        **Observation:** `car_does_not_start` = IN ✅
+        - *Justification:* Direct observation (fact)
+        
+        **Problem Detected:**
+        - System believes: `car_starts` = IN ✅
+        - New evidence says: `car_does_not_start` = IN ✅
+        - **These are logical opposites!**
+        
+        **LTMS Automatic Response:**
+        🚨 **CONTRADICTION DETECTED!** 🚨
+        
+        *(JTMS would need you to explicitly create a contradiction node)*
+        """)
+    
+    with step3:
+        st.markdown("### Step 3: Dependency-Directed Backtracking")
+        st.markdown('<div class="definition-box"><p><strong>LTMS traces the problem:</strong></p></div>', unsafe_allow_html=True)
+        st.markdown("""
+        **Tracing Dependencies:**
+        ```
+        car_starts (IN) depends on:
+        ├── engine_is_running_properly (IN) ✅
+        ├── has_fuel (IN) ✅
+        └── battery_is_working (IN) ✅
+        
+        One of these MUST be wrong!
+        ```
+        
+        **Mechanic Tests:**
+        - ✅ Engine: Working fine
+        - ✅ Fuel: Tank is full
+        - ❌ Battery: **DEAD!** 🔋💀
+        
+        **Discovery:** The battery assumption was wrong!
+        """)
+    
+    with step4:
+        st.markdown("### Step 4: Belief Revision")
+        st.markdown('<div class="formula-box"><p><strong>LTMS Updates the Network:</strong></p></div>', unsafe_allow_html=True)
+        st.markdown("""
+        **Update Process:**
+        
+        1️⃣ **Retract Battery Assumption:**
+        - Node C: `battery_is_working` = OUT ❌
+        - New justification: OUT(battery_is_dead_evidence)
+        
+        2️⃣ **Propagate Change:**
+        - Node D: `car_starts` = OUT ❌
+        - Because one of its dependencies (C) is now OUT
+        
+        3️⃣ **Add New Belief:**
+        - New Node: `battery_is_not_working` = IN ✅
+        
+        4️⃣ **Update Conclusion:**
+        - `car_does_not_start` = IN ✅
+        - Consistent with observation!
+        
+        **System is now consistent!** ✅
+        """)
+    
+    st.markdown("### 🔗 The Complete Flow")
+    
+    st.markdown("""
+    ```
+    Initial State:
+    [Engine OK] ─┐
+    [Fuel OK]   ─┼─> [Car Starts] ✅
+    [Battery OK]─┘
+    
+    ↓ New Evidence: Car doesn't start
+    
+    Contradiction!
+    
+    ↓ Test assumptions
+    
+    [Engine OK] ─┐
+    [Fuel OK]   ─┼─> [Car Starts] ❌
+    [Battery ❌] ─┘
+    
+    ↓ Update beliefs
+    
+    Final State:
+    [Engine OK] ─┐
+    [Fuel OK]   ─┼─> [Car Doesn't Start] ✅
+    [Battery ❌] ─┘
+    
+    Diagnosis: Battery is dead!
+    ```
+    """)
+    
+    st.markdown("### 🎲 The Same Diagnosis with Probabilities")
+
+    st.markdown("The LTMS keeps every assumption until a contradiction forces one out. A **Bayesian network** of the same car instead gives each part a failure rate and asks which combination of faults best explains what the mechanic sees - the *most probable explanation*.")
+
+    car_diagnosis()
+
+    st.markdown("### ✨ Key Features of LTMS")
+    
+    features_col1, features_col2 = st.columns(2)
+    
+    with features_col1:
+        st.markdown("""
+        **Intelligence:**
+        - 🧠 Logic-aware reasoning
+        - 🔍 Automatic contradiction detection
+        - 🔗 Understands logical relationships
+        - ⚡ Efficient dependency tracking
+        """)
+    
+    with features_col2:
+        st.markdown("""
+        **Process:**
+        - 📋 Maintains dependency network (like JTMS)
+        - 🚨 Detects logical contradictions automatically
+        - 🔍 Traces back through dependencies
+        - ❌ Retracts responsible beliefs
+        - 🔄 Propagates changes forward
+        """)
+    
+    st.markdown("### 📊 JTMS vs LTMS Comparison")
+    
+    comparison = {
+        'Feature': [
+            'Contradiction Detection',
+            'Logical Awareness',
+            'P and ¬P both IN',
+            'Setup Complexity',
+            'Intelligence Level',
+            'Best For'
+        ],
+        'JTMS': [
+            'Manual (you create nodes)',
+            'None (treats as atoms)',
+            'Allowed (no detection)',
+            'Simple',
+            'Bookkeeping',
+            'Simple reasoning tasks'
+        ],
+        'LTMS': [
+            'Automatic',
+            'Full (understands logic)',
+            'Automatically prevented',
+            'Moderate',
+            'Logic-based reasoning',
+            'Diagnosis, complex reasoning'
+        ]
+    }
+    
+    df_comparison = content_table(comparison)
+    st.table(df_comparison)
+    
+    st.markdown("### 💡 When to Use LTMS")
+    
+    st.info("""
+    **Use LTMS when:**
+    
+    ✅ You need automatic contradiction detection
+    
+    ✅ Working with logical propositions
+    
+    ✅ Building diagnosis systems
+    
+    ✅ Logical consistency is critical
+    
+    ✅ You want smarter reasoning
+    """)
+    
+    st.markdown("### 🎓 Summary")
+    
+    st.success("""
+    **LTMS = JTMS + Logical Intelligence**
+    
+    ✅ Automatically understands logical relationships
+    
+    ✅ Detects contradictions without being told
+    
+    ✅ More powerful for complex reasoning
+    
+    ✅ Perfect for diagnostic systems
+    
+    ✅ Efficient dependency-directed backtracking
+    """)
+    
+    st.info("👉 **Next:** Learn about ATMS, which explores multiple worlds at once!")
+
+
+@st.cache_resource(show_spinner=False)
+def car_engine():
+    return VariableElimination(car_network())
+
+
+CAR_PARTS = ["Battery", "Fuel", "Engine"]
+
+
+# A fragment: changing an observation reruns only the diagnosis
+@st.fragment
+def car_diagnosis():
+    net = car_engine().network
+    evidence = {}
+    for col, name in zip(st.columns(2), ["CarStarts", "Lights"]):
+        with col:
+            label = "Car starts?" if name == "CarStarts" else "Lights?"
+            value = st.selectbox(label, ["Unknown", *net.states[name]], key=f"ltms_car_{name}")
+            if value != "Unknown":
+                evidence[name] = value
+
+    # Partial MAP over the parts: the lights and the start are summed out
+    # when they are not observed
+    explanation, p = car_engine().map(CAR_PARTS, evidence)
+    for col, name in zip(st.columns(len(CAR_PARTS)), CAR_PARTS):
+        with col:
+            st.metric(name, explanation[name])
+    st.caption(f"Probability of this explanation given the observations: {p:.1%}")
@@ -0,0 +1,137 @@
+import streamlit as st
+
+
+def render_non_monotonic():
+    st.markdown('<p class="main-header">2️⃣ Non-Monotonic Reasoning</p>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="concept-box"><h3>🔄 The Core Concept</h3><p><strong>Monotonic Logic:</strong> Once you prove something true, adding more facts <strong>never changes</strong> that conclusion.</p><p><strong>Non-Monotonic Logic:</strong> Conclusions can be <strong>withdrawn</strong> when new information appears!</p></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 📊 Visual Comparison")
+    
+    comp1, comp2 = st.columns(2)
+    
+    with comp1:
+        st.markdown('<div class="warning-box"><h4>❌ Monotonic (Traditional)</h4><p><strong>Example:</strong></p><code>Facts: All birds fly<br>New: Tweety is a bird<br>→ Tweety flies ✅<br><br>Add more facts...<br>→ Tweety STILL flies ✅<br>(Never changes!)</code></div>', unsafe_allow_html=True)
+    
+    with comp2:
+        st.markdown('<div class="definition-box"><h4>✅ Non-Monotonic</h4><p><strong>Example:</strong></p><code>Facts: Birds typically fly<br>New: Tweety is a bird<br>→ Tweety probably flies ✅<br><br>New: Tweety is a penguin<br>→ Tweety does NOT fly ❌<br>(Belief changed!)</code></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🎯 Why Do We Need This?")
+    
+    st.markdown("""
+    **Real-world reasoning requires:**
+    - Making assumptions with incomplete information
+    - Updating beliefs when we learn more
+    - Handling contradictions gracefully
+    - Reasoning efficiently without all facts upfront
+    """)
+    
+    st.markdown("### 🧩 Types of Non-Monotonic Reasoning")
+    
+    st.markdown("---")
+    st.markdown("## 1️⃣ Default Reasoning")
+    
+    st.markdown('<div class="definition-box"><p><strong>Default Reasoning:</strong> Make reasonable assumptions unless proven otherwise</p><p>Think: "Innocent until proven guilty"</p></div>', unsafe_allow_html=True)
+    
+    tab1, tab2 = st.tabs(["Non-Monotonic Logic", "Default Logic"])
+    
+    with tab1:
+        st.markdown("### Non-Monotonic Logic")
+        st.markdown("""
+        Uses a special operator **M** which means "is consistent with what we know"
+        
+        **Formula:**
+        """)
+        st.latex(r"A \land M \space B \rightarrow C")
+        st.markdown("""
+        **Reading:** If A is true AND assuming B is consistent → conclude C
+        
+        **Example:**
+        """)
+        st.latex(r"\forall x \forall y \space Related(x,y) \land M \space Getalong(x,y) \rightarrow WillDefend(x,y)")
+        st.markdown("""
+        **Translation:** If two people are related AND we can assume they get along 
+        → they will defend each other
+        """)
+        
+        st.markdown('<div class="example-box"><h4>🔍 Practical Example</h4><p><strong>Statement:</strong> "My uncle is my relative, and I have no reason to think we don\'t get along"</p><p><strong>Conclusion:</strong> "My uncle will defend me"</p><p><strong>Later:</strong> "I discover my uncle doesn\'t like me"</p><p><strong>New Conclusion:</strong> "My uncle won\'t defend me" (retracted!)</p></div>', unsafe_allow_html=True)
+    
+    with tab2:
+        st.markdown("### Default Logic")
+        st.markdown("""
+        **Form:**
+        """)
+        st.latex(r"\frac{A : B}{C}")
+        st.markdown("""
+        **Meaning:** 
+        - If **A** is provable
+        - AND it's **consistent** to assume **B**
+        - THEN conclude **C**
+        
+        **Example:**
+        """)
+        st.latex(r"\frac{AdultMale(x) : BaseballPlayer(x)}{Height(x, 5'10'')}")
+        st.markdown("""
+        **Translation:**
+        - If x is an adult male
+        - AND it's consistent to assume x plays baseball
+        - THEN assume x's height is 5'10"
+        
+        **Why this works:** Most baseball players are around 5'10"
+        
+        **But:** If we later learn x is 7 feet tall → retract this assumption!
+        """)
+    
+    st.markdown("---")
+    st.markdown("## 2️⃣ Minimalistic Reasoning")
+    
+    st.markdown('<div class="concept-box"><p><strong>Principle:</strong> Assume as <strong>few things as possible</strong> are true</p><p>Don\'t make unnecessary assumptions!</p></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🔄 Dependency Directed Backtracking")
+    
+    st.markdown("""
+    **Problem:** When beliefs change, do we restart everything from scratch?
+    
+    **Solution:** Only change what's affected by the new information!
+    """)
+    
+    st.markdown('<div class="example-box"><h4>📅 Meeting Scheduling Example</h4><p><strong>Initial Plan:</strong></p><ul><li>Day: Tuesday</li><li>Time: 12:15 PM</li><li>Reason: Everyone is available</li></ul><p><strong>Problem Discovered:</strong> No room available on Tuesday!</p><hr><p><strong>❌ Bad Approach:</strong> Start over, recheck everyone\'s availability for every day and time</p><p><strong>✅ Smart Approach (Dependency Directed):</strong></p><ol><li>Change day to Thursday</li><li>Keep time at 12:15 PM</li><li><strong>Don\'t recheck availability</strong> - assume if Tuesday worked, Thursday works too</li></ol><p><strong>Result:</strong> Much faster! We only changed what needed to change.</p></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 💡 Why This Matters")
+    
+    st.info("""
+    **Efficiency:** Don't waste time rechecking everything
+    
+    **Intelligence:** Track which beliefs depend on which assumptions
+    
+    **Flexibility:** Update only what's necessary when something changes
+    """)
+    
+    st.markdown("---")
+    st.markdown("## 3️⃣ Statistical Reasoning")
+    
+    st.markdown("""
+    This approach uses **numbers** to handle uncertainty:
+    
+    - **Certainty Factors:** Simple numeric belief measures
+    - **Bayesian Networks:** Graphical probability models
+    - **Dempster-Shafer Theory:** Evidence combination
+    
+    *(These are covered in later chapters)*
+    """)
+    
+    st.markdown("### 🎓 Summary")
+    
+    st.success("""
+    **Non-Monotonic Reasoning allows AI to:**
+    
+    ✅ Make educated guesses with incomplete info
+    
+    ✅ Change its mind when learning new facts
+    
+    ✅ Reason efficiently using defaults and assumptions
+    
+    ✅ Handle real-world uncertainty intelligently
+    """)
+    
+    st.info("👉 **Next:** Learn how Truth Maintenance Systems implement non-monotonic reasoning!")
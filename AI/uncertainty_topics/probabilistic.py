@@ -0,0 +1,123 @@
+import itertools
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from reasoning.joint import JointDistribution, parse_variables
+
+# The Student example: P(Math, English) over who likes which subject
+STUDENT_VARIABLES = "Math: likes, dislikes; English: likes, dislikes"
+STUDENT_TABLE = [[0.4, 0.1], [0.3, 0.2]]
+# Larger tables are built in code; the editor shows up to this many cells
+MAX_EDITOR_CELLS = 4096
+
+
+def render_probabilistic():
+    st.markdown('<p class="main-header">7️⃣ Probabilistic Reasoning</p>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="definition-box"><h3>🎯 What is Probabilistic Reasoning?</h3><p>Instead of saying "definitely true" or "definitely false", we use <strong>numbers between 0 and 1</strong> to express how likely something is!</p></div>', unsafe_allow_html=True)
+    
+    # Probability basics
+    st.markdown("### 📊 Probability Basics")
+    
+    st.latex(r"0 \leq P(A) \leq 1")
+    
+    st.markdown("""
+    - **P(A) = 0** → Impossible
+    - **P(A) = 0.5** → 50-50 chance
+    - **P(A) = 1** → Certain
+    """)
+    
+    # Formula
+    st.markdown('<div class="formula-box"><p><strong>Basic Formula:</strong></p></div>', unsafe_allow_html=True)
+    
+    st.latex(r"P(A) = \frac{\text{Favorable outcomes}}{\text{Total outcomes}}")
+    
+    # Example
+    st.markdown('<div class="example-box"><h4>🎲 Die Roll Example</h4><p>Probability of rolling a 6:</p></div>', unsafe_allow_html=True)
+    
+    st.latex(r"P(\text{six}) = \frac{1}{6} \approx 0.167 = 16.7\%")
+    
+    # Conditional Probability
+    st.markdown("### 🔗 Conditional Probability")
+    
+    st.latex(r"P(A|B) = \frac{P(A \cap B)}{P(B)}")
+    
+    st.markdown("**Meaning:** Probability of A given that B happened")
+    
+    # Student Example, read off the joint table
+    student = JointDistribution(parse_variables(STUDENT_VARIABLES), STUDENT_TABLE)
+    english = student.mass({"English": "likes"})
+    both = student.mass({"Math": "likes", "English": "likes"})
+    math_given_english = student.probability({"Math": "likes"}, {"English": "likes"})
+    st.markdown(f'<div class="example-box"><h4>📚 Student Preferences Example</h4><ul><li>{english:.0%} like English: P(English) = {english:g}</li><li>{both:.0%} like both: P(English ∩ Math) = {both:g}</li></ul><p><strong>Question:</strong> What % of English-lovers also like Math?</p></div>', unsafe_allow_html=True)
+    
+    st.latex(rf"P(\text{{Math}}|\text{{English}}) = \frac{{{both:g}}}{{{english:g}}} = {math_given_english:.2f} = {math_given_english:.0%}".replace("%", r"\%"))
+    
+    st.success(f"**{math_given_english:.0%} of students who like English also like Math!**")
+
+    # Joint table engine
+    st.markdown("### 🧮 Ask the Joint Table")
+
+    st.markdown("Every probability question about a few variables can be answered from their **joint table** - one probability per combination of states. Define the variables, edit the table (any non-negative weights; they are normalized), then ask for a probability `P(Math=likes | English=likes)`, a conditional table `P(Math | English)` or an independence check `Math _|_ English`.")
+
+    joint_table_query()
+
+
+def starting_weights(variables, states):
+    # Starting weights for the editor: the Student table, else uniform
+    if variables == parse_variables(STUDENT_VARIABLES):
+        return np.asarray(STUDENT_TABLE, dtype=float).ravel()
+    return np.full(len(states), 1.0)
+
+
+# A fragment: editing the table or the question reruns only this section
+@st.fragment
+def joint_table_query():
+    spec = st.text_input("Variables (Name: state, state; ...):", STUDENT_VARIABLES, key="prob_variables")
+    try:
+        variables = parse_variables(spec)
+    except ValueError as error:
+        st.error(f"Could not read the variables: {error}")
+        return
+    cells = math.prod(len(states) for states in variables.values())
+    if cells > MAX_EDITOR_CELLS:
+        st.error(f"That table has {cells:,} cells - the editor takes up to {MAX_EDITOR_CELLS:,}.")
+        return
+
+    states = list(itertools.product(*variables.values()))
+    frame = pd.DataFrame(states, columns=list(variables))
+    frame["P"] = starting_weights(variables, states)
+    # Keyed by the variables, so changing them starts a fresh table
+    edited = st.data_editor(frame, disabled=list(variables), hide_index=True, key=f"prob_joint_{spec}")
+    try:
+        joint = JointDistribution(variables, edited["P"].fillna(0).to_numpy(dtype=float).reshape(
+            [len(s) for s in variables.values()]))
+    except (ValueError, ZeroDivisionError) as error:
+        st.error(f"Could not use the table: {error}")
+        return
+
+    first, *rest = variables
+    default = f"P({first}={variables[first][0]}" + (f" | {rest[0]}={variables[rest[0]][0]})" if rest else ")")
+    question = st.text_input("Ask:", default, key=f"prob_query_{spec}")
+    try:
+        answer = joint.ask(question)
+    except (ValueError, KeyError, ZeroDivisionError) as error:
+        st.error(f"Could not answer: {error.args[0]}")
+        return
+    if isinstance(answer, bool):
+        if answer:
+            st.success(f"**Independent:** {question.strip()} holds in this table.")
+        else:
+            st.warning(f"**Dependent:** {question.strip()} does not hold in this table.")
+    elif isinstance(answer, float):
+        st.metric(question.strip(), f"{answer:.4f}", help=f"{answer:.2%}")
+    else:
+        names = list(answer.variables)
+        index = list(itertools.product(*(joint.states[v] for v in names)))
+        table = pd.DataFrame(index, columns=names)
+        table["P"] = [f"{p:.4f}" if not np.isnan(p) else "undefined" for p in answer.values.ravel()]
+        st.table(table)
+    st.caption(f"{joint.size:,} cells, {'sparse' if joint.sparse else 'dense'} storage.")
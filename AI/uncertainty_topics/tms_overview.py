@@ -0,0 +1,144 @@
+import streamlit as st
+
+from tables import content_table
+
+
+def render_tms_overview():
+    st.markdown('<p class="main-header">3️⃣ Truth Maintenance Systems (TMS)</p>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="definition-box"><h3>🎯 What is a TMS?</h3><p>A <strong>Truth Maintenance System</strong> is like a smart bookkeeper that:</p><ul><li>Keeps track of <strong>what the AI believes</strong></li><li>Remembers <strong>why</strong> it believes each thing (justifications)</li><li><strong>Automatically updates</strong> beliefs when evidence changes</li><li>Maintains <strong>consistency</strong> in the belief system</li></ul></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🤔 Why Do We Need TMS?")
+    
+    st.markdown('<div class="example-box"><h4>The Problem Without TMS</h4><p>Imagine an AI system that believes:</p><ul><li>"The car will start" (based on: engine works, has fuel, battery works)</li></ul><p><strong>New information:</strong> Battery is dead!</p><p><strong>Without TMS:</strong> You manually find all beliefs that depend on the battery and update them one by one 😰</p><p><strong>With TMS:</strong> The system automatically:</p><ol><li>Detects the change</li><li>Finds dependent beliefs</li><li>Updates "car will start" to FALSE</li><li>Propagates changes throughout</li></ol><p><strong>Result:</strong> Automatic, consistent, efficient! 🎉</p></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🎯 Core Purpose of TMS")
+    
+    purposes = st.columns(4)
+    
+    with purposes[0]:
+        st.markdown("""
+        **Track**
+        📋
+        
+        Keep record of all beliefs
+        """)
+    
+    with purposes[1]:
+        st.markdown("""
+        **Justify**
+        📝
+        
+        Remember why we believe things
+        """)
+    
+    with purposes[2]:
+        st.markdown("""
+        **Update**
+        🔄
+        
+        Change beliefs automatically
+        """)
+    
+    with purposes[3]:
+        st.markdown("""
+        **Maintain**
+        ✅
+        
+        Ensure consistency
+        """)
+    
+    st.markdown("### 🧩 The Three Types of TMS")
+    
+    st.markdown("---")
+    
+    type1, type2, type3 = st.columns(3)
+    
+    with type1:
+        st.markdown('<div class="warning-box"><h3>JTMS</h3><h4>Justification-Based</h4><p><strong>Most Common</strong></p><hr><p><strong>How it works:</strong></p><ul><li>Tracks IN/OUT lists</li><li>Simple bookkeeping</li><li>Treats beliefs as atoms</li></ul><p><strong>Good for:</strong></p><ul><li>General reasoning</li><li>Expert systems</li></ul></div>', unsafe_allow_html=True)
+    
+    with type2:
+        st.markdown('<div class="example-box"><h3>LTMS</h3><h4>Logic-Based</h4><p><strong>More Intelligent</strong></p><hr><p><strong>How it works:</strong></p><ul><li>Like JTMS + logic</li><li>Detects contradictions automatically</li><li>Understands logical relationships</li></ul><p><strong>Good for:</strong></p><ul><li>Logical reasoning</li><li>Diagnosis systems</li></ul></div>', unsafe_allow_html=True)
+    
+    with type3:
+        st.markdown('<div class="definition-box"><h3>ATMS</h3><h4>Assumption-Based</h4><p><strong>Most Powerful</strong></p><hr><p><strong>How it works:</strong></p><ul><li>Explores multiple scenarios at once</li><li>No backtracking needed</li><li>Maintains contexts</li></ul><p><strong>Good for:</strong></p><ul><li>Complex problems</li><li>Multiple hypotheses</li></ul></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🔗 How TMS Works: The Dependency Network")
+    
+    st.markdown('<div class="concept-box"><p>Think of it like a <strong>social network</strong>, but for beliefs:</p><ul><li><strong>Nodes</strong> = Individual beliefs/assertions</li><li><strong>Connections</strong> = Dependencies (what supports what)</li><li><strong>Labels</strong> = Status (believed or not believed)</li></ul><p>When one belief changes, the network automatically updates connected beliefs!</p></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 📊 Simple Example")
+    
+    st.markdown("""
+    ```
+    Belief Network:
+    
+    [Engine Works] ──┐
+                      ├──> [Car Starts]
+    [Has Fuel] ───────┤
+                      │
+    [Battery Works] ──┘
+    
+    If "Battery Works" becomes FALSE:
+    → "Car Starts" automatically becomes FALSE
+    → System stays consistent!
+    ```
+    """)
+    
+    st.markdown("### 🔑 Key Operations")
+    
+    operations = {
+        'Operation': ['Consistent Labeling', 'Contradiction Resolution', 'Dependency Tracking', 'Belief Propagation'],
+        'What it does': [
+            'Ensures all beliefs are compatible',
+            'Fixes conflicting beliefs',
+            'Remembers what depends on what',
+            'Spreads changes through network'
+        ],
+        'Example': [
+            'If A supports B, and A is FALSE, then B must be FALSE',
+            'Can\'t believe both "raining" and "not raining"',
+            '"Car starts" depends on "battery works"',
+            'Battery fails → car doesn\'t start → can\'t drive to work'
+        ]
+    }
+    
+    df = content_table(operations)
+    st.table(df)
+    
+    st.markdown("### ⚡ Benefits of Using TMS")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **Advantages:**
+        - ✅ Automatic consistency maintenance
+        - ✅ Efficient belief updates
+        - ✅ Tracks reasoning history
+        - ✅ Supports non-monotonic reasoning
+        - ✅ Reduces manual work
+        """)
+    
+    with col2:
+        st.markdown("""
+        **Use Cases:**
+        - 🏥 Medical diagnosis systems
+        - 🔧 Fault diagnosis
+        - 🤖 Planning and scheduling
+        - 🧠 Expert systems
+        - 🎯 Decision support
+        """)
+    
+    st.markdown("### 🎓 Key Takeaway")
+    
+    st.success("""
+    **TMS is the "autopilot" for managing beliefs in AI systems!**
+    
+    Instead of manually tracking and updating everything, TMS does it automatically 
+    by maintaining a dependency network of beliefs and their justifications.
+    
+    The next three chapters explore each type in detail! 📚
+    """)
+    
+    st.info("👉 **Next:** Deep dive into JTMS with the ABC Murder Mystery example!")
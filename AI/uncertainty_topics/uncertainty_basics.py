@@ -0,0 +1,120 @@
+import streamlit as st
+
+
+def render_uncertainty_basics():
+    st.markdown('<p class="main-header">1️⃣ Uncertainty Basics</p>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="definition-box"><h3>🎯 What is Uncertainty?</h3><p>In traditional logic (like propositional or first-order logic), we assume everything is <strong>certain</strong> - statements are either <strong>TRUE</strong> or <strong>FALSE</strong>.</p><p>But in the real world, we often face situations where we\'re <strong>not completely sure</strong>. This is <strong>uncertainty</strong>.</p></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🤔 Understanding the Problem")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **Traditional Logic:**
+        ```
+        A → B  (If A is true, then B is true)
+        ```
+        - Clear and certain
+        - Works great in mathematics
+        - Not flexible enough for real world
+        """)
+    
+    with col2:
+        st.markdown("""
+        **Real World:**
+        ```
+        We're NOT sure if A is true
+        How do we handle this?
+        ```
+        - Uncertain information
+        - Incomplete data
+        - Need special reasoning methods
+        """)
+    
+    st.markdown("### 🌍 Where Does Uncertainty Come From?")
+    
+    causes_col1, causes_col2, causes_col3 = st.columns(3)
+    
+    with causes_col1:
+        st.markdown("""
+        **Sources:**
+        - 📰 Unreliable sources
+        - 🔬 Experimental errors
+        """)
+    
+    with causes_col2:
+        st.markdown("""
+        **Technical:**
+        - ⚙️ Equipment faults
+        - 🌡️ Temperature changes
+        """)
+    
+    with causes_col3:
+        st.markdown("""
+        **Environmental:**
+        - 🌍 Climate variations
+        - 🎲 Random events
+        """)
+    
+    st.markdown('<div class="example-box"><h4>💡 Real-Life Examples</h4><ul><li><strong>Weather:</strong> "70% chance of rain tomorrow" - Not certain!</li><li><strong>Medical:</strong> "Patient might have flu or cold" - Multiple possibilities</li><li><strong>Stock Market:</strong> "Price may go up" - Unknown future</li><li><strong>Sports:</strong> "Team A will probably win" - Unpredictable outcome</li></ul></div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🛠️ Two Main Approaches to Handle Uncertainty")
+    
+    approach1, approach2 = st.tabs(["Non-Monotonic Reasoning", "Statistical Reasoning"])
+    
+    with approach1:
+        st.markdown("### Non-Monotonic Reasoning")
+        st.markdown("""
+        **Core Idea:** Conclusions can **change** when new information arrives
+        
+        **How it works:**
+        - Start with incomplete knowledge
+        - Make assumptions (default beliefs)
+        - Update beliefs when new evidence appears
+        - Can **retract** old conclusions
+        
+        **Example:**
+        1. **Initial belief:** "Birds can fly" ✅
+        2. **Learn new fact:** "Penguins are birds"
+        3. **Updated belief:** "Most birds fly, but penguins don't" ✅
+        
+        **Key Point:** Old conclusions don't always stay true!
+        """)
+    
+    with approach2:
+        st.markdown("### Statistical Reasoning")
+        st.markdown("""
+        **Core Idea:** Use **numbers** (probabilities) to represent uncertainty
+        
+        **How it works:**
+        - Assign probability values (0 to 1)
+        - 0 = impossible
+        - 1 = certain
+        - 0.7 = 70% likely
+        
+        **Example:**
+        - P(Spam Email) = 0.85 (85% sure it's spam)
+        - P(Disease | Symptoms) = 0.30 (30% chance)
+        
+        **Methods include:**
+        - Bayes' Theorem
+        - Bayesian Networks
+        - Certainty Factors
+        - Dempster-Shafer Theory
+        """)
+    
+    st.markdown("### 🎓 Key Takeaways")
+    
+    st.success("""
+    ✅ **Uncertainty is normal** in real-world AI systems
+    
+    ✅ **Two main approaches:** Change beliefs (non-monotonic) OR use probabilities (statistical)
+    
+    ✅ **Both are important** and used in different situations
+    
+    ✅ **This course teaches both** approaches in detail
+    """)
+    
+    st.info("👉 **Next:** Learn about Non-Monotonic Reasoning in detail!")
@@ -1,23 +1,37 @@
 import streamlit as st
-import pandas as pd
+
+import content_store
+import instrumentation
+import search
+from tables import content_table
+from unit5_quiz import QUIZ_QUESTIONS, quiz_feedback, score_quiz
 
 # Page configuration
 st.set_page_config(page_title="Unit 5: Expert Systems & AI Programming", layout="wide", page_icon="🤖")
 
 # Sidebar navigation
 st.sidebar.title("📚 Navigation")
+search.sidebar("unit5")
 section = st.sidebar.radio(
     "Select Topic:",
     ["Introduction", "Expert Systems Overview", "ES Components", "ES Development", 
-     "ES Applications", "Prolog Programming", "LISP Programming", "Quiz & Summary"]
+     "ES Applications", "Prolog Programming", "LISP Programming", "Quiz & Summary"],
+    key=search.nav_key("unit5"),
 )
 
 # Main title
 st.title("🤖 Unit 5: Expert Systems & AI Programming Languages")
 st.markdown("---")
 
+instrumentation.begin("unit5", section)
+
+# Static pages compiled into the content pack are replayed from it; the
+# branches below are the source they were extracted from.
+if content_store.serve("unit5", section):
+    pass
+
 # ============ SECTION 1: INTRODUCTION ============
-if section == "Introduction":
+elif section == "Introduction":
     st.header("📖 Introduction to the Unit")
     
     col1, col2 = st.columns(2)
@@ -86,7 +100,7 @@ elif section == "Expert Systems Overview":
     
     with col2:
         st.subheader("📊 Examples")
-        examples_df = pd.DataFrame({
+        examples_df = content_table({
             "System": ["DENDRAL", "MYCIN", "PXDES", "CaDeT"],
             "Domain": ["Chemistry", "Medicine", "Oncology", "Cancer Detection"],
             "Purpose": [
@@ -318,7 +332,7 @@ elif section == "ES Development":
     
     with col2:
         st.markdown("**🔧 Shell Components:**")
-        components_df = pd.DataFrame({
+        components_df = content_table({
             "Component": ["Knowledge Base", "Reasoning Engine", "Acquisition", "Explanation", "UI"],
             "Function": ["Store knowledge", "Process logic", "Help build KB", "Justify actions", "User interaction"]
         })
@@ -544,7 +558,7 @@ pair(X, Y) :- male(X), female(Y).
     # Operators
     st.subheader("🔧 Operators")
     
-    operators_df = pd.DataFrame({
+    operators_df = content_table({
         "Position": ["Prefix", "Infix", "Postfix"],
         "Operator Syntax": ["-2", "5+17", "N!"],
         "Normal Syntax": ["-(2)", "+(17,5)", "!(N)"],
@@ -616,7 +630,7 @@ elif section == "LISP Programming":
         Predicates test conditions and return T (true) or NIL (false).
         """)
         
-        predicates_df = pd.DataFrame({
+        predicates_df = content_table({
             "Predicate": ["atom", "equal", "eq", "evenp", "oddp", "zerop", 
                          "null", "listp", "numberp", "integerp"],
             "Test": ["Is atom?", "Structural equality", "Object identity", 
@@ -862,65 +876,30 @@ elif section == "Quiz & Summary":
     # Quick Quiz
     st.subheader("🎯 Quick Quiz")
     
-    with st.form("quiz_form"):
-        q1 = st.radio(
-            "1. What are the three main components of an Expert System?",
-            ["A) Input, Output, Process",
-             "B) User Interface, Inference Engine, Knowledge Base",
-             "C) Hardware, Software, Network",
-             "D) Data, Information, Knowledge"],
-            key="q1"
-        )
-        
-        q2 = st.radio(
-            "2. Which inference mode starts from known facts and moves towards goals?",
-            ["A) Backward Chaining",
-             "B) Forward Chaining",
-             "C) Lateral Chaining",
-             "D) Circular Chaining"],
-            key="q2"
-        )
-        
-        q3 = st.radio(
-            "3. Which language uses logical variables and backtracking?",
-            ["A) Python", "B) Java", "C) Prolog", "D) C++"],
-            key="q3"
-        )
-        
-        q4 = st.radio(
-            "4. In LISP, what does the 'car' function do?",
-            ["A) Returns the last element",
-             "B) Returns the first element",
-             "C) Removes an element",
-             "D) Adds an element"],
-            key="q4"
-        )
-        
-        q5 = st.radio(
-            "5. What was the first expert system developed?",
-            ["A) MYCIN", "B) DENDRAL", "C) CaDeT", "D) PXDES"],
-            key="q5"
-        )
-        
-        submitted = st.form_submit_button("Submit Quiz")
-        
-        if submitted:
-            score = 0
-            if "B)" in q1: score += 1
-            if "B)" in q2: score += 1
-            if "C)" in q3: score += 1
-            if "B)" in q4: score += 1
-            if "B)" in q5: score += 1
+    # Submitting reruns only the quiz fragment, not the whole page
+    @st.fragment
+    def quiz():
+        with st.form("quiz_form"):
+            answers = {}
+            for question in QUIZ_QUESTIONS:
+                answers[question["key"]] = st.radio(
+                    question["question"], question["options"], key=question["key"]
+                )
             
-            st.success(f"Your Score: {score}/5 ({score*20}%)")
+            submitted = st.form_submit_button("Submit Quiz")
             
-            if score == 5:
-                st.balloons()
-                st.success("🎉 Perfect Score! You've mastered the material!")
-            elif score >= 3:
-                st.info("👍 Good job! Review the missed topics for better understanding.")
-            else:
-                st.warning("📚 Keep studying! Go through the sections again.")
+            if submitted:
+                score = score_quiz(answers)
+                total = len(QUIZ_QUESTIONS)
+                
+                st.success(f"Your Score: {score}/{total} ({score * 100 // total}%)")
+                
+                kind, message = quiz_feedback(score)
+                if score == total:
+                    st.balloons()
+                getattr(st, kind)(message)
+    
+    quiz()
     
     st.markdown("---")
     
@@ -1045,7 +1024,7 @@ elif section == "Quiz & Summary":
     # Comparison Table
     st.subheader("🔄 Prolog vs LISP Comparison")
     
-    comparison_df = pd.DataFrame({
+    comparison_df = content_table({
         "Aspect": ["Paradigm", "Style", "Syntax", "Main Use", "Variables", "Execution"],
         "Prolog": [
             "Logic Programming",
@@ -1085,6 +1064,8 @@ elif section == "Quiz & Summary":
     - Expert system shells
     """)
 
+instrumentation.end()
+
 # Footer
 st.markdown("---")
 st.markdown("""
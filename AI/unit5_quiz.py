@@ -0,0 +1,62 @@
+# Quiz data for the Unit 5 "Quiz & Summary" section.
+# Kept separate from unit5.py so the static-site export can ship the same
+# questions and answer key as a client-side island.
+
+QUIZ_QUESTIONS = [
+    {
+        "key": "q1",
+        "question": "1. What are the three main components of an Expert System?",
+        "options": ["A) Input, Output, Process",
+                    "B) User Interface, Inference Engine, Knowledge Base",
+                    "C) Hardware, Software, Network",
+                    "D) Data, Information, Knowledge"],
+        "answer": "B)",
+    },
+    {
+        "key": "q2",
+        "question": "2. Which inference mode starts from known facts and moves towards goals?",
+        "options": ["A) Backward Chaining",
+                    "B) Forward Chaining",
+                    "C) Lateral Chaining",
+                    "D) Circular Chaining"],
+        "answer": "B)",
+    },
+    {
+        "key": "q3",
+        "question": "3. Which language uses logical variables and backtracking?",
+        "options": ["A) Python", "B) Java", "C) Prolog", "D) C++"],
+        "answer": "C)",
+    },
+    {
+        "key": "q4",
+        "question": "4. In LISP, what does the 'car' function do?",
+        "options": ["A) Returns the last element",
+                    "B) Returns the first element",
+                    "C) Removes an element",
+                    "D) Adds an element"],
+        "answer": "B)",
+    },
+    {
+        "key": "q5",
+        "question": "5. What was the first expert system developed?",
+        "options": ["A) MYCIN", "B) DENDRAL", "C) CaDeT", "D) PXDES"],
+        "answer": "B)",
+    },
+]
+
+# (minimum score, alert kind, message), checked from the top
+QUIZ_FEEDBACK = [
+    (5, "success", "🎉 Perfect Score! You've mastered the material!"),
+    (3, "info", "👍 Good job! Review the missed topics for better understanding."),
+    (0, "warning", "📚 Keep studying! Go through the sections again."),
+]
+
+
+def score_quiz(answers):
+    return sum(1 for q in QUIZ_QUESTIONS if q["answer"] in answers[q["key"]])
+
+
+def quiz_feedback(score):
+    for minimum, kind, message in QUIZ_FEEDBACK:
+        if score >= minimum:
+            return kind, message